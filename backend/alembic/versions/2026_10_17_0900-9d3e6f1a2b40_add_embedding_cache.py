@@ -0,0 +1,43 @@
+"""add embedding cache
+
+Revision ID: 9d3e6f1a2b40
+Revises: 4b9f3a7d2c11
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3e6f1a2b40"
+down_revision: Union[str, Sequence[str], None] = "4b9f3a7d2c11"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("embedding_spec_id", sa.Integer(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["embedding_spec_id"], ["embedding_specs.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("embedding_spec_id", "content_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache")
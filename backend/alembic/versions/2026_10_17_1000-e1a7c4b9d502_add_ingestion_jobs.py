@@ -0,0 +1,104 @@
+"""add ingestion jobs
+
+Revision ID: e1a7c4b9d502
+Revises: 9d3e6f1a2b40
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c4b9d502"
+down_revision: Union[str, Sequence[str], None] = "9d3e6f1a2b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("collection_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("model_api_key_id", sa.Integer(), nullable=False),
+        sa.Column("chunk_size", sa.Integer(), nullable=False),
+        sa.Column("chunk_overlap", sa.Integer(), nullable=False),
+        sa.Column(
+            "status", sa.String(length=16), server_default="queued", nullable=False
+        ),
+        sa.Column(
+            "attempts", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "max_attempts", sa.Integer(), server_default=sa.text("3"), nullable=False
+        ),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["collection_id"], ["collections.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        op.f("ix_ingestion_jobs_collection_id"), "ingestion_jobs", ["collection_id"]
+    )
+    op.create_index(op.f("ix_ingestion_jobs_user_id"), "ingestion_jobs", ["user_id"])
+    op.create_index(
+        "ix_ingestion_jobs_claim", "ingestion_jobs", ["status", "run_after"]
+    )
+
+    op.create_table(
+        "ingestion_job_files",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("file_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("content_type", sa.String(length=255), nullable=True),
+        sa.Column("spool_path", sa.Text(), nullable=False),
+        sa.Column("metadata", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "stage", sa.String(length=16), server_default="queued", nullable=False
+        ),
+        sa.Column(
+            "chunk_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["ingestion_jobs.id"], ondelete="CASCADE"),
+    )
+    op.create_index(
+        op.f("ix_ingestion_job_files_job_id"), "ingestion_job_files", ["job_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_ingestion_job_files_job_id"), table_name="ingestion_job_files"
+    )
+    op.drop_table("ingestion_job_files")
+    op.drop_index("ix_ingestion_jobs_claim", table_name="ingestion_jobs")
+    op.drop_index(op.f("ix_ingestion_jobs_user_id"), table_name="ingestion_jobs")
+    op.drop_index(op.f("ix_ingestion_jobs_collection_id"), table_name="ingestion_jobs")
+    op.drop_table("ingestion_jobs")
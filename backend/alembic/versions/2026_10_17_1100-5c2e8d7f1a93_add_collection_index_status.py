@@ -0,0 +1,39 @@
+"""add collection index status
+
+Revision ID: 5c2e8d7f1a93
+Revises: e1a7c4b9d502
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8d7f1a93"
+down_revision: Union[str, Sequence[str], None] = "e1a7c4b9d502"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "collections",
+        sa.Column(
+            "index_status", sa.String(length=16), nullable=False, server_default="ready"
+        ),
+    )
+    op.add_column("collections", sa.Column("index_error", sa.Text(), nullable=True))
+    op.add_column(
+        "collections",
+        sa.Column("index_updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collections", "index_updated_at")
+    op.drop_column("collections", "index_error")
+    op.drop_column("collections", "index_status")
@@ -0,0 +1,42 @@
+"""add collection vector index policy
+
+Revision ID: 7a4d1e9c3b28
+Revises: 5c2e8d7f1a93
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4d1e9c3b28"
+down_revision: Union[str, Sequence[str], None] = "5c2e8d7f1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "collections",
+        sa.Column(
+            "vector_index", sa.String(length=16), nullable=False, server_default="hnsw"
+        ),
+    )
+    op.add_column(
+        "collections",
+        sa.Column(
+            "vector_index_params",
+            postgresql.JSONB(),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collections", "vector_index_params")
+    op.drop_column("collections", "vector_index")
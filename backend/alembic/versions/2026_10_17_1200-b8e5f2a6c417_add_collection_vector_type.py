@@ -0,0 +1,34 @@
+"""add collection vector type
+
+Revision ID: b8e5f2a6c417
+Revises: 7a4d1e9c3b28
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e5f2a6c417"
+down_revision: Union[str, Sequence[str], None] = "7a4d1e9c3b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 컬렉션 테이블은 vector 컬럼 그대로 유지.
+    # 스키마만 바꿉니다: 새 컬렉션의 저장 타입은 생성 시 storage_type_for가 정합니다.
+    op.add_column(
+        "collections",
+        sa.Column(
+            "vector_type", sa.String(length=16), nullable=False, server_default="vector"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collections", "vector_type")
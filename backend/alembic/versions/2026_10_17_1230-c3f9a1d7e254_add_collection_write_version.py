@@ -0,0 +1,30 @@
+"""add collection write version
+
+Revision ID: c3f9a1d7e254
+Revises: b8e5f2a6c417
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f9a1d7e254"
+down_revision: Union[str, Sequence[str], None] = "b8e5f2a6c417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "collections",
+        sa.Column("write_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collections", "write_version")
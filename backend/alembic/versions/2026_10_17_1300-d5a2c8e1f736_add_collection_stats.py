@@ -0,0 +1,69 @@
+"""add collection stats
+
+Revision ID: d5a2c8e1f736
+Revises: c3f9a1d7e254
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a2c8e1f736"
+down_revision: Union[str, Sequence[str], None] = "c3f9a1d7e254"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for name in ("chunk_count", "document_count", "content_bytes"):
+        op.add_column(
+            "collections",
+            sa.Column(name, sa.BigInteger(), nullable=False, server_default="0"),
+        )
+    op.add_column(
+        "collections",
+        sa.Column("stats_reconciled_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # 기존 컬렉션 테이블: 집계 초기값 채우기 + 파일 단위 삭제/집계용 인덱스
+    bind = op.get_bind()
+    for (collection_id,) in bind.execute(sa.text("SELECT id FROM collections")).all():
+        table = f"collection_{str(collection_id).replace('-', '_')}"
+        exists = bind.execute(
+            sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}
+        ).scalar()
+        if not exists:
+            continue
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_file_id ON {table} (file_id, chunk_index)"
+        )
+        bind.execute(
+            sa.text(
+                f"""
+                UPDATE collections AS c
+                SET chunk_count = s.chunks,
+                    document_count = s.documents,
+                    content_bytes = s.bytes,
+                    stats_reconciled_at = now()
+                FROM (
+                    SELECT COUNT(*) AS chunks,
+                        COUNT(DISTINCT file_id) AS documents,
+                        COALESCE(SUM(octet_length(content)), 0) AS bytes
+                    FROM {table}
+                ) AS s
+                WHERE c.id = :collection_id
+                """
+            ),
+            {"collection_id": collection_id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("collections", "stats_reconciled_at")
+    for name in ("content_bytes", "document_count", "chunk_count"):
+        op.drop_column("collections", name)
@@ -0,0 +1,77 @@
+"""add collection files
+
+Revision ID: e7b4d9f2a158
+Revises: d5a2c8e1f736
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b4d9f2a158"
+down_revision: Union[str, Sequence[str], None] = "d5a2c8e1f736"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_files",
+        sa.Column("collection_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("file_id", sa.Text(), nullable=False),
+        sa.Column("source", sa.Text(), nullable=True),
+        sa.Column("chunk_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("content_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["collection_id"], ["collections.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("collection_id", "file_id"),
+    )
+    op.create_index(
+        "ix_collection_files_listing",
+        "collection_files",
+        ["collection_id", "created_at", "file_id"],
+    )
+
+    # 기존 컬렉션 테이블의 파일 레지스트리 채우기(원본 해시/크기는 알 수 없어 NULL)
+    bind = op.get_bind()
+    for (collection_id,) in bind.execute(sa.text("SELECT id FROM collections")).all():
+        table = f"collection_{str(collection_id).replace('-', '_')}"
+        exists = bind.execute(
+            sa.text("SELECT to_regclass(:table) IS NOT NULL"), {"table": table}
+        ).scalar()
+        if not exists:
+            continue
+        bind.execute(
+            sa.text(
+                f"""
+                INSERT INTO collection_files
+                    (collection_id, file_id, source, chunk_count, content_bytes)
+                SELECT :collection_id, file_id, MAX(source), COUNT(*),
+                    COALESCE(SUM(octet_length(content)), 0)
+                FROM {table}
+                WHERE file_id IS NOT NULL
+                GROUP BY file_id
+                """
+            ),
+            {"collection_id": collection_id},
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_collection_files_listing", table_name="collection_files")
+    op.drop_table("collection_files")
@@ -31,6 +31,137 @@ class Settings(BaseSettings):
         default="https://api.smith.langchain.com", env="LANGCHAIN_ENDPOINT"
     )
 
+    # 컴파일된 LangGraph 에이전트 LRU 캐시 크기
+    agent_cache_size: int = Field(64, env="AGENT_CACHE_SIZE")
+
+    # MCP 툴 목록 캐시 유효 시간(초) 및 최대 서버 수
+    mcp_tools_ttl_sec: float = Field(300.0, env="MCP_TOOLS_TTL_SEC")
+    mcp_tools_cache_size: int = Field(128, env="MCP_TOOLS_CACHE_SIZE")
+
+    # warm MCP 세션 유휴 만료(초, 0 이하면 만료 없음) 및 최대 유지 세션 수
+    mcp_session_idle_sec: float = Field(600.0, env="MCP_SESSION_IDLE_SEC")
+    mcp_max_sessions: int = Field(32, env="MCP_MAX_SESSIONS")
+
+    # 임베딩 클라이언트 레지스트리 크기 및 로컬 모델 메모리 한도(바이트)
+    embedding_registry_size: int = Field(16, env="EMBEDDING_REGISTRY_SIZE")
+    embedding_registry_max_bytes: int = Field(
+        4 * 1024**3, env="EMBEDDING_REGISTRY_MAX_BYTES"
+    )
+
+    # 검색 질의 임베딩 캐시(LRU+TTL, 바이트 한도). shared=True면 DB 임베딩 캐시도 사용
+    query_embedding_cache_size: int = Field(4096, env="QUERY_EMBEDDING_CACHE_SIZE")
+    query_embedding_cache_ttl_sec: float = Field(
+        3600.0, env="QUERY_EMBEDDING_CACHE_TTL_SEC"
+    )
+    query_embedding_cache_max_bytes: int = Field(
+        64 * 1024**2, env="QUERY_EMBEDDING_CACHE_MAX_BYTES"
+    )
+    query_embedding_shared: bool = Field(False, env="QUERY_EMBEDDING_SHARED")
+
+    # 검색 결과 캐시(LRU, 바이트 한도). 키에 컬렉션 write_version이 있어 TTL 없이 무효화
+    search_result_cache: bool = Field(True, env="SEARCH_RESULT_CACHE")
+    search_result_cache_size: int = Field(2048, env="SEARCH_RESULT_CACHE_SIZE")
+    search_result_cache_max_bytes: int = Field(
+        64 * 1024**2, env="SEARCH_RESULT_CACHE_MAX_BYTES"
+    )
+
+    # 문서 적재 작업 큐: 업로드 파일 스풀 경로, 워커 수 등
+    # 스풀은 API와 모든 워커가 같은 내용을 보는 볼륨이어야 합니다(docker-compose의
+    # ingest_spool 볼륨, 여러 호스트면 NFS 등). 작업에는 이 경로 기준 상대 경로를 저장합니다.
+    # ingest_workers=0이면 API 프로세스에서는 워커를 띄우지 않습니다(별도 프로세스 실행).
+    ingest_spool_dir: str = Field("/var/lib/ingest_spool", env="INGEST_SPOOL_DIR")
+    ingest_workers: int = Field(2, env="INGEST_WORKERS")
+    ingest_max_attempts: int = Field(3, env="INGEST_MAX_ATTEMPTS")
+    ingest_lease_sec: float = Field(300.0, env="INGEST_LEASE_SEC")
+    ingest_poll_interval_sec: float = Field(2.0, env="INGEST_POLL_INTERVAL_SEC")
+
+    # 컬렉션 청크/문서/바이트 집계 보정 주기(초, 0이면 끔)
+    collection_stats_reconcile_interval_sec: float = Field(
+        3600.0, env="COLLECTION_STATS_RECONCILE_INTERVAL_SEC"
+    )
+    ingest_retry_backoff_sec: float = Field(30.0, env="INGEST_RETRY_BACKOFF_SEC")
+    # 적재 파이프라인: 배치당 청크 수, 단계별 동시성, 단계 사이 큐 크기(배치 수)
+    ingest_batch_size: int = Field(256, env="INGEST_BATCH_SIZE")
+    ingest_parse_concurrency: int = Field(2, env="INGEST_PARSE_CONCURRENCY")
+    ingest_embed_concurrency: int = Field(4, env="INGEST_EMBED_CONCURRENCY")
+    ingest_store_concurrency: int = Field(2, env="INGEST_STORE_CONCURRENCY")
+    ingest_queue_size: int = Field(8, env="INGEST_QUEUE_SIZE")
+
+    # 문서 파싱/청킹 프로세스 풀: 워커 수(0이면 CPU 수 기준), 메모리(MB, 0=무제한)
+    # 제한 시간은 파일 전체가 아니라 다음 청크 배치가 나올 때까지의 시간입니다(큰 업로드 대응).
+    parse_workers: int = Field(0, env="PARSE_WORKERS")
+    parse_timeout_sec: float = Field(120.0, env="PARSE_TIMEOUT_SEC")
+    parse_max_memory_mb: int = Field(2048, env="PARSE_MAX_MEMORY_MB")
+
+    # 청크 저장 시 바이너리 COPY 벌크 적재 사용 여부와 전용 커넥션 풀 크기
+    vector_bulk_insert: bool = Field(True, env="VECTOR_BULK_INSERT")
+    vector_bulk_pool_size: int = Field(4, env="VECTOR_BULK_POOL_SIZE")
+
+    # 벌크 적재 후 인덱스 빌드 세션 설정(maintenance_work_mem, 병렬 워커 수)
+    index_build_maintenance_work_mem: str = Field(
+        "1GB", env="INDEX_BUILD_MAINTENANCE_WORK_MEM"
+    )
+    index_build_parallel_workers: int = Field(4, env="INDEX_BUILD_PARALLEL_WORKERS")
+    # building 상태가 이 시간(초) 넘게 갱신되지 않고 진행 중인 CREATE INDEX도 없으면
+    # 재시작 등으로 중단된 빌드로 보고 다시 빌드/전환을 허용합니다.
+    index_build_stale_sec: int = Field(1800, env="INDEX_BUILD_STALE_SEC")
+
+    # 벡터 인덱스 기본 파라미터(컬렉션 vector_index_params가 우선)
+    vector_hnsw_m: int = Field(16, env="VECTOR_HNSW_M")
+    vector_hnsw_ef_construction: int = Field(64, env="VECTOR_HNSW_EF_CONSTRUCTION")
+    vector_hnsw_ef_search: int = Field(40, env="VECTOR_HNSW_EF_SEARCH")
+    vector_ivfflat_probes: int = Field(10, env="VECTOR_IVFFLAT_PROBES")
+
+    # 적응형 검색 계획: 필터 시 반복 인덱스 스캔(pgvector 0.8+) 사용 여부와 최대 스캔 튜플 수,
+    # 통계로 추정할 수 없는 필터의 기본 선택도, 선택도 추정 캐시 크기/TTL(초)
+    vector_iterative_scan: bool = Field(True, env="VECTOR_ITERATIVE_SCAN")
+    vector_max_scan_tuples: int = Field(20000, env="VECTOR_MAX_SCAN_TUPLES")
+    search_default_selectivity: float = Field(0.1, env="SEARCH_DEFAULT_SELECTIVITY")
+    search_plan_cache_size: int = Field(1024, env="SEARCH_PLAN_CACHE_SIZE")
+    search_plan_cache_ttl_sec: float = Field(300.0, env="SEARCH_PLAN_CACHE_TTL_SEC")
+
+    # 배치 검색 요청당 최대 질의 수
+    search_batch_max_queries: int = Field(64, env="SEARCH_BATCH_MAX_QUERIES")
+
+    # 연합(다중 컬렉션) 검색: 요청당 최대 컬렉션 수, 동시 검색 커넥션 수
+    federated_search_max_collections: int = Field(20, env="FEDERATED_SEARCH_MAX_COLLECTIONS")
+    federated_search_concurrency: int = Field(8, env="FEDERATED_SEARCH_CONCURRENCY")
+
+    # 이진 양자화 검색: 1차 후보 수 = k * 배수(최대 1000, hnsw.ef_search 상한)
+    vector_bq_rerank_factor: int = Field(4, env="VECTOR_BQ_RERANK_FACTOR")
+
+    # 컬렉션 테이블별 PGVectorStore(스키마 조회 결과) 캐시 크기
+    vectorstore_cache_size: int = Field(256, env="VECTORSTORE_CACHE_SIZE")
+
+    # 하이브리드(RRF) 검색: 신호별 가중치, RRF 상수, limit 외 추가 후보 수
+    hybrid_semantic_weight: float = Field(1.0, env="HYBRID_SEMANTIC_WEIGHT")
+    hybrid_keyword_weight: float = Field(1.0, env="HYBRID_KEYWORD_WEIGHT")
+    hybrid_rrf_k: int = Field(60, env="HYBRID_RRF_K")
+    hybrid_fetch_margin: int = Field(10, env="HYBRID_FETCH_MARGIN")
+
+    # 임베딩 호출: 배치당 최대 추정 토큰/텍스트 수, 동시 배치 수, 429 재시도 횟수와 백오프(초)
+    embedding_max_batch_tokens: int = Field(64000, env="EMBEDDING_MAX_BATCH_TOKENS")
+    embedding_max_batch_size: int = Field(256, env="EMBEDDING_MAX_BATCH_SIZE")
+    embedding_concurrency: int = Field(4, env="EMBEDDING_CONCURRENCY")
+    embedding_max_retries: int = Field(6, env="EMBEDDING_MAX_RETRIES")
+    embedding_backoff_base_sec: float = Field(1.0, env="EMBEDDING_BACKOFF_BASE_SEC")
+    embedding_backoff_max_sec: float = Field(60.0, env="EMBEDDING_BACKOFF_MAX_SEC")
+    # 제공자별 분당 요청/토큰 한도(JSON, 0=무제한). 모델 키 extra의 rpm/tpm이 우선합니다.
+    embedding_rate_limits: dict[str, dict[str, int]] = Field(
+        {
+            "openai": {"rpm": 3000, "tpm": 1000000},
+            "azure_openai": {"rpm": 720, "tpm": 120000},
+            "cohere": {"rpm": 2000, "tpm": 0},
+            "voyage": {"rpm": 2000, "tpm": 3000000},
+        },
+        env="EMBEDDING_RATE_LIMITS",
+    )
+
+    # 채팅 시 MCP 서버별 툴 로딩 제한 시간(초)과 서킷 브레이커 설정
+    mcp_load_timeout_sec: float = Field(5.0, env="MCP_LOAD_TIMEOUT_SEC")
+    mcp_breaker_threshold: int = Field(3, env="MCP_BREAKER_THRESHOLD")
+    mcp_breaker_cooldown_sec: float = Field(60.0, env="MCP_BREAKER_COOLDOWN_SEC")
+
     @computed_field
     @property
     def database_url(self) -> str:
@@ -1,9 +1,31 @@
 from app.db.session import Base, async_session, engine, pg_engine, raw_sql
+from app.db.batch import batch_search
+from app.db.collection_stats import (
+    delete_chunks_sql,
+    record_file_uploads,
+    refresh_collection_stats,
+)
+from app.db.bulk import bulk_insert_chunks, close_bulk_pool, record_inserted_chunks
+from app.db.hybrid import hybrid_search
+from app.db.quantized import exact_search, quantized_search
+from app.db.search_plan import SearchPlan, plan_vector_search, record_search_outcome
 from app.db.vector import (
     get_vectorstore,
     get_metadata_columns,
     get_hybrid_config,
     create_vectorstore_table,
+    secondary_index_specs,
+    has_vector_index,
+    vector_index_spec,
+    drop_secondary_indexes,
+    build_secondary_indexes,
+    secondary_index_state,
+    index_build_in_progress,
+    vector_query_options,
+    vector_type,
+    storage_type_for,
+    binary_quantized,
+    invalidate_vectorstore,
 )
 
 __all__ = [
@@ -16,4 +38,29 @@ __all__ = [
     "get_metadata_columns",
     "get_hybrid_config",
     "create_vectorstore_table",
+    "secondary_index_specs",
+    "has_vector_index",
+    "vector_index_spec",
+    "drop_secondary_indexes",
+    "build_secondary_indexes",
+    "secondary_index_state",
+    "index_build_in_progress",
+    "vector_query_options",
+    "vector_type",
+    "storage_type_for",
+    "binary_quantized",
+    "invalidate_vectorstore",
+    "quantized_search",
+    "exact_search",
+    "hybrid_search",
+    "batch_search",
+    "SearchPlan",
+    "plan_vector_search",
+    "record_search_outcome",
+    "delete_chunks_sql",
+    "refresh_collection_stats",
+    "record_file_uploads",
+    "bulk_insert_chunks",
+    "record_inserted_chunks",
+    "close_bulk_pool",
 ]
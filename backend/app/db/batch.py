@@ -0,0 +1,99 @@
+from typing import Any, Sequence
+
+from langchain_postgres.v2.indexes import QueryOptions
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .search_sql import (
+    RESULT_COLUMNS,
+    apply_query_options,
+    distance_sql,
+    filter_clause,
+    row_to_result,
+    vector_literal,
+)
+from .session import raw_sql
+from .vector import vector_type
+
+
+def batch_search_sql(collection, where: str) -> str:
+    """
+    Summary: 질의 벡터 배열을 펼쳐 질의마다 top-k를 LATERAL 조인으로 구하는 단일 SQL을 만듭니다.
+
+    Contract:
+        - 질의 벡터는 text[]로 받아 컬럼 저장 타입(vector/halfvec)으로 한 번만 캐스팅합니다.
+        - LATERAL 안은 ORDER BY 거리 LIMIT 형태라 질의마다 벡터 인덱스를 사용합니다.
+        - 결과는 (질의 순번, 거리) 순으로 정렬됩니다(반복 스캔의 느슨한 순서 보정).
+
+    Args:
+        collection: 컬렉션 엔티티.
+        where: 메타데이터 필터 WHERE 절.
+
+    Returns:
+        str: :qs(벡터 문자열 배열), :k 바인드를 쓰는 SQL.
+    """
+    fn, op = distance_sql(collection)
+    columns = ", ".join(f'"{c}"' for c in RESULT_COLUMNS)
+    return f"""
+    SELECT q.idx, r.*
+    FROM (
+        SELECT CAST(u.vec AS {vector_type(collection)}) AS vec, u.idx
+        FROM unnest(CAST(:qs AS text[])) WITH ORDINALITY AS u(vec, idx)
+    ) AS q
+    CROSS JOIN LATERAL (
+        SELECT {columns}, {fn}(embedding, q.vec) AS distance
+        FROM {collection.table_name}
+        WHERE {where}
+        ORDER BY embedding {op} q.vec
+        LIMIT :k
+    ) AS r
+    ORDER BY q.idx, r.distance
+    """
+
+
+async def batch_search(
+    session: AsyncSession,
+    collection,
+    embeddings: Sequence[Sequence[float] | str],
+    *,
+    k: int,
+    filter: dict | None = None,
+    query_options: QueryOptions | None = None,
+) -> list[list[dict[str, Any]]] | None:
+    """
+    Summary: 여러 질의 벡터의 top-k 벡터 검색을 한 번의 조회로 실행합니다.
+
+    Contract:
+        - 반환 목록은 입력 순서와 같고, 질의마다 거리 오름차순입니다.
+        - 인덱스 검색 옵션(ef_search/probes/반복 스캔)은 현재 트랜잭션에만 적용합니다.
+        - 지원하지 않는 필터면 None을 반환합니다(호출자가 벡터스토어 검색으로 대체).
+
+    Args:
+        session: DB 세션.
+        collection: 컬렉션 엔티티.
+        embeddings: 질의 벡터(또는 pgvector 텍스트 표현) 목록.
+        k: 질의별 반환 개수.
+        filter: 메타데이터 필터(동등 비교만).
+        query_options: 벡터 인덱스 검색 옵션.
+
+    Returns:
+        list[list[dict]] | None: 질의별 id/page_content/metadata/score 목록.
+
+    Side Effects:
+        - DB 조회(세션 트랜잭션 로컬 설정)
+    """
+    clause = filter_clause(filter)
+    if clause is None:
+        return None
+    if not embeddings:
+        return []
+    where, params = clause
+    await apply_query_options(session, query_options)
+    rows = await raw_sql(
+        session,
+        batch_search_sql(collection, where),
+        {**params, "qs": [vector_literal(e) for e in embeddings], "k": k},
+    )
+    results: list[list[dict[str, Any]]] = [[] for _ in embeddings]
+    for row in rows:
+        results[int(row["idx"]) - 1].append(row_to_result(row))
+    return results
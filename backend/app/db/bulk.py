@@ -0,0 +1,348 @@
+import asyncio
+import json
+import logging
+from typing import Any, Iterable, Sequence
+from uuid import UUID, uuid4
+
+import asyncpg
+from pgvector.asyncpg import register_vector
+
+from app.core import settings
+
+from .collection_stats import direct_insert_stats_sql, staged_insert_delta_sql
+from .vector import get_metadata_columns
+
+logger = logging.getLogger(__name__)
+
+# COPY로 적재하는 컬렉션 테이블 컬럼(순서 고정, tsvector 컬럼은 INSERT ... SELECT에서 계산)
+COPY_COLUMNS = (
+    "langchain_id",
+    "content",
+    "embedding",
+    "file_id",
+    "chunk_index",
+    "source",
+    "langchain_metadata",
+)
+
+_pool: asyncpg.Pool | None = None
+_pool_lock = asyncio.Lock()
+
+
+def _dsn() -> str:
+    return settings.database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def get_bulk_pool() -> asyncpg.Pool:
+    """
+    Summary: 벌크 적재 전용 asyncpg 풀을 반환합니다(최초 호출 시 생성).
+
+    Contract:
+        - 커넥션마다 pgvector 바이너리 코덱을 등록합니다.
+        - SQLAlchemy/PGVectorStore 풀은 vector를 텍스트로 주고받으므로 코덱이 섞이지 않도록
+          별도 풀을 사용합니다.
+
+    Returns:
+        asyncpg.Pool: 벌크 적재 풀.
+    """
+    global _pool
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await asyncpg.create_pool(
+                _dsn(),
+                min_size=0,
+                max_size=settings.vector_bulk_pool_size,
+                init=register_vector,
+            )
+    return _pool
+
+
+async def close_bulk_pool() -> None:
+    """
+    Why: 애플리케이션 종료 시 벌크 적재 커넥션을 정리합니다.
+    """
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def chunk_records(
+    ids: Sequence[str],
+    texts: Sequence[str],
+    embeddings: Sequence[Sequence[float]],
+    metadatas: Sequence[dict[str, Any]],
+) -> list[tuple]:
+    """
+    Summary: 청크를 COPY_COLUMNS 순서의 레코드로 변환합니다.
+
+    Contract:
+        - 메타데이터 컬럼(file_id/chunk_index/source)은 별도 컬럼으로, 나머지는 JSON으로 저장합니다.
+        - PGVectorStore.aadd_embeddings와 같은 행 형태를 만듭니다.
+
+    Returns:
+        list[tuple]: COPY 레코드 목록.
+    """
+    column_names = {c.name for c in get_metadata_columns()}
+    records = []
+    for id_, text, vector, metadata in zip(
+        ids, texts, embeddings, metadatas, strict=True
+    ):
+        metadata = metadata or {}
+        extra = {k: v for k, v in metadata.items() if k not in column_names}
+        file_id = metadata.get("file_id")
+        chunk_index = metadata.get("chunk_index")
+        records.append(
+            (
+                UUID(str(id_)),
+                text,
+                vector,
+                None if file_id is None else str(file_id),
+                None if chunk_index is None else int(chunk_index),
+                metadata.get("source"),
+                json.dumps(extra, ensure_ascii=False, default=str),
+            )
+        )
+    return records
+
+
+def _insert_stats_args(
+    collection_id: UUID | str, chunks: Iterable[tuple[str, str | None, str | None]]
+) -> tuple:
+    """
+    Summary: (본문, file_id, source) 목록을 direct_insert_stats_sql 바인드 값으로 집계합니다.
+
+    Returns:
+        tuple: $1~$7 바인드 값(컬렉션 ID, 청크 수, 바이트, 파일별 ID/source/청크 수/바이트).
+    """
+    return _delta_stats_args(
+        collection_id,
+        (
+            (file_id, source, 1, len(text.encode("utf-8")))
+            for text, file_id, source in chunks
+        ),
+    )
+
+
+def _delta_stats_args(
+    collection_id: UUID | str,
+    deltas: Iterable[tuple[str | None, str | None, int, int]],
+) -> tuple:
+    """
+    Summary: (file_id, source, 청크 수, 바이트) 증분을 파일별로 합쳐 direct_insert_stats_sql
+    바인드 값으로 바꿉니다(file_id가 None인 증분은 컬렉션 합계에만 더함).
+    """
+    chunks_total = bytes_total = 0
+    files: dict[str, list] = {}
+    for file_id, source, chunks, size in deltas:
+        chunks_total += int(chunks)
+        bytes_total += int(size)
+        if file_id is None:
+            continue
+        entry = files.setdefault(str(file_id), [source, 0, 0])
+        entry[1] += int(chunks)
+        entry[2] += int(size)
+    file_ids = sorted(files)
+    return (
+        UUID(str(collection_id)),
+        chunks_total,
+        bytes_total,
+        file_ids,
+        [files[f][0] for f in file_ids],
+        [files[f][1] for f in file_ids],
+        [files[f][2] for f in file_ids],
+    )
+
+
+async def record_inserted_chunks(
+    collection_id: UUID | str,
+    texts: Sequence[str],
+    metadatas: Sequence[dict[str, Any] | None],
+) -> None:
+    """
+    Summary: 다른 커넥션에서 이미 커밋된 새 청크만큼 컬렉션 집계/파일 레지스트리를
+    증분 갱신하고 write_version을 올립니다.
+
+    Contract:
+        - PGVectorStore 행 단위 INSERT 경로용입니다(COPY 경로는 bulk_insert_chunks가 갱신).
+        - 모든 청크를 새 ID로 가정합니다. 덮어쓰기로 생긴 차이는 주기적 재집계가 보정합니다.
+        - 적재 후에 실행하므로 새 write_version에 이전 검색 결과가 남지 않습니다.
+
+    Args:
+        collection_id: 컬렉션 ID.
+        texts: 적재한 청크 본문 목록.
+        metadatas: texts와 같은 순서의 메타데이터 목록.
+
+    Side Effects:
+        - collections/collection_files 갱신 및 commit
+    """
+    chunks = []
+    for text, metadata in zip(texts, metadatas, strict=True):
+        metadata = metadata or {}
+        file_id = metadata.get("file_id")
+        chunks.append(
+            (text, None if file_id is None else str(file_id), metadata.get("source"))
+        )
+    if not chunks:
+        return
+    pool = await get_bulk_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            direct_insert_stats_sql(), *_insert_stats_args(collection_id, chunks)
+        )
+
+
+async def bulk_insert_chunks(
+    table_name: str,
+    texts: Sequence[str],
+    embeddings: Sequence[Sequence[float]],
+    metadatas: Sequence[dict[str, Any]] | None = None,
+    ids: Sequence[str | None] | None = None,
+    *,
+    tsv_column: str | None = "content_tsv_simple",
+    tsv_lang: str | None = "simple",
+    staging: bool = True,
+    vector_type: str = "vector",
+    collection_id: UUID | str | None = None,
+) -> list[str]:
+    """
+    Summary: 청크를 바이너리 COPY로 컬렉션 테이블에 한 트랜잭션으로 적재합니다.
+
+    Contract:
+        - staging=True: 세션 임시 테이블(WAL 미기록, 커밋 시 삭제)에 COPY한 뒤
+          INSERT ... SELECT 한 번으로 tsvector를 계산해 넣고, 같은 ID는 갱신합니다.
+        - staging=False: 대상 테이블에 바로 COPY합니다. tsvector 컬럼이 없고 ID 충돌이
+          없을 때만 사용할 수 있습니다.
+        - 실패 시 트랜잭션 전체가 롤백되어 일부만 적재되지 않습니다.
+        - collection_id가 있으면 적재 커밋 후 짧은 단독 문장으로 컬렉션 집계(청크/문서/바이트),
+          파일 레지스트리(collection_files), write_version을 갱신합니다. collections 행 잠금을
+          COPY 트랜잭션 동안 잡지 않으므로 동시 적재가 직렬화되지 않습니다.
+          (커밋과 집계 사이에 실패하면 집계가 어긋날 수 있으며 주기적 재집계가 보정합니다.)
+
+    Args:
+        table_name: 컬렉션 테이블명.
+        texts: 청크 본문 목록.
+        embeddings: texts와 같은 순서의 벡터 목록.
+        metadatas: 청크 메타데이터 목록(옵션).
+        ids: 청크 ID 목록(옵션, None 항목은 새로 생성).
+        tsv_column: 하이브리드 검색 tsvector 컬럼명(없으면 None).
+        tsv_lang: to_tsvector 설정명.
+        staging: 임시 테이블 경유 여부.
+        vector_type: 대상 임베딩 컬럼 타입(vector/halfvec). 임시 테이블도 같은 타입으로
+            만들어 COPY 시 바이너리 인코딩이 한 번만 일어나게 합니다.
+        collection_id: 집계/write_version을 갱신할 컬렉션 ID(옵션).
+
+    Returns:
+        list[str]: 적재한 청크 ID 목록.
+
+    Raises:
+        ValueError: staging=False인데 tsvector 컬럼이 지정되었거나 벡터 타입이 잘못된 경우.
+
+    Side Effects:
+        - DB COPY/INSERT 및 commit
+    """
+    if not staging and tsv_column:
+        raise ValueError("tsvector 컬럼이 있는 테이블은 staging 적재만 지원합니다.")
+    if vector_type not in ("vector", "halfvec"):
+        raise ValueError(f"지원하지 않는 벡터 타입입니다: {vector_type}")
+    ids = [
+        str(i) if i is not None else str(uuid4()) for i in (ids or [None] * len(texts))
+    ]
+    metadatas = list(metadatas or [{} for _ in texts])
+    records = chunk_records(ids, texts, embeddings, metadatas)
+    if not records:
+        return []
+
+    pool = await get_bulk_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            deltas = await _load(
+                conn,
+                table_name,
+                records,
+                staging=staging,
+                tsv_column=tsv_column,
+                tsv_lang=tsv_lang,
+                vector_type=vector_type,
+                count_new=collection_id is not None,
+            )
+        if collection_id is not None:
+            await conn.execute(
+                direct_insert_stats_sql(), *_delta_stats_args(collection_id, deltas)
+            )
+    return ids
+
+
+async def _load(
+    conn: asyncpg.Connection,
+    table_name: str,
+    records: list[tuple],
+    *,
+    staging: bool,
+    tsv_column: str | None,
+    tsv_lang: str | None,
+    vector_type: str,
+    count_new: bool,
+) -> list[tuple]:
+    """
+    Summary: 열린 트랜잭션에서 레코드를 COPY로 적재하고 파일별 집계 증분을 반환합니다.
+
+    Returns:
+        list[tuple]: (file_id, source, 새 청크 수, 바이트 차이) 목록(count_new=False면 빈 목록).
+    """
+    table = _quote(table_name)
+    columns = ", ".join(_quote(c) for c in COPY_COLUMNS)
+    if not staging:
+        await conn.copy_records_to_table(
+            table_name, records=records, columns=list(COPY_COLUMNS)
+        )
+        if not count_new:
+            return []
+        # 직접 COPY는 ID 충돌이 없으므로 모든 청크가 새 청크입니다.
+        return [
+            (file_id, source, 1, len(text.encode("utf-8")))
+            for _, text, _, file_id, _, source, _ in records
+        ]
+
+    stage = f"_bulk_{uuid4().hex}"
+    await conn.execute(
+        f"""
+        CREATE TEMP TABLE {_quote(stage)} (
+            langchain_id uuid,
+            content text,
+            embedding {vector_type},
+            file_id text,
+            chunk_index integer,
+            source text,
+            langchain_metadata jsonb
+        ) ON COMMIT DROP
+        """
+    )
+    await conn.copy_records_to_table(stage, records=records, columns=list(COPY_COLUMNS))
+
+    target_columns = columns
+    select_columns = columns
+    updates = [f"{_quote(c)} = EXCLUDED.{_quote(c)}" for c in COPY_COLUMNS[1:]]
+    if tsv_column:
+        lang = f"'{tsv_lang}', " if tsv_lang else ""
+        target_columns += f", {_quote(tsv_column)}"
+        select_columns += f", to_tsvector({lang}content)"
+        updates.append(f"{_quote(tsv_column)} = EXCLUDED.{_quote(tsv_column)}")
+    deltas = []
+    if count_new:
+        deltas = [
+            tuple(row)
+            for row in await conn.fetch(staged_insert_delta_sql(table, _quote(stage)))
+        ]
+    await conn.execute(
+        f"""
+        INSERT INTO {table} ({target_columns})
+        SELECT {select_columns} FROM {_quote(stage)}
+        ON CONFLICT ("langchain_id") DO UPDATE SET {", ".join(updates)}
+        """
+    )
+    return deltas
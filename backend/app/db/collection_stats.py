@@ -0,0 +1,271 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .session import raw_sql
+
+
+# 파일 레지스트리 증분 upsert(같은 파일의 다음 배치는 청크 수/본문 바이트를 더함).
+# inserted(xmax = 0)는 이번 문장이 새로 만든 행만 참입니다. 같은 파일을 동시에 적재하는
+# 트랜잭션은 PK 충돌에서 직렬화되므로 문서 수는 파일당 한 번만 증가합니다.
+_FILES_UPSERT = """
+        ON CONFLICT (collection_id, file_id) DO UPDATE
+        SET chunk_count = collection_files.chunk_count + EXCLUDED.chunk_count,
+            content_bytes = collection_files.content_bytes + EXCLUDED.content_bytes,
+            source = COALESCE(collection_files.source, EXCLUDED.source)
+        RETURNING (xmax = 0) AS inserted
+"""
+
+
+def delete_chunks_sql(table: str, where: str) -> str:
+    """
+    Summary: 청크 삭제와 컬렉션 집계/write_version 갱신을 한 문장으로 만듭니다.
+
+    Contract:
+        - WITH 하위 문장은 모두 삭제 전 스냅샷을 보므로, 파일별 삭제 행 수가 테이블의
+          파일별 행 수와 같으면 그 문서가 사라진 것으로 셉니다.
+        - 삭제된 행이 없으면 collections 행을 갱신하지 않습니다.
+        - 파일 레지스트리는 일부만 지운 파일은 차감하고, 모두 지운 파일은 행을 삭제합니다.
+
+    Args:
+        table: 컬렉션 테이블명.
+        where: 삭제 조건 WHERE 절.
+
+    Returns:
+        str: :collection_id 바인드를 쓰고 deleted 컬럼 한 행을 반환하는 SQL.
+    """
+    return f"""
+    WITH deleted AS (
+        DELETE FROM {table}
+        WHERE {where}
+        RETURNING file_id, octet_length(content) AS bytes
+    ),
+    per_file AS (
+        SELECT file_id, COUNT(*) AS n, SUM(bytes) AS bytes
+        FROM deleted
+        WHERE file_id IS NOT NULL
+        GROUP BY file_id
+    ),
+    remaining AS (
+        SELECT file_id, COUNT(*) AS n
+        FROM {table}
+        WHERE file_id IN (SELECT file_id FROM per_file)
+        GROUP BY file_id
+    ),
+    stats AS (
+        SELECT
+            (SELECT COUNT(*) FROM deleted) AS chunks,
+            (SELECT COALESCE(SUM(bytes), 0) FROM deleted) AS bytes,
+            (
+                SELECT COUNT(*)
+                FROM per_file AS p JOIN remaining AS r USING (file_id)
+                WHERE p.n >= r.n
+            ) AS documents
+    ),
+    files_trimmed AS (
+        UPDATE collection_files AS f
+        SET chunk_count = GREATEST(f.chunk_count - p.n, 0),
+            content_bytes = GREATEST(f.content_bytes - p.bytes, 0)
+        FROM per_file AS p JOIN remaining AS r USING (file_id)
+        WHERE f.collection_id = :collection_id AND f.file_id = p.file_id AND p.n < r.n
+    ),
+    files_removed AS (
+        DELETE FROM collection_files AS f
+        USING per_file AS p JOIN remaining AS r USING (file_id)
+        WHERE f.collection_id = :collection_id AND f.file_id = p.file_id AND p.n >= r.n
+    ),
+    bumped AS (
+        UPDATE collections AS c
+        SET chunk_count = GREATEST(c.chunk_count - stats.chunks, 0),
+            document_count = GREATEST(c.document_count - stats.documents, 0),
+            content_bytes = GREATEST(c.content_bytes - stats.bytes, 0),
+            write_version = c.write_version + 1
+        FROM stats
+        WHERE c.id = :collection_id AND stats.chunks > 0
+        RETURNING c.write_version
+    )
+    SELECT chunks AS deleted FROM stats
+    """
+
+
+def staged_insert_delta_sql(table: str, stage: str) -> str:
+    """
+    Summary: 임시 테이블의 청크를 넣기 직전 파일별 집계 증분(새 청크 수/바이트 차이)을 구하는 SQL을 만듭니다.
+
+    Contract:
+        - 같은 ID가 이미 있으면(덮어쓰기) 청크 수는 그대로, 바이트는 차이만 셉니다.
+        - 적재와 같은 트랜잭션에서 INSERT 전에 실행해야 합니다(갱신 전 행과 비교).
+        - collections/collection_files는 건드리지 않습니다. 결과를 적재 커밋 후
+          direct_insert_stats_sql로 반영해 카운터 행 잠금을 적재 트랜잭션 밖에서 짧게 잡습니다.
+
+    Args:
+        table: 컬렉션 테이블명(인용 포함).
+        stage: 임시 테이블명(인용 포함).
+
+    Returns:
+        str: file_id/source/chunks/bytes 행(file_id가 NULL인 청크는 한 행)을 반환하는 SQL.
+    """
+    return f"""
+    SELECT s.file_id, MAX(s.source) AS source,
+        COUNT(*) FILTER (WHERE t.langchain_id IS NULL) AS chunks,
+        COALESCE(SUM(octet_length(s.content) - COALESCE(octet_length(t.content), 0)), 0)
+            AS bytes
+    FROM {stage} AS s
+    LEFT JOIN {table} AS t ON t.langchain_id = s.langchain_id
+    GROUP BY s.file_id
+    """
+
+
+def direct_insert_stats_sql() -> str:
+    """
+    Summary: 적재한 청크만큼 컬렉션 집계/파일 레지스트리/write_version을 증분 갱신하는 SQL을
+    만듭니다.
+
+    Contract:
+        - 적재 트랜잭션이 커밋된 뒤 단독 문장으로 실행합니다(collections 행 잠금을 짧게 유지).
+        - 레지스트리 행을 새로 만든 파일만 새 문서로 셉니다.
+
+    Returns:
+        str: $1(컬렉션 ID), $2(청크 수), $3(바이트), 파일별 $4(file_id text[]),
+        $5(source text[]), $6(청크 수 bigint[]), $7(바이트 bigint[]) 바인드를 쓰는 SQL.
+    """
+    return f"""
+    WITH files AS (
+        INSERT INTO collection_files
+            (collection_id, file_id, source, chunk_count, content_bytes)
+        SELECT $1, f.file_id, f.source, f.chunks, f.bytes
+        FROM unnest($4::text[], $5::text[], $6::bigint[], $7::bigint[])
+            AS f(file_id, source, chunks, bytes)
+        {_FILES_UPSERT}
+    )
+    UPDATE collections AS c
+    SET chunk_count = c.chunk_count + $2,
+        content_bytes = c.content_bytes + $3,
+        document_count = c.document_count + (SELECT COUNT(*) FROM files WHERE inserted),
+        write_version = c.write_version + 1
+    WHERE c.id = $1
+    """
+
+
+async def refresh_collection_stats(
+    session: AsyncSession, collection, *, bump_version: bool = False
+) -> dict[str, Any] | None:
+    """
+    Summary: 컬렉션 테이블을 전체 집계해 collections 행의 청크/문서/바이트 수를 바로잡습니다.
+
+    Contract:
+        - 집계와 갱신은 한 문장으로 실행하며 호출자가 커밋합니다.
+        - 파일 레지스트리도 파일별 재집계로 맞추고 청크가 없는 파일 행은 지웁니다.
+        - bump_version=True면 write_version도 올립니다(집계를 유지하지 못한 쓰기 경로용).
+        - 테이블이 없으면 None을 반환합니다.
+
+    Args:
+        session: DB 세션.
+        collection: 컬렉션 엔티티(id, table_name).
+        bump_version: write_version 증가 여부.
+
+    Returns:
+        dict | None: 갱신 전/후 집계(before_*/chunk_count/document_count/content_bytes).
+
+    Side Effects:
+        - 컬렉션 테이블 전체 스캔
+        - collections 행 갱신
+    """
+    exists = await raw_sql(
+        session,
+        "SELECT to_regclass(:table) IS NOT NULL AS exists",
+        {"table": collection.table_name},
+        one=True,
+    )
+    if not exists or not exists["exists"]:
+        return None
+    row = await raw_sql(
+        session,
+        f"""
+        WITH actual AS (
+            SELECT COUNT(*) AS chunks,
+                COUNT(DISTINCT file_id) AS documents,
+                COALESCE(SUM(octet_length(content)), 0) AS bytes
+            FROM {collection.table_name}
+        ),
+        before AS (
+            SELECT chunk_count, document_count, content_bytes
+            FROM collections WHERE id = :collection_id
+        ),
+        files AS (
+            INSERT INTO collection_files
+                (collection_id, file_id, source, chunk_count, content_bytes)
+            SELECT :collection_id, file_id, MAX(source), COUNT(*),
+                COALESCE(SUM(octet_length(content)), 0)
+            FROM {collection.table_name}
+            WHERE file_id IS NOT NULL
+            GROUP BY file_id
+            ON CONFLICT (collection_id, file_id) DO UPDATE
+            SET chunk_count = EXCLUDED.chunk_count,
+                content_bytes = EXCLUDED.content_bytes,
+                source = COALESCE(collection_files.source, EXCLUDED.source)
+        ),
+        orphans AS (
+            DELETE FROM collection_files AS f
+            WHERE f.collection_id = :collection_id
+              AND NOT EXISTS (
+                  SELECT 1 FROM {collection.table_name} AS x WHERE x.file_id = f.file_id
+              )
+        )
+        UPDATE collections AS c
+        SET chunk_count = actual.chunks,
+            document_count = actual.documents,
+            content_bytes = actual.bytes,
+            stats_reconciled_at = now(),
+            write_version = c.write_version + CASE WHEN :bump THEN 1 ELSE 0 END
+        FROM actual, before
+        WHERE c.id = :collection_id
+        RETURNING before.chunk_count AS before_chunk_count,
+            before.document_count AS before_document_count,
+            before.content_bytes AS before_content_bytes,
+            c.chunk_count, c.document_count, c.content_bytes
+        """,
+        {"collection_id": collection.id, "bump": bump_version},
+        one=True,
+    )
+    return dict(row) if row else None
+
+
+async def record_file_uploads(
+    session: AsyncSession, collection_id, uploads: dict[str, tuple[str, int]]
+) -> None:
+    """
+    Summary: 적재가 끝난 파일의 원본 sha256과 업로드 크기를 파일 레지스트리에 기록합니다.
+
+    Contract:
+        - content_bytes는 청크 본문 합계(겹침 포함)라 원본 크기가 아니므로 file_size를 따로 둡니다.
+
+    Args:
+        session: DB 세션.
+        collection_id: 컬렉션 ID.
+        uploads: file_id → (sha256 hex, 원본 바이트 수).
+
+    Side Effects:
+        - collection_files 갱신 및 commit
+    """
+    if not uploads:
+        return
+    await raw_sql(
+        session,
+        """
+        UPDATE collection_files AS f
+        SET content_hash = u.content_hash, file_size = u.file_size
+        FROM unnest(
+            CAST(:file_ids AS text[]),
+            CAST(:hashes AS text[]),
+            CAST(:sizes AS bigint[])
+        ) AS u(file_id, content_hash, file_size)
+        WHERE f.collection_id = :collection_id AND f.file_id = u.file_id
+        """,
+        {
+            "collection_id": collection_id,
+            "file_ids": list(uploads),
+            "hashes": [h for h, _ in uploads.values()],
+            "sizes": [size for _, size in uploads.values()],
+        },
+    )
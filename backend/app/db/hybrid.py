@@ -0,0 +1,160 @@
+from typing import Any, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+
+from .search_sql import (
+    RESULT_COLUMNS,
+    apply_query_options,
+    distance_sql,
+    filter_clause,
+    query_vector_sql,
+    row_to_result,
+    vector_literal,
+)
+from .session import raw_sql
+from .vector import vector_query_options
+
+
+def hybrid_search_sql(collection, where: str, tsv_column: str) -> str:
+    """
+    Summary: 벡터 top-k와 전문 검색 top-k를 RRF로 합치는 단일 SQL을 만듭니다.
+
+    Contract:
+        - semantic CTE는 ORDER BY 거리 LIMIT 형태로 벡터 인덱스를 사용합니다.
+        - keyword CTE는 tsv_column @@ websearch_to_tsquery로 GIN 인덱스를 사용합니다.
+        - 두 CTE를 FULL JOIN해 한쪽에만 있는 청크도 후보에 남깁니다.
+
+    Args:
+        collection: 컬렉션 엔티티.
+        where: 메타데이터 필터 WHERE 절.
+        tsv_column: 전문 검색 tsvector 컬럼명.
+
+    Returns:
+        str: :q/:text/:cfg/:fetch/:k/:w_semantic/:w_keyword/:rrf_k 바인드를 쓰는 SQL.
+    """
+    table = collection.table_name
+    fn, op = distance_sql(collection)
+    query_vec = query_vector_sql(collection)
+    columns = ", ".join(f't."{c}"' for c in RESULT_COLUMNS)
+    return f"""
+    WITH semantic AS (
+        SELECT langchain_id, distance, ROW_NUMBER() OVER (ORDER BY ord) AS rank
+        FROM (
+            SELECT langchain_id,
+                {fn}(embedding, {query_vec}) AS distance,
+                embedding {op} {query_vec} AS ord
+            FROM {table}
+            WHERE {where}
+            ORDER BY embedding {op} {query_vec}
+            LIMIT :fetch
+        ) AS s
+    ),
+    keyword AS (
+        SELECT langchain_id, text_score, ROW_NUMBER() OVER (ORDER BY text_score DESC) AS rank
+        FROM (
+            SELECT langchain_id, ts_rank_cd({tsv_column}, qs) AS text_score
+            FROM {table}, websearch_to_tsquery(CAST(:cfg AS regconfig), :text) AS qs
+            WHERE {tsv_column} @@ qs AND {where}
+            ORDER BY text_score DESC
+            LIMIT :fetch
+        ) AS kw
+    ),
+    fused AS (
+        SELECT langchain_id,
+            COALESCE(CAST(:w_semantic AS float8) / (:rrf_k + semantic.rank), 0)
+            + COALESCE(CAST(:w_keyword AS float8) / (:rrf_k + keyword.rank), 0) AS rrf_score,
+            semantic.distance AS semantic_score,
+            keyword.text_score AS keyword_score
+        FROM semantic FULL OUTER JOIN keyword USING (langchain_id)
+        ORDER BY rrf_score DESC
+        LIMIT :k
+    )
+    SELECT {columns}, f.rrf_score, f.semantic_score, f.keyword_score
+    FROM fused AS f
+    JOIN {table} AS t ON t.langchain_id = f.langchain_id
+    ORDER BY f.rrf_score DESC
+    """
+
+
+async def hybrid_search(
+    session: AsyncSession,
+    collection,
+    embedding: Sequence[float] | str,
+    query: str,
+    *,
+    k: int,
+    fts_config: str,
+    tsv_column: str,
+    filter: dict | None = None,
+    semantic_weight: float | None = None,
+    keyword_weight: float | None = None,
+) -> list[dict[str, Any]] | None:
+    """
+    Summary: 벡터/전문 검색 신호를 RRF(가중치 적용)로 합친 결과를 한 번의 조회로 반환합니다.
+
+    Contract:
+        - 신호별 후보는 k + HYBRID_FETCH_MARGIN개만 가져옵니다.
+        - score는 RRF 점수(클수록 관련), semantic_score는 거리, keyword_score는 ts_rank_cd입니다.
+        - 벡터 인덱스 검색 옵션(ef_search/probes)은 현재 트랜잭션에만 적용합니다.
+        - 지원하지 않는 필터면 None을 반환합니다(호출자가 벡터스토어 검색으로 대체).
+
+    Args:
+        session: DB 세션.
+        collection: 컬렉션 엔티티.
+        embedding: 질의 벡터(또는 pgvector 텍스트 표현).
+        query: 검색어.
+        k: 반환 개수.
+        fts_config: 전문 검색 설정(simple/english).
+        tsv_column: 전문 검색 tsvector 컬럼명.
+        filter: 메타데이터 필터(동등 비교만).
+        semantic_weight: 벡터 신호 가중치(미지정 시 설정값).
+        keyword_weight: 전문 검색 신호 가중치(미지정 시 설정값).
+
+    Returns:
+        list[dict] | None: id/page_content/metadata/score/semantic_score/keyword_score 목록.
+
+    Side Effects:
+        - DB 조회(세션 트랜잭션 로컬 설정)
+    """
+    clause = filter_clause(filter)
+    if clause is None:
+        return None
+    where, params = clause
+    fetch = k + max(0, settings.hybrid_fetch_margin)
+    await apply_query_options(session, vector_query_options(collection, fetch))
+    rows = await raw_sql(
+        session,
+        hybrid_search_sql(collection, where, tsv_column),
+        {
+            **params,
+            "q": vector_literal(embedding),
+            "text": query,
+            "cfg": fts_config,
+            "fetch": fetch,
+            "k": k,
+            "w_semantic": (
+                settings.hybrid_semantic_weight
+                if semantic_weight is None
+                else semantic_weight
+            ),
+            "w_keyword": (
+                settings.hybrid_keyword_weight
+                if keyword_weight is None
+                else keyword_weight
+            ),
+            "rrf_k": settings.hybrid_rrf_k,
+        },
+    )
+    results = []
+    for row in rows:
+        result = row_to_result(row, score_column="rrf_score")
+        result["semantic_score"] = (
+            float(row["semantic_score"]) if row["semantic_score"] is not None else None
+        )
+        result["keyword_score"] = (
+            float(row["keyword_score"]) if row["keyword_score"] is not None else None
+        )
+        results.append(result)
+    return results
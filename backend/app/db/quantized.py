@@ -0,0 +1,137 @@
+from typing import Any, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+
+from .search_sql import (
+    RESULT_COLUMNS,
+    distance_sql,
+    filter_clause,
+    query_vector_sql,
+    row_to_result,
+    vector_literal,
+)
+from .session import raw_sql
+from .vector import _index_policy, binary_quantize_expr
+
+# hnsw.ef_search 상한(pgvector)
+MAX_SHORTLIST = 1000
+
+
+def shortlist_size(collection, k: int) -> int:
+    factor = int(
+        _index_policy(collection)[1].get("rerank_factor")
+        or settings.vector_bq_rerank_factor
+    )
+    return min(MAX_SHORTLIST, max(k, k * max(1, factor)))
+
+
+def quantized_search_sql(collection, where: str) -> str:
+    """
+    Summary: bit 인덱스로 후보를 뽑고 원본 벡터 거리로 재정렬하는 단일 SQL을 만듭니다.
+
+    Args:
+        collection: 컬렉션 엔티티.
+        where: WHERE 절.
+
+    Returns:
+        str: :q(질의 벡터 문자열), :shortlist, :k 바인드를 쓰는 SQL.
+    """
+    fn, op = distance_sql(collection)
+    query_vec = query_vector_sql(collection)
+    columns = ", ".join(f'"{c}"' for c in RESULT_COLUMNS)
+    return f"""
+    SELECT {columns}, {fn}(embedding, {query_vec}) AS distance
+    FROM (
+        SELECT {columns}, embedding
+        FROM {collection.table_name}
+        WHERE {where}
+        ORDER BY {binary_quantize_expr(collection)} <~> {binary_quantize_expr(collection, query_vec)}
+        LIMIT :shortlist
+    ) AS shortlist
+    ORDER BY embedding {op} {query_vec}
+    LIMIT :k
+    """
+
+
+def exact_search_sql(collection, where: str = "TRUE") -> str:
+    """
+    Why: 재현율 평가 기준(순차 스캔 정확 검색)으로 쓰는 SQL입니다.
+    """
+    fn, op = distance_sql(collection)
+    query_vec = query_vector_sql(collection)
+    columns = ", ".join(f'"{c}"' for c in RESULT_COLUMNS)
+    return f"""
+    SELECT {columns}, {fn}(embedding, {query_vec}) AS distance
+    FROM {collection.table_name}
+    WHERE {where}
+    ORDER BY embedding {op} {query_vec}
+    LIMIT :k
+    """
+
+
+async def quantized_search(
+    session: AsyncSession,
+    collection,
+    embedding: Sequence[float] | str,
+    *,
+    k: int,
+    filter: dict | None = None,
+) -> list[dict[str, Any]] | None:
+    """
+    Summary: 이진 양자화 1차 검색 + 원본 정밀도 재정렬을 한 SQL로 실행합니다.
+
+    Contract:
+        - 1차 후보 수는 k * rerank_factor(최대 1000)이며, hnsw.ef_search를 같은 값 이상으로
+          현재 트랜잭션에만 설정합니다.
+        - 지원하지 않는 필터면 None을 반환합니다(호출자가 일반 검색으로 대체).
+        - 결과 형식/점수는 벡터스토어 검색과 같습니다(거리, 작을수록 유사).
+
+    Args:
+        session: DB 세션.
+        collection: 컬렉션 엔티티.
+        embedding: 질의 벡터(또는 pgvector 텍스트 표현).
+        k: 반환 개수.
+        filter: 메타데이터 필터(동등 비교만).
+
+    Returns:
+        list[dict] | None: id/page_content/metadata/score 목록.
+
+    Side Effects:
+        - DB 조회(세션 트랜잭션 로컬 설정)
+    """
+    clause = filter_clause(filter)
+    if clause is None:
+        return None
+    where, params = clause
+    shortlist = shortlist_size(collection, k)
+    await raw_sql(
+        session,
+        "SELECT set_config('hnsw.ef_search', :ef, true)",
+        {"ef": str(max(shortlist, settings.vector_hnsw_ef_search))},
+    )
+    rows = await raw_sql(
+        session,
+        quantized_search_sql(collection, where),
+        {**params, "q": vector_literal(embedding), "shortlist": shortlist, "k": k},
+    )
+    return [row_to_result(r) for r in rows]
+
+
+async def exact_search(
+    session: AsyncSession, collection, embedding: Sequence[float] | str, *, k: int
+) -> list[dict[str, Any]]:
+    """
+    Summary: 인덱스를 끄고 순차 스캔으로 정확한 top-k를 구합니다(평가 기준).
+
+    Side Effects:
+        - DB 조회(세션 트랜잭션 로컬 설정)
+    """
+    await raw_sql(session, "SELECT set_config('enable_indexscan', 'off', true)")
+    rows = await raw_sql(
+        session,
+        exact_search_sql(collection),
+        {"q": vector_literal(embedding), "k": k},
+    )
+    return [row_to_result(r) for r in rows]
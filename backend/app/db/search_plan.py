@@ -0,0 +1,280 @@
+import json
+import math
+from dataclasses import dataclass, field
+
+from langchain_postgres.v2.indexes import QueryOptions
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+from app.utils.cache import LRUCache
+
+from .search_sql import filter_clause
+from .session import raw_sql
+from .vector import _index_policy, _ivf_lists, has_vector_index
+
+# (테이블명, 필터 JSON) → (선택도, 테이블 행 수 추정)
+SelectivityKey = tuple[str, str]
+selectivity_cache: LRUCache[SelectivityKey, tuple[float, float]] = LRUCache(
+    "filter_selectivity",
+    maxsize=settings.search_plan_cache_size,
+    ttl=settings.search_plan_cache_ttl_sec,
+)
+
+# 테이블명 → 실제 IVFFlat 인덱스의 lists(빌드 시 행 수로 계산된 값)
+ivf_lists_cache: LRUCache[str, int] = LRUCache(
+    "ivf_lists",
+    maxsize=settings.search_plan_cache_size,
+    ttl=settings.search_plan_cache_ttl_sec,
+)
+
+# 테이블명 → 후보 확대 배수(결과가 모자라면 늘리고 충분하면 서서히 줄임)
+_ADAPT: dict[str, float] = {}
+
+# 선택도 하한(추정치가 0에 가까울 때 ef_search 폭주 방지)
+MIN_SELECTIVITY = 1e-4
+MAX_ADAPT = 8.0
+MAX_EF_SEARCH = 1000
+MAX_PROBES = 1000
+
+_iterative_supported: bool | None = None
+
+
+@dataclass
+class PlannedQueryOptions(QueryOptions):
+    """
+    Summary: 계획된 GUC 목록을 PGVectorStore index_query_options로 전달합니다(SET LOCAL).
+    """
+
+    parameters: tuple[str, ...] = ()
+
+    def to_parameter(self) -> list[str]:
+        return list(self.parameters)
+
+    def to_string(self) -> str:
+        return ", ".join(self.parameters)
+
+
+@dataclass
+class SearchPlan:
+    """
+    Summary: 벡터 검색 한 번의 후보 수와 인덱스 검색 옵션입니다.
+
+    Contract:
+        - parameters는 "이름 = 값" 형식이며 검색 트랜잭션에만 적용됩니다.
+        - iterative면 결과 순서가 느슨할 수 있어 호출자가 거리로 다시 정렬합니다.
+    """
+
+    table: str
+    k: int
+    selectivity: float = 1.0
+    rows: float = 0.0
+    iterative: bool = False
+    filtered: bool = False
+    parameters: tuple[str, ...] = field(default_factory=tuple)
+
+    def query_options(self) -> QueryOptions | None:
+        return PlannedQueryOptions(self.parameters) if self.parameters else None
+
+
+async def iterative_scan_supported(session: AsyncSession) -> bool:
+    """
+    Why: 반복 인덱스 스캔(hnsw/ivfflat.iterative_scan)은 pgvector 0.8.0부터 지원됩니다.
+
+    Side Effects:
+        - 최초 1회 DB 조회(pg_extension)
+    """
+    global _iterative_supported
+    if not settings.vector_iterative_scan:
+        return False
+    if _iterative_supported is None:
+        row = await raw_sql(
+            session,
+            "SELECT extversion FROM pg_extension WHERE extname = 'vector'",
+            one=True,
+        )
+        version = tuple(
+            int(part) for part in (row["extversion"] if row else "0").split(".")[:2]
+        )
+        _iterative_supported = version >= (0, 8)
+    return _iterative_supported
+
+
+async def estimate_selectivity(
+    session: AsyncSession, table: str, filter: dict | None
+) -> tuple[float, float]:
+    """
+    Summary: 필터가 통과시킬 행 비율을 Postgres 통계(EXPLAIN 추정 행 수)로 추정합니다.
+
+    Contract:
+        - 쿼리를 실행하지 않고 플래너 추정치만 사용합니다.
+        - 연산자 필터나 통계가 없는 테이블은 settings.search_default_selectivity를 씁니다.
+        - (테이블, 필터)별 결과를 TTL 동안 캐시합니다.
+
+    Args:
+        session: DB 세션.
+        table: 컬렉션 테이블명.
+        filter: 메타데이터 필터.
+
+    Returns:
+        tuple[float, float]: (선택도 0~1, 테이블 행 수 추정).
+
+    Side Effects:
+        - DB 카탈로그 조회/EXPLAIN
+    """
+    key = (table, json.dumps(filter or {}, sort_keys=True, default=str))
+    cached = selectivity_cache.get(key)
+    if cached is not None:
+        return cached
+    row = await raw_sql(
+        session,
+        "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)",
+        {"table": table},
+        one=True,
+    )
+    rows = float(row["reltuples"]) if row and row["reltuples"] else 0.0
+    selectivity = 1.0
+    if filter:
+        clause = filter_clause(filter)
+        if clause is None or rows <= 0:
+            selectivity = settings.search_default_selectivity
+        else:
+            where, params = clause
+            plan = await raw_sql(
+                session,
+                f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {where}",
+                params,
+                one=True,
+            )
+            document = plan["QUERY PLAN"]
+            if isinstance(document, str):
+                document = json.loads(document)
+            estimated = float(document[0]["Plan"]["Plan Rows"])
+            selectivity = estimated / rows
+    result = (min(1.0, max(MIN_SELECTIVITY, selectivity)), max(rows, 0.0))
+    selectivity_cache.put(key, result)
+    return result
+
+
+async def ivf_index_lists(session: AsyncSession, table: str) -> int | None:
+    """
+    Summary: 테이블 IVFFlat 인덱스가 실제로 빌드된 lists 값을 반환합니다(없으면 None).
+
+    Contract:
+        - lists 지정값이 없으면 빌드 시 행 수로 계산되므로 인덱스 reloptions에서 읽습니다.
+        - 결과를 TTL 동안 캐시합니다(재색인 후에는 TTL 안에 반영).
+
+    Side Effects:
+        - DB 카탈로그 조회(캐시 미스 시)
+    """
+    cached = ivf_lists_cache.get(table)
+    if cached is not None:
+        return cached
+    row = await raw_sql(
+        session,
+        "SELECT c.reloptions FROM pg_class c WHERE c.oid = to_regclass(:index)",
+        {"index": f"idx_{table}_vec_ivf"},
+        one=True,
+    )
+    for option in (row["reloptions"] or []) if row else []:
+        name, _, value = option.partition("=")
+        if name == "lists" and value.isdigit():
+            ivf_lists_cache.put(table, int(value))
+            return int(value)
+    return None
+
+
+def _clamp(value: float, low: int, high: int) -> int:
+    return int(min(high, max(low, math.ceil(value))))
+
+
+async def plan_vector_search(
+    session: AsyncSession, collection, *, limit: int, filter: dict | None = None
+) -> SearchPlan:
+    """
+    Summary: limit, 필터 선택도, 관측된 결과 충족률로 후보 수와 ef_search/probes를 정합니다.
+
+    Contract:
+        - 후보 수는 limit 그대로입니다(고정 100건 과다 조회 없음).
+        - HNSW ef_search는 max(기본값, 2 * limit)에서 시작합니다.
+        - 필터가 있으면 반복 인덱스 스캔(relaxed_order)을 켜고, 지원하지 않으면
+          ef_search/probes를 선택도에 반비례해 키웁니다.
+        - 최근 필터 검색이 limit을 못 채우면 배수를 늘립니다(record_search_outcome).
+        - 벡터 인덱스가 없으면(none 또는 차원 초과) 옵션 없이 정확 검색합니다.
+        - IVFFlat probes 상한은 지정 lists, 없으면 실제 인덱스의 lists(빌드 시 계산값)입니다.
+
+    Args:
+        session: DB 세션.
+        collection: 컬렉션 엔티티.
+        limit: 반환 개수.
+        filter: 메타데이터 필터.
+
+    Returns:
+        SearchPlan: 검색 계획.
+
+    Side Effects:
+        - DB 통계 조회(캐시 미스 시)
+    """
+    table = collection.table_name
+    plan = SearchPlan(table=table, k=limit, filtered=bool(filter))
+    if not has_vector_index(collection):
+        return plan
+    if filter:
+        plan.selectivity, plan.rows = await estimate_selectivity(session, table, filter)
+        plan.iterative = await iterative_scan_supported(session)
+    adapt = _ADAPT.get(table, 1.0) if filter else 1.0
+    strategy, params = _index_policy(collection)
+
+    if strategy == "hnsw":
+        ef = max(
+            int(params.get("ef_search") or settings.vector_hnsw_ef_search), 2 * limit
+        )
+        ef *= adapt
+        parameters = []
+        if filter and plan.iterative:
+            parameters += [
+                "hnsw.iterative_scan = relaxed_order",
+                f"hnsw.max_scan_tuples = {int(settings.vector_max_scan_tuples * adapt)}",
+            ]
+        elif filter:
+            ef /= plan.selectivity
+        plan.parameters = (
+            f"hnsw.ef_search = {_clamp(ef, limit, MAX_EF_SEARCH)}",
+            *parameters,
+        )
+        return plan
+
+    lists = (
+        int(params.get("lists") or 0)
+        or await ivf_index_lists(session, table)
+        or _ivf_lists(int(plan.rows))
+        or MAX_PROBES
+    )
+    probes = int(params.get("probes") or settings.vector_ivfflat_probes) * adapt
+    parameters = []
+    if filter and plan.iterative:
+        parameters += [
+            "ivfflat.iterative_scan = relaxed_order",
+            f"ivfflat.max_probes = {_clamp(probes * 4, 1, lists)}",
+        ]
+    elif filter:
+        probes /= plan.selectivity
+    plan.parameters = (f"ivfflat.probes = {_clamp(probes, 1, lists)}", *parameters)
+    return plan
+
+
+def record_search_outcome(plan: SearchPlan, returned: int) -> None:
+    """
+    Summary: 필터 검색이 요청 개수를 채웠는지로 다음 계획의 후보 확대 배수를 조정합니다.
+
+    Contract:
+        - 통계상 일치 행이 limit 이상인데 덜 받았으면 배수를 2배(최대 8)로 늘립니다.
+        - 채웠으면 배수를 10%씩 줄여 1로 돌아갑니다.
+    """
+    if not plan.filtered:
+        return
+    current = _ADAPT.get(plan.table, 1.0)
+    expected = plan.rows * plan.selectivity
+    if returned < plan.k and expected >= plan.k:
+        _ADAPT[plan.table] = min(MAX_ADAPT, current * 2)
+    elif current > 1.0:
+        _ADAPT[plan.table] = max(1.0, current * 0.9)
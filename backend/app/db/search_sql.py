@@ -0,0 +1,149 @@
+import json
+from typing import Any, Sequence
+
+from langchain_postgres.v2.indexes import QueryOptions
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .session import raw_sql
+from .vector import _metric, get_metadata_columns, vector_type
+
+# 결과 컬럼(임베딩 제외)
+RESULT_COLUMNS = (
+    "langchain_id",
+    "content",
+    "file_id",
+    "chunk_index",
+    "source",
+    "langchain_metadata",
+)
+
+
+def distance_sql(collection) -> tuple[str, str]:
+    """
+    Why: PGVectorStore와 같은 거리 함수(점수)와 연산자(정렬)를 사용합니다.
+
+    Returns:
+        tuple[str, str]: (거리 함수명, 정렬 연산자).
+    """
+    metric = _metric(collection)
+    if metric in ("l2", "euclidean"):
+        return "l2_distance", "<->"
+    if metric in ("ip", "inner", "inner_product", "dot"):
+        return "inner_product", "<#>"
+    return "cosine_distance", "<=>"
+
+
+def normalized_similarity(collection, score: float | None) -> float | None:
+    """
+    Summary: 거리 지표별 점수를 0~1 유사도(클수록 관련)로 바꿔 컬렉션 간 비교가 가능하게 합니다.
+
+    Contract:
+        - cosine 거리(0~2)는 1 - d/2, l2 거리는 1/(1 + d)로 바꿉니다.
+        - 내적(inner_product 값, 클수록 유사)은 (1 + ip)/2를 0~1로 자릅니다(정규화 벡터 기준).
+
+    Args:
+        collection: 컬렉션 엔티티.
+        score: distance_sql 함수의 점수.
+
+    Returns:
+        float | None: 정규화 유사도(점수가 없으면 None).
+    """
+    if score is None:
+        return None
+    fn, _ = distance_sql(collection)
+    if fn == "l2_distance":
+        return 1.0 / (1.0 + max(0.0, score))
+    if fn == "inner_product":
+        return min(1.0, max(0.0, (1.0 + score) / 2))
+    return min(1.0, max(0.0, 1.0 - score / 2))
+
+
+def query_vector_sql(collection) -> str:
+    """
+    Why: 질의 벡터 파라미터를 컬럼 저장 타입(vector/halfvec)으로 명시 캐스팅합니다.
+    """
+    return f"CAST(:q AS {vector_type(collection)})"
+
+
+def filter_clause(filter: dict | None) -> tuple[str, dict[str, Any]] | None:
+    """
+    Summary: 단순 동등 비교 필터를 SQL WHERE 절로 바꿉니다.
+
+    Contract:
+        - 메타데이터 컬럼(file_id/chunk_index/source)은 컬럼 비교, 나머지는 jsonb 포함(@>)으로 처리합니다.
+        - 연산자 필터($in 등 dict/list 값)는 지원하지 않아 None을 반환합니다.
+
+    Args:
+        filter: 메타데이터 필터.
+
+    Returns:
+        tuple[str, dict] | None: (WHERE 절, 바인드 파라미터) 또는 미지원 시 None.
+    """
+    if not filter:
+        return "TRUE", {}
+    columns = {c.name for c in get_metadata_columns()}
+    clauses, params, extra = [], {}, {}
+    for i, (key, value) in enumerate(filter.items()):
+        if isinstance(value, (dict, list)) or key.startswith("$"):
+            return None
+        if key in columns:
+            clauses.append(f'"{key}" = :f{i}')
+            params[f"f{i}"] = str(value) if key != "chunk_index" else int(value)
+        else:
+            extra[key] = value
+    if extra:
+        clauses.append("langchain_metadata @> CAST(:f_json AS jsonb)")
+        params["f_json"] = json.dumps(extra, ensure_ascii=False)
+    return " AND ".join(clauses), params
+
+
+def vector_literal(embedding: Sequence[float] | str) -> str:
+    if isinstance(embedding, str):
+        return embedding
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+
+
+def row_to_result(row, score_column: str = "distance") -> dict[str, Any]:
+    """
+    Summary: 검색 결과 행을 벡터스토어 검색과 같은 dict 형태로 바꿉니다.
+
+    Contract:
+        - 메타데이터 컬럼 값은 JSON 메타데이터에 합칩니다(PGVectorStore와 동일).
+    """
+    metadata = row["langchain_metadata"]
+    if not isinstance(metadata, dict):
+        metadata = json.loads(metadata) if metadata else {}
+    metadata = dict(metadata)
+    for column in ("file_id", "chunk_index", "source"):
+        if row[column] is not None:
+            metadata[column] = row[column]
+    score = row[score_column]
+    return {
+        "id": str(row["langchain_id"]),
+        "page_content": row["content"],
+        "metadata": metadata,
+        "score": float(score) if score is not None else None,
+    }
+
+
+async def apply_query_options(
+    session: AsyncSession, options: QueryOptions | None
+) -> None:
+    """
+    Summary: hnsw.ef_search/ivfflat.probes 등 검색 옵션을 현재 트랜잭션에만 적용합니다.
+
+    Contract:
+        - set_config(..., true)는 행을 반환하므로 raw_sql이 커밋하지 않습니다.
+
+    Side Effects:
+        - DB 세션 트랜잭션 로컬 설정
+    """
+    if options is None:
+        return
+    for parameter in options.to_parameter():
+        name, value = (part.strip() for part in parameter.split("=", 1))
+        await raw_sql(
+            session,
+            "SELECT set_config(:name, :value, true)",
+            {"name": name, "value": value},
+        )
@@ -1,15 +1,31 @@
+import copy
 import logging
+import math
 from uuid import uuid4
 
 from langchain_postgres import PGVectorStore, Column
 from langchain_postgres.v2.hybrid_search_config import HybridSearchConfig
+from langchain_postgres.v2.indexes import (
+    HNSWQueryOptions,
+    IVFFlatQueryOptions,
+    QueryOptions,
+)
 from asyncpg.exceptions import DuplicateTableError
 from sqlalchemy import text
 
+from app.core import settings
+from app.utils.cache import LRUCache
+
 from .session import pg_engine, engine
 
 logger = logging.getLogger(__name__)
 
+# (테이블명, 하이브리드 여부) → 스키마 조회가 끝난 PGVectorStore 원본
+VectorStoreKey = tuple[str, bool]
+vectorstore_cache: LRUCache[VectorStoreKey, PGVectorStore] = LRUCache(
+    "vectorstores", maxsize=settings.vectorstore_cache_size
+)
+
 
 async def _exec_many_ddl(stmts: list[str]) -> None:
     async with engine.begin() as conn:  # 트랜잭션 내 DDL (CONCURRENTLY 제외)
@@ -17,6 +33,59 @@ async def _exec_many_ddl(stmts: list[str]) -> None:
             await conn.execute(text(s))
 
 
+async def _embedding_column_type(table: str) -> str | None:
+    """
+    Why: 기존 테이블의 임베딩 컬럼 타입(예: "halfvec(1024)")을 확인해 불필요한 타입 변경을 피합니다.
+    """
+    async with engine.connect() as conn:
+        return await conn.scalar(
+            text(
+                "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+                "WHERE attrelid = to_regclass(:table) AND attname = 'embedding' "
+                "AND NOT attisdropped"
+            ),
+            {"table": table},
+        )
+
+
+# 저장 타입별 ANN 인덱스 최대 차원(pgvector 제한)
+INDEX_MAX_DIMENSIONS = {"vector": 2000, "halfvec": 4000}
+
+# halfvec로 저장할 임베딩 스펙 dtype 값
+HALFVEC_DTYPES = ("halfvec", "float16", "fp16")
+
+
+def storage_type_for(spec) -> str:
+    """
+    Summary: 임베딩 스펙으로 컬렉션 임베딩 컬럼 타입(vector/halfvec)을 정합니다.
+
+    Contract:
+        - dtype이 halfvec 계열이고 4000차원 이하이면 halfvec을 씁니다.
+        - dtype이 없거나 float32여도 vector로는 ANN 인덱스를 만들 수 없는 차원
+          (2000 초과 4000 이하)이면 halfvec을 씁니다.
+        - 그 밖에는 vector입니다(4000 초과는 어느 쪽도 인덱스 불가).
+
+    Args:
+        spec: 임베딩 스펙 엔티티.
+
+    Returns:
+        str: "vector" 또는 "halfvec".
+    """
+    dtype = (getattr(spec, "dtype", None) or "float32").lower()
+    dimension = int(spec.dimension)
+    if dimension > INDEX_MAX_DIMENSIONS["halfvec"]:
+        return "vector"
+    if dtype in HALFVEC_DTYPES:
+        return "halfvec"
+    if dtype == "float32" and dimension > INDEX_MAX_DIMENSIONS["vector"]:
+        return "halfvec"
+    return "vector"
+
+
+def vector_type(collection) -> str:
+    return (getattr(collection, "vector_type", None) or "vector").lower()
+
+
 def _metric(collection) -> str:
     return (getattr(collection.embedding, "distance", None) or "cosine").lower()
 
@@ -40,17 +109,6 @@ def get_metadata_columns() -> list[Column]:
     ]
 
 
-def _vec_ops_for(collection) -> str:
-    metric = (getattr(collection.embedding, "distance", None) or "cosine").lower()
-    if metric in ("cosine", "cos"):
-        return "vector_cosine_ops"
-    if metric in ("l2", "euclidean"):
-        return "vector_l2_ops"
-    if metric in ("ip", "inner", "inner_product", "dot"):
-        return "vector_ip_ops"
-    return "vector_cosine_ops"
-
-
 def get_hybrid_config(collection_name: str) -> HybridSearchConfig:
     return HybridSearchConfig(
         tsv_column="content_tsv_simple",
@@ -63,10 +121,193 @@ def get_hybrid_config(collection_name: str) -> HybridSearchConfig:
     )
 
 
-async def create_vectorstore_table(collection=None) -> None:
+def _ivf_lists(rows: int | None) -> int | None:
+    """
+    Why: IVFFlat 리스트 수를 적재된 행 수에 맞춥니다(pgvector 권장: 100만 행까지 rows/1000, 이후 sqrt).
+
+    Contract:
+        - 행 수를 모르거나 빈 테이블이면 None입니다(클러스터 중심을 학습할 데이터가 없음).
+    """
+    if not rows:
+        return None
+    if rows <= 1_000_000:
+        return max(10, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+def _index_policy(collection) -> tuple[str, dict]:
+    strategy = (getattr(collection, "vector_index", None) or "hnsw").lower()
+    return strategy, dict(getattr(collection, "vector_index_params", None) or {})
+
+
+def vector_index_names(collection) -> list[str]:
+    """
+    Why: 정책과 무관하게 컬렉션 테이블에 생길 수 있는 벡터 인덱스 이름 목록입니다(재색인 시 정리용).
+    """
+    table = collection.table_name
+    return [f"idx_{table}_vec_hnsw", f"idx_{table}_vec_ivf", f"idx_{table}_vec_bq"]
+
+
+def binary_quantized(collection) -> bool:
+    """
+    Why: 이진 양자화 1차 검색(bit 인덱스 + 원본 벡터 재정렬) 사용 여부입니다.
+    """
+    return bool(_index_policy(collection)[1].get("binary_quantize"))
+
+
+def binary_quantize_expr(collection, operand: str = "embedding") -> str:
+    """
+    Why: 인덱스 정의와 검색 SQL이 같은 식을 써야 bit 인덱스가 사용됩니다.
+    """
+    return f"(binary_quantize({operand})::bit({int(collection.embedding.dimension)}))"
+
+
+def has_vector_index(collection) -> bool:
+    """
+    Summary: 정책/차원상 컬렉션에 벡터 인덱스가 있어야 하는지 반환합니다(빌드 보류 중 포함).
+    """
+    strategy, _ = _index_policy(collection)
+    if strategy not in ("hnsw", "ivfflat"):
+        return False
+    dtype = vector_type(collection)
+    return int(collection.embedding.dimension) <= INDEX_MAX_DIMENSIONS[dtype]
+
+
+def vector_index_spec(collection, rows: int | None = None) -> tuple[str, str] | None:
+    """
+    Summary: 컬렉션 벡터 인덱스 정책에 맞는 (인덱스명, ON 이하 정의)를 반환합니다.
+
+    Contract:
+        - hnsw: m/ef_construction(미지정 시 설정값).
+        - ivfflat: lists 지정값, 없으면 rows 기준으로 계산. 지정값이 없고 행이 없으면
+          (빈 테이블/행 수 미상) 데이터가 쌓일 때까지 빌드를 보류해 None입니다.
+        - none 또는 저장 타입별 최대 차원(vector 2000, halfvec 4000) 초과: 인덱스 없음.
+
+    Args:
+        collection: 컬렉션 엔티티.
+        rows: 현재 행 수(옵션).
+
+    Returns:
+        tuple[str, str] | None: 벡터 인덱스 스펙.
+    """
+    dtype = vector_type(collection)
+    if int(collection.embedding.dimension) > INDEX_MAX_DIMENSIONS[dtype]:
+        return None
+    strategy, params = _index_policy(collection)
+    table = collection.table_name
+    vec_ops = _opclass(dtype, _metric(collection))
+    if strategy == "hnsw":
+        m = int(params.get("m") or settings.vector_hnsw_m)
+        ef_construction = int(
+            params.get("ef_construction") or settings.vector_hnsw_ef_construction
+        )
+        return (
+            f"idx_{table}_vec_hnsw",
+            f"{table} USING hnsw (embedding {vec_ops}) "
+            f"WITH (m = {m}, ef_construction = {ef_construction})",
+        )
+    if strategy == "ivfflat":
+        lists = int(params.get("lists") or 0) or _ivf_lists(rows)
+        if lists is None:
+            return None
+        return (
+            f"idx_{table}_vec_ivf",
+            f"{table} USING ivfflat (embedding {vec_ops}) WITH (lists = {lists})",
+        )
+    return None
+
+
+def vector_query_options(collection, k: int) -> QueryOptions | None:
+    """
+    Summary: 벡터 인덱스 정책에 맞는 검색 시점 옵션(hnsw.ef_search/ivfflat.probes)을 반환합니다.
+
+    Contract:
+        - hnsw: ef_search는 k 이상이어야 k개를 돌려받을 수 있어 max(ef_search, k)를 씁니다.
+        - ivfflat: probes는 lists를 넘지 않습니다.
+        - 인덱스가 없으면 None.
+
+    Args:
+        collection: 컬렉션 엔티티.
+        k: 검색 후보 수.
+
+    Returns:
+        QueryOptions | None: PGVectorStore index_query_options.
+    """
+    if not has_vector_index(collection):
+        return None
+    strategy, params = _index_policy(collection)
+    if strategy == "hnsw":
+        ef_search = int(params.get("ef_search") or settings.vector_hnsw_ef_search)
+        return HNSWQueryOptions(ef_search=max(ef_search, k))
+    probes = int(params.get("probes") or settings.vector_ivfflat_probes)
+    if params.get("lists"):
+        probes = min(probes, int(params["lists"]))
+    return IVFFlatQueryOptions(probes=max(1, probes))
+
+
+def secondary_index_specs(collection, rows: int | None = None) -> list[tuple[str, str]]:
+    """
+    Summary: 컬렉션 테이블의 보조 인덱스(이름, ON 이하 정의) 목록을 반환합니다.
+
+    Contract:
+        - 전문 검색/메타데이터 인덱스와 정책에 따른 벡터 인덱스(최대 1개)를 포함합니다.
+        - binary_quantize 정책이면 이진 양자화 bit 인덱스를 추가합니다.
+        - IVFFlat lists는 rows 기준으로 계산하며, lists 지정값도 rows도 없으면 IVFFlat
+          인덱스를 포함하지 않습니다(빈 테이블에서 만들지 않음).
+
+    Args:
+        collection: 컬렉션 엔티티.
+        rows: 현재 행 수(옵션).
+
+    Returns:
+        list[tuple[str, str]]: (인덱스명, 정의) 목록.
+    """
+    table = collection.table_name
+    hybrid = get_hybrid_config(table)
+    specs = [
+        (hybrid.index_name, f"{table} USING GIN ({hybrid.tsv_column})"),
+        (f"idx_{table}_tsv_en_gin", f"{table} USING GIN (content_tsv_en)"),
+        (f"idx_{table}_content_trgm", f"{table} USING GIN (content gin_trgm_ops)"),
+        (f"idx_{table}_metadata_gin", f"{table} USING GIN (langchain_metadata)"),
+        # 파일 단위 삭제/집계(문서 수 증감)와 파일별 청크 조회
+        (f"idx_{table}_file_id", f"{table} (file_id, chunk_index)"),
+    ]
+    vector_spec = vector_index_spec(collection, rows)
+    if vector_spec is not None:
+        specs.append(vector_spec)
+    if binary_quantized(collection):
+        # bit HNSW는 64000차원까지 가능해 저장 타입/차원과 무관하게 생성
+        specs.append(
+            (
+                f"idx_{table}_vec_bq",
+                f"{table} USING hnsw ({binary_quantize_expr(collection)} bit_hamming_ops)",
+            )
+        )
+    return specs
+
+
+async def create_vectorstore_table(
+    collection=None, *, defer_indexes: bool = False
+) -> None:
+    """
+    Summary: 컬렉션 벡터 테이블과 보조 컬럼/인덱스를 생성합니다.
+
+    Contract:
+        - defer_indexes=True면 보조 인덱스를 만들지 않습니다(벌크 적재 후
+          build_secondary_indexes로 생성).
+        - collection.vector_type이 halfvec이면 임베딩 컬럼을 halfvec(dim)으로 바꿉니다.
+          이미 있던 테이블은 컬럼이 halfvec이 아닐 때만 바꿉니다(재호출 시 테이블 재작성 방지).
+
+    Args:
+        collection: 컬렉션 엔티티.
+        defer_indexes: 보조 인덱스 생성 보류 여부.
+
+    Side Effects:
+        - DB DDL
+    """
     table = collection.table_name
     dim = int(collection.embedding.dimension)
-    metric = _metric(collection)
+    created = True
     try:
         await pg_engine.ainit_vectorstore_table(
             table_name=table,
@@ -75,53 +316,281 @@ async def create_vectorstore_table(collection=None) -> None:
             hybrid_search_config=get_hybrid_config(table),
         )
     except DuplicateTableError:
-        pass
+        created = False
 
     # 2) 공통 보강(DDL)
-    common_stmts = [
+    common_stmts = []
+    if vector_type(collection) == "halfvec" and (
+        created or not (await _embedding_column_type(table) or "").startswith("halfvec")
+    ):
+        # 새 테이블은 비어 있어 타입 변경 비용 없음(PGVectorStore는 vector로만 생성)
+        common_stmts.append(
+            f"""
+            ALTER TABLE {table}
+            ALTER COLUMN embedding TYPE halfvec({dim})
+            USING embedding::halfvec({dim})
+            """
+        )
+    common_stmts += [
         f"""
         ALTER TABLE {table}
         ADD COLUMN IF NOT EXISTS content_tsv_en tsvector
         GENERATED ALWAYS AS (to_tsvector('english', coalesce(content, ''))) STORED
         """,
-        f"CREATE INDEX IF NOT EXISTS idx_{table}_tsv_en_gin ON {table} USING GIN (content_tsv_en)",
-        f"CREATE INDEX IF NOT EXISTS idx_{table}_content_trgm ON {table} USING GIN (content gin_trgm_ops)",
         f"""
         ALTER TABLE {table}
         ALTER COLUMN langchain_metadata
         TYPE jsonb
         USING COALESCE((langchain_metadata)::jsonb, '{{}}'::jsonb)
         """,
-        f"CREATE INDEX IF NOT EXISTS idx_{table}_metadata_gin ON {table} USING GIN (langchain_metadata)",
     ]
     await _exec_many_ddl(common_stmts)
+    invalidate_vectorstore(table)
 
-    vec_ops = _opclass("vector", metric)
-
-    if dim <= 2000:
-        # HNSW + IVFFlat
-        stmts = [
-            f"CREATE INDEX IF NOT EXISTS idx_{table}_vec_hnsw ON {table} USING hnsw (embedding {vec_ops})",
-            f"CREATE INDEX IF NOT EXISTS idx_{table}_vec_ivf  ON {table} USING ivfflat (embedding {vec_ops}) WITH (lists = 100)",
+    if defer_indexes:
+        return
+    # 빈 테이블이므로 트랜잭션 내 일반 CREATE INDEX로 충분
+    await _exec_many_ddl(
+        [
+            f"CREATE INDEX IF NOT EXISTS {name} ON {definition}"
+            for name, definition in secondary_index_specs(collection)
         ]
-        await _exec_many_ddl(stmts)
-    # else:
-    #     # 2000 차원 초과: HNSW 금지, IVFFlat만 생성
-    #     stmts = [
-    #         f"CREATE INDEX IF NOT EXISTS idx_{table}_vec_ivf ON {table} USING ivfflat (embedding {vec_ops}) WITH (lists = 200)",
-    #     ]
-    #     await _exec_many_ddl(stmts)
+    )
+
+
+async def drop_secondary_indexes(collection) -> None:
+    """
+    Summary: 벌크 적재 전 보조 인덱스를 제거합니다.
+
+    Side Effects:
+        - DB DDL(DROP INDEX)
+    """
+    names = [name for name, _ in secondary_index_specs(collection)]
+    names += [name for name in vector_index_names(collection) if name not in names]
+    await _exec_many_ddl([f"DROP INDEX IF EXISTS {name}" for name in names])
+
+
+async def build_secondary_indexes(collection, *, rebuild_vector: bool = False) -> bool:
+    """
+    Summary: 보조 인덱스를 CREATE INDEX CONCURRENTLY로 생성합니다.
+
+    Contract:
+        - 빌드 동안 쓰기를 막지 않도록 autocommit 커넥션에서 하나씩 실행합니다.
+        - rebuild_vector=True면 기존 벡터 인덱스를 모두 삭제하고 현재 정책으로 다시 만듭니다.
+        - maintenance_work_mem/max_parallel_maintenance_workers를 빌드 세션에만 적용합니다.
+        - 실패한 CONCURRENTLY 빌드가 남긴 INVALID 인덱스는 삭제 후 예외를 전파합니다.
+        - 이미 유효한 인덱스는 건너뜁니다(재시도 가능).
+        - 테이블이 비어 있으면 lists 지정값이 없는 IVFFlat은 만들지 않습니다(데이터 적재 후 재빌드).
+
+    Returns:
+        bool: 정책상 필요한 벡터 인덱스까지 모두 만들었으면 True, IVFFlat을 보류했으면 False.
+
+    Side Effects:
+        - DB DDL(CREATE INDEX CONCURRENTLY)
+    """
+    table = collection.table_name
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        rows = await conn.scalar(text(f"SELECT count(*) FROM {table}"))
+        await conn.execute(
+            text("SELECT set_config('maintenance_work_mem', :mem, false)"),
+            {"mem": settings.index_build_maintenance_work_mem},
+        )
+        await conn.execute(
+            text("SELECT set_config('max_parallel_maintenance_workers', :n, false)"),
+            {"n": str(settings.index_build_parallel_workers)},
+        )
+        if rebuild_vector:
+            for name in vector_index_names(collection):
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+        try:
+            for name, definition in secondary_index_specs(collection, rows=rows):
+                valid = await conn.scalar(
+                    text(
+                        "SELECT i.indisvalid FROM pg_index i "
+                        "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+                    ),
+                    {"name": name},
+                )
+                if valid:
+                    continue
+                if valid is False:
+                    await conn.execute(
+                        text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                    )
+                try:
+                    await conn.execute(
+                        text(
+                            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}"
+                        )
+                    )
+                except Exception:
+                    await conn.execute(
+                        text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                    )
+                    raise
+        finally:
+            await conn.execute(text("RESET maintenance_work_mem"))
+            await conn.execute(text("RESET max_parallel_maintenance_workers"))
+    return (
+        not has_vector_index(collection)
+        or vector_index_spec(collection, rows) is not None
+    )
+
+
+async def secondary_index_state(collection) -> list[dict]:
+    """
+    Summary: 보조 인덱스별 존재/유효 여부와 진행 중 빌드 단계를 조회합니다.
+
+    Returns:
+        list[dict]: name/exists/valid/phase/blocks_done/blocks_total 목록.
+
+    Side Effects:
+        - DB 카탈로그 조회
+    """
+    async with engine.connect() as conn:
+        # 보류된 IVFFlat도 데이터가 있으면 빌드 대상으로 보이도록 행 수 추정치를 씁니다.
+        rows = await conn.scalar(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": collection.table_name},
+        )
+        specs = secondary_index_specs(collection, rows=max(int(rows or 0), 0))
+        valid_rows = await conn.execute(
+            text(
+                "SELECT c.relname, i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = ANY(:names)"
+            ),
+            {"names": [name for name, _ in specs]},
+        )
+        valid = dict(valid_rows.all())
+        progress_rows = await conn.execute(
+            text(
+                "SELECT c.relname, p.phase, p.blocks_done, p.blocks_total "
+                "FROM pg_stat_progress_create_index p "
+                "JOIN pg_class c ON c.oid = p.index_relid "
+                "WHERE p.relid = to_regclass(:table)"
+            ),
+            {"table": collection.table_name},
+        )
+        progress = {row[0]: row[1:] for row in progress_rows.all()}
+    return [
+        {
+            "name": name,
+            "exists": name in valid,
+            "valid": bool(valid.get(name)),
+            "phase": progress.get(name, (None, None, None))[0],
+            "blocks_done": progress.get(name, (None, None, None))[1],
+            "blocks_total": progress.get(name, (None, None, None))[2],
+        }
+        for name, _ in specs
+    ]
+
+
+async def index_build_in_progress(collection) -> bool:
+    """
+    Summary: 컬렉션 테이블에 진행 중인 CREATE INDEX가 있는지 확인합니다.
+
+    Contract:
+        - 어느 프로세스/세션이 빌드하든 pg_stat_progress_create_index에 보이면 True입니다.
+
+    Side Effects:
+        - DB 카탈로그 조회
+    """
+    async with engine.connect() as conn:
+        running = await conn.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_stat_progress_create_index "
+                "WHERE relid = to_regclass(:table))"
+            ),
+            {"table": collection.table_name},
+        )
+    return bool(running)
+
+
+def invalidate_vectorstore(table_name: str) -> int:
+    """
+    Summary: 테이블의 캐시된 벡터스토어를 제거합니다(컬렉션 삭제/스키마 변경 시).
+
+    Args:
+        table_name: 컬렉션 테이블명.
+
+    Returns:
+        int: 제거된 항목 수.
+    """
+    return vectorstore_cache.invalidate(lambda key: key[0] == table_name)
+
+
+# PGVectorStore가 내부 AsyncPGVectorStore를 보관하는 속성(langchain-postgres==0.0.15 고정).
+# 내부 스토어는 PGEngine 백그라운드 루프에서만 실행할 수 있어 래퍼째 복제합니다.
+# 속성이 바뀌면 tests/test_vectorstore_cache.py의 계약 테스트가 실패합니다.
+_INNER_STORE_ATTR = "_PGVectorStore__vs"
+
+
+def _bind(
+    store: PGVectorStore, embedding, index_query_options: QueryOptions | None
+) -> PGVectorStore:
+    """
+    Summary: 캐시된 스토어를 요청별 임베딩/검색 옵션으로 얕게 복제합니다.
+
+    Contract:
+        - 스키마 조회 결과(컬럼 목록 등)는 공유하고 DB 조회를 하지 않습니다.
+        - 하이브리드 설정은 검색 중 fusion 파라미터가 바뀌므로 요청마다 새로 복사합니다.
+
+    Raises:
+        RuntimeError: 설치된 langchain-postgres의 PGVectorStore 구조가 다른 경우.
+    """
+    try:
+        inner = copy.copy(getattr(store, _INNER_STORE_ATTR))
+    except AttributeError as exc:
+        raise RuntimeError(
+            "지원하지 않는 langchain-postgres 버전입니다(PGVectorStore 내부 구조 변경)."
+        ) from exc
+    inner.embedding_service = embedding
+    inner.index_query_options = index_query_options
+    if inner.hybrid_search_config is not None:
+        inner.hybrid_search_config = copy.deepcopy(inner.hybrid_search_config)
+    bound = copy.copy(store)
+    setattr(bound, _INNER_STORE_ATTR, inner)
+    return bound
 
 
 async def get_vectorstore(
-    collection, use_hybrid_search: bool = True, embedding=None
+    collection,
+    use_hybrid_search: bool = True,
+    embedding=None,
+    index_query_options: QueryOptions | None = None,
 ) -> PGVectorStore:
+    """
+    Summary: 컬렉션 테이블용 PGVectorStore를 반환합니다(스키마 조회 결과 캐시).
+
+    Contract:
+        - (테이블명, 하이브리드 여부)별로 PGVectorStore.create의 스키마 조회를 한 번만 합니다.
+        - 임베딩 클라이언트와 검색 옵션은 호출마다 바인딩합니다(요청 범위 래퍼를 안전하게 사용).
+        - 컬렉션 삭제/테이블 생성 시 invalidate_vectorstore로 무효화됩니다.
+
+    Args:
+        collection: 컬렉션 엔티티.
+        use_hybrid_search: 하이브리드 검색 설정 사용 여부.
+        embedding: 임베딩 클라이언트.
+        index_query_options: hnsw.ef_search/ivfflat.probes 등 검색 옵션.
+
+    Returns:
+        PGVectorStore: 요청별로 바인딩된 벡터스토어.
+
+    Raises:
+        RuntimeError: 벡터스토어 생성 실패.
+    """
     collection_name = collection.table_name
+    key = (collection_name, use_hybrid_search)
+    cached = vectorstore_cache.get(key)
+    if cached is not None:
+        return _bind(cached, embedding, index_query_options)
+
     metadata_columns = get_metadata_columns()
     hybrid_config = get_hybrid_config(collection_name) if use_hybrid_search else None
 
     try:
-        return await PGVectorStore.create(
+        store = await PGVectorStore.create(
             engine=pg_engine,
             table_name=collection_name,
             embedding_service=embedding,
@@ -134,3 +603,5 @@ async def get_vectorstore(
         raise RuntimeError(
             f"Vectorstore 초기화 실패 (인스턴스 생성) (error_id={error_id})"
         ) from e
+    vectorstore_cache.put(key, store)
+    return _bind(store, embedding, index_query_options)
@@ -4,13 +4,31 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core import settings
+from app.db import close_bulk_pool
 from app.routers import api_router, api_tags
+from app.services import CollectionStatsReconciler, IngestionWorker
+from app.utils import mcp_manager, shutdown_parse_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI application."""
+    ingest_worker = IngestionWorker(
+        concurrency=settings.ingest_workers,
+        poll_interval=settings.ingest_poll_interval_sec,
+    )
+    ingest_worker.start()
+    stats_reconciler = CollectionStatsReconciler(
+        interval=settings.collection_stats_reconcile_interval_sec
+    )
+    stats_reconciler.start()
     yield
+    await stats_reconciler.stop()
+    await ingest_worker.stop()
+    await mcp_manager.aclose()
+    shutdown_parse_pool()
+    await close_bulk_pool()
 
 
 # FastAPI 인스턴스 생성
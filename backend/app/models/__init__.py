@@ -5,10 +5,18 @@ from app.models.conversation_history import (
     MessageStatus,
 )
 from app.models.mcp_server import MCPServer
-from app.models.collection import Collection
+from app.models.collection import Collection, CollectionIndexStatus, VectorIndexStrategy
+from app.models.collection_file import CollectionFile
 from app.models.model_api_key import ModelApiKey
 from app.models.llm_api_key import LLMApiKey
 from app.models.embedding_spec import EmbeddingSpec
+from app.models.embedding_cache import EmbeddingCache
+from app.models.ingestion_job import (
+    IngestionFileStage,
+    IngestionJob,
+    IngestionJobFile,
+    IngestionJobStatus,
+)
 from app.models.wiki_page import WikiPage
 from app.models.lookups import (
     UserRoleLkp,
@@ -21,6 +29,9 @@ from app.models.lookups import (
 __all__ = [
     "User",
     "Collection",
+    "CollectionIndexStatus",
+    "VectorIndexStrategy",
+    "CollectionFile",
     "Conversation",
     "conversation_mcp_server",
     "ConversationHistory",
@@ -34,5 +45,10 @@ __all__ = [
     "MessageRoleLkp",
     "MessageStatusLkp",
     "EmbeddingSpec",
+    "EmbeddingCache",
+    "IngestionJob",
+    "IngestionJobFile",
+    "IngestionJobStatus",
+    "IngestionFileStage",
     "WikiPage",
 ]
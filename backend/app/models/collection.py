@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+import enum
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy import String, Boolean
 from uuid import uuid4
 
@@ -13,6 +15,19 @@ if TYPE_CHECKING:
     from .embedding_spec import EmbeddingSpec
 
 
+class CollectionIndexStatus(str, enum.Enum):
+    READY = "ready"
+    DEFERRED = "deferred"
+    BUILDING = "building"
+    FAILED = "failed"
+
+
+class VectorIndexStrategy(str, enum.Enum):
+    HNSW = "hnsw"
+    IVFFLAT = "ivfflat"
+    NONE = "none"
+
+
 class Collection(Base):
     __tablename__ = "collections"
 
@@ -33,6 +48,47 @@ class Collection(Base):
         index=True,
     )
     embedding: Mapped["EmbeddingSpec"] = relationship()
+    # 보조 인덱스 상태(벌크 적재 모드: deferred → building → ready/failed)
+    index_status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=CollectionIndexStatus.READY.value,
+        server_default=CollectionIndexStatus.READY.value,
+    )
+    index_error: Mapped[str | None] = mapped_column(sa.Text)
+    index_updated_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True)
+    )
+    # 벡터 인덱스 정책(hnsw/ivfflat/none)과 빌드/검색 파라미터(m, ef_construction, lists, ef_search, probes)
+    vector_index: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=VectorIndexStrategy.HNSW.value,
+        server_default=VectorIndexStrategy.HNSW.value,
+    )
+    vector_index_params: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
+    # 임베딩 컬럼 저장 타입(vector/halfvec), 생성 시 임베딩 스펙 dtype으로 결정
+    vector_type: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="vector", server_default="vector"
+    )
+    # 청크 쓰기(적재/삭제)마다 1씩 증가, 검색 결과 캐시 키에 포함
+    write_version: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    # 적재/삭제 트랜잭션에서 함께 갱신하는 집계(문서=고유 file_id 수, 바이트=본문 UTF-8 크기)
+    # 드리프트는 주기 보정 작업이 전체 재집계로 바로잡음(stats_reconciled_at)
+    chunk_count: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    document_count: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    content_bytes: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    stats_reconciled_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True)
+    )
 
     @property
     def table_name(self) -> str:
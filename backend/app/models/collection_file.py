@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class CollectionFile(Base):
+    __tablename__ = "collection_files"
+    # 문서 목록 keyset 페이지네이션(created_at, file_id)
+    __table_args__ = (
+        sa.Index(
+            "ix_collection_files_listing", "collection_id", "created_at", "file_id"
+        ),
+    )
+
+    # 업로드 파일 1건당 1행. 청크 적재/삭제 트랜잭션에서 chunk_count/content_bytes를 함께 갱신합니다.
+    collection_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        sa.ForeignKey("collections.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    file_id: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    source: Mapped[str | None] = mapped_column(sa.Text)
+    chunk_count: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    # 청크 본문 바이트 합계(겹침 포함, 원본 파일 크기가 아님)
+    content_bytes: Mapped[int] = mapped_column(
+        sa.BigInteger, nullable=False, default=0, server_default="0"
+    )
+    # 원본 파일 sha256/바이트 수(업로드 경로에서 계산, 청크만 직접 넣은 경우 NULL)
+    content_hash: Mapped[str | None] = mapped_column(sa.String(64))
+    file_size: Mapped[int | None] = mapped_column(sa.BigInteger)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+    )
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class EmbeddingCache(Base):
+    __tablename__ = "embedding_cache"
+
+    # (임베딩 스펙, 정규화 텍스트 sha256) → 벡터. 컬렉션과 무관하게 공유됩니다.
+    embedding_spec_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("embedding_specs.id", ondelete="CASCADE"), primary_key=True
+    )
+    content_hash: Mapped[str] = mapped_column(sa.String(64), primary_key=True)
+    # 스펙마다 차원이 다르므로 차원 없는 vector 타입으로 저장합니다(조회는 PK로만).
+    embedding: Mapped[list[float]] = mapped_column(Vector(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+    )
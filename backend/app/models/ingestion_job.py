@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db import Base
+
+
+class IngestionJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class IngestionFileStage(str, enum.Enum):
+    QUEUED = "queued"
+    PARSED = "parsed"
+    CHUNKED = "chunked"
+    EMBEDDED = "embedded"
+    STORED = "stored"
+    FAILED = "failed"
+
+
+class IngestionJob(Base):
+    __tablename__ = "ingestion_jobs"
+    __table_args__ = (sa.Index("ix_ingestion_jobs_claim", "status", "run_after"),)
+
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    collection_id: Mapped[UUID] = mapped_column(
+        sa.ForeignKey("collections.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id: Mapped[int] = mapped_column(
+        sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    model_api_key_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    chunk_size: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    chunk_overlap: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+
+    status: Mapped[str] = mapped_column(
+        sa.String(16),
+        nullable=False,
+        server_default=IngestionJobStatus.QUEUED.value,
+    )
+    attempts: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, server_default=sa.text("0")
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, server_default=sa.text("3")
+    )
+    # 재시도 백오프: 이 시각 이후에만 다시 가져갈 수 있습니다.
+    run_after: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+    )
+    # 워커 임대(lease): locked_at이 오래되면 다른 워커가 재개합니다.
+    locked_by: Mapped[str | None] = mapped_column(sa.String(100))
+    locked_at: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True))
+    error: Mapped[str | None] = mapped_column(sa.Text)
+
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), onupdate=sa.func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True))
+
+    files: Mapped[list["IngestionJobFile"]] = relationship(
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="IngestionJobFile.position",
+    )
+
+
+class IngestionJobFile(Base):
+    __tablename__ = "ingestion_job_files"
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
+    job_id: Mapped[UUID] = mapped_column(
+        sa.ForeignKey("ingestion_jobs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    job: Mapped["IngestionJob"] = relationship(back_populates="files")
+    position: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    # 벡터 테이블의 file_id. 재시도 시 부분 적재분을 지우는 데 사용합니다.
+    file_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), nullable=False, default=uuid4
+    )
+    filename: Mapped[str | None] = mapped_column(sa.String(255))
+    content_type: Mapped[str | None] = mapped_column(sa.String(255))
+    # ingest_spool_dir 기준 상대 경로(워커마다 마운트 위치가 달라도 됨)
+    spool_path: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    metadata_: Mapped[dict[str, Any] | None] = mapped_column("metadata", JSONB)
+
+    stage: Mapped[str] = mapped_column(
+        sa.String(16),
+        nullable=False,
+        server_default=IngestionFileStage.QUEUED.value,
+    )
+    chunk_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, server_default=sa.text("0")
+    )
+    error: Mapped[str | None] = mapped_column(sa.Text)
+    updated_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), onupdate=sa.func.now()
+    )
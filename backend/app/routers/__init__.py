@@ -7,6 +7,7 @@ from app.routers.rag import router as rag_router
 from app.routers.model_api_keys import router as model_api_key_router
 from app.routers.mcp_server import router as mcp_server_router
 from app.routers.wiki import router as wiki_router
+from app.routers.system import router as system_router
 
 api_router = APIRouter(prefix="/api/v1")
 
@@ -17,6 +18,7 @@ api_router.include_router(rag_router)
 api_router.include_router(model_api_key_router)
 api_router.include_router(mcp_server_router)
 api_router.include_router(wiki_router)
+api_router.include_router(system_router)
 
 api_tags = [
     {"name": "Auth", "description": "인증 및 로그인 관련 API"},
@@ -26,6 +28,7 @@ api_tags = [
     {"name": "API Keys", "description": "모델 API 키 관리"},
     {"name": "MCP Servers", "description": "MCP 서버 관리"},
     {"name": "Wiki", "description": "사용 가이드/문서 API"},
+    {"name": "System", "description": "운영 지표 API"},
 ]
 
 __all__ = ["api_router", "api_tags"]
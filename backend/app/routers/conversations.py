@@ -377,6 +377,8 @@ async def stream(
     Request/Response:
         - 요청: message/model_key_id/params/system_prompt/mcp_server_ids
         - 응답: text/event-stream(SSE)
+        - 이벤트: token/tool_start/tool_end/update/warning/done/error
+        - warning: 제외된 MCP 서버 정보(server/reason/detail)
 
     Errors:
         - 403/404: 권한 없음 또는 대화 미존재
@@ -2,6 +2,7 @@ from typing import Any, Literal
 from uuid import UUID
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     HTTPException,
     status,
     Query,
@@ -13,18 +14,32 @@ from fastapi import (
 from pydantic import TypeAdapter, ValidationError
 
 from app.dependencies import SessionDep, CurrentUser
-from app.services import CollectionService, DocumentService
+from app.services import (
+    CollectionService,
+    DocumentService,
+    FederatedSearchService,
+    IngestionService,
+)
+from app.services.collection import run_index_build
 from app.schemas import (
     CollectionCreate,
     CollectionRead,
+    CollectionIndexStatusRead,
+    CollectionReindexRequest,
     CollectionUpdate,
     PaginatedCollectionResponse,
     PaginatedDocumentResponse,
     DocumentUploadResponse,
     DocumentDeleteRequest,
+    DocumentFileChunks,
+    IngestionJobRead,
     PaginatedChunkResponse,
     SearchQuery,
     SearchResult,
+    BatchSearchQuery,
+    BatchSearchResult,
+    FederatedSearchQuery,
+    FederatedSearchResult,
 )
 
 _metadata_adapter = TypeAdapter(list[dict[str, Any]])
@@ -109,6 +124,54 @@ async def list_collections(
     return await service.get_list(user, limit=limit, offset=offset)
 
 
+@router.post(
+    "/search",
+    response_model=list[FederatedSearchResult],
+    summary="다중 컬렉션 검색",
+    description="여러 컬렉션을 동시에 검색하고 정규화 점수로 합친 결과를 반환합니다.",
+    responses={
+        400: {"description": "컬렉션 수 초과 또는 미지원 필터"},
+        401: {"description": "인증 실패"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        422: {"description": "요청 본문 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def search_collections(
+    search: FederatedSearchQuery,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 컬렉션마다 검색을 반복 호출하지 않고 한 요청으로 여러 컬렉션을 검색합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(모든 컬렉션에 접근 가능해야 함)
+
+    Request/Response:
+        - 요청: collection_ids/query/limit/filter/search_type(semantic|hybrid)/model_api_key_id
+        - 응답: collection_id가 붙은 검색 결과(0~1 정규화 score, 원래 점수 raw_score)
+
+    Errors:
+        - 400: 컬렉션 수 초과 또는 연산자 필터
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 401/422: 인증 실패 또는 요청 형식 오류
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    service = FederatedSearchService(db, user)
+    return await service.search(
+        search.collection_ids,
+        search.query,
+        limit=search.limit or 10,
+        search_type=search.search_type,
+        filter=search.filter,
+        model_api_key_id=search.model_api_key_id,
+    )
+
+
 @router.get(
     "/{collection_id}",
     response_model=CollectionRead,
@@ -228,12 +291,189 @@ async def delete_collection(
     await service.delete(collection_id, user)
 
 
+@router.get(
+    "/{collection_id}/indexes",
+    response_model=CollectionIndexStatusRead,
+    summary="컬렉션 인덱스 상태 조회",
+    description="보조(벡터/전문 검색) 인덱스의 상태와 빌드 진행 상황을 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        422: {"description": "경로 파라미터 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def get_collection_indexes(
+    collection_id: UUID,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 대량 적재 후 인덱스 빌드가 끝났는지 확인합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자 또는 공개 컬렉션)
+
+    Request/Response:
+        - 요청: collection_id
+        - 응답: 컬렉션 인덱스 상태와 인덱스별 유효/진행 정보
+
+    Errors:
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 401/422: 인증 실패 또는 경로 파라미터 오류
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    service = CollectionService(db)
+    return await service.get_index_status(collection_id, user)
+
+
+@router.post(
+    "/{collection_id}/indexes/defer",
+    response_model=CollectionIndexStatusRead,
+    summary="컬렉션 인덱스 빌드 보류",
+    description="대량 적재 전에 보조 인덱스를 제거하고 deferred 상태로 전환합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "수정 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        409: {"description": "인덱스 빌드 중"},
+        422: {"description": "경로 파라미터 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def defer_collection_indexes(
+    collection_id: UUID,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 기존 컬렉션에 대량 적재할 때 행마다 인덱스를 갱신하는 비용을 없앱니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자 또는 관리자)
+
+    Request/Response:
+        - 요청: collection_id
+        - 응답: 전환 후 인덱스 상태
+
+    Errors:
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 409: 인덱스 빌드 중
+        - 401/422: 인증 실패 또는 경로 파라미터 오류
+
+    Side Effects:
+        - 보조 인덱스 DROP(빌드 전까지 검색은 순차 스캔)
+        - DB 컬렉션 레코드 업데이트
+    """
+    service = CollectionService(db)
+    return await service.defer_indexes(collection_id, user)
+
+
+@router.post(
+    "/{collection_id}/indexes/build",
+    response_model=CollectionIndexStatusRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="컬렉션 인덱스 빌드",
+    description="보조 인덱스를 CREATE INDEX CONCURRENTLY로 백그라운드에서 빌드합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "수정 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        409: {"description": "인덱스 빌드 중"},
+        422: {"description": "경로 파라미터 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def build_collection_indexes(
+    collection_id: UUID,
+    background_tasks: BackgroundTasks,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 대량 적재가 끝난 뒤 인덱스를 한 번에 만들어 검색 성능을 복구합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자 또는 관리자)
+
+    Request/Response:
+        - 요청: collection_id
+        - 응답: building 상태(202), 진행 상황은 GET /indexes로 확인
+
+    Errors:
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 409: 이미 빌드 중
+        - 401/422: 인증 실패 또는 경로 파라미터 오류
+
+    Side Effects:
+        - DB 컬렉션 레코드 업데이트
+        - 백그라운드 인덱스 빌드(테이블 쓰기를 막지 않음)
+    """
+    service = CollectionService(db)
+    result = await service.start_index_build(collection_id, user)
+    background_tasks.add_task(run_index_build, collection_id)
+    return result
+
+
+@router.post(
+    "/{collection_id}/indexes/reindex",
+    response_model=CollectionIndexStatusRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="컬렉션 벡터 재색인",
+    description="벡터 인덱스 정책(hnsw/ivfflat/none)과 파라미터를 바꾸고 백그라운드에서 재색인합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "수정 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        409: {"description": "인덱스 빌드 중"},
+        422: {"description": "요청 본문/경로 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def reindex_collection(
+    collection_id: UUID,
+    data: CollectionReindexRequest,
+    background_tasks: BackgroundTasks,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 컬렉션 규모/정확도 요구에 맞게 벡터 인덱스 종류와 파라미터를 조정합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자 또는 관리자)
+
+    Request/Response:
+        - 요청: vector_index, vector_index_params(m/ef_construction/ef_search/lists/probes)
+        - 응답: building 상태(202), 진행 상황은 GET /indexes로 확인
+
+    Errors:
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 409: 이미 빌드 중
+        - 401/422: 인증 실패 또는 요청 형식 오류
+
+    Side Effects:
+        - DB 컬렉션 정책 업데이트
+        - 기존 벡터 인덱스 삭제 후 백그라운드 재생성(그동안 순차 스캔)
+    """
+    service = CollectionService(db)
+    result = await service.reindex(collection_id, data, user)
+    background_tasks.add_task(run_index_build, collection_id, rebuild_vector=True)
+    return result
+
+
 @router.post(
     "/{collection_id}/documents",
     response_model=DocumentUploadResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="문서 업로드",
-    description="컬렉션에 문서를 업로드하고 임베딩/벡터스토어에 저장합니다.",
+    description=(
+        "컬렉션에 문서 적재 작업을 등록하고 job_id를 즉시 반환합니다. "
+        "진행 상황은 /collections/{collection_id}/jobs/{job_id}로 조회합니다."
+    ),
     responses={
         400: {"description": "메타데이터 형식 오류 또는 파일/메타데이터 불일치"},
         401: {"description": "인증 실패"},
@@ -262,7 +502,7 @@ async def create_documents(
 
     Request/Response:
         - 요청: files + (선택) metadatas_json/chunk_size/chunk_overlap/model_api_key_id
-        - 응답: 업로드 결과 요약(성공/실패 수, 저장된 문서 정보)
+        - 응답: 202 + job_id/status(queued). 파싱/임베딩/저장은 백그라운드 워커가 수행
 
     Errors:
         - 400: 메타데이터 JSON 파싱 실패 또는 파일 수 불일치
@@ -270,8 +510,8 @@ async def create_documents(
         - 401/422: 인증 실패 또는 요청 형식 오류
 
     Side Effects:
-        - 파일/문서 메타데이터 저장
-        - 임베딩 생성 및 벡터스토어 저장
+        - 업로드 파일 스풀 저장
+        - 적재 작업 레코드 생성(워커가 임베딩/벡터스토어 저장 수행)
     """
     if not metadatas_json:
         metadatas: list[dict] | list[None] = [None] * len(files)
@@ -288,18 +528,68 @@ async def create_documents(
                     f"does not match number of files ({len(files)})."
                 ),
             )
-    service = DocumentService(db, collection_id, user)
-    return await service.create(
-        files, metadatas, chunk_size, chunk_overlap, model_api_key_id
+    service = IngestionService(db)
+    return await service.enqueue(
+        collection_id=collection_id,
+        user=user,
+        files=files,
+        metadatas=metadatas,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        model_api_key_id=model_api_key_id,
     )
 
 
+@router.get(
+    "/{collection_id}/jobs/{job_id}",
+    response_model=IngestionJobRead,
+    summary="문서 적재 작업 조회",
+    description="적재 작업 상태와 파일별 진행 단계(parsed/chunked/embedded/stored)를 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "컬렉션 또는 작업이 존재하지 않음"},
+        422: {"description": "요청 형식 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def get_ingestion_job(
+    collection_id: UUID,
+    job_id: UUID,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 비동기 적재 작업의 진행률과 실패 원인을 확인합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(컬렉션 접근 권한)
+
+    Request/Response:
+        - 요청: collection_id, job_id
+        - 응답: 작업 상태/시도 횟수/파일별 단계와 청크 수
+
+    Errors:
+        - 403/404: 권한 없음 또는 컬렉션/작업 미존재
+        - 401/422: 인증 실패 또는 요청 형식 오류
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    service = IngestionService(db)
+    return await service.get_job(collection_id, job_id, user)
+
+
 @router.get(
     "/{collection_id}/documents",
     response_model=PaginatedDocumentResponse | PaginatedChunkResponse,
     summary="컬렉션 내 문서 목록 조회",
-    description="컬렉션에 등록된 문서/청크 목록을 조회합니다.",
+    description=(
+        "컬렉션에 등록된 문서/청크 목록을 조회합니다. "
+        "문서 목록은 파일 레지스트리 기반이며 cursor로 keyset 페이지네이션을 지원합니다."
+    ),
     responses={
+        400: {"description": "잘못된 cursor"},
         401: {"description": "인증 실패"},
         403: {"description": "접근 권한 없음"},
         404: {"description": "컬렉션이 존재하지 않음"},
@@ -313,6 +603,7 @@ async def list_documents(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
     view: Literal["document", "chunk"] = Query("document"),
+    cursor: str | None = Query(None),
     db: SessionDep,
     user: CurrentUser,
 ):
@@ -323,10 +614,11 @@ async def list_documents(
         - 필요: Bearer 토큰(소유자)
 
     Request/Response:
-        - 요청: limit/offset/view(document|chunk)
-        - 응답: 문서 또는 청크 목록 + 페이지 정보
+        - 요청: limit/offset/view(document|chunk)/cursor(document 뷰 keyset)
+        - 응답: 문서 또는 청크 목록 + 페이지 정보(document 뷰는 next_cursor, 청크는 비어 있음)
 
     Errors:
+        - 400: 잘못된 cursor
         - 403/404: 권한 없음 또는 컬렉션 미존재
         - 401/422: 인증 실패 또는 쿼리 파라미터 오류
 
@@ -334,7 +626,52 @@ async def list_documents(
         - 없음(조회 전용)
     """
     service = DocumentService(db, collection_id, user)
-    return await service.get_list(limit=limit, offset=offset, view=view)
+    return await service.get_list(limit=limit, offset=offset, view=view, cursor=cursor)
+
+
+@router.get(
+    "/{collection_id}/documents/{file_id}/chunks",
+    response_model=DocumentFileChunks,
+    summary="파일별 청크 조회",
+    description="파일 하나의 청크를 chunk_index 순으로 페이지 조회합니다.",
+    responses={
+        400: {"description": "잘못된 cursor"},
+        401: {"description": "인증 실패"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "컬렉션 또는 파일이 존재하지 않음"},
+        422: {"description": "쿼리 파라미터 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def list_file_chunks(
+    collection_id: UUID,
+    file_id: str,
+    *,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None),
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 문서 목록에서 선택한 파일의 청크만 필요할 때 지연 로딩합니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자)
+
+    Request/Response:
+        - 요청: limit/cursor
+        - 응답: 파일 정보 + 청크 목록 + next_cursor
+
+    Errors:
+        - 400: 잘못된 cursor
+        - 403/404: 권한 없음 또는 컬렉션/파일 미존재
+        - 401/422: 인증 실패 또는 쿼리 파라미터 오류
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    service = DocumentService(db, collection_id, user)
+    return await service.get_file_chunks(file_id, limit=limit, cursor=cursor)
 
 
 @router.delete(
@@ -455,8 +792,8 @@ async def search_documents(
         - 필요: Bearer 토큰(소유자)
 
     Request/Response:
-        - 요청: query/limit/filter/search_type/model_api_key_id
-        - 응답: 검색 결과 목록(점수/메타데이터 포함)
+        - 요청: query/limit/filter/search_type/model_api_key_id(+ hybrid 가중치)
+        - 응답: 검색 결과 목록(점수/메타데이터, hybrid는 신호별 점수 포함)
 
     Errors:
         - 403/404: 권한 없음 또는 컬렉션 미존재
@@ -472,4 +809,57 @@ async def search_documents(
         filter=search.filter,
         search_type=search.search_type,
         model_api_key_id=search.model_api_key_id,
+        semantic_weight=search.semantic_weight,
+        keyword_weight=search.keyword_weight,
+    )
+
+
+@router.post(
+    "/{collection_id}/documents/search:batch",
+    response_model=list[BatchSearchResult],
+    summary="문서 배치 검색",
+    description="여러 질의를 한 번의 임베딩 호출과 한 번의 DB 조회로 시맨틱 검색합니다.",
+    responses={
+        400: {"description": "질의 수 초과"},
+        401: {"description": "인증 실패"},
+        403: {"description": "접근 권한 없음"},
+        404: {"description": "컬렉션이 존재하지 않음"},
+        422: {"description": "요청 본문 검증 실패"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def search_documents_batch(
+    collection_id: UUID,
+    search: BatchSearchQuery,
+    db: SessionDep,
+    user: CurrentUser,
+):
+    """
+    Why: 에이전트/평가 스크립트의 연속 단건 검색을 요청 하나로 묶어 처리량을 높입니다.
+
+    Auth:
+        - 필요: Bearer 토큰(소유자)
+
+    Request/Response:
+        - 요청: queries(최대 SEARCH_BATCH_MAX_QUERIES개)/limit/filter/model_api_key_id
+        - 응답: 질의 순서대로 query와 검색 결과 목록
+
+    Errors:
+        - 400: 질의 수 초과
+        - 403/404: 권한 없음 또는 컬렉션 미존재
+        - 401/422: 인증 실패 또는 요청 형식 오류
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    service = DocumentService(db, collection_id, user)
+    results = await service.search_batch(
+        search.queries,
+        limit=search.limit or 10,
+        filter=search.filter,
+        model_api_key_id=search.model_api_key_id,
     )
+    return [
+        {"query": query, "results": found}
+        for query, found in zip(search.queries, results)
+    ]
@@ -0,0 +1,147 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies import SessionDep, require_admin
+from app.schemas import (
+    CacheStats,
+    EmbeddingCacheStats,
+    EmbeddingThroughputStats,
+    QueryEmbeddingStats,
+)
+from app.services import EmbeddingCacheService
+from app.utils import cache_stats, embedding_throughput_stats, query_embedding_stats
+
+router = APIRouter(prefix="/system", tags=["System"])
+
+
+@router.get(
+    "/caches",
+    response_model=list[CacheStats],
+    summary="프로세스 캐시 지표(관리자)",
+    description="프로세스 로컬 캐시의 크기/hit/miss/적중률을 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "관리자 권한 없음"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def list_cache_stats(current_user=Depends(require_admin)):
+    """
+    Why: 부하 상황에서 캐시가 요청당 준비 비용을 줄이고 있는지 확인합니다.
+
+    Auth:
+        - 필요: 관리자 권한
+
+    Request/Response:
+        - 요청: 없음
+        - 응답: 캐시별 지표 목록
+
+    Errors:
+        - 403: 관리자 권한이 없는 경우
+        - 401: 인증 실패
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    _ = current_user
+    return cache_stats()
+
+
+@router.get(
+    "/embedding-cache",
+    response_model=EmbeddingCacheStats,
+    summary="임베딩 캐시 지표(관리자)",
+    description="임베딩 캐시 항목 수(스펙별)와 업로드 시 청크 적중률을 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "관리자 권한 없음"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def get_embedding_cache_stats(
+    session: SessionDep, current_user=Depends(require_admin)
+):
+    """
+    Why: 재업로드 시 임베딩 호출이 실제로 얼마나 절감되는지 확인합니다.
+
+    Auth:
+        - 필요: 관리자 권한
+
+    Request/Response:
+        - 요청: 없음
+        - 응답: entries/hits/misses/hit_rate/specs
+
+    Errors:
+        - 403: 관리자 권한이 없는 경우
+        - 401: 인증 실패
+
+    Side Effects:
+        - DB 조회
+    """
+    _ = current_user
+    return await EmbeddingCacheService(session).stats()
+
+
+@router.get(
+    "/query-embeddings",
+    response_model=list[QueryEmbeddingStats],
+    summary="컬렉션별 질의 임베딩 캐시 지표(관리자)",
+    description="검색 질의 임베딩 캐시의 컬렉션별 hit/miss/적중률을 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "관리자 권한 없음"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def list_query_embedding_stats(current_user=Depends(require_admin)):
+    """
+    Why: 반복 질의가 많은 컬렉션에서 임베딩 왕복이 줄어드는지 확인합니다.
+
+    Auth:
+        - 필요: 관리자 권한
+
+    Request/Response:
+        - 요청: 없음
+        - 응답: 컬렉션별 지표 목록(전체 크기/바이트는 /system/caches 참고)
+
+    Errors:
+        - 403: 관리자 권한이 없는 경우
+        - 401: 인증 실패
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    _ = current_user
+    return query_embedding_stats()
+
+
+@router.get(
+    "/embedding-throughput",
+    response_model=list[EmbeddingThroughputStats],
+    summary="제공자별 임베딩 처리량 지표(관리자)",
+    description="임베딩 제공자별 요청/토큰 처리량, 한도 대기 시간, 429 재시도 횟수를 조회합니다.",
+    responses={
+        401: {"description": "인증 실패"},
+        403: {"description": "관리자 권한 없음"},
+        500: {"description": "서버 오류"},
+    },
+)
+async def list_embedding_throughput(current_user=Depends(require_admin)):
+    """
+    Why: 제공자 한도를 포화시키되 429가 나지 않도록 동시성/한도 설정을 조정할 근거를 제공합니다.
+
+    Auth:
+        - 필요: 관리자 권한
+
+    Request/Response:
+        - 요청: 없음
+        - 응답: 제공자별 requests/texts/tokens/retries/rate_limited/wait_sec/busy_sec/tokens_per_sec
+
+    Errors:
+        - 403: 관리자 권한이 없는 경우
+        - 401: 인증 실패
+
+    Side Effects:
+        - 없음(조회 전용)
+    """
+    _ = current_user
+    return embedding_throughput_stats()
@@ -16,6 +16,7 @@ from app.schemas.document import (
     ChunkItem,
     DocumentChunk,
     DocumentFile,
+    DocumentFileChunks,
     PaginatedChunkResponse,
     PaginatedDocumentResponse,
     DocumentRead,
@@ -23,11 +24,19 @@ from app.schemas.document import (
     DocumentUploadResponse,
     SearchQuery,
     SearchResult,
+    BatchSearchQuery,
+    BatchSearchResult,
+    FederatedSearchQuery,
+    FederatedSearchResult,
 )
 from app.schemas.collection import (
     CollectionCreate,
     CollectionUpdate,
     CollectionRead,
+    CollectionIndexRead,
+    CollectionIndexStatusRead,
+    CollectionReindexRequest,
+    VectorIndexParams,
     PaginatedCollectionResponse,
 )
 from app.schemas.model_api_key import (
@@ -55,6 +64,14 @@ from app.schemas.mcp_server import (
     MCPServerRuntime,
 )
 from app.schemas.wiki import WikiPageRead, WikiPageUpdate
+from app.schemas.ingestion import IngestionJobFileRead, IngestionJobRead
+from app.schemas.system import (
+    CacheStats,
+    EmbeddingCacheSpecStats,
+    EmbeddingCacheStats,
+    EmbeddingThroughputStats,
+    QueryEmbeddingStats,
+)
 
 __all__ = [
     "UserCreate",
@@ -80,12 +97,21 @@ __all__ = [
     "CollectionCreate",
     "CollectionUpdate",
     "CollectionRead",
+    "CollectionIndexRead",
+    "CollectionIndexStatusRead",
+    "CollectionReindexRequest",
+    "VectorIndexParams",
     "PaginatedCollectionResponse",
     "SearchQuery",
     "SearchResult",
+    "BatchSearchQuery",
+    "BatchSearchResult",
+    "FederatedSearchQuery",
+    "FederatedSearchResult",
     "ChunkItem",
     "DocumentChunk",
     "DocumentFile",
+    "DocumentFileChunks",
     "PaginatedChunkResponse",
     "ModelApiKeyCreate",
     "ModelApiKeyUpdate",
@@ -100,4 +126,11 @@ __all__ = [
     "MCPServerRuntime",
     "WikiPageRead",
     "WikiPageUpdate",
+    "CacheStats",
+    "IngestionJobRead",
+    "IngestionJobFileRead",
+    "EmbeddingCacheSpecStats",
+    "EmbeddingCacheStats",
+    "QueryEmbeddingStats",
+    "EmbeddingThroughputStats",
 ]
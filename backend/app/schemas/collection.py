@@ -1,13 +1,43 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+from typing import Literal
 from uuid import UUID
 from datetime import datetime
 
 
+class VectorIndexParams(BaseModel):
+    # HNSW 빌드/검색 파라미터
+    m: int | None = Field(None, ge=2, le=100)
+    ef_construction: int | None = Field(None, ge=4, le=1000)
+    ef_search: int | None = Field(None, ge=1, le=1000)
+    # IVFFlat 빌드/검색 파라미터(lists 미지정 시 행 수 기준 계산)
+    lists: int | None = Field(None, ge=1, le=32768)
+    probes: int | None = Field(None, ge=1, le=32768)
+    # 이진 양자화 1차 검색(bit 인덱스)과 재정렬 후보 배수
+    binary_quantize: bool | None = None
+    rerank_factor: int | None = Field(None, ge=1, le=100)
+
+    @model_validator(mode="after")
+    def _check_ef_construction(self):
+        if self.m and self.ef_construction and self.ef_construction < 2 * self.m:
+            raise ValueError("ef_construction은 2 * m 이상이어야 합니다.")
+        return self
+
+
 class CollectionCreate(BaseModel):
     name: str
     description: str | None = None
     is_public: bool | None = False
     model_api_key_id: int | None = 1
+    # True면 보조 인덱스 없이 생성(대량 적재 후 인덱스 빌드 요청)
+    bulk_load: bool = False
+    # 벡터 인덱스 정책(소규모 컬렉션은 none으로 정확 검색)
+    vector_index: Literal["hnsw", "ivfflat", "none"] = "hnsw"
+    vector_index_params: VectorIndexParams | None = None
+
+
+class CollectionReindexRequest(BaseModel):
+    vector_index: Literal["hnsw", "ivfflat", "none"]
+    vector_index_params: VectorIndexParams | None = None
 
 
 class CollectionUpdate(BaseModel):
@@ -28,6 +58,29 @@ class CollectionRead(BaseModel):
     owner_id: int
     document_count: int
     chunk_count: int
+    content_bytes: int = 0
+    index_status: str | None = None
+    vector_index: str | None = None
+    vector_index_params: dict | None = None
+    vector_type: str | None = None
+
+
+class CollectionIndexRead(BaseModel):
+    name: str
+    exists: bool
+    valid: bool
+    phase: str | None = None
+    blocks_done: int | None = None
+    blocks_total: int | None = None
+
+
+class CollectionIndexStatusRead(BaseModel):
+    collection_id: UUID
+    status: str
+    vector_index: str | None = None
+    error: str | None = None
+    updated_at: datetime | None = None
+    indexes: list[CollectionIndexRead] = []
 
 
 class PaginatedCollectionResponse(BaseModel):
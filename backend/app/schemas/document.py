@@ -1,5 +1,8 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 from typing import Any, Literal
+from uuid import UUID
 
 
 class ChunkItem(BaseModel):
@@ -18,9 +21,27 @@ class DocumentChunk(BaseModel):
 
 class DocumentFile(BaseModel):
     file_id: str
-    source: str
+    source: str | None = None
     chunk_count: int
-    chunks: list[ChunkItem]
+    # 청크 본문 바이트 합계(겹침 포함)와 원본 업로드 크기(모르면 None)
+    content_bytes: int = 0
+    file_size: int | None = None
+    content_hash: str | None = None
+    created_at: datetime | None = None
+    # 목록에서는 비워 두고 파일별 청크 조회로 지연 로딩
+    chunks: list[ChunkItem] = Field(default_factory=list)
+
+
+class DocumentFileChunks(BaseModel):
+    file_id: str
+    source: str | None = None
+    chunk_count: int
+    content_bytes: int = 0
+    file_size: int | None = None
+    content_hash: str | None = None
+    created_at: datetime | None = None
+    items: list[ChunkItem]
+    next_cursor: str | None = None
 
 
 class PaginatedChunkResponse(BaseModel):
@@ -33,6 +54,8 @@ class PaginatedDocumentResponse(BaseModel):
     items: list[DocumentFile]
     chunk_total: int
     file_total: int
+    # 다음 페이지 keyset cursor(마지막 페이지면 None)
+    next_cursor: str | None = None
 
 
 class DocumentRead(BaseModel):
@@ -51,6 +74,8 @@ class DocumentUploadResponse(BaseModel):
     message: str
     added_chunk_ids: list[str]
     warnings: list[str] | None = None
+    job_id: UUID | None = None
+    status: str | None = None
 
 
 class SearchQuery(BaseModel):
@@ -59,6 +84,27 @@ class SearchQuery(BaseModel):
     model_api_key_id: int | None = 1
     filter: dict[str, Any] | None = None
     search_type: Literal["semantic", "keyword", "hybrid"] = "semantic"
+    # hybrid 전용 RRF 신호 가중치(미지정 시 서버 설정값)
+    semantic_weight: float | None = Field(None, ge=0)
+    keyword_weight: float | None = Field(None, ge=0)
+
+
+class BatchSearchQuery(BaseModel):
+    # 질의 수 상한은 서버 설정(SEARCH_BATCH_MAX_QUERIES)으로 검사
+    queries: list[str] = Field(..., min_length=1)
+    limit: int | None = 10
+    model_api_key_id: int | None = 1
+    filter: dict[str, Any] | None = None
+
+
+class FederatedSearchQuery(BaseModel):
+    collection_ids: list[UUID] = Field(..., min_length=1)
+    query: str
+    limit: int | None = 10
+    model_api_key_id: int | None = 1
+    # 모든 컬렉션에 공통(동등 비교만)
+    filter: dict[str, Any] | None = None
+    search_type: Literal["semantic", "hybrid"] = "semantic"
 
 
 class SearchResult(BaseModel):
@@ -66,3 +112,17 @@ class SearchResult(BaseModel):
     page_content: str
     metadata: dict[str, Any]
     score: float | None = None
+    # hybrid 결과의 신호별 점수(벡터 거리, ts_rank_cd)
+    semantic_score: float | None = None
+    keyword_score: float | None = None
+
+
+class BatchSearchResult(BaseModel):
+    query: str
+    results: list[SearchResult]
+
+
+class FederatedSearchResult(SearchResult):
+    collection_id: str
+    # 정규화 전 컬렉션 검색 점수(semantic: 거리 지표 값, hybrid: RRF)
+    raw_score: float | None = None
@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class IngestionJobFileRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    file_id: UUID
+    filename: str | None = None
+    stage: str
+    chunk_count: int
+    error: str | None = None
+    updated_at: datetime | None = None
+
+
+class IngestionJobRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    collection_id: UUID
+    status: str
+    attempts: int
+    max_attempts: int
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+    finished_at: datetime | None = None
+    files: list[IngestionJobFileRead]
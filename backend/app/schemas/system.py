@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    name: str
+    size: int
+    maxsize: int
+    bytes: int = 0
+    max_bytes: int | None = None
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int = 0
+    hit_rate: float
+
+
+class EmbeddingCacheSpecStats(BaseModel):
+    embedding_spec_id: int
+    entries: int
+
+
+class EmbeddingCacheStats(BaseModel):
+    entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+    specs: list[EmbeddingCacheSpecStats]
+
+
+class QueryEmbeddingStats(BaseModel):
+    collection_id: str
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class EmbeddingThroughputStats(BaseModel):
+    provider: str
+    requests: int
+    texts: int
+    tokens: int
+    retries: int
+    rate_limited: int
+    wait_sec: float
+    busy_sec: float
+    tokens_per_sec: float
@@ -4,9 +4,13 @@ from app.services.conversation_history import ConversationHistoryService
 from app.services.chat import ChatService
 from app.services.document import DocumentService
 from app.services.collection import CollectionService
+from app.services.federated_search import FederatedSearchService
 from app.services.model_api_key import ModelApiKeyService
 from app.services.mcp_server import MCPServerService
 from app.services.wiki import WikiService
+from app.services.embedding_cache import EmbeddingCacheService
+from app.services.ingestion import IngestionService, IngestionWorker
+from app.services.collection_stats import CollectionStatsReconciler
 
 __all__ = [
     "AuthService",
@@ -15,7 +19,12 @@ __all__ = [
     "ConversationHistoryService",
     "DocumentService",
     "CollectionService",
+    "FederatedSearchService",
     "ModelApiKeyService",
     "MCPServerService",
     "WikiService",
+    "EmbeddingCacheService",
+    "IngestionService",
+    "IngestionWorker",
+    "CollectionStatsReconciler",
 ]
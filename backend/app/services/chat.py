@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import Any, AsyncIterator, Sequence
 import json
-import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import undefer, selectinload
@@ -15,9 +14,6 @@ from langchain_core.messages import (
     AIMessageChunk,
 )
 
-from langgraph.prebuilt import create_react_agent
-from langgraph.checkpoint.memory import MemorySaver
-
 from app.models import (
     Conversation,
     ConversationHistory,
@@ -25,7 +21,12 @@ from app.models import (
     ModelApiKey,
     MessageRoleLkp,
 )
-from app.utils import get_chat_model, load_mcp_tools_from_servers, to_jsonable
+from app.utils import (
+    get_or_build_agent,
+    lease_mcp_sessions,
+    load_mcp_tools_isolated,
+    to_jsonable,
+)
 
 ROLE_CODE_USER = "user"
 ROLE_CODE_ASSISTANT = "assistant"
@@ -405,6 +406,117 @@ class ChatService:
         res = await self.session.execute(select(MCPServer).where(MCPServer.id.in_(ids)))
         return list(res.scalars())
 
+    async def _run_agent(
+        self,
+        agent: Any,
+        msgs: list[BaseMessage],
+        cfg: dict,
+        *,
+        conv_id: int,
+        tool_role_id: int,
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Summary: 에이전트 그래프를 한 번만 실행하며 이벤트를 SSE 단위로 분류합니다.
+
+        Contract:
+            - astream_events(v2) 단일 실행으로 token/tool_start/tool_end/update를 생성합니다.
+            - 마지막에 최종 상태를 담은 "final" 이벤트를 yield합니다(SSE로 전달하지 않음).
+            - tool 이벤트는 별도 히스토리로 저장합니다.
+
+        Args:
+            agent: 컴파일된 LangGraph 에이전트.
+            msgs: 입력 메시지 목록.
+            cfg: 실행 설정.
+            conv_id: 대화 ID.
+            tool_role_id: tool 역할 ID.
+
+        Yields:
+            tuple[str, dict]: (event_name, payload).
+
+        Side Effects:
+            - DB 히스토리 저장
+            - 외부 LLM/MCP 툴 호출
+        """
+        async for ev in agent.astream_events(
+            {"messages": msgs}, config=cfg, version="v2"
+        ):
+            kind = ev.get("event")
+            name = ev.get("name")  # 툴/노드 이름
+            run_id = ev.get("run_id")  # 호출 식별자
+            data = ev.get("data") or {}
+            is_root = not ev.get("parent_ids")
+
+            if kind == "on_chat_model_stream":
+                chunk = data.get("chunk")
+                text = getattr(chunk, "content", None)
+                s = str(text) if text is not None else ""
+                if s and _is_ai_message(chunk):
+                    yield ("token", {"text": s})
+
+            elif kind == "on_tool_start":
+                row = ConversationHistory(
+                    conversation_id=conv_id,
+                    role_id=tool_role_id,
+                    content=None,
+                    tool_name=name,
+                    tool_call_id=str(run_id) if run_id else None,
+                    tool_input=to_jsonable(data.get("input")),
+                )
+                self.session.add(row)
+                await self.session.flush()
+                yield (
+                    "tool_start",
+                    {
+                        "tool_call_id": row.tool_call_id,
+                        "tool_name": name,
+                        "args": row.tool_input or {},
+                        "message_id": row.id,
+                    },
+                )
+
+            elif kind == "on_tool_end":
+                raw_output = data.get("output")
+                raw_error = data.get("error")
+                safe_output = (
+                    to_jsonable(raw_output, max_str_len=3000)
+                    if raw_output is not None
+                    else None
+                )
+                safe_error = (
+                    to_jsonable(raw_error, max_str_len=3000)
+                    if raw_error is not None
+                    else None
+                )
+                row = ConversationHistory(
+                    conversation_id=conv_id,
+                    role_id=tool_role_id,
+                    content=None,
+                    tool_name=name,
+                    tool_call_id=str(run_id) if run_id else None,
+                    tool_output=safe_output,
+                    error=(str(safe_error) if safe_error else None),
+                )
+                self.session.add(row)
+                await self.session.flush()
+                yield (
+                    "tool_end",
+                    {
+                        "tool_call_id": row.tool_call_id,
+                        "tool_name": name,
+                        "ok": raw_error is None,
+                        "output": row.tool_output if raw_error is None else None,
+                        "error": row.error,
+                        "message_id": row.id,
+                    },
+                )
+
+            elif kind == "on_chain_stream" and is_root:
+                # 루트 그래프 스트림 청크 = stream_mode="updates"의 {node: update}
+                yield ("update", {"note": str(data.get("chunk"))})
+
+            elif kind == "on_chain_end" and is_root:
+                yield ("final", {"output": data.get("output")})
+
     async def chat_invoke(
         self,
         *,
@@ -422,6 +534,8 @@ class ChatService:
         Contract:
             - 모델 키가 없으면 ValueError를 발생시킵니다.
             - 히스토리를 읽어 메시지 컨텍스트를 구성합니다.
+            - 스트리밍과 동일한 실행 엔진(_run_agent)을 사용합니다.
+            - 응답하지 않거나 차단된 MCP 서버는 제외하고 나머지 툴로 실행합니다.
 
         Args:
             user_id: 사용자 ID.
@@ -449,21 +563,17 @@ class ChatService:
             servers = await self._get_mcp_servers(mcp_server_ids)
         else:
             servers = conv.mcp_servers
-        tools = await load_mcp_tools_from_servers(servers)
-        model = get_chat_model(model_key.model, model_key, **(params or {}))
-        memory = MemorySaver()
-        agent = create_react_agent(model, tools, checkpointer=memory)
-        cfg = {"configurable": {"thread_id": str(conversation_id)}}
+        loaded = await load_mcp_tools_isolated(servers)
+        agent = get_or_build_agent(model_key, params, loaded.servers, loaded.tools)
+        cfg = {"configurable": {"thread_id": str(conv.id)}}
 
         user_role_id = await self._role_id(ROLE_CODE_USER)
         assistant_role_id = await self._role_id(ROLE_CODE_ASSISTANT)
-        system_role_id = await self._role_id(ROLE_CODE_SYSTEM)
         tool_role_id = await self._role_id(ROLE_CODE_TOOL)
         histories = await self.get_histories(
             conversation_id=conv.id, user_id=user_id, limit=1000
         )
-        _ = system_role_id, tool_role_id
-        msgs = self._build_messages_from_histories(histories, system_prompt)
+        msgs = _build_messages_from_histories(histories, system_prompt)
         msgs.append(HumanMessage(content=message))
         self.session.add(
             ConversationHistory(
@@ -471,10 +581,22 @@ class ChatService:
             )
         )
         await self.session.flush()
-        result = await agent.ainvoke({"messages": msgs}, config=cfg)
-        content = (
-            result["messages"][-1].content if isinstance(result, dict) else str(result)
-        )
+
+        parts: list[str] = []
+        result: Any = None
+        with lease_mcp_sessions(loaded.servers):
+            async for kind, payload in self._run_agent(
+                agent, msgs, cfg, conv_id=conv.id, tool_role_id=tool_role_id
+            ):
+                if kind == "token":
+                    parts.append(payload["text"])
+                elif kind == "final":
+                    result = payload["output"]
+
+        if isinstance(result, dict) and result.get("messages"):
+            content = str(result["messages"][-1].content)
+        else:
+            content = "".join(parts)
         ai = ConversationHistory(
             conversation_id=conv.id,
             role_id=assistant_role_id,
@@ -505,7 +627,8 @@ class ChatService:
 
         Contract:
             - SSE 이벤트 이름과 payload를 튜플로 yield합니다.
-            - tool 이벤트는 별도 히스토리로 저장합니다.
+            - 그래프는 한 번만 실행되며 tool 이벤트는 별도 히스토리로 저장합니다.
+            - 응답하지 않거나 차단된 MCP 서버는 제외하고 warning 이벤트로 알립니다.
 
         Args:
             user_id: 사용자 ID.
@@ -544,7 +667,9 @@ class ChatService:
         assistant_role_id = await self._role_id(ROLE_CODE_ASSISTANT)
         tool_role_id = await self._role_id(ROLE_CODE_TOOL)
 
-        tools = await load_mcp_tools_from_servers(servers)
+        loaded = await load_mcp_tools_isolated(servers)
+        for warning in loaded.warnings:
+            yield ("warning", warning)
         histories = await self.get_histories(
             conversation_id=conv_id, user_id=user_id, limit=1000
         )
@@ -558,147 +683,19 @@ class ChatService:
         )
         await self.session.flush()
 
-        model = get_chat_model(model_name, model_key, **(params or {}))
-        memory = MemorySaver()
-        agent = create_react_agent(model, tools, checkpointer=memory)
+        agent = get_or_build_agent(model_key, params, loaded.servers, loaded.tools)
         cfg = {"configurable": {"thread_id": str(conv_id)}}
 
         parts: list[str] = []
-        q: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
-
-        async def consume_events():
-            """
-            Summary: LangGraph 이벤트를 구독해 툴 호출 상태를 큐로 전달합니다.
-
-            Contract:
-                - on_tool_start/on_tool_end만 처리합니다.
-
-            Side Effects:
-                - DB 히스토리 저장
-                - SSE 큐 적재
-            """
-            try:
-                async for ev in agent.astream_events(
-                    {"messages": msgs}, config=cfg, version="v2"
-                ):
-                    kind = ev.get("event")  # 예: "on_tool_start", "on_tool_end"
-                    name = ev.get("name")  # 툴 이름
-                    run_id = ev.get("run_id") or ev.get("id")  # 호출 식별자
-                    data = ev.get("data") or {}
-
-                    if kind == "on_tool_start":
-                        # 입력 인자 추출 (스키마에 따라 data에 포함)
-                        tool_input = (
-                            data.get("input") if isinstance(data, dict) else None
-                        )
-                        row = ConversationHistory(
-                            conversation_id=conv_id,
-                            role_id=tool_role_id,
-                            content=None,
-                            tool_name=name,
-                            tool_call_id=str(run_id) if run_id else None,
-                            tool_input=to_jsonable(tool_input),
-                        )
-                        self.session.add(row)
-                        await self.session.flush()
-                        await q.put(
-                            (
-                                "tool_start",
-                                {
-                                    "tool_call_id": row.tool_call_id,
-                                    "tool_name": name,
-                                    "args": row.tool_input or {},
-                                    "message_id": row.id,
-                                },
-                            )
-                        )
-
-                    elif kind == "on_tool_end":
-                        # 결과/에러 추출 (LangChain 콜백/이벤트 규격)
-                        raw_output = (
-                            data.get("output") if isinstance(data, dict) else None
-                        )
-                        raw_error = (
-                            data.get("error") if isinstance(data, dict) else None
-                        )
-                        safe_output = (
-                            to_jsonable(raw_output, max_str_len=3000)
-                            if raw_output is not None
-                            else None
-                        )
-                        safe_error = (
-                            to_jsonable(raw_error, max_str_len=3000)
-                            if raw_error is not None
-                            else None
-                        )
-
-                        row = ConversationHistory(
-                            conversation_id=conv_id,
-                            role_id=tool_role_id,
-                            content=None,
-                            tool_name=name,
-                            tool_call_id=str(run_id) if run_id else None,
-                            tool_output=safe_output,
-                            error=(str(safe_error) if safe_error else None),
-                        )
-                        self.session.add(row)
-                        await self.session.flush()
-                        await q.put(
-                            (
-                                "tool_end",
-                                {
-                                    "tool_call_id": row.tool_call_id,
-                                    "tool_name": name,
-                                    "ok": raw_error is None,
-                                    "output": (
-                                        row.tool_output if raw_error is None else None
-                                    ),
-                                    "error": row.error,
-                                    "message_id": row.id,
-                                },
-                            )
-                        )
-
-                    # 필요시 다른 이벤트도 필터링 가능:
-                    # - "on_chat_model_stream", "on_chain_start/end" 등
-            except Exception as e:
-                import traceback
-
-                tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))[
-                    :8000
-                ]
-                await q.put(("error", {"message": str(e), "traceback": tb}))
-
-        ev_task = asyncio.create_task(consume_events())
-        try:
-            async for mode, payload in agent.astream(
-                {"messages": msgs}, config=cfg, stream_mode=["messages", "updates"]
+        with lease_mcp_sessions(loaded.servers):
+            async for kind, payload in self._run_agent(
+                agent, msgs, cfg, conv_id=conv_id, tool_role_id=tool_role_id
             ):
-                # 이벤트 큐 비우기 → SSE로 전달
-                while not q.empty():
-                    k, p = await q.get()
-                    yield (k, p)
-
-                if mode == "messages":
-                    msg, meta = payload
-                    text = getattr(msg, "content", None)
-                    s = str(text) if text is not None else str(msg)
-                    if s and _is_ai_message(msg):
-                        parts.append(s)
-                        yield ("token", {"text": s})
-
-                elif mode == "updates":
-                    yield ("update", {"note": str(payload)})
-        finally:
-            # 남은 이벤트 배출 후 태스크 종료 대기
-            await asyncio.sleep(0)
-            while not q.empty():
-                k, p = await q.get()
-                yield (k, p)
-            try:
-                await asyncio.wait_for(ev_task, timeout=0.1)
-            except Exception:
-                pass
+                if kind == "final":
+                    continue
+                if kind == "token":
+                    parts.append(payload["text"])
+                yield (kind, payload)
 
         # 최종 답변 저장 (툴 결과는 포함 안 함)
         final_text = "".join(parts)
@@ -1,18 +1,41 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import or_, select, func
 from sqlalchemy.orm import selectinload
 
-from app.db import create_vectorstore_table, raw_sql
-from app.models import Collection, User, EmbeddingSpec, ModelApiKey
+from app.db import (
+    async_session,
+    build_secondary_indexes,
+    create_vectorstore_table,
+    drop_secondary_indexes,
+    has_vector_index,
+    index_build_in_progress,
+    invalidate_vectorstore,
+    raw_sql,
+    secondary_index_state,
+    storage_type_for,
+    vector_index_spec,
+)
+from app.models import (
+    Collection,
+    CollectionIndexStatus,
+    User,
+    EmbeddingSpec,
+    ModelApiKey,
+)
 from app.schemas import (
     CollectionCreate,
     CollectionUpdate,
     CollectionRead,
+    CollectionIndexStatusRead,
+    CollectionReindexRequest,
     PaginatedCollectionResponse,
 )
+from app.core import settings
+from app.utils import invalidate_search_results
 from app.utils import is_admin_user as is_admin
 
 from app.services.model_api_key import ModelApiKeyService
@@ -20,6 +43,29 @@ from app.services.model_api_key import ModelApiKeyService
 logger = logging.getLogger(__name__)
 
 
+def _to_read(collection: Collection) -> CollectionRead:
+    return CollectionRead(
+        collection_id=collection.id,
+        table_id=collection.table_name,
+        name=collection.name,
+        description=collection.description,
+        is_public=collection.is_public,
+        owner_id=collection.owner_id,
+        document_count=collection.document_count,
+        chunk_count=collection.chunk_count,
+        content_bytes=collection.content_bytes,
+        index_status=collection.index_status,
+        vector_index=collection.vector_index,
+        vector_index_params=collection.vector_index_params,
+        vector_type=collection.vector_type,
+        embedding_id=collection.embedding_id,
+        embedding_dimension=(
+            collection.embedding.dimension if collection.embedding else None
+        ),
+        embedding_model=(collection.embedding.model if collection.embedding else None),
+    )
+
+
 class CollectionService:
     def __init__(self, db: AsyncSession):
         """
@@ -142,6 +188,11 @@ class CollectionService:
 
         Contract:
             - 컬렉션 임베딩 모델은 모델 API 키와 일치해야 합니다.
+            - bulk_load=True면 보조 인덱스 없이 만들고 index_status를 deferred로 둡니다.
+            - lists 지정 없는 ivfflat은 빈 테이블에 만들지 않으므로 deferred로 두고,
+              적재 후 인덱스 빌드 요청으로 행 수에 맞춰 만듭니다.
+            - 벡터 인덱스는 vector_index 정책(hnsw/ivfflat/none)에 따라 하나만 만듭니다.
+            - 저장 타입(vector/halfvec)은 storage_type_for로 임베딩 스펙에서 정합니다.
 
         Args:
             user: 요청 사용자.
@@ -169,7 +220,22 @@ class CollectionService:
             is_public=data.is_public,
             owner_id=user.id,
             embedding_id=emb_spec.id,
+            index_status=(
+                CollectionIndexStatus.DEFERRED.value
+                if data.bulk_load
+                else CollectionIndexStatus.READY.value
+            ),
+            vector_index=data.vector_index,
+            vector_index_params=(
+                data.vector_index_params.model_dump(exclude_none=True)
+                if data.vector_index_params
+                else None
+            ),
+            vector_type=storage_type_for(emb_spec),
         )
+        collection.embedding = emb_spec
+        if has_vector_index(collection) and vector_index_spec(collection) is None:
+            collection.index_status = CollectionIndexStatus.DEFERRED.value
 
         try:
             self.db.add(collection)
@@ -177,6 +243,7 @@ class CollectionService:
             await self.db.refresh(collection)
             await create_vectorstore_table(
                 collection=collection,
+                defer_indexes=data.bulk_load,
             )
         except Exception as e:
             await self.db.rollback()
@@ -199,12 +266,19 @@ class CollectionService:
             owner_id=collection.owner_id,
             document_count=0,
             chunk_count=0,
+            index_status=collection.index_status,
+            vector_index=collection.vector_index,
+            vector_index_params=collection.vector_index_params,
+            vector_type=collection.vector_type,
         )
 
     async def get(self, collection_id: UUID, user: User) -> CollectionRead:
         """
         Summary: 컬렉션 상세 정보와 문서/청크 카운트를 반환합니다.
 
+        Contract:
+            - 카운트는 collections 행에 유지되는 집계이며 컬렉션 테이블을 스캔하지 않습니다.
+
         Args:
             collection_id: 컬렉션 ID.
             user: 요청 사용자.
@@ -216,7 +290,7 @@ class CollectionService:
             HTTPException: 컬렉션 미존재 또는 접근 권한 없음.
 
         Side Effects:
-            - DB 조회(raw SQL 포함)
+            - DB 조회
         """
         collection = await self.db.get(
             Collection, collection_id, options=(selectinload(Collection.embedding),)
@@ -228,36 +302,7 @@ class CollectionService:
         if not (collection.is_public or is_owner or is_admin(user)):
             raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
 
-        row = await raw_sql(
-            self.db,
-            f"""
-            SELECT
-                COUNT(DISTINCT file_id ) AS document_count,
-                COUNT(*) AS chunk_count
-            FROM {collection.table_name}
-            """,
-            one=True,
-        )
-        document_count = row.get("document_count", 0)
-        chunk_count = row.get("chunk_count", 0)
-
-        return CollectionRead(
-            collection_id=collection.id,
-            table_id=collection.table_name,
-            name=collection.name,
-            description=collection.description,
-            is_public=collection.is_public,
-            owner_id=collection.owner_id,
-            document_count=document_count,
-            chunk_count=chunk_count,
-            embedding_id=collection.embedding_id,
-            embedding_dimension=(
-                collection.embedding.dimension if collection.embedding else None
-            ),
-            embedding_model=(
-                collection.embedding.model if collection.embedding else None
-            ),
-        )
+        return _to_read(collection)
 
     async def get_list(
         self,
@@ -270,6 +315,7 @@ class CollectionService:
 
         Contract:
             - 공개 컬렉션 또는 소유 컬렉션만 반환합니다.
+            - 카운트는 collections 행의 집계를 쓰므로 목록 조회는 단일 쿼리입니다.
 
         Args:
             user: 요청 사용자.
@@ -280,7 +326,7 @@ class CollectionService:
             PaginatedCollectionResponse: 목록과 전체 개수.
 
         Side Effects:
-            - DB 조회(raw SQL 포함)
+            - DB 조회
         """
         is_admin_check = is_admin(user)
         condition = or_(
@@ -302,46 +348,7 @@ class CollectionService:
         )
         collections = result.scalars().all()
 
-        items = []
-        for row in collections:
-            collection: Collection = row
-
-            try:
-                raw = await raw_sql(
-                    self.db,
-                    f"""
-                    SELECT
-                        COUNT(DISTINCT file_id) AS document_count,
-                        COUNT(*) AS chunk_count
-                    FROM {collection.table_name}
-                    """,
-                    one=True,
-                )
-
-                document_count = raw.get("document_count", 0)
-                chunk_count = raw.get("chunk_count", 0)
-            except Exception:
-                document_count, chunk_count = 0, 0
-
-            items.append(
-                CollectionRead(
-                    collection_id=collection.id,
-                    table_id=collection.table_name,
-                    name=collection.name,
-                    description=collection.description,
-                    is_public=collection.is_public,
-                    owner_id=collection.owner_id,
-                    document_count=document_count,
-                    chunk_count=chunk_count,
-                    embedding_id=collection.embedding_id,
-                    embedding_dimension=(
-                        collection.embedding.dimension if collection.embedding else None
-                    ),
-                    embedding_model=(
-                        collection.embedding.model if collection.embedding else None
-                    ),
-                )
-            )
+        items = [_to_read(collection) for collection in collections]
 
         return PaginatedCollectionResponse(
             total_count=total_count,
@@ -392,35 +399,7 @@ class CollectionService:
         )
         collection = res.scalar_one()
 
-        raw = await raw_sql(
-            self.db,
-            f"""
-            SELECT
-                COUNT(DISTINCT file_id) AS document_count,
-                COUNT(*) AS chunk_count
-            FROM {collection.table_name}
-            """,
-            one=True,
-        )
-        document_count = raw.get("document_count", 0)
-        chunk_count = raw.get("chunk_count", 0)
-        return CollectionRead(
-            collection_id=collection.id,
-            table_id=collection.table_name,
-            name=collection.name,
-            description=collection.description,
-            is_public=collection.is_public,
-            owner_id=collection.owner_id,
-            document_count=document_count,
-            chunk_count=chunk_count,
-            embedding_id=collection.embedding_id,
-            embedding_dimension=(
-                collection.embedding.dimension if collection.embedding else None
-            ),
-            embedding_model=(
-                collection.embedding.model if collection.embedding else None
-            ),
-        )
+        return _to_read(collection)
 
     async def delete(self, collection_id: UUID, user: User) -> None:
         """
@@ -434,7 +413,7 @@ class CollectionService:
             HTTPException: 컬렉션 미존재 또는 권한 없음.
 
         Side Effects:
-            - 벡터 테이블 DROP
+            - 벡터 테이블 DROP 및 벡터스토어 캐시 무효화
             - DB 컬렉션 레코드 삭제
         """
         collection = await self.db.get(Collection, collection_id)
@@ -451,6 +430,226 @@ class CollectionService:
             self.db,
             f"DROP TABLE IF EXISTS {table_name} CASCADE",
         )
+        invalidate_vectorstore(table_name)
+        invalidate_search_results(collection.id)
 
         await self.db.delete(collection)
         await self.db.commit()
+
+    async def _get_writable(self, collection_id: UUID, user: User) -> Collection:
+        """
+        Why: 인덱스 관리처럼 소유자/관리자만 가능한 작업의 대상을 조회합니다.
+
+        Raises:
+            HTTPException: 컬렉션 미존재(404) 또는 권한 없음(403).
+        """
+        collection = await self.db.get(
+            Collection, collection_id, options=(selectinload(Collection.embedding),)
+        )
+        if not collection:
+            raise HTTPException(status_code=404, detail="컬렉션을 찾을 수 없습니다.")
+        if not (user.id == collection.owner_id or is_admin(user)):
+            raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
+        return collection
+
+    async def _ensure_not_building(self, collection: Collection) -> None:
+        """
+        Summary: 인덱스 빌드가 실제로 진행 중이면 409를 발생시킵니다.
+
+        Contract:
+            - building 상태라도 index_updated_at이 index_build_stale_sec보다 오래됐고
+              진행 중인 CREATE INDEX가 없으면 중단된 빌드(프로세스 재시작 등)로 보고 통과합니다.
+
+        Raises:
+            HTTPException: 빌드 진행 중(409).
+        """
+        if collection.index_status != CollectionIndexStatus.BUILDING.value:
+            return
+        updated_at = collection.index_updated_at
+        stale_after = timedelta(seconds=settings.index_build_stale_sec)
+        if (
+            updated_at is None or datetime.now(timezone.utc) - updated_at >= stale_after
+        ) and not await index_build_in_progress(collection):
+            logger.warning(
+                f"[index {collection.id}] 중단된 building 상태를 무시하고 다시 진행합니다."
+            )
+            return
+        raise HTTPException(status_code=409, detail="인덱스를 빌드 중입니다.")
+
+    async def get_index_status(
+        self, collection_id: UUID, user: User
+    ) -> CollectionIndexStatusRead:
+        """
+        Summary: 컬렉션 보조 인덱스 상태와 인덱스별 유효/빌드 진행 상황을 반환합니다.
+
+        Args:
+            collection_id: 컬렉션 ID.
+            user: 요청 사용자.
+
+        Returns:
+            CollectionIndexStatusRead: 인덱스 상태 DTO.
+
+        Raises:
+            HTTPException: 컬렉션 미존재 또는 접근 권한 없음.
+
+        Side Effects:
+            - DB 카탈로그 조회
+        """
+        collection = await self.get_orm_model(collection_id, user)
+        return CollectionIndexStatusRead(
+            collection_id=collection.id,
+            status=collection.index_status,
+            vector_index=collection.vector_index,
+            error=collection.index_error,
+            updated_at=collection.index_updated_at,
+            indexes=await secondary_index_state(collection),
+        )
+
+    async def defer_indexes(
+        self, collection_id: UUID, user: User
+    ) -> CollectionIndexStatusRead:
+        """
+        Summary: 대량 적재를 위해 보조 인덱스를 제거하고 deferred 상태로 전환합니다.
+
+        Contract:
+            - 빌드 중에는 전환할 수 없습니다(409, 중단된 빌드는 제외).
+            - 인덱스가 없는 동안 검색은 순차 스캔으로 동작합니다.
+
+        Args:
+            collection_id: 컬렉션 ID.
+            user: 요청 사용자.
+
+        Returns:
+            CollectionIndexStatusRead: 전환 후 인덱스 상태.
+
+        Raises:
+            HTTPException: 컬렉션 미존재, 권한 없음, 빌드 중.
+
+        Side Effects:
+            - 보조 인덱스 DROP
+            - DB 컬렉션 레코드 업데이트
+        """
+        collection = await self._get_writable(collection_id, user)
+        await self._ensure_not_building(collection)
+        await drop_secondary_indexes(collection)
+        collection.index_status = CollectionIndexStatus.DEFERRED.value
+        collection.index_error = None
+        collection.index_updated_at = datetime.now(timezone.utc)
+        await self.db.commit()
+        return await self.get_index_status(collection_id, user)
+
+    async def start_index_build(
+        self, collection_id: UUID, user: User
+    ) -> CollectionIndexStatusRead:
+        """
+        Summary: 보조 인덱스 빌드를 building 상태로 예약합니다.
+
+        Contract:
+            - 실제 빌드는 호출자가 run_index_build로 백그라운드 실행합니다.
+            - 이미 빌드 중이면 409를 반환합니다. 재시작 등으로 중단되어 building에 남은
+              상태(_ensure_not_building)는 다시 예약할 수 있습니다.
+
+        Args:
+            collection_id: 컬렉션 ID.
+            user: 요청 사용자.
+
+        Returns:
+            CollectionIndexStatusRead: 예약 직후 인덱스 상태.
+
+        Raises:
+            HTTPException: 컬렉션 미존재, 권한 없음, 빌드 중.
+
+        Side Effects:
+            - DB 컬렉션 레코드 업데이트
+        """
+        collection = await self._get_writable(collection_id, user)
+        await self._ensure_not_building(collection)
+        collection.index_status = CollectionIndexStatus.BUILDING.value
+        collection.index_error = None
+        collection.index_updated_at = datetime.now(timezone.utc)
+        await self.db.commit()
+        return CollectionIndexStatusRead(
+            collection_id=collection.id,
+            status=collection.index_status,
+            vector_index=collection.vector_index,
+            updated_at=collection.index_updated_at,
+        )
+
+    async def reindex(
+        self, collection_id: UUID, data: CollectionReindexRequest, user: User
+    ) -> CollectionIndexStatusRead:
+        """
+        Summary: 벡터 인덱스 정책을 바꾸고 재색인을 building 상태로 예약합니다.
+
+        Contract:
+            - 실제 빌드는 호출자가 run_index_build(rebuild_vector=True)로 실행합니다.
+            - 재색인 동안 벡터 검색은 순차 스캔으로 동작합니다.
+            - 이미 빌드 중이면 409를 반환합니다. 재시작 등으로 중단되어 building에 남은
+              상태(_ensure_not_building)는 다시 예약할 수 있습니다.
+
+        Args:
+            collection_id: 컬렉션 ID.
+            data: 새 벡터 인덱스 정책.
+            user: 요청 사용자.
+
+        Returns:
+            CollectionIndexStatusRead: 예약 직후 인덱스 상태.
+
+        Raises:
+            HTTPException: 컬렉션 미존재, 권한 없음, 빌드 중.
+
+        Side Effects:
+            - DB 컬렉션 레코드 업데이트
+        """
+        collection = await self._get_writable(collection_id, user)
+        await self._ensure_not_building(collection)
+        collection.vector_index = data.vector_index
+        collection.vector_index_params = (
+            data.vector_index_params.model_dump(exclude_none=True)
+            if data.vector_index_params
+            else None
+        )
+        return await self.start_index_build(collection_id, user)
+
+
+async def run_index_build(collection_id: UUID, *, rebuild_vector: bool = False) -> None:
+    """
+    Summary: 보조 인덱스를 CONCURRENTLY로 빌드하고 결과를 컬렉션 상태에 기록합니다.
+
+    Contract:
+        - 요청 세션과 분리된 새 세션을 사용합니다(백그라운드 태스크).
+        - 실패 시 failed와 오류 메시지를 남기며, 다시 빌드 요청하면 이어서 생성합니다.
+        - 빈 테이블이라 IVFFlat을 보류하면 deferred로 남깁니다.
+
+    Args:
+        collection_id: 컬렉션 ID.
+        rebuild_vector: 기존 벡터 인덱스를 지우고 현재 정책으로 다시 만들지 여부.
+
+    Side Effects:
+        - DB DDL(CREATE INDEX CONCURRENTLY)
+        - DB 컬렉션 레코드 업데이트
+    """
+    async with async_session() as session:
+        collection = await session.get(
+            Collection, collection_id, options=(selectinload(Collection.embedding),)
+        )
+        if not collection:
+            return
+        try:
+            complete = await build_secondary_indexes(
+                collection, rebuild_vector=rebuild_vector
+            )
+        except Exception as e:
+            logger.exception(f"[index {collection_id}] 인덱스 빌드 실패: {e!r}")
+            collection.index_status = CollectionIndexStatus.FAILED.value
+            collection.index_error = str(e)
+        else:
+            # 빈 테이블이라 IVFFlat을 보류했으면 적재 후 다시 빌드하도록 deferred로 둡니다.
+            collection.index_status = (
+                CollectionIndexStatus.READY.value
+                if complete
+                else CollectionIndexStatus.DEFERRED.value
+            )
+            collection.index_error = None
+        collection.index_updated_at = datetime.now(timezone.utc)
+        await session.commit()
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from sqlalchemy import select
+
+from app.core import settings
+from app.db import async_session, refresh_collection_stats
+from app.models import Collection
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_collection_stats() -> list[dict[str, Any]]:
+    """
+    Summary: 모든 컬렉션의 청크/문서/바이트 집계를 테이블 전체 재집계로 보정합니다.
+
+    Contract:
+        - 컬렉션마다 별도 트랜잭션으로 처리해 한 컬렉션 실패가 나머지를 막지 않습니다.
+        - write_version은 올리지 않습니다(데이터 변경 없음).
+        - 집계가 달라진(드리프트) 컬렉션만 경고 로그와 함께 반환합니다.
+
+    Returns:
+        list[dict[str, Any]]: 드리프트가 있던 컬렉션의 보정 전/후 집계 목록.
+
+    Side Effects:
+        - 컬렉션 테이블 전체 스캔
+        - collections 행 갱신(stats_reconciled_at)
+    """
+    async with async_session() as session:
+        collections = (await session.execute(select(Collection))).scalars().all()
+
+    drift = []
+    for collection in collections:
+        try:
+            async with async_session() as session:
+                stats = await refresh_collection_stats(session, collection)
+                await session.commit()
+        except Exception:
+            logger.exception(f"[collection-stats] {collection.id} 집계 보정 실패")
+            continue
+        if stats is None:
+            continue
+        if any(
+            stats[f"before_{name}"] != stats[name]
+            for name in ("chunk_count", "document_count", "content_bytes")
+        ):
+            logger.warning(
+                f"[collection-stats] {collection.id} 집계 드리프트 보정: {stats}"
+            )
+            drift.append({"collection_id": str(collection.id), **stats})
+    return drift
+
+
+class CollectionStatsReconciler:
+    """
+    Summary: 컬렉션 집계 보정을 주기적으로 실행하는 백그라운드 작업입니다.
+
+    Contract:
+        - interval이 0 이하이면 시작하지 않습니다.
+        - 보정 실패는 로그만 남기고 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self, *, interval: float) -> None:
+        self.interval = interval
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._loop(), name="collection-stats")
+
+    async def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await reconcile_collection_stats()
+            except Exception:
+                logger.exception("[collection-stats] 집계 보정 작업 오류")
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+async def _main() -> None:
+    drift = await reconcile_collection_stats()
+    print(json.dumps(drift, ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
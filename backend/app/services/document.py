@@ -1,20 +1,39 @@
+import base64
 import json
 import logging
 import re
+from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID, uuid4
 
-from fastapi import HTTPException, UploadFile, status
+from fastapi import HTTPException, status
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_vectorstore, raw_sql
+from app.db import (
+    batch_search,
+    binary_quantized,
+    bulk_insert_chunks,
+    delete_chunks_sql,
+    get_hybrid_config,
+    get_vectorstore,
+    hybrid_search,
+    plan_vector_search,
+    quantized_search,
+    raw_sql,
+    record_inserted_chunks,
+    record_search_outcome,
+    vector_type,
+)
 from app.models import Collection, ModelApiKey, User
-from app.schemas import DocumentUploadResponse
 from app.services.collection import CollectionService
+from app.services.embedding_cache import EmbeddingCacheService
 from app.services.model_api_key import ModelApiKeyService
-from app.utils import get_embedding, process_document
+from app.core import settings
+from app.utils import CachedQueryEmbeddings, get_embedding
 from app.utils import is_admin_user as is_admin
+from app.utils.search_cache import search_cache_key, search_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +41,52 @@ _ASCII_RE = re.compile(r"^[\x00-\x7F]+$")
 _HANGUL_RE = re.compile(r"[\u3130-\u318F\uAC00-\uD7A3]")
 
 
+def _encode_cursor(*values: str) -> str:
+    """
+    Why: keyset 페이지 위치를 클라이언트가 그대로 돌려주는 불투명 문자열로 만듭니다.
+    """
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> list[str]:
+    """
+    Summary: _encode_cursor로 만든 cursor를 값 size개의 목록으로 되돌립니다.
+
+    Raises:
+        HTTPException: cursor 형식 오류(400).
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, UnicodeError) as exc:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다.")
+    return values
+
+
+def _chunk_item(row: Any) -> dict[str, Any]:
+    """
+    Summary: 청크 행을 ChunkItem 형태(메타데이터 컬럼 + JSON 메타데이터 병합)로 변환합니다.
+    """
+    metadata = {
+        "file_id": row["file_id"],
+        "chunk_index": row["chunk_index"],
+        "source": row["source"],
+    }
+    if row["langchain_metadata"]:
+        try:
+            extra = row["langchain_metadata"]
+            metadata.update(extra if isinstance(extra, dict) else json.loads(extra))
+        except Exception:
+            pass
+    return {
+        "id": str(row["langchain_id"]),
+        "content": row["content"],
+        "metadata": metadata,
+        "source": row["source"],
+    }
+
+
 def _choose_fts(detail: str) -> tuple[str, str]:
     """
     Why: 입력 언어 특성에 맞는 FTS 구성/컬럼을 선택합니다.
@@ -149,140 +214,121 @@ class DocumentService:
 
         return model_api_key
 
-    async def upsert(
-        self, documents: list[Document], model_api_key: ModelApiKey
-    ) -> list[str]:
+    async def resolve_upload_target(
+        self, model_api_key_id: int
+    ) -> tuple[Collection, ModelApiKey]:
         """
-        Summary: 문서를 벡터스토어에 추가하고 생성된 ID를 반환합니다.
-
-        Contract:
-            - 임베딩 생성 실패 시 400을 반환합니다.
-            - 벡터스토어 장애는 error_id와 함께 500으로 래핑합니다.
+        Summary: 업로드 대상 컬렉션과 임베딩 키를 조회하고 모델 일치를 검증합니다.
 
         Args:
-            documents: LangChain Document 목록.
-            model_api_key: 임베딩에 사용할 API 키.
+            model_api_key_id: 사용할 모델 API 키 ID.
 
         Returns:
-            list[str]: 추가된 문서/청크 ID 목록.
+            tuple[Collection, ModelApiKey]: (컬렉션, 키).
 
         Raises:
-            HTTPException: 임베딩/벡터스토어 처리 실패.
+            HTTPException: 접근 권한 없음, 키 미존재, 모델 불일치(400).
 
         Side Effects:
-            - 외부 임베딩 API 호출
-            - 벡터스토어 저장
+            - DB 조회
         """
+        model_api_key = await self._reslove_model_api_key(model_api_key_id)
         collection = await self._get_collection()
-        try:
-            embed = get_embedding(
-                model_name=collection.embedding.model, model_api_key=model_api_key
-            )
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-        try:
-            store = await get_vectorstore(
-                collection=collection,
-                embedding=embed,
-            )
-            added_ids = await store.aadd_documents(documents)
-            return added_ids
-        except HTTPException:
-            raise
-        except Exception as exc:
-            error_id = uuid4().hex[:8]
-            logger.exception(f"[{error_id}] 벡터스토어 추가 중 오류 발생: {exc!r}")
+        if (
+            collection.embedding.model != model_api_key.model
+            or model_api_key.provider_id != collection.embedding.provider_id
+        ):
             raise HTTPException(
-                status_code=500,
-                detail=f"벡터스토어 추가 중 오류 발생 (error_id={error_id})",
-            ) from exc
+                status_code=400,
+                detail="컬렉션의 임베딩 모델과 API 키의 모델이 일치하지 않습니다.",
+            )
+        return collection, model_api_key
 
-    async def create(
+    async def embed_chunks(
         self,
-        files: list[UploadFile],
-        metadatas: list[dict[str, Any] | None],
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200,
-        model_api_key_id: int = 1,
-    ) -> DocumentUploadResponse:
+        collection: Collection,
+        embed: Embeddings,
+        documents: list[Document],
+        *,
+        session: AsyncSession | None = None,
+    ) -> list[list[float]]:
         """
-        Summary: 파일을 청크로 분해해 임베딩 후 벡터스토어에 저장합니다.
+        Summary: 청크 벡터를 임베딩 캐시 우선으로 계산합니다.
 
-        Contract:
-            - 메타데이터 수와 파일 수가 일치해야 합니다.
-            - 컬렉션 임베딩 설정과 API 키 모델이 일치해야 합니다.
+        Args:
+            collection: 대상 컬렉션.
+            embed: 임베딩 클라이언트.
+            documents: 청크 문서 목록.
+            session: 캐시 조회 세션(옵션). 배치를 동시에 임베딩할 때 배치별로 넘깁니다.
+
+        Returns:
+            list[list[float]]: 문서 순서의 벡터 목록.
+
+        Side Effects:
+            - 임베딩 캐시 조회/저장
+            - 외부 임베딩 API 호출(캐시 미스만)
+        """
+        return await EmbeddingCacheService(session or self.db).embed_documents(
+            collection.embedding_id, embed, [d.page_content for d in documents]
+        )
+
+    async def store_chunks(
+        self,
+        collection: Collection,
+        embed: Embeddings,
+        documents: list[Document],
+        vectors: list[list[float]],
+    ) -> list[str]:
+        """
+        Summary: 계산된 벡터와 청크를 컬렉션 벡터 테이블에 저장합니다.
 
         Args:
-            files: 업로드 파일 목록.
-            metadatas: 파일별 메타데이터 목록.
-            chunk_size: 청크 크기.
-            chunk_overlap: 청크 겹침 크기.
-            model_api_key_id: 사용할 모델 API 키 ID.
+            collection: 대상 컬렉션.
+            embed: 임베딩 클라이언트(벡터스토어 생성용).
+            documents: 청크 문서 목록.
+            vectors: documents와 같은 순서의 벡터 목록.
 
         Returns:
-            DocumentUploadResponse: 업로드 결과 요약.
+            list[str]: 추가된 청크 ID 목록.
 
-        Raises:
-            HTTPException: 파일 처리 실패, 모델 불일치, 벡터 저장 실패.
+        Contract:
+            - VECTOR_BULK_INSERT가 켜져 있으면 바이너리 COPY로 한 트랜잭션에 적재합니다.
+            - 꺼져 있으면 PGVectorStore의 행 단위 INSERT를 사용합니다.
+            - 컬렉션 집계와 write_version을 증분 갱신합니다(COPY 경로는 같은 트랜잭션에서,
+              행 단위 INSERT 경로는 적재 후). 전체 재집계는 주기적 보정 작업만 합니다.
 
         Side Effects:
-            - 파일 파싱/청킹
-            - 임베딩 생성
             - 벡터스토어 저장
+            - 컬렉션 집계/write_version 갱신
         """
-        docs_to_index: list[Document] = []
-        processed_files_count = 0
-        failed_files: list[str] = []
-        model_api_key = await self._reslove_model_api_key(model_api_key_id)
-        collection = await self._get_collection()
-        if (
-            collection.embedding.model != model_api_key.model
-            or model_api_key.provider_id != collection.embedding.provider_id
-        ):
-            raise HTTPException(
-                status_code=400,
-                detail="컬렉션의 임베딩 모델과 API 키의 모델이 일치하지 않습니다.",
-            )
-
-        for file, metadata in zip(files, metadatas, strict=False):
-            try:
-                docs = await process_document(
-                    file=file,
-                    metadata=metadata,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap,
-                )
-                if docs:
-                    docs_to_index.extend(docs)
-                    processed_files_count += 1
-                else:
-                    logger.warning(f"파일에서 처리된 문서가 없습니다: {file.filename}")
-            except Exception as e:
-                logger.error(f"파일 처리 중 오류 발생: {file.filename} - {e}")
-                failed_files.append(file.filename)
-
-        if not docs_to_index:
-            raise HTTPException(
-                status_code=400,
-                detail="업로드된 파일들로부터 처리 가능한 문서가 없습니다.",
-            )
-
-        added_ids = await self.upsert(docs_to_index, model_api_key=model_api_key)
-        if not added_ids:
-            error_id = uuid4().hex[:8]
-            logger.error(f"[{error_id}] 벡터스토어에 문서를 추가하지 못했습니다.")
-            raise HTTPException(
-                status_code=500,
-                detail=f"벡터스토어에 문서를 추가하지 못했습니다. (error_id={error_id})",
+        if settings.vector_bulk_insert:
+            hybrid = get_hybrid_config(collection.table_name)
+            return await bulk_insert_chunks(
+                collection.table_name,
+                [d.page_content for d in documents],
+                vectors,
+                [d.metadata for d in documents],
+                [d.id for d in documents],
+                tsv_column=hybrid.tsv_column,
+                tsv_lang=hybrid.tsv_lang,
+                vector_type=vector_type(collection),
+                collection_id=collection.id,
             )
-        response = DocumentUploadResponse(
-            success=True,
-            message=f"{processed_files_count}개 파일에서 {len(added_ids)}개 청크를 추가했습니다.",
-            added_chunk_ids=added_ids,
-            warnings=(failed_files if failed_files else None),
+        store = await get_vectorstore(collection=collection, embedding=embed)
+        ids = await store.aadd_embeddings(
+            [d.page_content for d in documents],
+            vectors,
+            metadatas=[d.metadata for d in documents],
+            ids=[d.id for d in documents],
+        )
+        # 벡터스토어는 별도 커넥션에서 커밋하므로 적재 후 증분 집계하며 write_version을 올림
+        # (이전 버전 키에 새 결과가 남을 수는 있어도 새 버전 키에 이전 결과가 남지는 않음)
+        await record_inserted_chunks(
+            collection.id,
+            [d.page_content for d in documents],
+            [d.metadata for d in documents],
         )
-        return response
+        return ids
 
     async def get_list(
         self,
@@ -290,89 +336,77 @@ class DocumentService:
         limit: int = 10,
         offset: int = 0,
         view: Literal["chunk", "document"] = "document",
+        cursor: str | None = None,
     ) -> dict:
         """
         Summary: 컬렉션 문서를 문서/청크 단위로 조회합니다.
 
         Contract:
             - view에 따라 응답 구조가 달라집니다.
-            - raw SQL로 벡터 테이블을 직접 조회합니다.
+            - 총계는 컬렉션 집계 컬럼을 그대로 씁니다(테이블 COUNT 없음).
+            - document 뷰는 파일 레지스트리(collection_files)만 읽고 청크는 비워 둡니다
+              (청크는 get_file_chunks로 파일별 지연 조회).
+            - document 뷰는 (created_at, file_id) keyset 페이지네이션을 지원하며,
+              cursor가 있으면 offset을 무시하고 다음 페이지가 있으면 next_cursor를 채웁니다.
 
         Args:
             limit: 페이지 크기.
-            offset: 페이지 시작 위치.
+            offset: 페이지 시작 위치(cursor가 없을 때).
             view: "document" 또는 "chunk".
+            cursor: 이전 응답의 next_cursor(document 뷰).
 
         Returns:
             dict: 목록과 카운트 정보를 포함한 응답.
 
+        Raises:
+            HTTPException: cursor 형식 오류(400).
+
         Side Effects:
             - DB 조회(raw SQL)
         """
         collection = await self._get_collection()
-        table = collection.table_name
-        count_row = await raw_sql(
-            self.db,
-            f"SELECT COUNT(*) AS chunk_count, COUNT(DISTINCT file_id) AS file_count FROM {table}",
-            one=True,
-        )
-
-        chunk_total = count_row["chunk_count"]
-        file_total = count_row["file_count"]
+        totals = {
+            "chunk_total": collection.chunk_count,
+            "file_total": collection.document_count,
+        }
         if view == "document":
+            params: dict[str, Any] = {
+                "collection_id": collection.id,
+                "limit": limit + 1,
+            }
+            if cursor:
+                created_at, file_id = _decode_cursor(cursor, 2)
+                try:
+                    params["after_created_at"] = datetime.fromisoformat(created_at)
+                except (TypeError, ValueError) as exc:
+                    raise HTTPException(
+                        status_code=400, detail="잘못된 cursor입니다."
+                    ) from exc
+                params["after_file_id"] = file_id
+                page = "AND (created_at, file_id) > (:after_created_at, :after_file_id)"
+            else:
+                params["offset"] = offset
+                page = ""
             rows = await raw_sql(
                 self.db,
                 f"""
-                SELECT 
-                    file_id,
-                    source,
-                    COUNT(*) AS chunk_count,
-                    JSON_AGG(
-                        JSON_BUILD_OBJECT(
-                            'id', langchain_id,
-                            'content', content,
-                            'metadata', langchain_metadata,
-                            'chunk_index', chunk_index
-                        )
-                        ORDER BY chunk_index
-                    ) AS chunks
-                FROM {table}
-                GROUP BY file_id, source
-                ORDER BY MAX(chunk_index)
-                LIMIT :limit OFFSET :offset
+                SELECT file_id, source, chunk_count, content_bytes, file_size,
+                    content_hash, created_at
+                FROM collection_files
+                WHERE collection_id = :collection_id {page}
+                ORDER BY created_at, file_id
+                LIMIT :limit{"" if cursor else " OFFSET :offset"}
                 """,
-                {"limit": limit, "offset": offset},
+                params,
             )
-
-            return {
-                "items": [
-                    {
-                        "file_id": r["file_id"],
-                        "source": r["source"],
-                        "chunk_count": r["chunk_count"],
-                        "chunks": [
-                            {
-                                "id": c["id"],
-                                "content": c["content"],
-                                "metadata": (
-                                    c["metadata"]
-                                    if isinstance(c["metadata"], dict)
-                                    else (
-                                        json.loads(c["metadata"])
-                                        if c["metadata"]
-                                        else {}
-                                    )
-                                ),
-                                "chunk_index": c["chunk_index"],
-                            }
-                            for c in r["chunks"]
-                        ],
-                    }
-                    for r in rows
-                ],
-                "chunk_total": chunk_total,
-                "file_total": file_total,
-            }
+            items = [{**dict(r), "chunks": []} for r in rows[:limit]]
+            next_cursor = None
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                next_cursor = _encode_cursor(
+                    last["created_at"].isoformat(), last["file_id"]
+                )
+            return {"items": items, **totals, "next_cursor": next_cursor}
 
         rows = await raw_sql(
             self.db,
@@ -384,39 +418,80 @@ class DocumentService:
                 chunk_index,
                 source,
                 langchain_metadata
-            FROM {table}
+            FROM {collection.table_name}
             ORDER BY file_id, chunk_index
             LIMIT :limit OFFSET :offset
             """,
             {"limit": limit, "offset": offset},
         )
+        return {"items": [_chunk_item(r) for r in rows], **totals}
 
-        docs = []
-        for r in rows:
-            metadata = {
-                "file_id": r["file_id"],
-                "chunk_index": r["chunk_index"],
-                "source": r["source"],
-            }
-            if r["langchain_metadata"]:
-                try:
-                    metadata.update(json.loads(r["langchain_metadata"]))
-                except Exception:
-                    pass
+    async def get_file_chunks(
+        self, file_id: str, *, limit: int = 100, cursor: str | None = None
+    ) -> dict:
+        """
+        Summary: 파일 하나의 청크를 chunk_index 순 keyset 페이지로 조회합니다.
 
-            docs.append(
-                {
-                    "id": str(r["langchain_id"]),
-                    "content": r["content"],
-                    "metadata": metadata,
-                    "source": r["source"],
-                }
-            )
+        Contract:
+            - 파일 레지스트리에 없는 file_id는 404입니다.
+            - (file_id, chunk_index) 보조 인덱스로 해당 파일 행만 읽습니다.
+
+        Args:
+            file_id: 파일 ID.
+            limit: 페이지 크기.
+            cursor: 이전 응답의 next_cursor.
 
+        Returns:
+            dict: 파일 정보, 청크 목록, next_cursor.
+
+        Raises:
+            HTTPException: 파일 미존재(404), cursor 형식 오류(400).
+
+        Side Effects:
+            - DB 조회(raw SQL)
+        """
+        collection = await self._get_collection()
+        file = await raw_sql(
+            self.db,
+            """
+            SELECT file_id, source, chunk_count, content_bytes, file_size,
+                content_hash, created_at
+            FROM collection_files
+            WHERE collection_id = :collection_id AND file_id = :file_id
+            """,
+            {"collection_id": collection.id, "file_id": file_id},
+            one=True,
+        )
+        if not file:
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+        after = -1
+        if cursor:
+            (value,) = _decode_cursor(cursor, 1)
+            try:
+                after = int(value)
+            except (TypeError, ValueError) as exc:
+                raise HTTPException(
+                    status_code=400, detail="잘못된 cursor입니다."
+                ) from exc
+        rows = await raw_sql(
+            self.db,
+            f"""
+            SELECT langchain_id, content, file_id, chunk_index, source, langchain_metadata
+            FROM {collection.table_name}
+            WHERE file_id = :file_id AND chunk_index > :after
+            ORDER BY chunk_index
+            LIMIT :limit
+            """,
+            {"file_id": file_id, "after": after, "limit": limit + 1},
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = _encode_cursor(str(rows[limit - 1]["chunk_index"]))
         return {
-            "items": docs,
-            "chunk_total": chunk_total,
-            "file_total": file_total,
+            **dict(file),
+            "items": [_chunk_item(r) for r in rows[:limit]],
+            "next_cursor": next_cursor,
         }
 
     async def delete_all(
@@ -440,34 +515,23 @@ class DocumentService:
         Side Effects:
             - DB 삭제(raw SQL)
             - 벡터스토어 데이터 삭제
+            - 컬렉션 write_version 증가(검색 결과 캐시 무효화)
         """
         collection = await self._get_collection()
 
         if file_ids:
-            result = await raw_sql(
-                self.db,
-                f"""
-                DELETE FROM {collection.table_name}
-                WHERE file_id = ANY(:file_ids)
-                """,
+            return await self._delete_chunks(
+                collection,
+                "file_id = ANY(:file_ids)",
                 {"file_ids": [str(fid) for fid in file_ids]},
             )
-        elif document_ids:
-            result = await raw_sql(
-                self.db,
-                f"""
-                DELETE FROM {collection.table_name}
-                WHERE langchain_id = ANY(:document_ids)
-                """,
+        if document_ids:
+            return await self._delete_chunks(
+                collection,
+                "langchain_id = ANY(:document_ids)",
                 {"document_ids": [str(did) for did in document_ids]},
             )
-        else:
-            result = await raw_sql(
-                self.db,
-                f"DELETE FROM {collection.table_name}",
-            )
-
-        return result.rowcount
+        return await self._delete_chunks(collection, "TRUE", {})
 
     async def delete_by(
         self,
@@ -490,28 +554,84 @@ class DocumentService:
         Side Effects:
             - DB 삭제(raw SQL)
             - 벡터스토어 데이터 삭제
+            - 컬렉션 write_version 증가(검색 결과 캐시 무효화)
         """
         collection = await self._get_collection()
 
         if delete_by == "document_id":
-            query = f"""
-                DELETE FROM {collection.table_name}
-                WHERE langchain_id = :id
-            """
+            where = "langchain_id = :id"
         elif delete_by == "file_id":
-            query = f"""
-                DELETE FROM {collection.table_name}
-                WHERE file_id = :id
-            """
+            where = "file_id = :id"
         else:
             raise ValueError("delete_by는 'file_id' 또는 'document_id'만 허용됩니다.")
 
-        result = await raw_sql(
+        return await self._delete_chunks(collection, where, {"id": str(target_id)})
+
+    async def _delete_chunks(
+        self, collection: Collection, where: str, params: dict[str, Any]
+    ) -> int:
+        """
+        Summary: 청크 삭제와 컬렉션 집계/write_version 갱신을 한 문장(한 트랜잭션)으로 실행합니다.
+
+        Contract:
+            - 삭제된 행이 없으면 collections 행을 갱신하지 않습니다.
+
+        Args:
+            collection: 대상 컬렉션.
+            where: 삭제 조건 WHERE 절.
+            params: 바인드 파라미터.
+
+        Returns:
+            int: 삭제된 행 수.
+
+        Side Effects:
+            - DB 삭제/갱신 및 commit
+        """
+        row = await raw_sql(
             self.db,
-            query,
-            {"id": str(target_id)},
+            delete_chunks_sql(collection.table_name, where),
+            {**params, "collection_id": collection.id},
+            one=True,
+        )
+        await self.db.commit()
+        return int(row["deleted"]) if row else 0
+
+    async def _search_embedding(
+        self, collection: Collection, model_api_key_id: int
+    ) -> Embeddings:
+        """
+        Why: 검색 요청의 키가 컬렉션 임베딩 모델과 다르면 자동 매칭 키로 대체합니다.
+
+        Raises:
+            HTTPException: 키 조회 실패 또는 임베딩 클라이언트 생성 실패.
+        """
+        model_api_key = await self._reslove_model_api_key(model_api_key_id)
+        if (
+            collection.embedding.model != model_api_key.model
+            or model_api_key.provider_id != collection.embedding.provider_id
+        ):
+            model_api_key = await self._auto_matched_api_key(collection)
+
+        try:
+            return get_embedding(
+                model_name=collection.embedding.model, model_api_key=model_api_key
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def _query_embeddings(
+        self, collection: Collection, embed: Embeddings
+    ) -> CachedQueryEmbeddings:
+        return CachedQueryEmbeddings(
+            embed,
+            spec_id=collection.embedding_id,
+            collection_id=collection.id,
+            shared=(
+                EmbeddingCacheService(self.db)
+                if settings.query_embedding_shared
+                else None
+            ),
         )
-        return result.rowcount
 
     async def search(
         self,
@@ -521,6 +641,8 @@ class DocumentService:
         search_type: Literal["semantic", "keyword", "hybrid"] = "semantic",
         filter: dict[str, Any] | None = None,
         model_api_key_id: int = 1,
+        semantic_weight: float | None = None,
+        keyword_weight: float | None = None,
     ) -> list[dict[str, Any]]:
         """
         Summary: 키워드/시맨틱/하이브리드 방식으로 문서를 검색합니다.
@@ -528,6 +650,11 @@ class DocumentService:
         Contract:
             - search_type은 semantic/keyword/hybrid 중 하나여야 합니다.
             - 임베딩 모델 불일치 시 자동 매칭 키로 대체합니다.
+            - 질의 임베딩은 (임베딩 스펙, 정규화 질의) 캐시를 먼저 조회합니다.
+            - hybrid는 벡터/전문 검색 top-k를 RRF로 합치는 단일 SQL로 실행합니다
+              (연산자 필터만 벡터스토어 하이브리드 검색으로 대체).
+            - 결과는 (컬렉션, write_version, 질의, 방식, 필터, limit) 키로 캐시되며
+              청크 쓰기가 write_version을 올리면 자동으로 무효화됩니다.
 
         Args:
             query: 검색어.
@@ -535,6 +662,8 @@ class DocumentService:
             search_type: 검색 방식.
             filter: 메타데이터 필터(JSONB).
             model_api_key_id: 사용할 모델 API 키 ID.
+            semantic_weight: hybrid 벡터 신호 가중치.
+            keyword_weight: hybrid 전문 검색 신호 가중치.
 
         Returns:
             list[dict[str, Any]]: 검색 결과 목록.
@@ -554,19 +683,59 @@ class DocumentService:
             )
 
         collection = await self._get_collection()
-        model_api_key = await self._reslove_model_api_key(model_api_key_id)
-        if (
-            collection.embedding.model != model_api_key.model
-            or model_api_key.provider_id != collection.embedding.provider_id
-        ):
-            model_api_key = await self._auto_matched_api_key(collection)
-
-        try:
-            embed = get_embedding(
-                model_name=collection.embedding.model, model_api_key=model_api_key
+        embed = await self._search_embedding(collection, model_api_key_id)
+
+        key = None
+        if settings.search_result_cache:
+            key = search_cache_key(
+                collection,
+                query,
+                search_type=search_type,
+                filter=filter,
+                limit=limit,
+                semantic_weight=semantic_weight,
+                keyword_weight=keyword_weight,
             )
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+            cached = search_result_cache.get(key)
+            if cached is not None:
+                return list(cached)
+
+        results = await self._search(
+            collection,
+            embed,
+            query,
+            limit=limit,
+            search_type=search_type,
+            filter=filter,
+            semantic_weight=semantic_weight,
+            keyword_weight=keyword_weight,
+        )
+        if key is not None:
+            search_result_cache.put(key, list(results))
+        return results
+
+    async def _search(
+        self,
+        collection: Collection,
+        embed: Embeddings,
+        query: str,
+        *,
+        limit: int,
+        search_type: str,
+        filter: dict[str, Any] | None,
+        semantic_weight: float | None,
+        keyword_weight: float | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Summary: 캐시 미스 시 search_type별 검색 경로(키워드/하이브리드/양자화/벡터스토어)를 실행합니다.
+
+        Raises:
+            HTTPException: 벡터스토어 오류.
+
+        Side Effects:
+            - DB 조회(raw SQL)
+            - 외부 임베딩 API 호출
+        """
         table = collection.table_name
 
         if search_type == "keyword":
@@ -645,27 +814,63 @@ class DocumentService:
             ]
 
         vf = filter or None
-        k_candidates = max(limit, 100)
 
+        # semantic or hybrid → 벡터스토어 호출 (질의 임베딩은 캐시 우선)
+        query_embed = self._query_embeddings(collection, embed)
+        if search_type == "hybrid":
+            cfg, col = _choose_fts(query)
+            try:
+                results = await hybrid_search(
+                    self.db,
+                    collection,
+                    await query_embed.aembed_query(query),
+                    query,
+                    k=limit,
+                    fts_config=cfg,
+                    tsv_column=col,
+                    filter=vf,
+                    semantic_weight=semantic_weight,
+                    keyword_weight=keyword_weight,
+                )
+            except Exception as exc:
+                error_id = uuid4().hex[:8]
+                logger.exception(f"[{error_id}] 하이브리드 검색 중 오류 발생: {exc!r}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"벡터스토어 검색 중 오류 발생 (error_id={error_id})",
+                ) from exc
+            if results is not None:
+                return results
+        if search_type == "semantic" and binary_quantized(collection):
+            # bit 인덱스 1차 후보 → 원본 벡터 재정렬(단순 필터만, 그 외는 벡터스토어로 대체)
+            try:
+                results = await quantized_search(
+                    self.db,
+                    collection,
+                    await query_embed.aembed_query(query),
+                    k=limit,
+                    filter=vf,
+                )
+            except Exception as exc:
+                error_id = uuid4().hex[:8]
+                logger.exception(f"[{error_id}] 양자화 검색 중 오류 발생: {exc!r}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"벡터스토어 검색 중 오류 발생 (error_id={error_id})",
+                ) from exc
+            if results is not None:
+                return results
         try:
-            # await raw_sql(self.db, "SET LOCAL ivfflat.probes = :p", {"p": 10})
-            await raw_sql(
-                self.db, "SET LOCAL hnsw.ef_search = :ef", {"ef": max(100, 2 * limit)}
-            )
-        except Exception:
-            pass
-        # semantic or hybrid → 벡터스토어 호출
-        embed = get_embedding(
-            model_name=collection.embedding.model, model_api_key=model_api_key
-        )
-        try:
+            plan = await plan_vector_search(self.db, collection, limit=limit, filter=vf)
             store = await get_vectorstore(
                 collection=collection,
                 use_hybrid_search=(search_type == "hybrid"),
-                embedding=embed,
+                embedding=query_embed,
+                # ef_search/probes/반복 스캔은 검색 커넥션 트랜잭션에 SET LOCAL로 적용
+                index_query_options=plan.query_options(),
             )
             results = await store.asimilarity_search_with_score(
-                query, k=k_candidates, filter=vf
+                query, k=plan.k, filter=vf
             )
         except Exception as exc:
             error_id = uuid4().hex[:8]
@@ -674,6 +879,10 @@ class DocumentService:
                 status_code=500,
                 detail=f"벡터스토어 검색 중 오류 발생 (error_id={error_id})",
             ) from exc
+        record_search_outcome(plan, len(results))
+        if plan.iterative and search_type == "semantic":
+            # relaxed_order 반복 스캔은 순서가 느슨하므로 거리순으로 다시 정렬
+            results.sort(key=lambda item: item[1])
         results = results[:limit]
         return [
             {
@@ -684,3 +893,94 @@ class DocumentService:
             }
             for doc, score in results
         ]
+
+    async def search_batch(
+        self,
+        queries: list[str],
+        *,
+        limit: int = 10,
+        filter: dict[str, Any] | None = None,
+        model_api_key_id: int = 1,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Summary: 여러 질의를 캐시된 질의 임베딩과 한 번의 벡터 검색 조회로 처리합니다.
+
+        Contract:
+            - 질의 수는 settings.search_batch_max_queries 이하여야 합니다.
+            - 컬렉션/모델 키/벡터스토어 해석은 요청당 한 번만 합니다.
+            - 시맨틱 검색만 지원하며 결과 형식/점수는 단건 semantic 검색과 같습니다.
+            - 연산자 필터는 질의별 벡터스토어 검색(임베딩 재사용)으로 대체합니다.
+
+        Args:
+            queries: 검색어 목록.
+            limit: 질의별 반환 개수.
+            filter: 메타데이터 필터(모든 질의에 공통).
+            model_api_key_id: 사용할 모델 API 키 ID.
+
+        Returns:
+            list[list[dict[str, Any]]]: 입력 순서의 질의별 검색 결과 목록.
+
+        Raises:
+            HTTPException: 질의 수 초과 또는 벡터스토어 오류.
+
+        Side Effects:
+            - DB 조회(raw SQL)
+            - 외부 임베딩 API 호출(캐시 미스 질의만, 질의별 동시 호출)
+        """
+        if len(queries) > settings.search_batch_max_queries:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"한 번에 최대 {settings.search_batch_max_queries}개 질의만 검색할 수 있습니다.",
+            )
+        if not queries:
+            return []
+
+        collection = await self._get_collection()
+        embed = await self._search_embedding(collection, model_api_key_id)
+        query_embed = self._query_embeddings(collection, embed)
+        vf = filter or None
+        try:
+            vectors = await query_embed.aembed_queries(queries)
+            plan = await plan_vector_search(self.db, collection, limit=limit, filter=vf)
+            results = await batch_search(
+                self.db,
+                collection,
+                vectors,
+                k=plan.k,
+                filter=vf,
+                query_options=plan.query_options(),
+            )
+            if results is None:
+                store = await get_vectorstore(
+                    collection=collection,
+                    embedding=query_embed,
+                    index_query_options=plan.query_options(),
+                )
+                results = []
+                for vector in vectors:
+                    found = await store.asimilarity_search_with_score_by_vector(
+                        vector, k=plan.k, filter=vf
+                    )
+                    if plan.iterative:
+                        found.sort(key=lambda item: item[1])
+                    results.append(
+                        [
+                            {
+                                "id": doc.id,
+                                "page_content": doc.page_content,
+                                "metadata": doc.metadata,
+                                "score": score,
+                            }
+                            for doc, score in found
+                        ]
+                    )
+        except Exception as exc:
+            error_id = uuid4().hex[:8]
+            logger.exception(f"[{error_id}] 배치 검색 중 오류 발생: {exc!r}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"벡터스토어 검색 중 오류 발생 (error_id={error_id})",
+            ) from exc
+        # 필터는 모든 질의에 공통이므로 가장 적게 채운 질의로 후보 배수를 조정
+        record_search_outcome(plan, min(len(found) for found in results))
+        return [found[:limit] for found in results]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import unicodedata
+from typing import Callable, Sequence
+
+from langchain_core.embeddings import Embeddings
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import async_session
+from app.models import EmbeddingCache
+
+# 프로세스 누적 조회 지표(청크 단위)
+_COUNTERS = {"hits": 0, "misses": 0}
+
+# 한 번에 조회/저장할 해시 수 (파라미터 수 제한 회피)
+_BATCH = 500
+
+
+def content_hash(text: str) -> str:
+    """
+    Why: 같은 내용의 청크가 같은 키를 갖도록 텍스트를 정규화해 해시합니다.
+
+    Contract:
+        - 유니코드 NFC 정규화 후 앞뒤 공백을 제거합니다.
+
+    Args:
+        text: 청크 텍스트.
+
+    Returns:
+        str: sha256 hex 문자열.
+    """
+    normalized = unicodedata.normalize("NFC", text or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCacheService:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        writer: Callable[[], AsyncSession] = async_session,
+    ):
+        """
+        Why: 임베딩 캐시 조회 세션과 저장용 세션 팩토리를 주입합니다.
+
+        Contract:
+            - 저장은 writer로 연 별도 세션에서 커밋하므로 호출자 세션의 트랜잭션을
+              중간에 커밋하지 않습니다.
+
+        Args:
+            session: 조회용 비동기 SQLAlchemy 세션.
+            writer: 저장용 세션 팩토리(기본값은 앱 세션 팩토리).
+        """
+        self.session = session
+        self._writer = writer
+
+    async def _lookup(self, spec_id: int, hashes: Sequence[str]) -> dict[str, list[float]]:
+        """
+        Summary: 해시 목록 중 캐시에 있는 벡터를 조회합니다.
+
+        Side Effects:
+            - DB 조회
+        """
+        found: dict[str, list[float]] = {}
+        for i in range(0, len(hashes), _BATCH):
+            chunk = hashes[i : i + _BATCH]
+            rows = await self.session.execute(
+                select(EmbeddingCache.content_hash, EmbeddingCache.embedding).where(
+                    EmbeddingCache.embedding_spec_id == spec_id,
+                    EmbeddingCache.content_hash.in_(chunk),
+                )
+            )
+            for h, vec in rows.all():
+                found[h] = [float(x) for x in vec]
+        return found
+
+    async def _store(self, spec_id: int, vectors: dict[str, list[float]]) -> None:
+        """
+        Summary: 새로 계산한 벡터를 캐시에 저장합니다(이미 있으면 무시).
+
+        Side Effects:
+            - 별도 세션에서 DB insert 및 commit
+        """
+        items = list(vectors.items())
+        async with self._writer() as session:
+            for i in range(0, len(items), _BATCH):
+                rows = [
+                    {"embedding_spec_id": spec_id, "content_hash": h, "embedding": v}
+                    for h, v in items[i : i + _BATCH]
+                ]
+                await session.execute(
+                    insert(EmbeddingCache).values(rows).on_conflict_do_nothing()
+                )
+            await session.commit()
+
+    async def embed_documents(
+        self, spec_id: int, embed: Embeddings, texts: Sequence[str]
+    ) -> list[list[float]]:
+        """
+        Summary: 캐시 미스 텍스트만 임베딩 제공자에 보내고 전체 벡터를 반환합니다.
+
+        Contract:
+            - 반환 순서는 입력 texts 순서와 같습니다.
+            - 같은 요청 안의 중복 텍스트는 한 번만 임베딩합니다.
+            - 새 벡터는 (spec_id, content_hash) 키로 저장되어 다른 컬렉션과 공유됩니다.
+
+        Args:
+            spec_id: 컬렉션의 임베딩 스펙 ID.
+            embed: 임베딩 클라이언트.
+            texts: 청크 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서의 벡터 목록.
+
+        Side Effects:
+            - DB 조회/저장
+            - 외부 임베딩 API 호출(미스만)
+        """
+        hashes = [content_hash(t) for t in texts]
+        unique = list(dict.fromkeys(hashes))
+        found = await self._lookup(spec_id, unique)
+
+        hits = sum(1 for h in hashes if h in found)
+        _COUNTERS["hits"] += hits
+        _COUNTERS["misses"] += len(hashes) - hits
+
+        first_text: dict[str, str] = {}
+        for h, t in zip(hashes, texts):
+            if h not in found:
+                first_text.setdefault(h, t)
+        if first_text:
+            miss_hashes = list(first_text)
+            vectors = await embed.aembed_documents([first_text[h] for h in miss_hashes])
+            computed = dict(zip(miss_hashes, vectors))
+            await self._store(spec_id, computed)
+            found.update(computed)
+
+        return [found[h] for h in hashes]
+
+    async def get_query(self, spec_id: int, query: str) -> list[float] | None:
+        """
+        Summary: 공유 질의 임베딩을 조회합니다("query:" 네임스페이스).
+
+        Contract:
+            - 일부 제공자는 질의/문서 임베딩이 달라 문서 캐시와 키를 분리합니다.
+
+        Side Effects:
+            - DB 조회
+        """
+        h = content_hash(f"query:{query}")
+        found = await self._lookup(spec_id, [h])
+        return found.get(h)
+
+    async def put_query(self, spec_id: int, query: str, vector: list[float]) -> None:
+        """
+        Summary: 질의 임베딩을 공유 저장소에 저장합니다.
+
+        Contract:
+            - 검색 요청 세션이 아닌 별도 세션에서 커밋합니다.
+
+        Side Effects:
+            - 별도 세션에서 DB insert 및 commit
+        """
+        await self._store(spec_id, {content_hash(f"query:{query}"): vector})
+
+    async def stats(self) -> dict:
+        """
+        Summary: 캐시 항목 수(스펙별)와 프로세스 누적 적중률을 반환합니다.
+
+        Returns:
+            dict: entries/hits/misses/hit_rate/specs.
+
+        Side Effects:
+            - DB 조회
+        """
+        rows = await self.session.execute(
+            select(EmbeddingCache.embedding_spec_id, func.count())
+            .group_by(EmbeddingCache.embedding_spec_id)
+            .order_by(EmbeddingCache.embedding_spec_id)
+        )
+        specs = [
+            {"embedding_spec_id": spec_id, "entries": int(count)}
+            for spec_id, count in rows.all()
+        ]
+        hits, misses = _COUNTERS["hits"], _COUNTERS["misses"]
+        total = hits + misses
+        return {
+            "entries": sum(s["entries"] for s in specs),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": (hits / total) if total else 0.0,
+            "specs": specs,
+        }
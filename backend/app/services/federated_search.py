@@ -0,0 +1,245 @@
+import asyncio
+import logging
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core import settings
+from app.db import (
+    async_session,
+    batch_search,
+    binary_quantized,
+    hybrid_search,
+    plan_vector_search,
+    quantized_search,
+    record_search_outcome,
+)
+from app.db.search_sql import filter_clause, normalized_similarity
+from app.models import Collection, User
+from app.services.document import DocumentService, _choose_fts
+from app.utils import is_admin_user as is_admin
+
+logger = logging.getLogger(__name__)
+
+
+class FederatedSearchService:
+    def __init__(self, db: AsyncSession, user: User):
+        """
+        Why: 여러 컬렉션을 한 요청으로 검색하는 데 필요한 컨텍스트를 고정합니다.
+
+        Args:
+            db: 비동기 DB 세션(권한/키 조회용).
+            user: 요청 사용자.
+        """
+        self.db = db
+        self.user = user
+
+    async def _get_collections(self, collection_ids: list[UUID]) -> list[Collection]:
+        """
+        Summary: 대상 컬렉션을 한 번에 조회하고 모두 접근 가능한지 검증합니다.
+
+        Returns:
+            list[Collection]: 요청 순서(중복 제거)의 컬렉션 엔티티 목록.
+
+        Raises:
+            HTTPException: 컬렉션 미존재(404) 또는 접근 권한 없음(403).
+
+        Side Effects:
+            - DB 조회
+        """
+        ids = list(dict.fromkeys(collection_ids))
+        rows = await self.db.execute(
+            select(Collection)
+            .where(Collection.id.in_(ids))
+            .options(selectinload(Collection.embedding))
+        )
+        found = {c.id: c for c in rows.scalars().all()}
+        missing = [str(cid) for cid in ids if cid not in found]
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"컬렉션을 찾을 수 없습니다: {', '.join(missing)}",
+            )
+        for collection in found.values():
+            is_owner = self.user.id == collection.owner_id
+            if not (collection.is_public or is_owner or is_admin(self.user)):
+                raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+        return [found[cid] for cid in ids]
+
+    async def _search_collection(
+        self,
+        collection: Collection,
+        embedding: list[float],
+        query: str,
+        *,
+        limit: int,
+        search_type: str,
+        filter: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Summary: 컬렉션 하나를 별도 풀 커넥션(세션)에서 검색합니다.
+
+        Contract:
+            - 트랜잭션 로컬 검색 옵션은 세션 종료(롤백)와 함께 사라집니다.
+
+        Side Effects:
+            - DB 조회(새 세션)
+        """
+        async with async_session() as session:
+            if search_type == "hybrid":
+                cfg, col = _choose_fts(query)
+                return (
+                    await hybrid_search(
+                        session,
+                        collection,
+                        embedding,
+                        query,
+                        k=limit,
+                        fts_config=cfg,
+                        tsv_column=col,
+                        filter=filter,
+                    )
+                    or []
+                )
+            if binary_quantized(collection):
+                return (
+                    await quantized_search(
+                        session, collection, embedding, k=limit, filter=filter
+                    )
+                    or []
+                )
+            plan = await plan_vector_search(
+                session, collection, limit=limit, filter=filter
+            )
+            found = await batch_search(
+                session,
+                collection,
+                [embedding],
+                k=plan.k,
+                filter=filter,
+                query_options=plan.query_options(),
+            )
+            results = found[0] if found else []
+            record_search_outcome(plan, len(results))
+            return results[:limit]
+
+    async def search(
+        self,
+        collection_ids: list[UUID],
+        query: str,
+        *,
+        limit: int = 10,
+        search_type: Literal["semantic", "hybrid"] = "semantic",
+        filter: dict[str, Any] | None = None,
+        model_api_key_id: int = 1,
+    ) -> list[dict[str, Any]]:
+        """
+        Summary: 여러 컬렉션을 동시에 검색하고 정규화 점수로 합친 상위 결과를 반환합니다.
+
+        Contract:
+            - 컬렉션 수는 settings.federated_search_max_collections 이하여야 합니다.
+            - 질의 임베딩은 같은 EmbeddingSpec을 쓰는 컬렉션끼리 한 번만 계산합니다.
+            - 컬렉션별 검색은 별도 풀 커넥션에서 동시에 실행합니다
+              (동시 실행 수는 settings.federated_search_concurrency).
+            - score는 0~1 정규화 점수(semantic: 거리 지표별 유사도, hybrid: RRF / 최대 RRF),
+              raw_score는 컬렉션 검색의 원래 점수입니다.
+            - 메타데이터 필터는 동등 비교만 지원합니다.
+
+        Args:
+            collection_ids: 검색할 컬렉션 ID 목록.
+            query: 검색어.
+            limit: 전체 반환 개수.
+            search_type: semantic 또는 hybrid.
+            filter: 모든 컬렉션에 공통인 메타데이터 필터.
+            model_api_key_id: 우선 사용할 모델 API 키 ID(임베딩 모델이 다르면 자동 매칭).
+
+        Returns:
+            list[dict[str, Any]]: collection_id가 붙은 검색 결과(정규화 점수 내림차순).
+
+        Raises:
+            HTTPException: 컬렉션 수 초과, 미지원 필터, 권한 없음, 검색 오류.
+
+        Side Effects:
+            - DB 조회(컬렉션별 별도 세션)
+            - 외부 임베딩 API 호출(임베딩 스펙별 1회, 캐시 미스 시)
+        """
+        if len(collection_ids) > settings.federated_search_max_collections:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"한 번에 최대 {settings.federated_search_max_collections}개 "
+                    "컬렉션만 검색할 수 있습니다."
+                ),
+            )
+        vf = filter or None
+        if filter_clause(vf) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="연합 검색은 동등 비교 메타데이터 필터만 지원합니다.",
+            )
+
+        collections = await self._get_collections(collection_ids)
+
+        # 임베딩 스펙별 질의 벡터(키 조회는 요청 세션을 쓰므로 순차 실행)
+        vectors: dict[int, list[float]] = {}
+        for collection in collections:
+            if collection.embedding_id in vectors:
+                continue
+            service = DocumentService(self.db, collection.id, self.user)
+            embed = await service._search_embedding(collection, model_api_key_id)
+            vectors[collection.embedding_id] = await service._query_embeddings(
+                collection, embed
+            ).aembed_query(query)
+
+        semaphore = asyncio.Semaphore(max(1, settings.federated_search_concurrency))
+
+        async def run(collection: Collection) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._search_collection(
+                    collection,
+                    vectors[collection.embedding_id],
+                    query,
+                    limit=limit,
+                    search_type=search_type,
+                    filter=vf,
+                )
+
+        try:
+            per_collection = await asyncio.gather(*(run(c) for c in collections))
+        except Exception as exc:
+            error_id = uuid4().hex[:8]
+            logger.exception(f"[{error_id}] 연합 검색 중 오류 발생: {exc!r}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"벡터스토어 검색 중 오류 발생 (error_id={error_id})",
+            ) from exc
+
+        max_rrf = (settings.hybrid_semantic_weight + settings.hybrid_keyword_weight) / (
+            settings.hybrid_rrf_k + 1
+        )
+        merged: list[dict[str, Any]] = []
+        for collection, results in zip(collections, per_collection):
+            for result in results:
+                raw = result["score"]
+                if search_type == "hybrid":
+                    score = (
+                        min(1.0, raw / max_rrf)
+                        if raw is not None and max_rrf > 0
+                        else None
+                    )
+                else:
+                    score = normalized_similarity(collection, raw)
+                merged.append(
+                    {
+                        **result,
+                        "collection_id": str(collection.id),
+                        "score": score,
+                        "raw_score": raw,
+                    }
+                )
+        merged.sort(key=lambda item: item["score"] or 0.0, reverse=True)
+        return merged[:limit]
@@ -0,0 +1,563 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+import socket
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, UploadFile
+from langchain_core.documents import Document
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core import settings
+from app.db import async_session, close_bulk_pool, raw_sql, record_file_uploads
+from app.models import (
+    IngestionFileStage,
+    IngestionJob,
+    IngestionJobFile,
+    IngestionJobStatus,
+    User,
+)
+from app.schemas import DocumentUploadResponse, IngestionJobRead
+from app.services.collection import CollectionService
+from app.services.document import DocumentService
+from app.utils import get_embedding
+from app.utils.document_process import guess_mime_type
+from app.utils.ingest_pipeline import IngestionPipeline, PipelineSource
+from app.utils.parse_pool import shutdown_parse_pool
+
+logger = logging.getLogger(__name__)
+
+_DONE_STAGES = {IngestionFileStage.STORED.value, IngestionFileStage.FAILED.value}
+
+_CLAIM_SQL = """
+UPDATE ingestion_jobs AS j
+SET status = 'running',
+    attempts = j.attempts + 1,
+    locked_by = :worker,
+    locked_at = now(),
+    updated_at = now()
+WHERE j.id = (
+    SELECT id FROM ingestion_jobs
+    WHERE (status = 'queued' AND run_after <= now())
+       OR (status = 'running' AND locked_at < now() - make_interval(secs => :lease))
+    ORDER BY created_at
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+)
+RETURNING j.id
+"""
+
+
+_HEARTBEAT_SQL = """
+UPDATE ingestion_jobs
+SET locked_at = now()
+WHERE id = :id AND status = 'running' AND locked_by = :worker
+RETURNING id
+"""
+
+
+def _spool_dir(job_id: UUID) -> Path:
+    return Path(settings.ingest_spool_dir) / str(job_id)
+
+
+def _spool_file(item: IngestionJobFile) -> Path:
+    """
+    Why: 작업에는 스풀 기준 상대 경로를 저장하므로 현재 워커의 마운트 위치로 풉니다.
+    """
+    return Path(settings.ingest_spool_dir) / item.spool_path
+
+
+def _cleanup_spool(job_id: UUID) -> None:
+    shutil.rmtree(_spool_dir(job_id), ignore_errors=True)
+
+
+class IngestionService:
+    def __init__(self, session: AsyncSession):
+        """
+        Why: 적재 작업 등록/조회에 사용할 DB 세션을 주입합니다.
+
+        Args:
+            session: 비동기 SQLAlchemy 세션.
+        """
+        self.session = session
+
+    async def enqueue(
+        self,
+        *,
+        collection_id: UUID,
+        user: User,
+        files: list[UploadFile],
+        metadatas: list[dict[str, Any] | None],
+        chunk_size: int,
+        chunk_overlap: int,
+        model_api_key_id: int,
+    ) -> DocumentUploadResponse:
+        """
+        Summary: 업로드 파일을 공유 스풀 볼륨에 저장하고 적재 작업을 등록합니다.
+
+        Contract:
+            - 컬렉션 권한과 임베딩 키/모델 일치는 등록 시점에 검증합니다.
+            - 스풀 경로는 ingest_spool_dir 기준 상대 경로로 기록합니다.
+            - 파싱/청킹/임베딩/저장은 워커가 비동기로 수행합니다.
+
+        Args:
+            collection_id: 대상 컬렉션 ID.
+            user: 요청 사용자.
+            files: 업로드 파일 목록.
+            metadatas: 파일별 메타데이터 목록.
+            chunk_size: 청크 크기.
+            chunk_overlap: 청크 겹침 크기.
+            model_api_key_id: 사용할 모델 API 키 ID.
+
+        Returns:
+            DocumentUploadResponse: job_id와 queued 상태를 담은 응답.
+
+        Raises:
+            HTTPException: 권한 없음, 키 미존재, 모델 불일치.
+
+        Side Effects:
+            - 스풀 파일 쓰기
+            - DB 작업/파일 레코드 생성 및 commit
+        """
+        await DocumentService(self.session, collection_id, user).resolve_upload_target(
+            model_api_key_id
+        )
+
+        job_id = uuid4()
+        spool = _spool_dir(job_id)
+        spool.mkdir(parents=True, exist_ok=True)
+        job = IngestionJob(
+            id=job_id,
+            collection_id=collection_id,
+            user_id=user.id,
+            model_api_key_id=model_api_key_id,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            max_attempts=settings.ingest_max_attempts,
+        )
+        try:
+            for position, (file, metadata) in enumerate(
+                zip(files, metadatas, strict=False)
+            ):
+                path = spool / f"{position:04d}"
+                await asyncio.to_thread(_copy_upload, file, path)
+                job.files.append(
+                    IngestionJobFile(
+                        position=position,
+                        file_id=uuid4(),
+                        filename=file.filename,
+                        content_type=file.content_type,
+                        spool_path=str(path.relative_to(settings.ingest_spool_dir)),
+                        metadata_=metadata,
+                    )
+                )
+            self.session.add(job)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            _cleanup_spool(job_id)
+            raise
+
+        return DocumentUploadResponse(
+            success=True,
+            message=f"{len(job.files)}개 파일의 적재 작업을 등록했습니다.",
+            added_chunk_ids=[],
+            job_id=job_id,
+            status=IngestionJobStatus.QUEUED.value,
+        )
+
+    async def get_job(
+        self, collection_id: UUID, job_id: UUID, user: User
+    ) -> IngestionJobRead:
+        """
+        Summary: 적재 작업 상태와 파일별 진행 단계를 조회합니다.
+
+        Args:
+            collection_id: 컬렉션 ID.
+            job_id: 작업 ID.
+            user: 요청 사용자.
+
+        Returns:
+            IngestionJobRead: 작업/파일 진행 정보.
+
+        Raises:
+            HTTPException: 컬렉션 권한 없음 또는 작업 미존재(404).
+
+        Side Effects:
+            - DB 조회
+        """
+        await CollectionService(self.session).get_orm_model(collection_id, user)
+        job = await self.session.scalar(
+            select(IngestionJob)
+            .options(selectinload(IngestionJob.files))
+            .where(
+                IngestionJob.id == job_id,
+                IngestionJob.collection_id == collection_id,
+            )
+        )
+        if not job:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+        return IngestionJobRead.model_validate(job)
+
+
+def _copy_upload(file: UploadFile, path: Path) -> None:
+    """
+    Why: 업로드 임시 파일을 메모리에 올리지 않고 스풀 경로로 복사합니다.
+    """
+    file.file.seek(0)
+    with open(path, "wb") as out:
+        shutil.copyfileobj(file.file, out, length=1024 * 1024)
+
+
+async def claim_next_job(session: AsyncSession, worker_id: str) -> UUID | None:
+    """
+    Summary: 대기 중이거나 임대가 만료된 작업 하나를 SKIP LOCKED로 가져옵니다.
+
+    Contract:
+        - 여러 워커(코루틴/프로세스)가 동시에 호출해도 같은 작업을 가져가지 않습니다.
+        - 임대가 만료된 running 작업(워커 중단)은 재개 대상으로 다시 가져옵니다.
+
+    Args:
+        session: 비동기 DB 세션.
+        worker_id: 워커 식별자.
+
+    Returns:
+        UUID | None: 가져간 작업 ID 또는 None.
+
+    Side Effects:
+        - DB update 및 commit
+    """
+    row = await raw_sql(
+        session,
+        _CLAIM_SQL,
+        {"worker": worker_id, "lease": settings.ingest_lease_sec},
+        one=True,
+    )
+    await session.commit()
+    return row["id"] if row else None
+
+
+async def _touch(session: AsyncSession, job: IngestionJob) -> None:
+    """
+    Why: 단계 진행을 저장하면서 작업 임대(locked_at)를 갱신합니다.
+    """
+    job.locked_at = datetime.now(timezone.utc)
+    await session.commit()
+
+
+async def _heartbeat(job_id: UUID, worker: str | None, interval: float) -> None:
+    """
+    Summary: 작업 임대(locked_at)를 주기적으로 갱신합니다.
+
+    Contract:
+        - 작업 세션은 파이프라인 단계 기록에 쓰이므로 갱신마다 별도 세션을 사용합니다.
+        - 갱신 실패는 로그만 남기고 다음 주기에 다시 시도합니다.
+        - 임대를 잃었으면(다른 워커가 재개) 경고 로그를 남깁니다.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with async_session() as session:
+                row = await raw_sql(
+                    session, _HEARTBEAT_SQL, {"id": job_id, "worker": worker}, one=True
+                )
+                await session.commit()
+        except Exception:
+            logger.exception(f"[ingest {job_id}] 임대 갱신 실패")
+            continue
+        if not row:
+            logger.warning(
+                f"[ingest {job_id}] 작업 임대를 잃었습니다 (worker={worker})"
+            )
+
+
+@asynccontextmanager
+async def _lease_heartbeat(job: IngestionJob) -> AsyncIterator[None]:
+    """
+    Why: 큰 PDF 파싱이나 긴 임베딩 재시도처럼 이벤트 없이 오래 걸리는 단계가 있어도
+    임대가 만료되어 다른 워커가 같은 작업을 재개하지 않게 합니다.
+
+    Contract:
+        - 블록이 실행되는 동안 ingest_lease_sec의 1/3 주기로 임대를 갱신합니다.
+        - ingest_lease_sec가 0 이하이면 갱신하지 않습니다.
+    """
+    if settings.ingest_lease_sec <= 0:
+        yield
+        return
+    task = asyncio.create_task(
+        _heartbeat(job.id, job.locked_by, settings.ingest_lease_sec / 3),
+        name=f"ingest-heartbeat-{job.id}",
+    )
+    try:
+        yield
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def _process_files(
+    session: AsyncSession,
+    job: IngestionJob,
+    items: list[IngestionJobFile],
+    svc: DocumentService,
+    collection: Any,
+    embed: Any,
+) -> None:
+    """
+    Summary: 파일들을 parse → embed → store 파이프라인으로 동시에 처리하고 단계를 기록합니다.
+
+    Contract:
+        - 파싱 실패/빈 문서는 재시도해도 같으므로 파일 단위 FAILED로 기록합니다.
+          파싱 도중 실패하면 그때까지 저장된 청크를 삭제합니다.
+        - 임베딩/저장 예외는 호출자에게 전파되어 작업 재시도 대상이 됩니다.
+        - 이전 시도의 부분 적재분은 file_id로 삭제 후 다시 저장합니다.
+        - 배치 임베딩은 동시에 실행되므로 배치마다 별도 세션을 사용합니다.
+        - 단계 기록/임대 갱신은 작업 세션 하나로 직렬화됩니다.
+        - 저장을 마친 파일은 원본 sha256/크기를 파일 레지스트리에 기록합니다.
+        - 스풀 파일이 보이지 않으면(공유 볼륨 미마운트 등) 파일을 실패 처리하지 않고
+          재시도 가능한 오류로 작업 전체를 되돌립니다.
+
+    Raises:
+        RuntimeError: 이 워커에서 스풀 파일을 찾을 수 없는 경우.
+    """
+    missing = [item.filename for item in items if not _spool_file(item).exists()]
+    if missing:
+        raise RuntimeError(
+            f"스풀 파일을 찾을 수 없습니다({settings.ingest_spool_dir}): "
+            + ", ".join(str(name) for name in missing)
+        )
+    for item in items:
+        if item.stage != IngestionFileStage.QUEUED.value:
+            await svc.delete_by(item.file_id, "file_id")
+
+    async def on_event(source: PipelineSource, event: str, info: dict) -> None:
+        item: IngestionJobFile = source.key
+        if event == "failed":
+            item.stage = IngestionFileStage.FAILED.value
+            item.error = info["error"]
+            if source.stored:
+                await svc.delete_by(item.file_id, "file_id")
+        elif event == "chunked":
+            # 파싱 중에 먼저 저장된 배치가 있으면 이미 EMBEDDED 단계입니다.
+            if not source.stored:
+                item.stage = IngestionFileStage.CHUNKED.value
+            item.chunk_count = info["chunk_count"]
+        elif event == "batch":
+            item.stage = IngestionFileStage.EMBEDDED.value
+        elif event == "stored":
+            item.stage = IngestionFileStage.STORED.value
+            if source.content_hash:
+                await record_file_uploads(
+                    session,
+                    svc.collection_id,
+                    {source.file_id: (source.content_hash, source.file_size)},
+                )
+        await _touch(session, job)
+
+    async def embed_batch(chunks: list[Document]) -> list[list[float]]:
+        async with async_session() as batch_session:
+            return await svc.embed_chunks(
+                collection, embed, chunks, session=batch_session
+            )
+
+    async def store_batch(chunks: list[Document], vectors: list[list[float]]) -> None:
+        await svc.store_chunks(collection, embed, chunks, vectors)
+
+    pipeline = IngestionPipeline(
+        embed=embed_batch,
+        store=store_batch,
+        chunk_size=job.chunk_size,
+        chunk_overlap=job.chunk_overlap,
+        on_event=on_event,
+    )
+    await pipeline.run(
+        PipelineSource(
+            path=str(_spool_file(item)),
+            mime_type=guess_mime_type(item.content_type, item.filename),
+            file_id=str(item.file_id),
+            filename=item.filename,
+            metadata=item.metadata_,
+            key=item,
+        )
+        for item in items
+    )
+
+
+async def _finish(
+    session: AsyncSession, job: IngestionJob, status: str, error: str | None
+) -> None:
+    job.status = status
+    job.error = error
+    job.locked_by = None
+    job.locked_at = None
+    job.finished_at = datetime.now(timezone.utc)
+    await session.commit()
+    _cleanup_spool(job.id)
+
+
+async def run_job(job_id: UUID) -> None:
+    """
+    Summary: 가져간 작업을 실행하고 결과에 따라 완료/재시도/실패로 기록합니다.
+
+    Contract:
+        - STORED/FAILED 파일은 건너뛰므로 재시작 후에도 이어서 처리됩니다.
+        - 4xx HTTPException(키 삭제/권한 변경 등)은 재시도하지 않고 실패 처리합니다.
+        - 그 외 예외는 max_attempts까지 백오프 후 재시도합니다.
+        - 처리 중에는 타이머로 임대를 갱신합니다(_lease_heartbeat).
+
+    Args:
+        job_id: 작업 ID.
+
+    Side Effects:
+        - 파일 파싱/청킹, 외부 임베딩 호출, 벡터스토어 저장
+        - DB 상태 갱신, 완료 시 스풀 파일 삭제
+    """
+    async with async_session() as session:
+        job = await session.scalar(
+            select(IngestionJob)
+            .options(selectinload(IngestionJob.files))
+            .where(IngestionJob.id == job_id)
+        )
+        if not job:
+            return
+        if job.attempts > job.max_attempts:
+            await _finish(
+                session,
+                job,
+                IngestionJobStatus.FAILED.value,
+                "재시도 한도를 초과했습니다.",
+            )
+            return
+
+        try:
+            user = await session.scalar(
+                select(User)
+                .options(selectinload(User.role))
+                .where(User.id == job.user_id)
+            )
+            if not user:
+                raise HTTPException(
+                    status_code=404, detail="사용자를 찾을 수 없습니다."
+                )
+            svc = DocumentService(session, job.collection_id, user)
+            collection, model_api_key = await svc.resolve_upload_target(
+                job.model_api_key_id
+            )
+            try:
+                embed = get_embedding(
+                    model_name=collection.embedding.model, model_api_key=model_api_key
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+            pending = [f for f in job.files if f.stage not in _DONE_STAGES]
+            async with _lease_heartbeat(job):
+                await _process_files(session, job, pending, svc, collection, embed)
+        except Exception as exc:
+            await session.rollback()
+            await session.refresh(job)
+            permanent = isinstance(exc, HTTPException) and exc.status_code < 500
+            detail = exc.detail if isinstance(exc, HTTPException) else repr(exc)
+            logger.exception(f"[ingest {job_id}] 작업 실패 (attempt={job.attempts})")
+            if permanent or job.attempts >= job.max_attempts:
+                await _finish(
+                    session, job, IngestionJobStatus.FAILED.value, str(detail)
+                )
+            else:
+                job.status = IngestionJobStatus.QUEUED.value
+                job.error = str(detail)
+                job.locked_by = None
+                job.run_after = datetime.now(timezone.utc) + timedelta(
+                    seconds=settings.ingest_retry_backoff_sec * job.attempts
+                )
+                await session.commit()
+            return
+
+        failed = [f for f in job.files if f.stage == IngestionFileStage.FAILED.value]
+        stored = [f for f in job.files if f.stage == IngestionFileStage.STORED.value]
+        error = (
+            ", ".join(f"{f.filename}: {f.error}" for f in failed) if failed else None
+        )
+        await _finish(
+            session,
+            job,
+            (
+                IngestionJobStatus.SUCCEEDED.value
+                if stored
+                else IngestionJobStatus.FAILED.value
+            ),
+            error,
+        )
+
+
+class IngestionWorker:
+    """
+    Summary: 적재 작업을 폴링해 실행하는 워커 코루틴 묶음입니다.
+
+    Contract:
+        - API 프로세스 lifespan 또는 별도 프로세스(python -m)에서 실행합니다.
+        - stop 시 실행 중 작업은 취소되며, 임대 만료 후 다른 워커가 재개합니다.
+    """
+
+    def __init__(self, *, concurrency: int, poll_interval: float) -> None:
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stop = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for i in range(self.concurrency):
+            self._tasks.append(
+                asyncio.create_task(self._loop(f"{prefix}:{i}"), name=f"ingest-{i}")
+            )
+
+    async def _loop(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            job_id = None
+            try:
+                async with async_session() as session:
+                    job_id = await claim_next_job(session, worker_id)
+                if job_id:
+                    await run_job(job_id)
+                    continue
+            except Exception:
+                logger.exception(f"[{worker_id}] 적재 워커 오류")
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        self._stop.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+async def _main() -> None:
+    worker = IngestionWorker(
+        concurrency=max(1, settings.ingest_workers),
+        poll_interval=settings.ingest_poll_interval_sec,
+    )
+    worker.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await worker.stop()
+        shutdown_parse_pool()
+        await close_bulk_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
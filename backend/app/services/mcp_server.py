@@ -16,7 +16,12 @@ from app.schemas import (
     MCPToolInfo,
     MCPServerRuntime,
 )
-from app.utils import load_mcp_tools_from_servers, is_admin_user as is_admin
+from app.utils import (
+    invalidate_agents,
+    load_mcp_tools_from_servers,
+    mcp_manager,
+    is_admin_user as is_admin,
+)
 
 
 def _ilike(term: str) -> str:
@@ -65,6 +70,7 @@ async def probe_mcp_server(
     Contract:
         - 지정된 시간 내에 응답이 없으면 실패로 처리합니다.
         - 실패 시 reachable=False와 error 메시지를 반환합니다.
+        - 툴 목록 캐시(TTL)가 유효하면 재탐지 없이 캐시 결과를 사용합니다.
 
     Args:
         server: MCP 서버 엔티티.
@@ -278,6 +284,8 @@ class MCPServerService:
 
         Side Effects:
             - DB 레코드 업데이트
+            - 해당 서버를 사용하는 에이전트 캐시 무효화
+            - 해당 서버의 MCP 세션 종료 및 툴 캐시 제거
         """
         server = await self.session.get(MCPServer, server_id, with_for_update=True)
         if not server:
@@ -316,6 +324,8 @@ class MCPServerService:
             await self.session.rollback()
             raise ValueError("MCP 서버 수정 중 무결성 오류가 발생했습니다.") from e
 
+        invalidate_agents(mcp_server_id=server_id)
+        await mcp_manager.invalidate(server_id)
         await self.session.refresh(server)
         return MCPServerRead.model_validate(server)
 
@@ -337,6 +347,8 @@ class MCPServerService:
 
         Side Effects:
             - DB 레코드 삭제
+            - 해당 서버를 사용하는 에이전트 캐시 무효화
+            - 해당 서버의 MCP 세션 종료 및 툴 캐시 제거
         """
         server = await self.session.get(MCPServer, server_id)
         if not server:
@@ -352,3 +364,5 @@ class MCPServerService:
             raise ValueError(
                 "MCP 서버를 삭제할 수 없습니다. 연결된 리소스를 먼저 해제하세요."
             ) from e
+        invalidate_agents(mcp_server_id=server_id)
+        await mcp_manager.invalidate(server_id)
@@ -12,6 +12,7 @@ from app.schemas import (
     ModelApiKeyReadWithSecret,
     ModelApiKeyUpdate,
 )
+from app.utils import invalidate_agents, invalidate_embeddings
 
 
 def _mask_key(value: str | None) -> str | None:
@@ -331,6 +332,8 @@ class ModelApiKeyService:
 
         Side Effects:
             - DB 키 레코드 업데이트
+            - 해당 키로 컴파일된 에이전트 캐시 무효화
+            - 해당 키로 만든 임베딩 클라이언트 무효화
         """
         simple_fields = (
             "alias",
@@ -358,6 +361,8 @@ class ModelApiKeyService:
             raise ValueError(f"업데이트 충돌: {e.orig}") from e
 
         await self.session.commit()
+        invalidate_agents(model_key_id=obj.id)
+        invalidate_embeddings(model_key_id=obj.id)
 
         res = await self.session.execute(
             select(ModelApiKey)
@@ -382,9 +387,14 @@ class ModelApiKeyService:
 
         Side Effects:
             - DB 키 레코드 삭제
+            - 해당 키로 컴파일된 에이전트 캐시 무효화
+            - 해당 키로 만든 임베딩 클라이언트 무효화
         """
+        key_id = obj.id
         await self.session.delete(obj)
         await self.session.commit()
+        invalidate_agents(model_key_id=key_id)
+        invalidate_embeddings(model_key_id=key_id)
 
     @staticmethod
     def to_read(
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db import (
+    async_session,
+    binary_quantized,
+    exact_search,
+    quantized_search,
+    raw_sql,
+)
+from app.db.quantized import shortlist_size
+from app.models import Collection
+
+
+async def evaluate_quantized_recall(
+    session: AsyncSession, collection: Collection, *, samples: int = 50, k: int = 10
+) -> dict[str, Any]:
+    """
+    Summary: 저장된 청크 벡터를 질의로 삼아 양자화 검색의 recall@k를 정확 검색과 비교합니다.
+
+    Contract:
+        - 임베딩 API를 호출하지 않도록 테이블에서 무작위 청크 벡터를 표본으로 씁니다.
+        - 표본마다 트랜잭션을 롤백해 세션 로컬 설정을 되돌립니다.
+
+    Args:
+        session: DB 세션.
+        collection: 평가할 컬렉션(embedding 로드 필요).
+        samples: 표본 질의 수.
+        k: 비교할 상위 개수.
+
+    Returns:
+        dict[str, Any]: recall/평균 지연(ms)/표본 수 등 평가 결과.
+
+    Raises:
+        ValueError: 이진 양자화 검색이 켜지지 않은 컬렉션인 경우.
+
+    Side Effects:
+        - DB 조회(순차 스캔 포함)
+    """
+    if not binary_quantized(collection):
+        raise ValueError("이진 양자화 검색이 설정되지 않은 컬렉션입니다.")
+    rows = await raw_sql(
+        session,
+        f"SELECT embedding::text AS embedding FROM {collection.table_name} "
+        "ORDER BY random() LIMIT :n",
+        {"n": samples},
+    )
+    queries = [r["embedding"] for r in rows]
+    await session.rollback()
+
+    hits, total = 0, 0
+    quantized_sec, exact_sec = 0.0, 0.0
+    for vector in queries:
+        started = time.perf_counter()
+        approx = await quantized_search(session, collection, vector, k=k) or []
+        quantized_sec += time.perf_counter() - started
+        await session.rollback()
+
+        started = time.perf_counter()
+        exact = await exact_search(session, collection, vector, k=k)
+        exact_sec += time.perf_counter() - started
+        await session.rollback()
+
+        expected = {r["id"] for r in exact}
+        hits += len(expected & {r["id"] for r in approx})
+        total += len(expected)
+
+    count = len(queries)
+    return {
+        "collection_id": str(collection.id),
+        "samples": count,
+        "k": k,
+        "shortlist": shortlist_size(collection, k),
+        "recall": (hits / total) if total else 0.0,
+        "quantized_ms": (quantized_sec / count * 1000) if count else 0.0,
+        "exact_ms": (exact_sec / count * 1000) if count else 0.0,
+    }
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(
+        description="이진 양자화 검색 recall@k 평가 (python -m app.services.search_eval)"
+    )
+    parser.add_argument("collection_id", type=UUID)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    async with async_session() as session:
+        collection = await session.get(
+            Collection,
+            args.collection_id,
+            options=(selectinload(Collection.embedding),),
+        )
+        if collection is None:
+            raise SystemExit(f"컬렉션을 찾을 수 없습니다: {args.collection_id}")
+        report = await evaluate_quantized_recall(
+            session, collection, samples=args.samples, k=args.k
+        )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -1,11 +1,22 @@
 from app.utils.jwt import create_access_token, create_refresh_token, decode_token
 from app.utils.security import hash_password, verify_password
-from app.utils.document_process import process_document
-from app.utils.embedding import get_embedding
+from app.utils.embedding import get_embedding, invalidate_embeddings
+from app.utils.embedding_executor import embedding_throughput_stats
 from app.utils.auth import is_admin_user, is_system_user
-from app.utils.mcp import load_mcp_tools_from_servers
 from app.utils.llm import get_chat_model
 from app.utils.jsonsafe import to_jsonable, parse_jsonish
+from app.utils.cache import LRUCache, cache_stats
+from app.utils.agent_cache import get_or_build_agent, invalidate_agents
+from app.utils.query_embedding import CachedQueryEmbeddings, query_embedding_stats
+from app.utils.search_cache import invalidate_search_results
+from app.utils.parse_pool import run_in_parse_pool, shutdown_parse_pool
+from app.utils.mcp_pool import (
+    MCPLoadResult,
+    lease_mcp_sessions,
+    load_mcp_tools_from_servers,
+    load_mcp_tools_isolated,
+    mcp_manager,
+)
 
 __all__ = [
     "create_access_token",
@@ -13,12 +24,26 @@ __all__ = [
     "decode_token",
     "hash_password",
     "verify_password",
-    "process_document",
     "get_embedding",
+    "invalidate_embeddings",
+    "embedding_throughput_stats",
+    "CachedQueryEmbeddings",
+    "query_embedding_stats",
+    "invalidate_search_results",
     "is_admin_user",
     "is_system_user",
     "load_mcp_tools_from_servers",
+    "load_mcp_tools_isolated",
+    "lease_mcp_sessions",
+    "MCPLoadResult",
     "get_chat_model",
     "to_jsonable",
     "parse_jsonish",
+    "LRUCache",
+    "cache_stats",
+    "get_or_build_agent",
+    "invalidate_agents",
+    "mcp_manager",
+    "run_in_parse_pool",
+    "shutdown_parse_pool",
 ]
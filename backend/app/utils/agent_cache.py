@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Sequence
+
+from langchain_core.tools import BaseTool
+from langgraph.prebuilt import create_react_agent
+
+from app.core import settings
+from app.utils.cache import LRUCache
+from app.utils.llm import get_chat_model
+from app.utils.mcp import server_cache_id, tools_fingerprint
+
+# key: (model_key_id, model_key_version, params_hash, server_ids, tools_fp)
+AgentKey = tuple[int, str, str, tuple[str, ...], str]
+
+agent_cache: LRUCache[AgentKey, Any] = LRUCache(
+    "agents", maxsize=settings.agent_cache_size
+)
+
+
+def _params_hash(params: dict | None) -> str:
+    """
+    Why: 모델 파라미터를 순서와 무관한 키로 정규화합니다.
+
+    Args:
+        params: 모델 파라미터(옵션).
+
+    Returns:
+        str: sha256 hex 문자열.
+    """
+    raw = json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _model_key_version(model_api_key: Any) -> str:
+    """
+    Why: 키 수정 시각을 버전으로 사용해 변경된 키의 재사용을 막습니다.
+    """
+    updated = getattr(model_api_key, "updated_at", None) or getattr(
+        model_api_key, "created_at", None
+    )
+    return updated.isoformat() if updated else "0"
+
+
+def build_agent_key(
+    model_api_key: Any,
+    params: dict | None,
+    servers: Sequence[Any],
+    tools: Sequence[BaseTool],
+) -> AgentKey:
+    """
+    Summary: 에이전트 캐시 키를 계산합니다.
+
+    Args:
+        model_api_key: 채팅 모델 키 엔티티.
+        params: 모델 파라미터.
+        servers: 사용 중인 MCP 서버 목록.
+        tools: 로드된 MCP 툴 목록.
+
+    Returns:
+        AgentKey: (키 ID, 키 버전, 파라미터 해시, 서버 ID 목록, 툴 스키마 해시).
+    """
+    return (
+        int(model_api_key.id),
+        _model_key_version(model_api_key),
+        _params_hash(params),
+        tuple(sorted(server_cache_id(s) for s in servers)),
+        tools_fingerprint(tools),
+    )
+
+
+def get_or_build_agent(
+    model_api_key: Any,
+    params: dict | None,
+    servers: Sequence[Any],
+    tools: Sequence[BaseTool],
+) -> Any:
+    """
+    Summary: 캐시된 react 에이전트를 반환하거나 새로 컴파일해 저장합니다.
+
+    Contract:
+        - 체크포인터 없이 컴파일합니다(대화 맥락은 매 요청 DB 히스토리로 구성).
+        - 모델 키/파라미터/서버/툴 스키마가 같으면 같은 그래프를 재사용합니다.
+
+    Args:
+        model_api_key: 채팅 모델 키 엔티티.
+        params: 모델 파라미터.
+        servers: 사용 중인 MCP 서버 목록.
+        tools: 로드된 MCP 툴 목록.
+
+    Returns:
+        Any: 컴파일된 LangGraph 에이전트.
+
+    Raises:
+        ValueError: 모델 키 정보가 유효하지 않은 경우(get_chat_model).
+    """
+    key = build_agent_key(model_api_key, params, servers, tools)
+    agent = agent_cache.get(key)
+    if agent is None:
+        model = get_chat_model(model_api_key.model, model_api_key, **(params or {}))
+        agent = create_react_agent(model, list(tools))
+        agent_cache.put(key, agent)
+    return agent
+
+
+def invalidate_agents(
+    *, model_key_id: int | None = None, mcp_server_id: int | str | None = None
+) -> int:
+    """
+    Summary: 모델 키 또는 MCP 서버 변경 시 관련 에이전트를 제거합니다.
+
+    Args:
+        model_key_id: 변경된 모델 키 ID.
+        mcp_server_id: 변경된 MCP 서버 ID(또는 server_cache_id 값).
+
+    Returns:
+        int: 제거된 항목 수.
+    """
+    sid = str(mcp_server_id) if mcp_server_id is not None else None
+    return agent_cache.invalidate(
+        lambda k: (model_key_id is not None and k[0] == model_key_id)
+        or (sid is not None and sid in k[3])
+    )
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 이름 → 캐시 인스턴스 (운영 지표 조회용)
+CACHE_REGISTRY: dict[str, "LRUCache[Any, Any]"] = {}
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Summary: 프로세스 로컬 LRU 캐시와 hit/miss 카운터를 제공합니다.
+
+    Contract:
+        - maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거합니다.
+        - ttl이 지정되면 저장 후 ttl초가 지난 항목은 미스로 처리됩니다.
+        - max_bytes가 지정되면 sizeof로 계산한 총 크기가 넘지 않도록 제거합니다.
+        - 생성 시 이름으로 CACHE_REGISTRY에 등록됩니다.
+        - 단일 이벤트 루프 내 사용을 전제로 하며 별도 락을 두지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        sizeof: Callable[[V], int] | None = None,
+    ) -> None:
+        """
+        Why: 캐시 이름과 최대 항목 수/만료 시간/메모리 한도를 고정합니다.
+
+        Args:
+            name: 지표에 노출될 캐시 이름.
+            maxsize: 최대 항목 수(1 이상).
+            ttl: 항목 유효 시간(초). None이면 만료하지 않습니다.
+            max_bytes: 총 크기 한도(바이트). None이면 제한하지 않습니다.
+            sizeof: 값의 크기(바이트) 추정 함수. 없으면 0으로 계산합니다.
+        """
+        self.name = name
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        # key → (만료 시각(monotonic) 또는 None, 값)
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+        self._sizes: dict[K, int] = {}
+        self.bytes = 0
+        self.expirations = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        CACHE_REGISTRY[name] = self
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def keys(self) -> list[K]:
+        """
+        Why: 무효화 대상 탐색을 위해 현재 키 스냅샷을 반환합니다(만료 여부 무관).
+        """
+        return list(self._data)
+
+    def get(self, key: K) -> V | None:
+        """
+        Summary: 항목을 조회하고 최근 사용으로 표시합니다.
+
+        Args:
+            key: 캐시 키.
+
+        Returns:
+            V | None: 캐시 값 또는 None(미스).
+        """
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Summary: 항목을 저장하고 용량 초과분을 제거합니다.
+
+        Args:
+            key: 캐시 키.
+            value: 저장할 값.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        if key in self._data:
+            self._remove(key)
+        size = int(self._sizeof(value)) if self._sizeof is not None else 0
+        self._data[key] = (expires_at, value)
+        self._sizes[key] = size
+        self.bytes += size
+        while len(self._data) > self.maxsize or (
+            self.max_bytes is not None
+            and self.bytes > self.max_bytes
+            and len(self._data) > 1
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: K) -> tuple[float | None, V]:
+        entry = self._data.pop(key)
+        self.bytes -= self._sizes.pop(key, 0)
+        return entry
+
+    def pop(self, key: K) -> V | None:
+        """
+        Why: 특정 키를 명시적으로 무효화합니다.
+
+        Args:
+            key: 캐시 키.
+
+        Returns:
+            V | None: 제거된 값 또는 None.
+        """
+        if key not in self._data:
+            return None
+        return self._remove(key)[1]
+
+    def invalidate(self, predicate: Callable[[K], bool]) -> int:
+        """
+        Summary: 조건에 맞는 키를 모두 제거합니다.
+
+        Args:
+            predicate: 제거 여부를 판별하는 함수.
+
+        Returns:
+            int: 제거된 항목 수.
+        """
+        targets = [k for k in self._data if predicate(k)]
+        for k in targets:
+            self._remove(k)
+        return len(targets)
+
+    def clear(self) -> None:
+        """
+        Why: 전체 항목을 비웁니다(카운터는 유지).
+        """
+        self._data.clear()
+        self._sizes.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summary: 운영 지표용 캐시 상태를 반환합니다.
+
+        Returns:
+            dict[str, Any]: 이름/크기/메모리/hit/miss/eviction/expiration/적중률.
+        """
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
+def cache_stats() -> list[dict[str, Any]]:
+    """
+    Summary: 등록된 모든 캐시의 지표를 이름순으로 반환합니다.
+
+    Returns:
+        list[dict[str, Any]]: 캐시별 지표 목록.
+    """
+    return [CACHE_REGISTRY[name].stats() for name in sorted(CACHE_REGISTRY)]
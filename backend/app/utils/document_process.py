@@ -1,7 +1,9 @@
+import codecs
+import hashlib
 import logging
 import uuid
+from typing import Callable, Iterable, Iterator
 
-from fastapi import UploadFile
 from langchain_community.document_loaders.parsers import (
     BS4HTMLParser,
     PDFPlumberParser,
@@ -28,44 +30,31 @@ HANDLERS = {
 
 SUPPORTED_MIMETYPES = sorted(HANDLERS.keys())
 
+# 블록 단위로 읽어 페이지로 스트리밍하는 텍스트 MIME 타입과 블록 크기(바이트)
+TEXT_MIMETYPES = {"text/plain", "text/markdown", "text/x-markdown"}
+TEXT_PAGE_BYTES = 1024 * 1024
+
 MIMETYPE_BASED_PARSER = MimeTypeBasedParser(
     handlers=HANDLERS,
     fallback_parser=None,
 )
 
 
-async def process_document(
-    file: UploadFile,
-    metadata: dict | None = None,
-    chunk_size: int = 1000,
-    chunk_overlap: int = 200,
-) -> list[Document]:
+def guess_mime_type(content_type: str | None, filename: str | None) -> str:
     """
-    Summary: 업로드 파일을 파싱하고 청크 단위 문서로 변환합니다.
-
-    Contract:
-        - 파일 MIME 타입을 추정하고 지원 파서로 처리합니다.
-        - 각 청크에 file_id/chunk_index/source 메타데이터를 추가합니다.
+    Why: 브라우저가 octet-stream으로 보낸 파일을 확장자로 보정합니다.
 
     Args:
-        file: 업로드 파일.
-        metadata: 문서 메타데이터(옵션).
-        chunk_size: 청크 크기.
-        chunk_overlap: 청크 겹침 크기.
+        content_type: 업로드 Content-Type.
+        filename: 원본 파일명.
 
     Returns:
-        list[Document]: 청크 문서 목록.
-
-    Side Effects:
-        - 파일 바이트 읽기
+        str: 파서 선택에 사용할 MIME 타입.
     """
-    file_id = uuid.uuid4()
-    contents = await file.read()
+    mime_type = content_type or "text/plain"
 
-    mime_type = file.content_type or "text/plain"
-
-    if mime_type == "application/octet-stream" and file.filename:
-        filename_lower = file.filename.lower()
+    if mime_type == "application/octet-stream" and filename:
+        filename_lower = filename.lower()
         if filename_lower.endswith(".md") or filename_lower.endswith(".markdown"):
             mime_type = "text/markdown"
         elif filename_lower.endswith(".txt"):
@@ -78,33 +67,214 @@ async def process_document(
             mime_type = "application/msword"
         elif filename_lower.endswith(".docx"):
             mime_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    return mime_type
 
-    blob = Blob(data=contents, mimetype=mime_type)
-    docs = MIMETYPE_BASED_PARSER.parse(blob)
 
-    if metadata:
-        for doc in docs:
-            if not hasattr(doc, "metadata") or not isinstance(doc.metadata, dict):
-                doc.metadata = {}
-            doc.metadata.update(metadata)
+def iter_chunks(
+    docs: Iterable[Document],
+    *,
+    file_id: uuid.UUID | str,
+    source: str | None,
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+) -> Iterator[Document]:
+    """
+    Summary: 문서(페이지)를 하나씩 받아 청크를 생성하는 제너레이터입니다.
 
+    Contract:
+        - chunk_index는 파일 전체에서 연속으로 증가합니다.
+        - 겹침(chunk_overlap)은 페이지 경계를 넘지 않습니다.
+
+    Args:
+        docs: 파싱된 문서(페이지) 이터러블.
+        file_id: 파일 식별자.
+        source: 원본 파일명.
+        chunk_size: 청크 크기.
+        chunk_overlap: 청크 겹침 크기.
+
+    Returns:
+        Iterator[Document]: 청크 문서 이터레이터.
+    """
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size, chunk_overlap=chunk_overlap
     )
-    split_docs = text_splitter.split_documents(docs)
-
-    for idx, split_doc in enumerate(split_docs):
-        if not hasattr(split_doc, "metadata") or not isinstance(
-            split_doc.metadata, dict
-        ):
-            split_doc.metadata = {}
-
-        split_doc.metadata.update(
-            {
-                "file_id": str(file_id),
-                "chunk_index": idx,
-                "source": file.filename,
-            }
+    idx = 0
+    for doc in docs:
+        for split_doc in text_splitter.split_documents([doc]):
+            if not hasattr(split_doc, "metadata") or not isinstance(
+                split_doc.metadata, dict
+            ):
+                split_doc.metadata = {}
+
+            split_doc.metadata.update(
+                {
+                    "file_id": str(file_id),
+                    "chunk_index": idx,
+                    "source": source,
+                }
+            )
+            idx += 1
+            yield split_doc
+
+
+def _iter_text_pages(
+    path: str, page_bytes: int = TEXT_PAGE_BYTES
+) -> Iterator[Document]:
+    """
+    Why: 큰 텍스트 파일을 page_bytes 단위로 읽어 줄 경계 기준 페이지로 나눕니다.
+        mmap은 파일 전체가 주소 공간(RLIMIT_AS)을 차지하므로 쓰지 않습니다.
+
+    Contract:
+        - 메모리에는 현재/다음 블록과 마지막 줄바꿈 뒤 나머지만 유지합니다.
+        - 줄바꿈이 없는 구간은 블록 단위로 자르되 UTF-8 문자 중간에서 자르지 않습니다.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    rest = ""
+    with open(path, "rb") as f:
+        block = f.read(page_bytes)
+        while block:
+            # 다음 블록이 있을 때만 마지막 줄바꿈에서 자르고 나머지를 이월합니다.
+            following = f.read(page_bytes)
+            text = rest + decoder.decode(block, final=not following)
+            cut = (text.rfind("\n") + 1 or len(text)) if following else len(text)
+            text, rest = text[:cut], text[cut:]
+            if text.strip():
+                yield Document(page_content=text, metadata={"source": None})
+            block = following
+
+
+def _iter_pdf_pages(path: str) -> Iterator[Document]:
+    """
+    Why: PDFPlumberParser는 전체 페이지 목록을 만든 뒤 반환하므로, 페이지를 하나씩
+        추출하고 캐시를 해제해 메모리를 페이지 단위로 유지합니다.
+
+    Contract:
+        - 메타데이터 키는 PDFPlumberParser와 같습니다(source/file_path/page/total_pages 등).
+    """
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        info = {k: v for k, v in (pdf.metadata or {}).items() if type(v) in (str, int)}
+        total = len(pdf.pages)
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            page_no = page.page_number - 1
+            page.close()
+            yield Document(
+                page_content=text + "\n",
+                metadata={
+                    "source": None,
+                    "file_path": None,
+                    "page": page_no,
+                    "total_pages": total,
+                    **info,
+                },
+            )
+
+
+def iter_parse_path(
+    path: str, mime_type: str, metadata: dict | None = None
+) -> Iterator[Document]:
+    """
+    Summary: 파일 경로를 페이지 단위로 지연 파싱합니다.
+
+    Contract:
+        - PDF는 페이지별, 텍스트/마크다운은 고정 크기 블록 단위 페이지로 스트리밍합니다.
+        - HTML/Word는 파서 특성상 문서 전체를 한 번에 파싱하되 파일을 메모리에 복사하지 않습니다.
+        - 지원하지 않는 MIME 타입이면 ValueError를 발생시킵니다.
+
+    Args:
+        path: 파일 경로.
+        mime_type: MIME 타입.
+        metadata: 문서 메타데이터(옵션).
+
+    Returns:
+        Iterator[Document]: 문서(페이지) 이터레이터.
+
+    Raises:
+        ValueError: 지원하지 않는 MIME 타입.
+    """
+    if mime_type == "application/pdf":
+        pages = _iter_pdf_pages(path)
+    elif mime_type in TEXT_MIMETYPES:
+        pages = _iter_text_pages(path)
+    else:
+        pages = MIMETYPE_BASED_PARSER.lazy_parse(
+            Blob.from_path(path, mime_type=mime_type)
         )
+    for doc in pages:
+        if metadata:
+            doc.metadata.update(metadata)
+        yield doc
 
-    return split_docs
+
+def emit_chunk_batches(
+    path: str,
+    mime_type: str,
+    metadata: dict | None,
+    *,
+    emit: Callable[[list[tuple[str, dict]]], None],
+    file_id: str,
+    filename: str | None,
+    chunk_size: int,
+    chunk_overlap: int,
+    batch_size: int,
+) -> int:
+    """
+    Summary: 파일을 스트리밍 파싱/청킹하면서 batch_size 청크마다 (본문, 메타데이터) 배치를 내보냅니다.
+
+    Contract:
+        - 프로세스 풀(stream_from_parse_pool)에서 실행되며 emit은 bounded 채널에 넣습니다.
+          소비자가 느리면 emit이 대기하므로 파싱이 임베딩보다 앞서 쌓이지 않습니다.
+        - 같은 입력이면 같은 배치를 같은 순서로 내보냅니다(재시도 시 중복 제거 기준).
+        - 페이지 하나와 배치 하나만 메모리에 유지하므로 파일 크기와 무관하게 메모리가 일정합니다.
+
+    Args:
+        path: 원본 파일 경로.
+        mime_type: MIME 타입.
+        metadata: 문서 메타데이터(옵션).
+        emit: 배치 하나를 내보내는 함수.
+        file_id: 파일 식별자.
+        filename: 원본 파일명.
+        chunk_size: 청크 크기.
+        chunk_overlap: 청크 겹침 크기.
+        batch_size: 배치당 청크 수.
+
+    Returns:
+        int: 내보낸 청크 수.
+    """
+    count = 0
+    batch: list[tuple[str, dict]] = []
+    chunks = iter_chunks(
+        iter_parse_path(path, mime_type, metadata),
+        file_id=file_id,
+        source=filename,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+    for chunk in chunks:
+        batch.append((chunk.page_content, chunk.metadata))
+        count += 1
+        if len(batch) >= batch_size:
+            emit(batch)
+            batch = []
+    if batch:
+        emit(batch)
+    return count
+
+
+def file_sha256(path: str) -> str:
+    """
+    Why: 파일 레지스트리에 원본 내용 해시를 남겨 같은 파일의 중복 업로드를 식별합니다.
+
+    Args:
+        path: 파일 경로.
+
+    Returns:
+        str: sha256 hex 문자열.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
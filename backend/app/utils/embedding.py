@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Callable, Protocol, Any
 from langchain_core.embeddings import Embeddings
 
+from app.core import settings
+from app.utils.cache import LRUCache
+from app.utils.embedding_executor import RateLimitedEmbeddings, get_limiter
+
 
 class ProviderLike(Protocol):
     code: str
@@ -21,6 +27,40 @@ class ModelApiKeyLike(Protocol):
 Factory = Callable[[str, ModelApiKeyLike], Embeddings]
 _FACTORIES: dict[str, Factory] = {}
 
+# key: (model_key_id, provider_code, model_name, endpoint, key_fingerprint)
+EmbeddingKey = tuple[int | None, str, str, str, str]
+
+
+def _estimate_client_bytes(embed: Embeddings) -> int:
+    """
+    Why: 로컬 모델(sentence-transformers 등)의 파라미터 메모리를 추정합니다.
+
+    Contract:
+        - 원격 API 클라이언트처럼 파라미터가 없으면 0을 반환합니다.
+
+    Args:
+        embed: 임베딩 클라이언트.
+
+    Returns:
+        int: 추정 바이트 수.
+    """
+    model = getattr(embed, "_client", None) or getattr(embed, "client", None)
+    parameters = getattr(model, "parameters", None)
+    if not callable(parameters):
+        return 0
+    try:
+        return sum(p.numel() * p.element_size() for p in parameters())
+    except Exception:
+        return 0
+
+
+_registry: LRUCache[EmbeddingKey, Embeddings] = LRUCache(
+    "embeddings",
+    maxsize=settings.embedding_registry_size,
+    max_bytes=settings.embedding_registry_max_bytes,
+    sizeof=_estimate_client_bytes,
+)
+
 
 def register_factory(provider_code: str):
     """
@@ -164,6 +204,8 @@ def get_embedding(model_name: str, model_api_key: ModelApiKeyLike) -> Embeddings
 
     Contract:
         - model_api_key.provider.code와 purpose="embedding"이 필요합니다.
+        - 같은 키/모델/엔드포인트의 클라이언트는 레지스트리에서 재사용합니다.
+        - 반환 클라이언트는 배치 분할/동시 호출/제공자 한도/429 재시도가 적용된 래퍼입니다.
 
     Args:
         model_name: 임베딩 모델명.
@@ -188,4 +230,61 @@ def get_embedding(model_name: str, model_api_key: ModelApiKeyLike) -> Embeddings
     if not factory:
         raise ValueError(f"지원하지 않는 provider_code: {provider_code}")
 
-    return factory(model_name, model_api_key)
+    key = _registry_key(provider_code, model_name, model_api_key)
+    embed = _registry.get(key)
+    if embed is None:
+        embed = RateLimitedEmbeddings(
+            factory(model_name, model_api_key),
+            provider_code=provider_code,
+            limiter=get_limiter(provider_code, model_api_key),
+        )
+        _registry.put(key, embed)
+    return embed
+
+
+def _registry_key(
+    provider_code: str, model_name: str, model_api_key: ModelApiKeyLike
+) -> EmbeddingKey:
+    """
+    Why: 클라이언트 생성에 쓰이는 모든 값을 키에 반영해 변경된 설정의 재사용을 막습니다.
+
+    Contract:
+        - 비밀 키 원문 대신 해시(fingerprint)만 키에 보관합니다.
+
+    Returns:
+        EmbeddingKey: (키 ID, 제공자, 모델명, 엔드포인트, 키/옵션 해시).
+    """
+    endpoint = getattr(model_api_key, "endpoint", None) or getattr(
+        model_api_key, "endpoint_url", None
+    )
+    raw = json.dumps(
+        [
+            getattr(model_api_key, "api_key", None),
+            getattr(model_api_key, "api_version", None),
+            getattr(model_api_key, "organization", None),
+            getattr(model_api_key, "extra", None),
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return (
+        getattr(model_api_key, "id", None),
+        provider_code,
+        model_name,
+        endpoint or "",
+        hashlib.sha256(raw.encode("utf-8")).hexdigest(),
+    )
+
+
+def invalidate_embeddings(*, model_key_id: int) -> int:
+    """
+    Summary: 모델 키 수정/삭제 시 해당 키로 만든 임베딩 클라이언트를 제거합니다.
+
+    Args:
+        model_key_id: 변경된 모델 키 ID.
+
+    Returns:
+        int: 제거된 항목 수.
+    """
+    return _registry.invalidate(lambda k: k[0] == model_key_id)
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Iterator, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+from app.core import settings
+
+logger = logging.getLogger(__name__)
+
+# (제공자 코드, 모델 키 ID, rpm, tpm) → 리미터
+_LIMITERS: dict[tuple[str, int | None, int, int], "ProviderLimiter"] = {}
+
+# 제공자 코드 → 처리량 카운터
+_THROUGHPUT: dict[str, dict[str, float]] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Why: 제공자 토크나이저 없이 토큰 수를 보수적으로 추정합니다(UTF-8 3바이트 ≈ 1토큰).
+
+    Args:
+        text: 입력 텍스트.
+
+    Returns:
+        int: 추정 토큰 수(1 이상).
+    """
+    return len((text or "").encode("utf-8")) // 3 + 1
+
+
+def token_batches(
+    texts: Sequence[str], *, max_tokens: int, max_items: int
+) -> Iterator[tuple[int, int, int]]:
+    """
+    Summary: 텍스트 목록을 토큰/개수 한도 안의 연속 구간으로 나눕니다.
+
+    Contract:
+        - 한 텍스트가 max_tokens를 넘으면 단독 배치로 내보냅니다.
+
+    Args:
+        texts: 텍스트 목록.
+        max_tokens: 배치당 최대 추정 토큰 수.
+        max_items: 배치당 최대 텍스트 수.
+
+    Returns:
+        Iterator[tuple[int, int, int]]: (시작 인덱스, 끝 인덱스, 추정 토큰 수).
+    """
+    start, tokens = 0, 0
+    for i, text in enumerate(texts):
+        n = estimate_tokens(text)
+        if i > start and (tokens + n > max_tokens or i - start >= max_items):
+            yield start, i, tokens
+            start, tokens = i, 0
+        tokens += n
+    if start < len(texts):
+        yield start, len(texts), tokens
+
+
+class TokenBucket:
+    """
+    Summary: 분당 한도를 연속적으로 채우는 토큰 버킷입니다.
+
+    Contract:
+        - 용량보다 큰 요청은 버킷이 가득 찼을 때 통과시킵니다(무한 대기 방지).
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def drain(self) -> None:
+        """
+        Why: 429 응답 후 남은 용량을 비워 동시 요청이 함께 물러나게 합니다.
+        """
+        self._refill()
+        self.tokens = 0.0
+
+    async def acquire(self, amount: float) -> float:
+        """
+        Summary: amount만큼 용량이 생길 때까지 대기한 뒤 차감합니다.
+
+        Returns:
+            float: 대기한 시간(초).
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return waited
+            delay = (amount - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class ProviderLimiter:
+    """
+    Summary: 요청 수(rpm)와 토큰 수(tpm) 버킷을 묶은 제공자 키별 리미터입니다.
+
+    Contract:
+        - 0 이하 한도는 제한하지 않습니다.
+        - penalize 후에는 지정 시각까지 모든 요청이 대기합니다.
+    """
+
+    def __init__(self, *, rpm: int, tpm: int) -> None:
+        self.rpm = TokenBucket(rpm) if rpm > 0 else None
+        self.tpm = TokenBucket(tpm) if tpm > 0 else None
+        self.blocked_until = 0.0
+
+    async def acquire(self, tokens: int) -> float:
+        """
+        Summary: 요청 1건과 tokens만큼의 한도를 확보합니다.
+
+        Returns:
+            float: 대기한 시간(초).
+        """
+        waited = 0.0
+        delay = self.blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        if self.rpm is not None:
+            waited += await self.rpm.acquire(1)
+        if self.tpm is not None:
+            waited += await self.tpm.acquire(tokens)
+        return waited
+
+    def penalize(self, delay: float) -> None:
+        """
+        Why: 제공자가 429를 돌려주면 버킷을 비우고 delay초 동안 신규 요청을 막습니다.
+        """
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        for bucket in (self.rpm, self.tpm):
+            if bucket is not None:
+                bucket.drain()
+
+
+def get_limiter(provider_code: str, model_api_key: Any) -> ProviderLimiter:
+    """
+    Summary: 제공자/모델 키별 리미터를 반환합니다(같은 키는 같은 리미터 공유).
+
+    Contract:
+        - 한도는 EMBEDDING_RATE_LIMITS의 제공자 기본값을 쓰고,
+          모델 키 extra의 rpm/tpm 값이 있으면 우선합니다.
+
+    Args:
+        provider_code: 제공자 코드(소문자).
+        model_api_key: 모델 키 객체.
+
+    Returns:
+        ProviderLimiter: 공유 리미터.
+    """
+    limits = dict(settings.embedding_rate_limits.get(provider_code, {}))
+    extra = getattr(model_api_key, "extra", None) or {}
+    if isinstance(extra, dict):
+        limits.update({k: extra[k] for k in ("rpm", "tpm") if k in extra})
+    rpm, tpm = int(limits.get("rpm", 0) or 0), int(limits.get("tpm", 0) or 0)
+    key = (provider_code, getattr(model_api_key, "id", None), rpm, tpm)
+    limiter = _LIMITERS.get(key)
+    if limiter is None:
+        limiter = _LIMITERS[key] = ProviderLimiter(rpm=rpm, tpm=tpm)
+    return limiter
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """
+    Why: 제공자 SDK마다 429 예외 타입이 달라 HTTP 상태 코드나 예외 타입명으로만 판별합니다.
+
+    Contract:
+        - 메시지 문자열은 보지 않습니다(요청 ID/본문에 "429"가 들어간 다른 오류를 재시도하지 않음).
+    """
+    response = getattr(exc, "response", None)
+    status = (
+        getattr(exc, "status_code", None)
+        or getattr(exc, "http_status", None)
+        or getattr(response, "status_code", None)
+    )
+    if status is not None:
+        return status == 429
+    name = type(exc).__name__.lower()
+    return "ratelimit" in name or "toomanyrequests" in name
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _record(provider_code: str, **deltas: float) -> None:
+    stats = _THROUGHPUT.setdefault(
+        provider_code,
+        {
+            "requests": 0,
+            "texts": 0,
+            "tokens": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "wait_sec": 0.0,
+            "busy_sec": 0.0,
+        },
+    )
+    for name, value in deltas.items():
+        stats[name] += value
+
+
+def embedding_throughput_stats() -> list[dict[str, Any]]:
+    """
+    Summary: 제공자별 임베딩 처리량 지표를 반환합니다.
+
+    Contract:
+        - tokens_per_sec는 제공자 호출에 걸린 시간 합 기준입니다(대기 시간 제외).
+
+    Returns:
+        list[dict[str, Any]]: 제공자 코드순 지표 목록.
+    """
+    result = []
+    for provider_code in sorted(_THROUGHPUT):
+        stats = _THROUGHPUT[provider_code]
+        busy = stats["busy_sec"]
+        result.append(
+            {
+                "provider": provider_code,
+                "requests": int(stats["requests"]),
+                "texts": int(stats["texts"]),
+                "tokens": int(stats["tokens"]),
+                "retries": int(stats["retries"]),
+                "rate_limited": int(stats["rate_limited"]),
+                "wait_sec": round(stats["wait_sec"], 3),
+                "busy_sec": round(busy, 3),
+                "tokens_per_sec": (stats["tokens"] / busy) if busy else 0.0,
+            }
+        )
+    return result
+
+
+class RateLimitedEmbeddings(Embeddings):
+    """
+    Summary: 토큰 기준 배치 분할, 동시 호출, 제공자 한도, 429 재시도를 적용하는 임베딩 래퍼입니다.
+
+    Contract:
+        - 반환 순서는 입력 순서와 같습니다.
+        - 429는 지수 백오프(full jitter, Retry-After 우선)로 max_retries까지 재시도합니다.
+        - 그 외 예외는 즉시 전파합니다.
+        - 배치/동시성/한도/재시도는 비동기 경로(aembed_documents/aembed_query)에만 적용됩니다.
+          동기 embed_documents/embed_query는 원본을 그대로 호출하며 제한되지 않습니다
+          (애플리케이션 경로는 모두 비동기이며, 동기 호출은 스크립트/도구용입니다).
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        *,
+        provider_code: str,
+        limiter: ProviderLimiter,
+        concurrency: int | None = None,
+        max_batch_tokens: int | None = None,
+        max_batch_size: int | None = None,
+        max_retries: int | None = None,
+    ) -> None:
+        """
+        Why: 원본 클라이언트와 제공자 리미터, 배치/동시성 한도를 고정합니다(미지정 시 설정값).
+        """
+        self.base = base
+        self.provider_code = provider_code
+        self.limiter = limiter
+        self.concurrency = max(1, concurrency or settings.embedding_concurrency)
+        self.max_batch_tokens = max(
+            1, max_batch_tokens or settings.embedding_max_batch_tokens
+        )
+        self.max_batch_size = max(
+            1, max_batch_size or settings.embedding_max_batch_size
+        )
+        self.max_retries = (
+            settings.embedding_max_retries if max_retries is None else max_retries
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # 모델명/클라이언트 등 원본 속성 조회는 그대로 위임
+        if name == "base":
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+    async def _call(self, fn, payload, *, texts: int, tokens: int):
+        """
+        Summary: 리미터를 통과한 뒤 제공자를 호출하고 429면 백오프 후 재시도합니다.
+        """
+        attempt = 0
+        while True:
+            waited = await self.limiter.acquire(tokens)
+            started = time.monotonic()
+            try:
+                result = await fn(payload)
+            except Exception as exc:
+                if not _is_rate_limited(exc) or attempt >= self.max_retries:
+                    raise
+                cap = min(
+                    settings.embedding_backoff_max_sec,
+                    settings.embedding_backoff_base_sec * (2**attempt),
+                )
+                delay = max(_retry_after(exc) or 0.0, random.uniform(0, cap))
+                attempt += 1
+                _record(self.provider_code, retries=1, rate_limited=1, wait_sec=waited)
+                logger.warning(
+                    f"[embedding:{self.provider_code}] 429, {delay:.2f}s 후 재시도 ({attempt}/{self.max_retries})"
+                )
+                self.limiter.penalize(delay)
+                continue
+            _record(
+                self.provider_code,
+                requests=1,
+                texts=texts,
+                tokens=tokens,
+                wait_sec=waited,
+                busy_sec=time.monotonic() - started,
+            )
+            return result
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Summary: 토큰 기준 배치로 나눠 최대 concurrency개를 동시에 임베딩합니다.
+
+        Args:
+            texts: 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서의 벡터 목록.
+        """
+        if not texts:
+            return []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        out: list[list[float]] = [None] * len(texts)  # type: ignore[list-item]
+
+        async def run(start: int, end: int, tokens: int) -> None:
+            async with semaphore:
+                vectors = await self._call(
+                    self.base.aembed_documents,
+                    list(texts[start:end]),
+                    texts=end - start,
+                    tokens=tokens,
+                )
+            out[start:end] = vectors
+
+        batches = token_batches(
+            texts, max_tokens=self.max_batch_tokens, max_items=self.max_batch_size
+        )
+        await asyncio.gather(*(run(s, e, t) for s, e, t in batches))
+        return out
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self._call(
+            self.base.aembed_query, text, texts=1, tokens=estimate_tokens(text)
+        )
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        # 제한 없음: 리미터/재시도는 비동기 경로 전용입니다(클래스 Contract 참고).
+        return self.base.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        # 제한 없음: 리미터/재시도는 비동기 경로 전용입니다(클래스 Contract 참고).
+        return self.base.embed_query(text)
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+from langchain_core.documents import Document
+
+from app.core import settings
+from app.utils.document_process import emit_chunk_batches, file_sha256
+from app.utils.parse_pool import stream_from_parse_pool
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[list[Document]], Awaitable[list[list[float]]]]
+StoreFn = Callable[[list[Document], list[list[float]]], Awaitable[Any]]
+EventFn = Callable[["PipelineSource", str, dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(eq=False)
+class PipelineSource:
+    """
+    Summary: 파이프라인에 넣을 파일 하나와 그 진행 상태입니다.
+
+    Contract:
+        - key는 호출자가 결과를 자신의 객체(작업 파일 행 등)와 연결하는 데 씁니다.
+        - chunk_count/stored/error/content_hash/file_size는 파이프라인이 갱신합니다.
+    """
+
+    path: str
+    mime_type: str
+    file_id: str
+    filename: str | None
+    metadata: dict | None = None
+    key: Any = None
+    chunk_count: int = 0
+    stored: int = 0
+    error: str | None = None
+    content_hash: str | None = None
+    file_size: int | None = None
+
+
+class IngestionPipeline:
+    """
+    Summary: parse → embed → store 단계를 bounded queue로 연결한 적재 파이프라인입니다.
+
+    Contract:
+        - 여러 파일/배치가 동시에 서로 다른 단계를 통과합니다.
+        - 파싱 중에도 완성된 배치부터 임베딩 단계로 넘기므로 큰 파일의 첫 배치가
+          파싱 완료를 기다리지 않습니다.
+        - 파싱 자식 → parse → embed → store 모든 구간이 queue_size로 제한된 큐/채널입니다.
+          뒤 단계가 밀리면 파싱 자식까지 대기하므로(backpressure) 메모리/디스크가 제한됩니다.
+        - 배치 완료는 채널로 바로 전달되며 파일 시스템을 폴링하지 않습니다.
+        - 파싱 실패/빈 문서는 파일 단위로 "failed" 이벤트를 내고 계속 진행합니다.
+          이미 넘긴 배치가 모두 정리된 뒤에 내며, 남은 배치는 임베딩/저장하지 않습니다.
+        - 임베딩/저장 예외는 전체 파이프라인을 취소하고 그대로 전파합니다.
+        - on_event 콜백은 락으로 직렬화되어 하나의 DB 세션을 안전하게 쓸 수 있습니다.
+
+    Events:
+        - "chunked": {"chunk_count": int} (파싱 완료, 앞선 "batch"보다 늦을 수 있음)
+        - "batch": {"stored": int} (배치 하나 저장 완료)
+        - "stored": {"stored": int} (파일의 모든 배치 저장 완료)
+        - "failed": {"error": str} (source.stored > 0이면 일부 배치가 저장된 상태)
+    """
+
+    def __init__(
+        self,
+        *,
+        embed: EmbedFn,
+        store: StoreFn,
+        chunk_size: int,
+        chunk_overlap: int,
+        on_event: EventFn | None = None,
+        parse_concurrency: int | None = None,
+        embed_concurrency: int | None = None,
+        store_concurrency: int | None = None,
+        queue_size: int | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """
+        Why: 단계별 처리 함수와 동시성/큐 크기를 고정합니다(미지정 시 설정값).
+
+        Args:
+            embed: 청크 배치 → 벡터 목록. 동시에 호출되므로 세션을 공유하지 않아야 합니다.
+            store: (청크 배치, 벡터 목록) 저장.
+            chunk_size: 청크 크기.
+            chunk_overlap: 청크 겹침 크기.
+            on_event: 진행 이벤트 콜백(옵션).
+            parse_concurrency: 동시에 파싱할 파일 수.
+            embed_concurrency: 동시 임베딩 호출 수.
+            store_concurrency: 동시 저장 수.
+            queue_size: 단계 사이 큐에 대기할 최대 배치 수.
+            batch_size: 배치당 청크 수.
+        """
+        self._embed = embed
+        self._store = store
+        self._on_event = on_event
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.parse_concurrency = max(
+            1, parse_concurrency or settings.ingest_parse_concurrency
+        )
+        self.embed_concurrency = max(
+            1, embed_concurrency or settings.ingest_embed_concurrency
+        )
+        self.store_concurrency = max(
+            1, store_concurrency or settings.ingest_store_concurrency
+        )
+        self.queue_size = max(1, queue_size or settings.ingest_queue_size)
+        self.batch_size = max(1, batch_size or settings.ingest_batch_size)
+        self._events = asyncio.Lock()
+        # 파일별 미저장 배치 수(+ 생산 중이면 1)
+        self._pending: dict[int, int] = {}
+
+    async def _emit(self, source: PipelineSource, event: str, **info: Any) -> None:
+        if self._on_event is None:
+            return
+        async with self._events:
+            await self._on_event(source, event, info)
+
+    async def _settle(self, source: PipelineSource) -> None:
+        """
+        Why: 파일의 마지막 배치가 정리되고 생산도 끝났을 때 "stored"/"failed"를 한 번만 냅니다.
+        """
+        self._pending[id(source)] -= 1
+        if self._pending[id(source)] == 0:
+            del self._pending[id(source)]
+            if source.error is not None:
+                await self._emit(source, "failed", error=source.error)
+            else:
+                await self._emit(source, "stored", stored=source.stored)
+
+    async def _produce(self, source: PipelineSource, embed_q: asyncio.Queue) -> int:
+        """
+        Why: 프로세스 풀이 채널로 보내는 배치를 받는 즉시 임베딩 큐에 넣습니다.
+
+        Contract:
+            - 채널은 queue_size개까지만 쌓이고 임베딩 큐가 가득 차면 받기를 멈추므로,
+              임베딩이 밀리면 파싱 자식도 대기합니다(디스크/메모리 사용이 제한됨).
+
+        Returns:
+            int: 파일의 전체 청크 수.
+
+        Raises:
+            Exception: 파싱 작업에서 발생한 예외.
+        """
+        source.content_hash = await asyncio.to_thread(file_sha256, source.path)
+        source.file_size = os.path.getsize(source.path)
+        count = 0
+        batches = stream_from_parse_pool(
+            emit_chunk_batches,
+            source.path,
+            source.mime_type,
+            source.metadata,
+            maxsize=self.queue_size,
+            file_id=source.file_id,
+            filename=source.filename,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            batch_size=self.batch_size,
+        )
+        async with contextlib.aclosing(batches):
+            async for records in batches:
+                batch = [
+                    Document(page_content=text, metadata=metadata)
+                    for text, metadata in records
+                ]
+                count += len(batch)
+                self._pending[id(source)] += 1
+                await embed_q.put((source, batch))
+        return count
+
+    async def _parse_stage(
+        self, files: asyncio.Queue[PipelineSource], embed_q: asyncio.Queue
+    ) -> None:
+        while True:
+            try:
+                source = files.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._pending[id(source)] = 1
+            try:
+                count = await self._produce(source, embed_q)
+            except Exception as e:
+                logger.error(f"파일 처리 중 오류 발생: {source.filename} - {e}")
+                source.error = str(e)
+            else:
+                if count:
+                    source.chunk_count = count
+                    await self._emit(source, "chunked", chunk_count=count)
+                else:
+                    source.error = "파일에서 처리된 문서가 없습니다."
+            await self._settle(source)
+
+    async def _embed_stage(
+        self, embed_q: asyncio.Queue, store_q: asyncio.Queue
+    ) -> None:
+        while (task := await embed_q.get()) is not None:
+            source, batch = task
+            if source.error is not None:
+                await self._settle(source)
+                continue
+            vectors = await self._embed(batch)
+            await store_q.put((source, batch, vectors))
+
+    async def _store_stage(self, store_q: asyncio.Queue) -> None:
+        while (task := await store_q.get()) is not None:
+            source, batch, vectors = task
+            if source.error is None:
+                await self._store(batch, vectors)
+                source.stored += len(batch)
+                await self._emit(source, "batch", stored=source.stored)
+            await self._settle(source)
+
+    @staticmethod
+    async def _close_after(
+        upstream: list[asyncio.Task[None]], queue: asyncio.Queue, consumers: int
+    ) -> None:
+        """
+        Why: 앞 단계가 모두 끝나면 다음 단계 소비자 수만큼 종료 신호(None)를 넣습니다.
+        """
+        await asyncio.wait(upstream)
+        for _ in range(consumers):
+            await queue.put(None)
+
+    async def run(self, sources: Iterable[PipelineSource]) -> list[PipelineSource]:
+        """
+        Summary: 모든 파일을 단계 병렬로 처리하고 진행 상태가 채워진 source 목록을 반환합니다.
+
+        Args:
+            sources: 처리할 파일 목록.
+
+        Returns:
+            list[PipelineSource]: 입력 순서의 source 목록.
+
+        Raises:
+            Exception: 임베딩/저장 단계에서 발생한 첫 번째 예외.
+
+        Side Effects:
+            - 프로세스 풀 파싱(배치는 bounded 채널로 전달, 임시 파일 없음)
+            - embed/store 콜백 호출
+        """
+        items = list(sources)
+        files: asyncio.Queue[PipelineSource] = asyncio.Queue()
+        for source in items:
+            files.put_nowait(source)
+        embed_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        store_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                parsers = [
+                    tg.create_task(self._parse_stage(files, embed_q))
+                    for _ in range(self.parse_concurrency)
+                ]
+                embedders = [
+                    tg.create_task(self._embed_stage(embed_q, store_q))
+                    for _ in range(self.embed_concurrency)
+                ]
+                for _ in range(self.store_concurrency):
+                    tg.create_task(self._store_stage(store_q))
+                tg.create_task(self._close_after(parsers, embed_q, len(embedders)))
+                tg.create_task(
+                    self._close_after(embedders, store_q, self.store_concurrency)
+                )
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return items
@@ -1,9 +1,10 @@
 # app/utils/mcp.py
 from __future__ import annotations
+import hashlib
+import json
 from typing import Any, Iterable
 
 from langchain_core.tools import BaseTool
-from langchain_mcp_adapters.client import MultiServerMCPClient
 
 
 ALLOWED_TRANSPORTS = {"streamable_http", "sse"}
@@ -43,16 +44,58 @@ def _normalize_server_config(item: Any) -> tuple[str, dict[str, Any]]:
     return name, normalized
 
 
-async def load_mcp_tools_from_servers(servers: Iterable[Any]) -> list[BaseTool]:
+def server_cache_id(server: Any) -> str:
     """
-    servers: MCPServer 인스턴스들 또는 {"name": str, "config": {...}} dict 들
-    반환: LangChain BaseTool 리스트
+    Why: MCPServer 인스턴스/dict 모두에서 캐시 키용 식별자(ID, 없으면 이름)를 추출합니다.
+
+    Args:
+        server: MCPServer 인스턴스 또는 {"name","config"} dict.
+
+    Returns:
+        str: 캐시 식별자 문자열.
+    """
+    sid = getattr(server, "id", None)
+    if sid is None and isinstance(server, dict):
+        sid = server.get("id") or server.get("name")
+    return str(sid)
+
+
+def config_fingerprint(cfg: dict[str, Any]) -> str:
+    """
+    Why: 정규화된 서버 설정이 바뀌면 기존 세션을 재사용하지 않도록 해시를 만듭니다.
+
+    Args:
+        cfg: _normalize_server_config 결과 설정.
+
+    Returns:
+        str: sha256 hex 문자열.
+    """
+    raw = json.dumps(cfg, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def tools_fingerprint(tools: Iterable[BaseTool]) -> str:
     """
-    server_map: dict[str, dict[str, Any]] = {}
-    for item in servers:
-        name, cfg = _normalize_server_config(item)
-        server_map[name] = cfg
+    Summary: 툴 목록(이름/설명/입력 스키마)의 안정적인 해시를 계산합니다.
 
-    client = MultiServerMCPClient(server_map)
-    tools = await client.get_tools()
-    return tools
+    Contract:
+        - 툴 순서와 무관하게 동일한 스키마면 동일한 값을 반환합니다.
+
+    Args:
+        tools: LangChain 툴 목록.
+
+    Returns:
+        str: sha256 hex 문자열.
+    """
+    items = []
+    for t in tools:
+        schema = getattr(t, "args_schema", None)
+        if schema is not None and not isinstance(schema, dict):
+            try:
+                schema = schema.model_json_schema()
+            except Exception:
+                schema = repr(schema)
+        items.append([t.name, t.description or "", schema])
+    items.sort(key=lambda x: x[0])
+    raw = json.dumps(items, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.sessions import create_session
+from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import ClientSession
+
+from app.core import settings
+from app.utils.agent_cache import invalidate_agents
+from app.utils.cache import LRUCache
+from app.utils.mcp import (
+    _normalize_server_config,
+    config_fingerprint,
+    server_cache_id,
+)
+
+logger = logging.getLogger(__name__)
+
+# key: (server_cache_id, config_fingerprint)
+SessionKey = tuple[str, str]
+
+
+class _ServerSession:
+    """
+    Summary: MCP 서버 하나에 대한 장기 세션을 소유 태스크에서 유지합니다.
+
+    Contract:
+        - create_session 컨텍스트는 진입/종료가 같은 태스크여야 하므로
+          전용 소유 태스크가 세션을 열고 stop 신호까지 대기합니다.
+        - 세션이 끊기면 alive=False가 되며 재사용되지 않습니다.
+        - last_used는 관리자가 세션/툴을 내줄 때 갱신합니다(유휴 만료/LRU 기준).
+    """
+
+    def __init__(self, name: str, connection: dict[str, Any]) -> None:
+        self.name = name
+        self.connection = connection
+        self.session: ClientSession | None = None
+        self.error: BaseException | None = None
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self.last_used = time.monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def start(self) -> ClientSession:
+        """
+        Summary: 소유 태스크를 띄우고 세션 초기화 완료까지 대기합니다.
+
+        Returns:
+            ClientSession: 초기화된 MCP 세션.
+
+        Raises:
+            Exception: 연결/초기화 실패 시 원래 예외.
+        """
+        self._task = asyncio.create_task(self._run(), name=f"mcp-session:{self.name}")
+        await self._ready.wait()
+        if self.session is None:
+            raise self.error or RuntimeError(f"MCP 세션 시작 실패: {self.name}")
+        return self.session
+
+    async def _run(self) -> None:
+        try:
+            async with create_session(self.connection) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set()
+                await self._stop.wait()
+        except Exception as e:
+            self.error = e
+            logger.warning("MCP session %s closed: %r", self.name, e)
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def aclose(self, *, timeout_sec: float = 5.0) -> None:
+        """
+        Why: stop 신호로 소유 태스크가 컨텍스트를 정상 종료하도록 합니다.
+
+        Args:
+            timeout_sec: 정상 종료 대기 시간(초). 초과 시 태스크를 취소합니다.
+        """
+        self._stop.set()
+        task = self._task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+
+class _CircuitBreaker:
+    """
+    Summary: 서버별 연속 실패 횟수를 세어 임계치 도달 시 쿨다운 동안 차단합니다.
+
+    Contract:
+        - 쿨다운이 지나면 한 번의 시도(half-open)를 허용합니다.
+        - 성공 시 실패 횟수를 초기화합니다.
+    """
+
+    def __init__(self, *, threshold: int, cooldown_sec: float) -> None:
+        self.threshold = max(1, int(threshold))
+        self.cooldown_sec = cooldown_sec
+        self.failures = 0
+        self.opened_until = 0.0
+
+    def allow(self) -> bool:
+        return time.monotonic() >= self.opened_until
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_until = 0.0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_until = time.monotonic() + self.cooldown_sec
+
+
+class MCPLoadResult(NamedTuple):
+    """
+    Summary: 서버별 격리 로딩 결과(정상 서버의 툴/서버 목록과 실패 경고).
+    """
+
+    tools: list[BaseTool]
+    servers: list[Any]
+    warnings: list[dict[str, str]]
+
+
+class MCPConnectionManager:
+    """
+    Summary: 서버 설정별 warm MCP 세션과 TTL 툴 목록 캐시를 관리합니다.
+
+    Contract:
+        - 같은 서버(ID+설정 해시)는 하나의 세션을 공유합니다.
+        - 툴 목록은 ttl 동안 재탐지하지 않습니다.
+        - 세션이 교체되면 이전 세션에 묶인 에이전트 캐시를 무효화합니다.
+        - 서버별 서킷 브레이커로 반복 실패 서버를 쿨다운 동안 건너뜁니다.
+        - idle_sec 동안 쓰이지 않은 세션과 max_sessions를 넘는 가장 오래된 세션은
+          툴 조회 시점에 닫습니다. 연결/탐지 중이거나 lease로 에이전트 실행에 잡혀 있는
+          세션은 제외합니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        maxsize: int,
+        breaker_threshold: int = 3,
+        breaker_cooldown_sec: float = 60.0,
+        idle_sec: float = 0.0,
+        max_sessions: int = 0,
+    ) -> None:
+        self.tools_cache: LRUCache[SessionKey, list[BaseTool]] = LRUCache(
+            "mcp_tools", maxsize=maxsize, ttl=ttl
+        )
+        self._sessions: dict[SessionKey, _ServerSession] = {}
+        self._locks: dict[SessionKey, asyncio.Lock] = {}
+        # 세션 키별 진행 중인 에이전트 실행 수(lease)
+        self._leases: dict[SessionKey, int] = {}
+        self._breakers: dict[str, _CircuitBreaker] = {}
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown_sec = breaker_cooldown_sec
+        self.idle_sec = idle_sec
+        self.max_sessions = max_sessions
+
+    async def get_tools(self, server: Any) -> list[BaseTool]:
+        """
+        Summary: 서버의 툴 목록을 캐시에서 반환하거나 warm 세션으로 탐지합니다.
+
+        Contract:
+            - 반환된 툴은 관리자가 유지하는 세션에 바인딩됩니다.
+            - 캐시된 세션으로 탐지가 실패하면 한 번 재연결 후 재시도합니다.
+
+        Args:
+            server: MCPServer 인스턴스 또는 {"name","config"} dict.
+
+        Returns:
+            list[BaseTool]: LangChain 툴 목록.
+
+        Raises:
+            ValueError: 서버 설정이 유효하지 않은 경우.
+            Exception: 연결/탐지 실패.
+        """
+        name, cfg = _normalize_server_config(server)
+        key: SessionKey = (server_cache_id(server), config_fingerprint(cfg))
+
+        await self.evict_idle(keep=key)
+        tools = self._cached_tools(key)
+        if tools is not None:
+            return tools
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            tools = self._cached_tools(key)
+            if tools is not None:
+                return tools
+
+            reused = key in self._sessions and self._sessions[key].alive
+            session = await self._ensure_session(key, name, cfg)
+            try:
+                tools = await load_mcp_tools(session, connection=cfg)
+            except Exception:
+                if not reused:
+                    raise
+                await self._drop(key)
+                session = await self._ensure_session(key, name, cfg)
+                tools = await load_mcp_tools(session, connection=cfg)
+            self.tools_cache.put(key, tools)
+            self._sessions[key].last_used = time.monotonic()
+            return tools
+
+    def _cached_tools(self, key: SessionKey) -> list[BaseTool] | None:
+        """
+        Why: 세션이 살아 있을 때만 캐시된 툴을 유효한 것으로 봅니다.
+        """
+        entry = self._sessions.get(key)
+        if entry is None or not entry.alive:
+            return None
+        tools = self.tools_cache.get(key)
+        if tools is not None:
+            entry.last_used = time.monotonic()
+        return tools
+
+    async def evict_idle(self, *, keep: SessionKey | None = None) -> int:
+        """
+        Summary: 유휴 만료된 세션과 최대 수를 넘는 LRU 세션을 닫습니다.
+
+        Contract:
+            - 락을 잡고 있는(연결/탐지 중인) 세션, lease 중인 세션과 keep 세션은 닫지 않습니다.
+            - 끊긴 세션은 유휴 시간과 무관하게 정리합니다.
+
+        Args:
+            keep: 이번 요청에서 쓸 세션 키(옵션).
+
+        Returns:
+            int: 닫은 세션 수.
+        """
+        now = time.monotonic()
+        total = len(self._sessions)
+        if keep is not None and keep not in self._sessions:
+            total += 1
+        overflow = total - self.max_sessions if self.max_sessions > 0 else 0
+        evicted = 0
+        for key, entry in sorted(self._sessions.items(), key=lambda i: i[1].last_used):
+            lock = self._locks.get(key)
+            if key == keep or (lock is not None and lock.locked()):
+                continue
+            if self._leases.get(key):
+                continue
+            # 앞선 세션을 닫는 동안 교체/제거됐을 수 있습니다.
+            if self._sessions.get(key) is not entry:
+                continue
+            idle = self.idle_sec > 0 and now - entry.last_used >= self.idle_sec
+            if not (idle or overflow > 0 or not entry.alive):
+                continue
+            await self._drop(key)
+            self._locks.pop(key, None)
+            overflow -= 1
+            evicted += 1
+        return evicted
+
+    @contextlib.contextmanager
+    def lease(self, servers: Iterable[Any]) -> Iterator[None]:
+        """
+        Summary: 블록 동안 서버들의 세션을 유휴/LRU 정리 대상에서 제외합니다.
+
+        Contract:
+            - 에이전트 실행 전체를 감싸 툴 호출 도중 세션이 닫히지 않게 합니다.
+            - 중첩/동시 lease는 참조 수로 셉니다. 해제 시 last_used를 갱신합니다.
+            - 설정 변경에 따른 invalidate는 lease와 무관하게 세션을 닫습니다.
+
+        Args:
+            servers: MCPServer 인스턴스 또는 {"name","config"} dict 목록.
+        """
+        keys: list[SessionKey] = []
+        for server in servers:
+            _, cfg = _normalize_server_config(server)
+            keys.append((server_cache_id(server), config_fingerprint(cfg)))
+        for key in keys:
+            self._leases[key] = self._leases.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            now = time.monotonic()
+            for key in keys:
+                count = self._leases.get(key, 0) - 1
+                if count > 0:
+                    self._leases[key] = count
+                else:
+                    self._leases.pop(key, None)
+                entry = self._sessions.get(key)
+                if entry is not None:
+                    entry.last_used = now
+
+    async def _ensure_session(
+        self, key: SessionKey, name: str, cfg: dict[str, Any]
+    ) -> ClientSession:
+        """
+        Summary: 살아 있는 세션을 반환하거나 새로 연결합니다.
+
+        Side Effects:
+            - 같은 서버의 이전 설정 세션 및 끊긴 세션 종료
+            - 세션 교체 시 해당 서버의 에이전트 캐시 무효화
+        """
+        entry = self._sessions.get(key)
+        if entry is not None and entry.alive and entry.session is not None:
+            return entry.session
+
+        for stale in [k for k in self._sessions if k[0] == key[0]]:
+            await self._drop(stale)
+
+        entry = _ServerSession(name, cfg)
+        try:
+            session = await entry.start()
+        except BaseException:
+            # 연결 도중 취소(타임아웃)돼도 소유 태스크가 세션을 닫고 종료하도록 합니다.
+            entry._stop.set()
+            raise
+        self._sessions[key] = entry
+        return session
+
+    async def _drop(self, key: SessionKey) -> None:
+        """
+        Why: 세션/툴 캐시를 제거하고, 그 세션에 묶인 툴을 쓰는 에이전트를 무효화합니다.
+        """
+        entry = self._sessions.pop(key, None)
+        self.tools_cache.pop(key)
+        invalidate_agents(mcp_server_id=key[0])
+        if entry is not None:
+            await entry.aclose()
+
+    def _breaker(self, sid: str) -> _CircuitBreaker:
+        breaker = self._breakers.get(sid)
+        if breaker is None:
+            breaker = _CircuitBreaker(
+                threshold=self.breaker_threshold,
+                cooldown_sec=self.breaker_cooldown_sec,
+            )
+            self._breakers[sid] = breaker
+        return breaker
+
+    async def _load_one(
+        self, server: Any, timeout_sec: float
+    ) -> tuple[list[BaseTool] | None, dict[str, str] | None]:
+        """
+        Summary: 단일 서버의 툴을 제한 시간 안에 로드하고 브레이커 상태를 갱신합니다.
+
+        Returns:
+            tuple: (툴 목록 또는 None, 실패 시 경고 dict 또는 None).
+        """
+        sid = server_cache_id(server)
+        name = getattr(server, "name", None) or (
+            server.get("name") if isinstance(server, dict) else sid
+        )
+        breaker = self._breaker(sid)
+        if not breaker.allow():
+            return None, {
+                "server": str(name),
+                "reason": "circuit_open",
+                "detail": "반복 실패로 일시적으로 건너뜁니다.",
+            }
+        try:
+            tools = await asyncio.wait_for(self.get_tools(server), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            return None, {
+                "server": str(name),
+                "reason": "timeout",
+                "detail": f"{timeout_sec:g}초 안에 응답하지 않았습니다.",
+            }
+        except Exception as e:
+            breaker.record_failure()
+            return None, {"server": str(name), "reason": "error", "detail": str(e)}
+        breaker.record_success()
+        return tools, None
+
+    async def load_tools_isolated(
+        self, servers: Iterable[Any], *, timeout_sec: float
+    ) -> MCPLoadResult:
+        """
+        Summary: 서버별로 동시에, 제한 시간 안에 툴을 로드하고 실패를 격리합니다.
+
+        Contract:
+            - 실패/시간 초과/차단된 서버는 결과에서 제외하고 경고로 보고합니다.
+            - 전체 지연은 가장 느린 서버가 아니라 timeout_sec로 제한됩니다.
+
+        Args:
+            servers: MCPServer 인스턴스 또는 {"name","config"} dict 목록.
+            timeout_sec: 서버별 제한 시간(초).
+
+        Returns:
+            MCPLoadResult: 정상 서버의 툴/서버 목록과 경고 목록.
+        """
+        items = list(servers)
+        results = await asyncio.gather(*(self._load_one(s, timeout_sec) for s in items))
+        tools: list[BaseTool] = []
+        healthy: list[Any] = []
+        warnings: list[dict[str, str]] = []
+        for server, (server_tools, warning) in zip(items, results):
+            if warning is not None:
+                logger.warning("MCP server skipped: %s", warning)
+                warnings.append(warning)
+                continue
+            healthy.append(server)
+            tools.extend(server_tools or [])
+        return MCPLoadResult(tools=tools, servers=healthy, warnings=warnings)
+
+    async def invalidate(self, server_id: int | str) -> int:
+        """
+        Summary: 서버 수정/삭제 시 해당 서버의 세션과 툴 캐시를 제거합니다.
+
+        Args:
+            server_id: MCP 서버 ID(또는 server_cache_id 값).
+
+        Returns:
+            int: 종료된 세션 수.
+        """
+        sid = str(server_id)
+        keys = {k for k in self._sessions if k[0] == sid}
+        keys.update(k for k in self.tools_cache.keys() if k[0] == sid)
+        for key in keys:
+            await self._drop(key)
+            self._locks.pop(key, None)
+        self._breakers.pop(sid, None)
+        return len(keys)
+
+    async def aclose(self) -> None:
+        """
+        Why: 애플리케이션 종료 시 모든 세션을 정리합니다.
+        """
+        for key in list(self._sessions):
+            await self._drop(key)
+        self._locks.clear()
+        self._leases.clear()
+        self._breakers.clear()
+        self.tools_cache.clear()
+
+
+mcp_manager = MCPConnectionManager(
+    ttl=settings.mcp_tools_ttl_sec,
+    maxsize=settings.mcp_tools_cache_size,
+    breaker_threshold=settings.mcp_breaker_threshold,
+    breaker_cooldown_sec=settings.mcp_breaker_cooldown_sec,
+    idle_sec=settings.mcp_session_idle_sec,
+    max_sessions=settings.mcp_max_sessions,
+)
+
+
+async def load_mcp_tools_from_servers(servers: Iterable[Any]) -> list[BaseTool]:
+    """
+    servers: MCPServer 인스턴스들 또는 {"name": str, "config": {...}} dict 들
+    반환: LangChain BaseTool 리스트 (프로세스 공용 warm 세션/툴 캐시 사용)
+    """
+    items = list(servers)
+    for item in items:
+        _normalize_server_config(item)
+
+    results = await asyncio.gather(*(mcp_manager.get_tools(s) for s in items))
+    tools: list[BaseTool] = []
+    for server_tools in results:
+        tools.extend(server_tools)
+    return tools
+
+
+def lease_mcp_sessions(servers: Iterable[Any]) -> contextlib.AbstractContextManager:
+    """
+    Summary: 에이전트 실행 동안 서버 세션이 유휴 정리로 닫히지 않게 잡아 둡니다.
+
+    Args:
+        servers: load_mcp_tools_isolated가 반환한 정상 서버 목록.
+
+    Returns:
+        AbstractContextManager: with 블록 동안 유지되는 lease.
+    """
+    return mcp_manager.lease(servers)
+
+
+async def load_mcp_tools_isolated(
+    servers: Iterable[Any], *, timeout_sec: float | None = None
+) -> MCPLoadResult:
+    """
+    Summary: 채팅용으로 서버별 장애를 격리해 툴을 로드합니다.
+
+    Args:
+        servers: MCPServer 인스턴스 또는 {"name","config"} dict 목록.
+        timeout_sec: 서버별 제한 시간(초). 기본값은 설정값.
+
+    Returns:
+        MCPLoadResult: 정상 서버의 툴/서버 목록과 경고 목록.
+    """
+    return await mcp_manager.load_tools_isolated(
+        servers,
+        timeout_sec=(
+            timeout_sec if timeout_sec is not None else settings.mcp_load_timeout_sec
+        ),
+    )
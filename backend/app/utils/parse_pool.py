@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, TypeVar
+from uuid import uuid4
+
+from app.core import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_pool: ProcessPoolExecutor | None = None
+# 작업 시작 시 자식이 (토큰, pid)를 보내는 큐(풀과 함께 생성/교체)
+_started: Any = None
+_task_pids: dict[str, int] = {}
+# 스트리밍 작업의 부모↔자식 bounded 채널(Manager 큐)을 만드는 관리자 프로세스
+_manager: Any = None
+
+# 스트리밍 채널 대기 중 자식 작업 종료/실패를 확인하는 주기(초)
+STREAM_CHECK_SEC = 0.5
+
+# 자식 프로세스 전역: 부모가 넘겨준 시작 알림 큐
+_worker_started: Any = None
+
+
+def _init_worker(max_memory_mb: int, started: Any = None) -> None:
+    """
+    Why: 자식 프로세스의 주소 공간을 제한해 거대한 파일이 호스트 메모리를 잠식하지 않게 합니다.
+
+    Contract:
+        - resource 모듈이 없는 플랫폼(Windows)에서는 제한 없이 동작합니다.
+        - started 큐가 있으면 작업마다 실행 중인 pid를 부모에게 알립니다.
+    """
+    global _worker_started
+    _worker_started = started
+    if max_memory_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def _run_task(token: str, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    """
+    Why: 시간 초과 시 그 작업을 실행 중인 자식만 종료할 수 있도록 pid를 먼저 알립니다.
+    """
+    if _worker_started is not None:
+        _worker_started.put((token, os.getpid()))
+    return fn(*args, **kwargs)
+
+
+def _run_stream_task(
+    token: str, fn: Callable[..., Any], channel: Any, args: tuple, kwargs: dict
+) -> None:
+    """
+    Why: fn이 emit으로 내보낸 값을 (순번, 값)으로 채널에 넣고, 끝나면 종료 표시를 넣습니다.
+
+    Contract:
+        - 채널이 가득 차면 emit이 대기하므로 부모가 소비한 만큼만 앞서 나갑니다.
+        - 재시도된 작업도 순번 0부터 다시 보내며, 부모가 이미 받은 순번은 건너뜁니다.
+    """
+    if _worker_started is not None:
+        _worker_started.put((token, os.getpid()))
+    seq = itertools.count()
+    try:
+        fn(*args, emit=lambda item: channel.put((next(seq), item)), **kwargs)
+    finally:
+        channel.put((None, None))
+
+
+def _worker_count() -> int:
+    if settings.parse_workers > 0:
+        return settings.parse_workers
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Summary: 파싱 전용 프로세스 풀을 반환합니다(최초 호출 시 생성).
+
+    Contract:
+        - spawn 컨텍스트를 사용해 이벤트 루프/스레드 상태를 복제하지 않습니다.
+
+    Returns:
+        ProcessPoolExecutor: 공용 파싱 풀.
+    """
+    global _pool, _started
+    if _pool is None:
+        context = multiprocessing.get_context("spawn")
+        _started = context.SimpleQueue()
+        _task_pids.clear()
+        _pool = ProcessPoolExecutor(
+            max_workers=_worker_count(),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(settings.parse_max_memory_mb, _started),
+        )
+    return _pool
+
+
+def _drain_started() -> None:
+    started = _started
+    while started is not None and not started.empty():
+        started_token, pid = started.get()
+        _task_pids[started_token] = pid
+
+
+def _task_pid(token: str) -> int | None:
+    """
+    Summary: 시작 알림 큐를 비우고 토큰 작업을 실행한 자식 pid를 꺼냅니다(없으면 None).
+    """
+    _drain_started()
+    return _task_pids.pop(token, None)
+
+
+def _kill_task(pool: ProcessPoolExecutor, token: str) -> bool:
+    """
+    Summary: 시간 초과 작업을 실행 중인 자식 프로세스 하나만 종료합니다.
+
+    Contract:
+        - 작업이 아직 시작되지 않았으면(대기열) 아무 프로세스도 종료하지 않습니다.
+        - 자식 하나가 죽으면 executor가 풀을 broken으로 표시하므로 같은 풀의 다른 작업은
+          BrokenProcessPool을 받고 새 풀에서 한 번 재시도합니다.
+
+    Returns:
+        bool: 자식을 종료했으면 True.
+    """
+    pid = _task_pid(token)
+    if pid is None:
+        return False
+    proc = getattr(pool, "_processes", {}).get(pid)
+    if proc is None:
+        return False
+    try:
+        proc.terminate()
+    except Exception:
+        return False
+    return True
+
+
+def _reset_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Why: 깨진 풀을 버리고 다음 호출에서 새 풀을 만듭니다.
+
+    Contract:
+        - 실패한 풀이 아직 현재 풀일 때만 교체합니다(이미 교체된 새 풀은 건드리지 않음).
+    """
+    global _pool, _started
+    if _pool is not pool:
+        return
+    _pool, _started = None, None
+    _task_pids.clear()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_manager() -> Any:
+    """
+    Why: 프로세스 풀 작업에 넘길 수 있는(피클 가능한) bounded 큐를 만들 관리자를 띄웁니다.
+    """
+    global _manager
+    if _manager is None:
+        _manager = multiprocessing.get_context("spawn").Manager()
+    return _manager
+
+
+def shutdown_parse_pool() -> None:
+    """
+    Why: 애플리케이션 종료 시 자식 프로세스를 정리합니다.
+    """
+    global _pool, _manager
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+    manager, _manager = _manager, None
+    if manager is not None:
+        manager.shutdown()
+
+
+async def run_in_parse_pool(
+    fn: Callable[..., T], *args: Any, timeout_sec: float | None = None, **kwargs: Any
+) -> T:
+    """
+    Summary: CPU 작업을 프로세스 풀에서 실행해 이벤트 루프를 막지 않습니다.
+
+    Contract:
+        - fn/인자/반환값은 피클 가능해야 합니다.
+        - 제한 시간을 넘기면 그 작업을 실행 중인 자식만 종료하고 ValueError를 발생시킵니다.
+        - 풀이 깨지면(다른 작업의 시간 초과로 함께 종료된 경우 포함) 현재 풀일 때만
+          재생성하고 새 풀에서 한 번 재시도합니다. 재시도도 실패하면 ValueError입니다.
+
+    Args:
+        fn: 모듈 최상위 함수.
+        *args: 위치 인자.
+        timeout_sec: 제한 시간(초). 기본값은 설정값.
+        **kwargs: 키워드 인자.
+
+    Returns:
+        T: fn 반환값.
+
+    Raises:
+        ValueError: 시간 초과 또는 자식 프로세스 비정상 종료(메모리 한도 초과 등).
+    """
+    timeout = settings.parse_timeout_sec if timeout_sec is None else timeout_sec
+    loop = asyncio.get_running_loop()
+    retried = False
+    while True:
+        pool = get_parse_pool()
+        token = uuid4().hex
+        try:
+            future = loop.run_in_executor(
+                pool, functools.partial(_run_task, token, fn, args, kwargs)
+            )
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError as e:
+            logger.warning("parse pool task timed out after %ss", timeout)
+            if _kill_task(pool, token):
+                _reset_pool(pool)
+            raise ValueError(f"문서 파싱 시간이 {timeout:g}초를 초과했습니다.") from e
+        except BrokenProcessPool as e:
+            # 다른 작업의 시간 초과/비정상 종료로 함께 깨진 경우 새 풀에서 한 번 재시도
+            _reset_pool(pool)
+            if retried:
+                raise ValueError("문서 파싱 프로세스가 비정상 종료되었습니다.") from e
+            logger.warning("parse pool broken; retrying task on a new pool")
+            retried = True
+        except MemoryError as e:
+            raise ValueError("문서 파싱 중 메모리 한도를 초과했습니다.") from e
+        finally:
+            _task_pid(token)
+
+
+async def stream_from_parse_pool(
+    fn: Callable[..., Any],
+    *args: Any,
+    maxsize: int,
+    idle_timeout_sec: float | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Summary: 프로세스 풀 작업이 emit으로 내보내는 값을 bounded 채널로 받아 차례로 내줍니다.
+
+    Contract:
+        - fn은 emit 키워드 인자(값 하나를 보내는 함수)를 받는 모듈 최상위 함수입니다.
+          반환값은 쓰지 않습니다.
+        - 채널은 maxsize개까지만 쌓이므로 소비자가 느리면 자식이 대기합니다(backpressure).
+        - 제한 시간은 전체가 아니라 다음 값을 기다리는 시간입니다. 소비자가 가져가지 않아
+          자식이 대기하는 시간은 포함하지 않습니다.
+        - 제한 시간 초과/조기 종료(소비 중단, 취소) 시 그 작업의 자식만 종료합니다.
+        - 풀이 깨지면 run_in_parse_pool처럼 새 풀에서 한 번 재시도하고, 이미 내준 값은
+          다시 내주지 않습니다.
+
+    Args:
+        fn: 모듈 최상위 함수.
+        *args: 위치 인자.
+        maxsize: 채널에 쌓일 수 있는 최대 값 수.
+        idle_timeout_sec: 값 사이 제한 시간(초). 기본값은 parse_timeout_sec.
+        **kwargs: 키워드 인자.
+
+    Returns:
+        AsyncIterator[Any]: emit된 값 이터레이터.
+
+    Raises:
+        ValueError: 제한 시간 초과 또는 자식 프로세스 비정상 종료(메모리 한도 초과 등).
+        Exception: fn에서 발생한 예외.
+    """
+    timeout = (
+        settings.parse_timeout_sec if idle_timeout_sec is None else idle_timeout_sec
+    )
+    loop = asyncio.get_running_loop()
+    manager = await asyncio.to_thread(_get_manager)
+    received = 0
+    retried = False
+    while True:
+        pool = get_parse_pool()
+        token = uuid4().hex
+        channel = await asyncio.to_thread(manager.Queue, max(1, maxsize))
+        future = loop.run_in_executor(
+            pool,
+            functools.partial(_run_stream_task, token, fn, channel, args, kwargs),
+        )
+        finished = False
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                try:
+                    seq, item = await asyncio.to_thread(
+                        channel.get, True, STREAM_CHECK_SEC
+                    )
+                except queue.Empty:
+                    if future.done():
+                        # 종료 표시 없이 끝남(자식 비정상 종료 등)
+                        finished = True
+                        await future
+                        return
+                    _drain_started()
+                    if token not in _task_pids:
+                        # 아직 풀 대기열에 있는 작업은 제한 시간을 세지 않습니다.
+                        deadline = loop.time() + timeout
+                    if loop.time() < deadline:
+                        continue
+                    logger.warning("parse stream idle for %ss", timeout)
+                    if _kill_task(pool, token):
+                        _reset_pool(pool)
+                    finished = True
+                    raise ValueError(
+                        f"문서 파싱이 {timeout:g}초 동안 진행되지 않았습니다."
+                    )
+                deadline = loop.time() + timeout
+                if seq is None:
+                    finished = True
+                    await future
+                    return
+                if seq < received:
+                    continue
+                received += 1
+                yield item
+        except BrokenProcessPool as e:
+            _reset_pool(pool)
+            if retried:
+                raise ValueError("문서 파싱 프로세스가 비정상 종료되었습니다.") from e
+            logger.warning("parse pool broken; retrying stream on a new pool")
+            retried = True
+        except MemoryError as e:
+            raise ValueError("문서 파싱 중 메모리 한도를 초과했습니다.") from e
+        finally:
+            if not finished and not future.done():
+                # 소비 중단/취소: 대기열 작업은 취소하고, 채널이 가득 차 대기 중일
+                # 자식은 종료합니다.
+                future.cancel()
+                if _kill_task(pool, token):
+                    _reset_pool(pool)
+            _task_pid(token)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+import unicodedata
+from array import array
+from typing import Any, Protocol
+
+from langchain_core.embeddings import Embeddings
+
+from app.core import settings
+from app.utils.cache import LRUCache
+
+# key: (embedding_spec_id, 정규화된 질의)
+QueryKey = tuple[int, str]
+
+
+def _vector_bytes(vec: array) -> int:
+    return vec.itemsize * len(vec) + 64
+
+
+def _pack(vector: list[float]) -> array:
+    # float64로 보관해 캐시 적중 결과가 제공자 응답(미스)과 비트 단위로 같게 합니다.
+    return array("d", vector)
+
+
+query_embedding_cache: LRUCache[QueryKey, array] = LRUCache(
+    "query_embeddings",
+    maxsize=settings.query_embedding_cache_size,
+    ttl=settings.query_embedding_cache_ttl_sec,
+    max_bytes=settings.query_embedding_cache_max_bytes,
+    sizeof=_vector_bytes,
+)
+
+# collection_id → {"hits", "misses"} (프로세스 누적)
+_COLLECTION_COUNTERS: dict[str, dict[str, int]] = {}
+
+
+class SharedQueryStore(Protocol):
+    async def get_query(self, spec_id: int, query: str) -> list[float] | None: ...
+
+    async def put_query(
+        self, spec_id: int, query: str, vector: list[float]
+    ) -> None: ...
+
+
+def normalize_query(text: str) -> str:
+    """
+    Why: 공백/유니코드 표현만 다른 동일 질의가 같은 캐시 키를 갖도록 합니다.
+
+    Args:
+        text: 검색 질의.
+
+    Returns:
+        str: NFC 정규화 후 공백을 하나로 합친 문자열.
+    """
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def _record(collection_id: Any, hit: bool) -> None:
+    counters = _COLLECTION_COUNTERS.setdefault(
+        str(collection_id), {"hits": 0, "misses": 0}
+    )
+    counters["hits" if hit else "misses"] += 1
+
+
+def query_embedding_stats() -> list[dict[str, Any]]:
+    """
+    Summary: 컬렉션별 질의 임베딩 캐시 적중 지표를 반환합니다.
+
+    Returns:
+        list[dict[str, Any]]: collection_id/hits/misses/hit_rate 목록.
+    """
+    out = []
+    for cid in sorted(_COLLECTION_COUNTERS):
+        c = _COLLECTION_COUNTERS[cid]
+        total = c["hits"] + c["misses"]
+        out.append(
+            {
+                "collection_id": cid,
+                "hits": c["hits"],
+                "misses": c["misses"],
+                "hit_rate": (c["hits"] / total) if total else 0.0,
+            }
+        )
+    return out
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Summary: 질의 임베딩만 캐시하는 임베딩 클라이언트 래퍼입니다.
+
+    Contract:
+        - 문서 임베딩은 원본 클라이언트에 그대로 위임합니다.
+        - 질의 임베딩은 프로세스 LRU → (옵션) 공유 저장소 → 제공자 순으로 찾습니다.
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        *,
+        spec_id: int,
+        collection_id: Any,
+        shared: SharedQueryStore | None = None,
+    ) -> None:
+        """
+        Args:
+            base: 원본 임베딩 클라이언트.
+            spec_id: 컬렉션 임베딩 스펙 ID(캐시 키).
+            collection_id: 지표 집계용 컬렉션 ID.
+            shared: 프로세스 간 공유 저장소(옵션).
+        """
+        self.base = base
+        self.spec_id = spec_id
+        self.collection_id = collection_id
+        self.shared = shared
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.base.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.base.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = (self.spec_id, normalize_query(text))
+        cached = query_embedding_cache.get(key)
+        _record(self.collection_id, cached is not None)
+        if cached is not None:
+            return cached.tolist()
+        vector = self.base.embed_query(text)
+        query_embedding_cache.put(key, _pack(vector))
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = (self.spec_id, normalize_query(text))
+        cached = query_embedding_cache.get(key)
+        if cached is not None:
+            _record(self.collection_id, True)
+            return cached.tolist()
+
+        vector = None
+        if self.shared is not None:
+            vector = await self.shared.get_query(*key)
+        _record(self.collection_id, vector is not None)
+        if vector is None:
+            vector = await self.base.aembed_query(text)
+            if self.shared is not None:
+                await self.shared.put_query(*key, vector)
+        query_embedding_cache.put(key, _pack(vector))
+        return vector
+
+    async def aembed_queries(self, texts: list[str]) -> list[list[float]]:
+        """
+        Summary: 여러 질의를 캐시 조회 후 미스만 질의 임베딩 API로 동시에 임베딩합니다.
+
+        Contract:
+            - 반환 순서는 입력 순서와 같고, 정규화 결과가 같은 질의는 한 번만 임베딩합니다.
+            - 미스도 aembed_query로 임베딩해 aembed_query와 같은 키에 같은 벡터를 캐시합니다
+              (문서 임베딩은 제공자/모델에 따라 질의 임베딩과 다를 수 있음).
+            - 동시 호출 수는 embedding_concurrency로 제한합니다(제공자 한도는 래퍼가 적용).
+
+        Args:
+            texts: 검색 질의 목록.
+
+        Returns:
+            list[list[float]]: 질의별 벡터 목록.
+
+        Side Effects:
+            - 외부 임베딩 API 호출(캐시 미스 시)
+            - 공유 저장소 조회/저장(옵션)
+        """
+        keys = [(self.spec_id, normalize_query(t)) for t in texts]
+        found: dict[QueryKey, list[float]] = {}
+        pending: dict[QueryKey, str] = {}
+        for key, text in zip(keys, texts):
+            if key in found or key in pending:
+                continue
+            cached = query_embedding_cache.get(key)
+            if cached is not None:
+                _record(self.collection_id, True)
+                found[key] = cached.tolist()
+                continue
+            vector = None
+            if self.shared is not None:
+                vector = await self.shared.get_query(*key)
+            _record(self.collection_id, vector is not None)
+            if vector is None:
+                pending[key] = text
+            else:
+                found[key] = vector
+                query_embedding_cache.put(key, _pack(vector))
+
+        if pending:
+            semaphore = asyncio.Semaphore(max(1, settings.embedding_concurrency))
+
+            async def embed(text: str) -> list[float]:
+                async with semaphore:
+                    return await self.base.aembed_query(text)
+
+            vectors = await asyncio.gather(*(embed(t) for t in pending.values()))
+            for key, vector in zip(pending, vectors):
+                vector = list(vector)
+                found[key] = vector
+                query_embedding_cache.put(key, _pack(vector))
+                if self.shared is not None:
+                    await self.shared.put_query(*key, vector)
+        return [found[key] for key in keys]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.core import settings
+from app.utils.cache import LRUCache
+from app.utils.query_embedding import normalize_query
+
+# key: (collection_id, write_version, 정규화 질의, search_type, 필터 JSON, limit, 가중치)
+SearchKey = tuple[str, int, str, str, str, int, tuple[float | None, float | None]]
+
+
+def _results_bytes(results: list[dict[str, Any]]) -> int:
+    size = 64
+    for item in results:
+        size += 200 + len((item.get("page_content") or "").encode("utf-8"))
+        size += len(
+            json.dumps(item.get("metadata") or {}, ensure_ascii=False, default=str)
+        )
+    return size
+
+
+search_result_cache: LRUCache[SearchKey, list[dict[str, Any]]] = LRUCache(
+    "search_results",
+    maxsize=settings.search_result_cache_size,
+    max_bytes=settings.search_result_cache_max_bytes,
+    sizeof=_results_bytes,
+)
+
+
+def search_cache_key(
+    collection,
+    query: str,
+    *,
+    search_type: str,
+    filter: dict[str, Any] | None,
+    limit: int,
+    semantic_weight: float | None = None,
+    keyword_weight: float | None = None,
+) -> SearchKey:
+    """
+    Summary: 검색 결과 캐시 키를 만듭니다.
+
+    Contract:
+        - 컬렉션 write_version이 키에 포함되어 청크 쓰기 후에는 이전 항목이 조회되지 않습니다
+          (TTL 없이 무효화).
+        - 공백/유니코드 표현만 다른 질의와 키 순서만 다른 필터는 같은 키가 됩니다.
+
+    Args:
+        collection: 컬렉션 엔티티(id, write_version).
+        query: 검색어.
+        search_type: 검색 방식.
+        filter: 메타데이터 필터.
+        limit: 반환 개수.
+        semantic_weight: hybrid 벡터 신호 가중치.
+        keyword_weight: hybrid 전문 검색 신호 가중치.
+
+    Returns:
+        SearchKey: 캐시 키.
+    """
+    return (
+        str(collection.id),
+        int(collection.write_version or 0),
+        normalize_query(query),
+        search_type,
+        json.dumps(filter or {}, sort_keys=True, ensure_ascii=False, default=str),
+        limit,
+        (semantic_weight, keyword_weight) if search_type == "hybrid" else (None, None),
+    )
+
+
+def invalidate_search_results(collection_id: Any) -> int:
+    """
+    Why: 삭제된 컬렉션의 항목이 용량을 차지하지 않도록 즉시 제거합니다.
+
+    Returns:
+        int: 제거된 항목 수.
+    """
+    cid = str(collection_id)
+    return search_result_cache.invalidate(lambda key: key[0] == cid)
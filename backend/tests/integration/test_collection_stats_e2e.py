@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.db import async_session, bulk_insert_chunks, get_hybrid_config, vector_type
+from app.models import Collection
+from .conftest import async_client, auth_header, login
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stores_of_same_file_count_one_document(async_client):
+    admin_token = await login(async_client, "admin", "data123!")
+    headers = auth_header(admin_token)
+
+    keys = await async_client.get("/api/v1/api-keys", headers=headers)
+    keys.raise_for_status()
+    embedding_key = next(
+        (k for k in keys.json() if k.get("purpose_code") == "embedding"),
+        None,
+    )
+    assert embedding_key is not None
+
+    resp = await async_client.post(
+        "/api/v1/collections/",
+        headers=headers,
+        json={
+            "name": "집계 동시성 테스트",
+            "description": "통합 테스트",
+            "is_public": False,
+            "model_api_key_id": embedding_key["id"],
+        },
+    )
+    resp.raise_for_status()
+    collection_id = resp.json()["collection_id"]
+
+    async with async_session() as session:
+        collection = (
+            await session.execute(
+                select(Collection)
+                .where(Collection.id == UUID(collection_id))
+                .options(selectinload(Collection.embedding))
+            )
+        ).scalar_one()
+    hybrid = get_hybrid_config(collection.table_name)
+    dimension = collection.embedding.dimension
+
+    async def store(file_id: str, index: int) -> None:
+        await bulk_insert_chunks(
+            collection.table_name,
+            [f"chunk {index}"],
+            [[0.1] * dimension],
+            [{"file_id": file_id, "chunk_index": index, "source": "a.txt"}],
+            [str(uuid4())],
+            tsv_column=hybrid.tsv_column,
+            tsv_lang=hybrid.tsv_lang,
+            vector_type=vector_type(collection),
+            collection_id=collection.id,
+        )
+
+    # 같은 파일의 두 배치를 동시에 커밋(ingest_store_concurrency=2와 같은 상황)
+    file_ids = [str(uuid4()) for _ in range(5)]
+    await asyncio.gather(*(store(f, i) for f in file_ids for i in range(2)))
+
+    read = await async_client.get(
+        f"/api/v1/collections/{collection_id}", headers=headers
+    )
+    read.raise_for_status()
+    assert read.json()["document_count"] == len(file_ids)
+    assert read.json()["chunk_count"] == 2 * len(file_ids)
+
+    listing = await async_client.get(
+        f"/api/v1/collections/{collection_id}/documents",
+        headers=headers,
+        params={"limit": 10},
+    )
+    listing.raise_for_status()
+    assert {item["chunk_count"] for item in listing.json()["items"]} == {2}
+
+    cleanup = await async_client.delete(
+        f"/api/v1/collections/{collection_id}",
+        headers=headers,
+    )
+    assert cleanup.status_code == 204
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from app.utils import agent_cache as agent_cache_module
+from app.utils.agent_cache import agent_cache, get_or_build_agent, invalidate_agents
+from app.utils.cache import LRUCache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    agent_cache.clear()
+    yield
+    agent_cache.clear()
+
+
+def _make_key(key_id: int = 1, updated_at: datetime | None = None) -> SimpleNamespace:
+    return SimpleNamespace(id=key_id, model="gpt", updated_at=updated_at)
+
+
+def _make_tool(name: str, schema: dict) -> StructuredTool:
+    async def _run(**kwargs):
+        return "ok"
+
+    return StructuredTool(
+        name=name, description=name, args_schema=schema, coroutine=_run
+    )
+
+
+def test_lru_cache_evicts_and_counts():
+    cache: LRUCache[str, int] = LRUCache("test-lru", maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_get_or_build_agent_reuses_compiled_graph(monkeypatch: pytest.MonkeyPatch):
+    built: list[int] = []
+
+    def fake_create(model, tools):
+        built.append(1)
+        return object()
+
+    monkeypatch.setattr(agent_cache_module, "get_chat_model", lambda *a, **k: None)
+    monkeypatch.setattr(agent_cache_module, "create_react_agent", fake_create)
+    servers = [SimpleNamespace(id=3), SimpleNamespace(id=1)]
+    tools = [_make_tool("t", {"type": "object", "properties": {}})]
+    hits, misses = agent_cache.hits, agent_cache.misses
+
+    a1 = get_or_build_agent(_make_key(), {"temperature": 0}, servers, tools)
+    a2 = get_or_build_agent(_make_key(), {"temperature": 0}, servers[::-1], tools)
+
+    assert a1 is a2
+    assert len(built) == 1
+    assert (agent_cache.hits - hits, agent_cache.misses - misses) == (1, 1)
+    assert len(agent_cache) == 1
+
+
+def test_agent_key_changes_with_key_version_and_tool_schema(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(agent_cache_module, "get_chat_model", lambda *a, **k: None)
+    monkeypatch.setattr(
+        agent_cache_module, "create_react_agent", lambda model, tools: object()
+    )
+    tools_v1 = [_make_tool("t", {"type": "object", "properties": {}})]
+    tools_v2 = [
+        _make_tool("t", {"type": "object", "properties": {"q": {"type": "string"}}})
+    ]
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    t1 = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+    a = get_or_build_agent(_make_key(updated_at=t0), None, [], tools_v1)
+    b = get_or_build_agent(_make_key(updated_at=t1), None, [], tools_v1)
+    c = get_or_build_agent(_make_key(updated_at=t1), None, [], tools_v2)
+
+    assert a is not b
+    assert b is not c
+
+
+def test_invalidate_agents_by_model_key_and_server(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(agent_cache_module, "get_chat_model", lambda *a, **k: None)
+    monkeypatch.setattr(
+        agent_cache_module, "create_react_agent", lambda model, tools: object()
+    )
+    get_or_build_agent(_make_key(1), None, [SimpleNamespace(id=5)], [])
+    get_or_build_agent(_make_key(2), None, [SimpleNamespace(id=6)], [])
+
+    assert invalidate_agents(mcp_server_id=5) == 1
+    assert invalidate_agents(model_key_id=2) == 1
+    assert len(agent_cache) == 0
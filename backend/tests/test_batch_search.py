@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import batch, search_sql
+from app.db.search_plan import PlannedQueryOptions
+
+
+def _collection(vector_type: str = "vector"):
+    return SimpleNamespace(
+        table_name="collection_t",
+        embedding=SimpleNamespace(dimension=3, distance="cosine"),
+        vector_index="hnsw",
+        vector_index_params=None,
+        vector_type=vector_type,
+    )
+
+
+def _row(idx: int, chunk_id: str, distance: float) -> dict:
+    return {
+        "idx": idx,
+        "langchain_id": chunk_id,
+        "content": chunk_id,
+        "file_id": None,
+        "chunk_index": None,
+        "source": None,
+        "langchain_metadata": {},
+        "distance": distance,
+    }
+
+
+def test_batch_sql_runs_one_lateral_lookup_per_query_vector():
+    sql = batch.batch_search_sql(_collection("halfvec"), "TRUE")
+
+    assert "unnest(CAST(:qs AS text[])) WITH ORDINALITY" in sql
+    assert "CAST(u.vec AS halfvec)" in sql
+    assert "CROSS JOIN LATERAL" in sql
+    assert "ORDER BY embedding <=> q.vec" in sql
+    assert "ORDER BY q.idx, r.distance" in sql
+
+
+@pytest.mark.asyncio
+async def test_batch_search_groups_rows_by_query(monkeypatch: pytest.MonkeyPatch):
+    calls: list = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append((query, params))
+        if "set_config" in query:
+            return [{"set_config": params["value"]}]
+        return [_row(1, "a", 0.1), _row(1, "b", 0.2), _row(3, "c", 0.3)]
+
+    monkeypatch.setattr(batch, "raw_sql", fake_raw_sql)
+    monkeypatch.setattr(search_sql, "raw_sql", fake_raw_sql)
+
+    results = await batch.batch_search(
+        None,
+        _collection(),
+        [[0.1, 0.2, 0.3], "[1,0,0]", [0.0, 1.0, 0.0]],
+        k=2,
+        query_options=PlannedQueryOptions(("hnsw.ef_search = 40",)),
+    )
+
+    assert calls[0][1] == {"name": "hnsw.ef_search", "value": "40"}
+    params = calls[1][1]
+    assert params["k"] == 2
+    assert params["qs"] == ["[0.1,0.2,0.3]", "[1,0,0]", "[0.0,1.0,0.0]"]
+    assert [[r["id"] for r in found] for found in results] == [["a", "b"], [], ["c"]]
+    assert results[0][1]["score"] == 0.2
+
+
+@pytest.mark.asyncio
+async def test_batch_search_skips_operator_filters():
+    result = await batch.batch_search(
+        None, _collection(), [[0.1, 0.2, 0.3]], k=5, filter={"source": {"$in": ["a"]}}
+    )
+
+    assert result is None
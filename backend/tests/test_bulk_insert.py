@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+from uuid import UUID
+
+import pytest
+
+from app.db import bulk
+
+
+class FakeConnection:
+    def __init__(self, deltas: list[tuple] | None = None) -> None:
+        self.calls: list[tuple] = []
+        self.deltas = deltas or []
+
+    def transaction(self):
+        conn = self
+
+        class _Tx:
+            async def __aenter__(self):
+                conn.calls.append(("begin",))
+
+            async def __aexit__(self, *exc):
+                conn.calls.append(("commit" if exc[0] is None else "rollback",))
+                return False
+
+        return _Tx()
+
+    async def execute(self, sql: str, *args):
+        self.calls.append(("execute", " ".join(sql.split()), *args))
+
+    async def fetch(self, sql: str, *args):
+        self.calls.append(("fetch", " ".join(sql.split()), *args))
+        return self.deltas
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        self.calls.append(("copy", table, list(records), tuple(columns)))
+
+
+class FakePool:
+    def __init__(self, conn: FakeConnection) -> None:
+        self.conn = conn
+
+    def acquire(self):
+        conn = self.conn
+
+        class _Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+@pytest.fixture
+def conn(monkeypatch) -> FakeConnection:
+    conn = FakeConnection()
+
+    async def get_pool():
+        return FakePool(conn)
+
+    monkeypatch.setattr(bulk, "get_bulk_pool", get_pool)
+    return conn
+
+
+def test_chunk_records_split_metadata_columns():
+    [record] = bulk.chunk_records(
+        ["00000000-0000-0000-0000-000000000001"],
+        ["hello"],
+        [[0.1, 0.2]],
+        [{"file_id": "f", "chunk_index": "3", "source": "a.txt", "tag": "x"}],
+    )
+
+    assert record[0] == UUID(int=1)
+    assert record[2] == [0.1, 0.2]
+    assert record[3:6] == ("f", 3, "a.txt")
+    assert json.loads(record[6]) == {"tag": "x"}
+
+
+@pytest.mark.asyncio
+async def test_staging_load_is_one_transaction(conn: FakeConnection):
+    ids = await bulk.bulk_insert_chunks(
+        "collection_x", ["a", "b"], [[0.0], [1.0]], [{}, {}], [None, None]
+    )
+
+    assert len(ids) == 2
+    kinds = [c[0] for c in conn.calls]
+    assert kinds == ["begin", "execute", "copy", "execute", "commit"]
+    assert "CREATE TEMP TABLE" in conn.calls[1][1]
+    assert conn.calls[2][1].startswith("_bulk_")
+    insert = conn.calls[3][1]
+    assert 'INSERT INTO "collection_x"' in insert
+    assert "to_tsvector('simple', content)" in insert
+    assert 'ON CONFLICT ("langchain_id")' in insert
+
+
+@pytest.mark.asyncio
+async def test_direct_copy_requires_no_tsv_column(conn: FakeConnection):
+    with pytest.raises(ValueError):
+        await bulk.bulk_insert_chunks("t", ["a"], [[0.0]], staging=False)
+
+    await bulk.bulk_insert_chunks("t", ["a"], [[0.0]], tsv_column=None, staging=False)
+    assert [c[0] for c in conn.calls] == ["begin", "copy", "commit"]
+    assert conn.calls[1][1] == "t"
+
+
+@pytest.mark.asyncio
+async def test_halfvec_staging_table_matches_target_type(conn: FakeConnection):
+    await bulk.bulk_insert_chunks("t", ["a"], [[0.0]], vector_type="halfvec")
+
+    assert "embedding halfvec" in conn.calls[1][1]
+    with pytest.raises(ValueError):
+        await bulk.bulk_insert_chunks("t", ["a"], [[0.0]], vector_type="bit")
+
+
+@pytest.mark.asyncio
+async def test_collection_stats_are_updated_after_the_load_commits(
+    conn: FakeConnection,
+):
+    conn.deltas = [("f1", "a.txt", 1, 3), (None, None, 0, -2)]
+    await bulk.bulk_insert_chunks(
+        "t", ["a"], [[0.0]], collection_id="00000000-0000-0000-0000-000000000007"
+    )
+
+    kinds = [c[0] for c in conn.calls]
+    # 카운터 행 갱신은 COPY 트랜잭션 밖의 짧은 단독 문장
+    assert kinds == [
+        "begin",
+        "execute",
+        "copy",
+        "fetch",
+        "execute",
+        "commit",
+        "execute",
+    ]
+    delta, insert, stats = conn.calls[3], conn.calls[4], conn.calls[6]
+    assert 'LEFT JOIN "t" AS t ON t.langchain_id = s.langchain_id' in delta[1]
+    assert insert[1].startswith('INSERT INTO "t"')
+    assert "write_version = c.write_version + 1" in stats[1]
+    assert stats[2:] == (UUID(int=7), 1, 1, ["f1"], ["a.txt"], [1], [3])
+
+
+@pytest.mark.asyncio
+async def test_direct_copy_counts_new_chunks_bytes_and_files(conn: FakeConnection):
+    await bulk.bulk_insert_chunks(
+        "t",
+        ["가", "ab"],
+        [[0.0], [1.0]],
+        [{"file_id": "f1", "source": "a.txt"}, {"file_id": "f1", "source": "a.txt"}],
+        tsv_column=None,
+        staging=False,
+        collection_id=UUID(int=7),
+    )
+
+    assert [c[0] for c in conn.calls] == ["begin", "copy", "commit", "execute"]
+    _, sql, collection_id, chunks, size, file_ids, sources, counts, sizes = conn.calls[
+        3
+    ]
+    assert "unnest($4::text[], $5::text[], $6::bigint[], $7::bigint[])" in sql
+    assert "INSERT INTO collection_files" in sql
+    assert (collection_id, chunks, size, file_ids) == (UUID(int=7), 2, 5, ["f1"])
+    assert (sources, counts, sizes) == (["a.txt"], [2], [5])
+
+
+@pytest.mark.asyncio
+async def test_row_insert_path_applies_incremental_stats(conn: FakeConnection):
+    await bulk.record_inserted_chunks(
+        UUID(int=7),
+        ["가", "ab", "c"],
+        [{"file_id": "f1", "source": "a.txt"}, {"file_id": "f1"}, None],
+    )
+
+    [(kind, sql, *args)] = conn.calls
+    assert kind == "execute"
+    assert "INSERT INTO collection_files" in sql
+    # 컬렉션 테이블 전체 재집계 없이 증분만 반영
+    assert "COUNT(DISTINCT file_id)" not in sql
+    assert args == [UUID(int=7), 3, 6, ["f1"], ["a.txt"], [2], [5]]
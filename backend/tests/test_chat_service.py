@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langgraph.prebuilt import create_react_agent
+
+from app.services.chat import ChatService
+from app.utils import MCPLoadResult
+from app.utils.agent_cache import agent_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_agent_cache():
+    agent_cache.clear()
+    yield
+    agent_cache.clear()
+
+
+def _make_session() -> MagicMock:
+    session = MagicMock()
+    session.add = MagicMock()
+    session.flush = AsyncMock()
+    return session
+
+
+class ScriptedAgent:
+    """astream_events만 지원하는 가짜 에이전트(astream 호출 시 실패)."""
+
+    def __init__(self, events: list[dict]) -> None:
+        self.events = events
+        self.calls = 0
+
+    async def astream_events(self, inputs, *, config=None, version=None):
+        self.calls += 1
+        for ev in self.events:
+            yield ev
+
+    async def astream(self, *args, **kwargs):  # pragma: no cover - 호출되면 안 됨
+        raise AssertionError("graph must not be executed twice")
+        yield
+
+
+@pytest.mark.asyncio
+async def test_run_agent_single_pass_splits_events():
+    root = "root-run"
+    agent = ScriptedAgent(
+        [
+            {
+                "event": "on_chat_model_stream",
+                "name": "model",
+                "run_id": "m1",
+                "parent_ids": [root],
+                "data": {"chunk": AIMessageChunk(content="안녕")},
+            },
+            {
+                "event": "on_tool_start",
+                "name": "search",
+                "run_id": "t1",
+                "parent_ids": [root],
+                "data": {"input": {"q": "x"}},
+            },
+            {
+                "event": "on_tool_end",
+                "name": "search",
+                "run_id": "t1",
+                "parent_ids": [root],
+                "data": {"output": "result"},
+            },
+            {
+                "event": "on_chain_stream",
+                "name": "LangGraph",
+                "run_id": root,
+                "parent_ids": [],
+                "data": {"chunk": {"tools": {"messages": []}}},
+            },
+            {
+                "event": "on_chain_end",
+                "name": "LangGraph",
+                "run_id": root,
+                "parent_ids": [],
+                "data": {"output": {"messages": [AIMessage(content="안녕")]}},
+            },
+        ]
+    )
+    service = ChatService(_make_session())
+
+    events = [
+        ev
+        async for ev in service._run_agent(
+            agent, [HumanMessage(content="hi")], {}, conv_id=1, tool_role_id=3
+        )
+    ]
+
+    assert agent.calls == 1
+    assert [k for k, _ in events] == [
+        "token",
+        "tool_start",
+        "tool_end",
+        "update",
+        "final",
+    ]
+    assert events[0][1] == {"text": "안녕"}
+    assert events[1][1]["tool_call_id"] == "t1"
+    assert events[1][1]["args"] == {"q": "x"}
+    assert events[2][1]["ok"] is True
+    assert events[2][1]["output"] == "result"
+    assert service.session.add.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_agent_with_real_graph_streams_tokens_once():
+    model = GenericFakeChatModel(messages=iter([AIMessage(content="hello world")]))
+    agent = create_react_agent(model, [])
+    service = ChatService(_make_session())
+
+    tokens: list[str] = []
+    final = None
+    async for kind, payload in service._run_agent(
+        agent, [HumanMessage(content="hi")], {}, conv_id=1, tool_role_id=3
+    ):
+        if kind == "token":
+            tokens.append(payload["text"])
+        elif kind == "final":
+            final = payload["output"]
+
+    assert "".join(tokens) == "hello world"
+    assert final["messages"][-1].content == "hello world"
+
+
+@pytest.mark.asyncio
+async def test_chat_invoke_uses_shared_engine(monkeypatch: pytest.MonkeyPatch):
+    service = ChatService(_make_session())
+    conv = SimpleNamespace(id=7, mcp_servers=[], default_model_key_id=1)
+    model_key = SimpleNamespace(
+        id=1, model="gpt", provider_id=2, provider=SimpleNamespace(code="openai")
+    )
+    monkeypatch.setattr(service, "_get_conversation", AsyncMock(return_value=conv))
+    monkeypatch.setattr(service, "_get_model_key", AsyncMock(return_value=model_key))
+    monkeypatch.setattr(service, "_role_id", AsyncMock(return_value=1))
+    monkeypatch.setattr(service, "get_histories", AsyncMock(return_value=[]))
+    monkeypatch.setattr(
+        "app.services.chat.load_mcp_tools_isolated",
+        AsyncMock(return_value=MCPLoadResult(tools=[], servers=[], warnings=[])),
+    )
+    monkeypatch.setattr(
+        "app.utils.agent_cache.get_chat_model",
+        lambda *a, **k: GenericFakeChatModel(
+            messages=iter([AIMessage(content="답변")])
+        ),
+    )
+
+    conv_id, _, content = await service.chat_invoke(
+        user_id=1,
+        conversation_id=7,
+        message="질문",
+        model_key_id=None,
+        params=None,
+        system_prompt=None,
+        mcp_server_ids=None,
+    )
+
+    assert conv_id == 7
+    assert content == "답변"
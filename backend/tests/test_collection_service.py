@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.collection import CollectionService, run_index_build
+
+
+def _building(age_sec: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        table_name="collection_t",
+        index_status="building",
+        index_error=None,
+        index_updated_at=datetime.now(timezone.utc) - timedelta(seconds=age_sec),
+        vector_index="hnsw",
+    )
+
+
+def _service(monkeypatch, collection, *, in_progress: bool) -> CollectionService:
+    session = MagicMock()
+    session.commit = AsyncMock()
+    service = CollectionService(session)
+    monkeypatch.setattr(service, "_get_writable", AsyncMock(return_value=collection))
+    monkeypatch.setattr(
+        "app.services.collection.index_build_in_progress",
+        AsyncMock(return_value=in_progress),
+    )
+    monkeypatch.setattr("app.services.collection.settings.index_build_stale_sec", 600)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_recent_build_returns_409(monkeypatch):
+    collection = _building(age_sec=10)
+    service = _service(monkeypatch, collection, in_progress=False)
+
+    with pytest.raises(HTTPException) as exc:
+        await service.start_index_build(collection.id, SimpleNamespace(id=1))
+
+    assert exc.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_stale_build_with_running_create_index_returns_409(monkeypatch):
+    collection = _building(age_sec=3600)
+    service = _service(monkeypatch, collection, in_progress=True)
+
+    with pytest.raises(HTTPException) as exc:
+        await service.start_index_build(collection.id, SimpleNamespace(id=1))
+
+    assert exc.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_abandoned_build_can_be_rescheduled(monkeypatch):
+    collection = _building(age_sec=3600)
+    before = collection.index_updated_at
+    service = _service(monkeypatch, collection, in_progress=False)
+
+    result = await service.start_index_build(collection.id, SimpleNamespace(id=1))
+
+    assert result.status == "building"
+    assert collection.index_updated_at > before
+    service.db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_empty_ivfflat_build_stays_deferred(monkeypatch):
+    collection = _building(age_sec=0)
+    session = MagicMock()
+    session.get = AsyncMock(return_value=collection)
+    session.commit = AsyncMock()
+
+    class _Session:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr("app.services.collection.async_session", _Session)
+    monkeypatch.setattr(
+        "app.services.collection.build_secondary_indexes",
+        AsyncMock(return_value=False),
+    )
+
+    await run_index_build(collection.id, rebuild_vector=True)
+
+    assert collection.index_status == "deferred"
+    assert collection.index_error is None
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_build_records_error(monkeypatch):
+    collection = _building(age_sec=0)
+    session = MagicMock()
+    session.get = AsyncMock(return_value=collection)
+    session.commit = AsyncMock()
+
+    class _Session:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr("app.services.collection.async_session", _Session)
+    monkeypatch.setattr(
+        "app.services.collection.build_secondary_indexes",
+        AsyncMock(side_effect=RuntimeError("lock timeout")),
+    )
+
+    await run_index_build(collection.id)
+
+    assert collection.index_status == "failed"
+    assert collection.index_error == "lock timeout"
+    session.commit.assert_awaited_once()
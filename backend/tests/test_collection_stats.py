@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.db import collection_stats
+from app.services import collection as collection_module
+from app.services.collection import CollectionService
+
+
+def _collection(n: int = 1, **counts):
+    return SimpleNamespace(
+        id=UUID(int=n),
+        table_name=f"collection_{n}",
+        name=f"c{n}",
+        description=None,
+        is_public=True,
+        owner_id=1,
+        document_count=counts.get("document_count", 2),
+        chunk_count=counts.get("chunk_count", 10),
+        content_bytes=counts.get("content_bytes", 1234),
+        index_status="ready",
+        vector_index="hnsw",
+        vector_index_params=None,
+        vector_type="vector",
+        embedding_id=1,
+        embedding=SimpleNamespace(dimension=3, model="m"),
+    )
+
+
+def test_delete_sql_counts_documents_from_pre_delete_snapshot():
+    sql = " ".join(
+        collection_stats.delete_chunks_sql("collection_1", "file_id = :id").split()
+    )
+
+    assert "DELETE FROM collection_1 WHERE file_id = :id RETURNING file_id" in sql
+    assert "WHERE p.n >= r.n" in sql
+    assert "document_count = GREATEST(c.document_count - stats.documents, 0)" in sql
+    assert "WHERE c.id = :collection_id AND stats.chunks > 0" in sql
+
+
+def test_insert_sql_counts_documents_from_registry_inserts():
+    sql = " ".join(collection_stats.direct_insert_stats_sql().split())
+
+    # 테이블 NOT EXISTS는 동시 트랜잭션의 미커밋 행을 못 봐 같은 파일을 두 번 셀 수 있음
+    assert "NOT EXISTS" not in sql
+    assert "RETURNING (xmax = 0) AS inserted" in sql
+    assert "(SELECT COUNT(*) FROM files WHERE inserted)" in sql
+
+
+@pytest.mark.asyncio
+async def test_refresh_recounts_and_reports_drift(monkeypatch: pytest.MonkeyPatch):
+    calls: list = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append((" ".join(query.split()), params))
+        if "to_regclass" in query:
+            return {"exists": True}
+        return {
+            "before_chunk_count": 9,
+            "before_document_count": 2,
+            "before_content_bytes": 100,
+            "chunk_count": 10,
+            "document_count": 2,
+            "content_bytes": 120,
+        }
+
+    monkeypatch.setattr(collection_stats, "raw_sql", fake_raw_sql)
+
+    stats = await collection_stats.refresh_collection_stats(
+        None, _collection(), bump_version=True
+    )
+
+    sql, params = calls[1]
+    assert "COUNT(DISTINCT file_id) AS documents" in sql
+    assert params == {"collection_id": UUID(int=1), "bump": True}
+    assert stats["chunk_count"] == 10 and stats["before_chunk_count"] == 9
+
+
+@pytest.mark.asyncio
+async def test_get_list_reads_materialized_counts(monkeypatch: pytest.MonkeyPatch):
+    class Result:
+        def scalars(self):
+            return self
+
+        def all(self):
+            return [_collection(1), _collection(2, chunk_count=0, document_count=0)]
+
+    class FakeDB:
+        async def scalar(self, stmt):
+            return 2
+
+        async def execute(self, stmt):
+            return Result()
+
+    async def fail_raw_sql(*args, **kwargs):
+        raise AssertionError("컬렉션 테이블을 스캔하면 안 됩니다.")
+
+    monkeypatch.setattr(collection_module, "raw_sql", fail_raw_sql)
+
+    page = await CollectionService(FakeDB()).get_list(
+        SimpleNamespace(id=1, role=SimpleNamespace(code="user"))
+    )
+
+    assert page.total_count == 2
+    assert [(i.chunk_count, i.document_count) for i in page.items] == [(10, 2), (0, 0)]
+    assert page.items[0].content_bytes == 1234
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from app.utils import document_process
+from app.utils.document_process import emit_chunk_batches, iter_parse_path
+
+
+def test_text_pages_split_on_line_boundaries(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("가나다\n" * 5 + "가" * 10, encoding="utf-8")
+
+    pages = list(document_process._iter_text_pages(str(path), page_bytes=16))
+
+    assert len(pages) > 1
+    assert "".join(p.page_content for p in pages) == path.read_text(encoding="utf-8")
+    assert all("�" not in p.page_content for p in pages)
+
+
+def test_text_pages_without_newlines_keep_utf8_characters(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("가" * 20, encoding="utf-8")
+
+    pages = list(document_process._iter_text_pages(str(path), page_bytes=16))
+
+    assert len(pages) > 1
+    assert "".join(p.page_content for p in pages) == "가" * 20
+
+
+def test_iter_parse_path_merges_metadata(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("# title\n\nbody", encoding="utf-8")
+
+    docs = list(iter_parse_path(str(path), "text/markdown", {"tag": "x"}))
+
+    assert docs[0].metadata["tag"] == "x"
+    assert "body" in docs[0].page_content
+
+
+def test_emit_chunk_batches_in_order(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("hello world\n" * 200, encoding="utf-8")
+    batches = []
+
+    count = emit_chunk_batches(
+        str(path),
+        "text/plain",
+        {"tag": "x"},
+        emit=batches.append,
+        file_id="f1",
+        filename="a.txt",
+        chunk_size=100,
+        chunk_overlap=0,
+        batch_size=7,
+    )
+
+    assert count == sum(len(b) for b in batches) > 7
+    assert all(len(b) <= 7 for b in batches)
+    indexes = [meta["chunk_index"] for b in batches for _, meta in b]
+    assert indexes == list(range(count))
+    text, meta = batches[0][0]
+    assert "hello world" in text
+    assert meta["source"] == "a.txt"
+    assert meta["tag"] == "x"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app.services.embedding_cache import EmbeddingCacheService, content_hash
+
+
+class RecordingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text))]
+
+
+def _session_with_cached(cached: dict[str, list[float]]) -> MagicMock:
+    session = MagicMock()
+    lookup = MagicMock()
+    lookup.all.return_value = list(cached.items())
+    session.execute = AsyncMock(return_value=lookup)
+    session.commit = AsyncMock()
+    return session
+
+
+def _writer() -> tuple[MagicMock, MagicMock]:
+    session = MagicMock(execute=AsyncMock(), commit=AsyncMock())
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory, session
+
+
+def test_content_hash_normalizes_whitespace_and_unicode():
+    composed = "\uac00"  # 가
+    decomposed = "\u1100\u1161"  # ㄱ + ㅏ
+
+    assert content_hash(f"  {composed}\n") == content_hash(decomposed)
+
+
+@pytest.mark.asyncio
+async def test_embed_documents_only_sends_misses():
+    cached = {content_hash("old"): [9.0]}
+    session = _session_with_cached(cached)
+    factory, writer = _writer()
+    embed = RecordingEmbeddings()
+
+    vectors = await EmbeddingCacheService(session, writer=factory).embed_documents(
+        1, embed, ["old", "new!", "new!"]
+    )
+
+    assert vectors == [[9.0], [4.0], [4.0]]
+    assert embed.batches == [["new!"]]
+    session.execute.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    writer.execute.assert_awaited_once()
+    writer.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embed_documents_all_hits_skips_provider():
+    cached = {content_hash("a"): [1.0]}
+    session = _session_with_cached(cached)
+    factory, _ = _writer()
+    embed = RecordingEmbeddings()
+
+    vectors = await EmbeddingCacheService(session, writer=factory).embed_documents(
+        1, embed, ["a"]
+    )
+
+    assert vectors == [[1.0]]
+    assert embed.batches == []
+    factory.assert_not_called()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app.utils import embedding_executor
+from app.utils.embedding_executor import (
+    ProviderLimiter,
+    RateLimitedEmbeddings,
+    TokenBucket,
+    embedding_throughput_stats,
+    token_batches,
+)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FlakyEmbeddings(Embeddings):
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def embed_documents(self, texts):
+        return [[float(len(t))] for t in texts]
+
+    def embed_query(self, text):
+        return [float(len(text))]
+
+    async def aembed_documents(self, texts):
+        if self.failures:
+            self.failures -= 1
+            raise RateLimitError("Too Many Requests")
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.batches.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch):
+    monkeypatch.setattr(embedding_executor.settings, "embedding_backoff_base_sec", 0.01)
+    monkeypatch.setattr(embedding_executor.settings, "embedding_backoff_max_sec", 0.02)
+
+
+def test_token_batches_respect_token_and_item_limits():
+    texts = ["a" * 30, "b" * 30, "c" * 30, "d", "e", "f"]
+
+    batches = list(token_batches(texts, max_tokens=25, max_items=2))
+
+    assert [(s, e) for s, e, _ in batches] == [(0, 2), (2, 4), (4, 6)]
+    assert all(t <= 25 for _, _, t in batches)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill(monkeypatch):
+    slept: list[float] = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+        bucket.tokens = bucket.capacity
+
+    monkeypatch.setattr(embedding_executor.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(60)
+
+    assert await bucket.acquire(60) == 0
+    assert await bucket.acquire(30) > 0
+    assert slept
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_and_keep_order():
+    base = FlakyEmbeddings()
+    embed = RateLimitedEmbeddings(
+        base,
+        provider_code="test-order",
+        limiter=ProviderLimiter(rpm=0, tpm=0),
+        concurrency=3,
+        max_batch_size=2,
+    )
+    texts = [str(i) * (i + 1) for i in range(7)]
+
+    vectors = await embed.aembed_documents(texts)
+
+    assert vectors == [[float(len(t))] for t in texts]
+    assert len(base.batches) == 4
+    assert base.peak > 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_retried_and_reported():
+    base = FlakyEmbeddings(failures=2)
+    limiter = ProviderLimiter(rpm=0, tpm=0)
+    embed = RateLimitedEmbeddings(
+        base, provider_code="test-429", limiter=limiter, max_retries=3
+    )
+
+    assert await embed.aembed_documents(["x"]) == [[1.0]]
+
+    stats = {s["provider"]: s for s in embedding_throughput_stats()}["test-429"]
+    assert stats["rate_limited"] == 2
+    assert stats["requests"] == 1
+    assert limiter.blocked_until > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_gives_up_after_max_retries():
+    embed = RateLimitedEmbeddings(
+        FlakyEmbeddings(failures=5),
+        provider_code="test-giveup",
+        limiter=ProviderLimiter(rpm=0, tpm=0),
+        max_retries=1,
+    )
+
+    with pytest.raises(RateLimitError):
+        await embed.aembed_documents(["x"])
+
+
+class ProviderError(Exception):
+    status_code = 500
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_detected_by_status_not_message():
+    class Failing(FlakyEmbeddings):
+        async def aembed_documents(self, texts):
+            self.batches.append(list(texts))
+            raise ProviderError("upstream 500 (request 4291, too many requests?)")
+
+    base = Failing()
+    embed = RateLimitedEmbeddings(
+        base,
+        provider_code="test-status",
+        limiter=ProviderLimiter(rpm=0, tpm=0),
+        max_retries=3,
+    )
+
+    with pytest.raises(ProviderError):
+        await embed.aembed_documents(["x"])
+    assert len(base.batches) == 1
+    assert embedding_executor._is_rate_limited(RateLimitError())
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app.utils import embedding as embedding_module
+from app.utils.cache import LRUCache
+from app.utils.embedding import get_embedding, invalidate_embeddings
+
+
+class CountingEmbeddings(Embeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [0.0]
+
+
+@pytest.fixture
+def built(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def factory(model_name, key):
+        calls.append(model_name)
+        return CountingEmbeddings()
+
+    monkeypatch.setitem(embedding_module._FACTORIES, "fake", factory)
+    embedding_module._registry.clear()
+    yield calls
+    embedding_module._registry.clear()
+
+
+def _key(key_id: int = 1, api_key: str = "secret") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=key_id,
+        provider=SimpleNamespace(code="fake"),
+        purpose=SimpleNamespace(code="embedding"),
+        api_key=api_key,
+        endpoint_url=None,
+    )
+
+
+def test_get_embedding_reuses_client(built: list[str]):
+    first = get_embedding("m", _key())
+    second = get_embedding("m", _key())
+
+    assert first is second
+    assert built == ["m"]
+
+
+def test_changed_secret_builds_new_client(built: list[str]):
+    first = get_embedding("m", _key(api_key="a"))
+    second = get_embedding("m", _key(api_key="b"))
+
+    assert first is not second
+    assert len(built) == 2
+
+
+def test_invalidate_embeddings_by_model_key(built: list[str]):
+    get_embedding("m", _key(1))
+    get_embedding("m", _key(2))
+
+    assert invalidate_embeddings(model_key_id=1) == 1
+    get_embedding("m", _key(2))
+    assert len(built) == 2
+
+
+def test_lru_cache_evicts_by_bytes():
+    cache: LRUCache[str, int] = LRUCache(
+        "test-bytes", maxsize=10, max_bytes=100, sizeof=lambda v: v
+    )
+    cache.put("a", 60)
+    cache.put("b", 60)
+
+    assert "a" not in cache
+    assert cache.bytes == 60
+    assert cache.stats()["evictions"] == 1
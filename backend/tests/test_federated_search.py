@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from app.db.search_sql import normalized_similarity
+from app.services import federated_search as module
+from app.services.federated_search import FederatedSearchService
+
+
+def _collection(n: int, *, spec: int, distance: str = "cosine", owner: int = 1):
+    return SimpleNamespace(
+        id=UUID(int=n),
+        owner_id=owner,
+        is_public=False,
+        embedding_id=spec,
+        embedding=SimpleNamespace(dimension=3, distance=distance),
+        table_name=f"collection_{n}",
+        vector_index="hnsw",
+        vector_index_params=None,
+        vector_type="vector",
+    )
+
+
+class FakeResult:
+    def __init__(self, items):
+        self.items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.items
+
+
+class FakeDB:
+    def __init__(self, items):
+        self.items = items
+
+    async def execute(self, stmt):
+        return FakeResult(self.items)
+
+
+def _user(user_id: int = 1):
+    return SimpleNamespace(id=user_id, role=SimpleNamespace(code="user"))
+
+
+def test_normalized_similarity_maps_metrics_to_unit_range():
+    assert normalized_similarity(_collection(1, spec=1), 0.2) == pytest.approx(0.9)
+    assert normalized_similarity(_collection(1, spec=1, distance="l2"), 1.0) == 0.5
+    assert normalized_similarity(_collection(1, spec=1, distance="ip"), 0.6) == 0.8
+    assert normalized_similarity(_collection(1, spec=1), None) is None
+
+
+@pytest.mark.asyncio
+async def test_federated_search_shares_embeddings_and_merges(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    a, b, c = (
+        _collection(1, spec=7),
+        _collection(2, spec=7),
+        _collection(3, spec=9, distance="l2"),
+    )
+    embedded: list[int] = []
+
+    class FakeEmbeddings:
+        def __init__(self, spec):
+            self.spec = spec
+
+        async def aembed_query(self, text):
+            embedded.append(self.spec)
+            return [float(self.spec)]
+
+    class FakeDocumentService:
+        def __init__(self, db, cid, user):
+            pass
+
+        async def _search_embedding(self, collection, model_api_key_id):
+            return collection.embedding_id
+
+        def _query_embeddings(self, collection, embed):
+            return FakeEmbeddings(embed)
+
+    distances = {a.id: [0.4], b.id: [0.1, 1.0], c.id: [0.0]}
+
+    async def fake_search_collection(self, collection, embedding, query, **kwargs):
+        assert embedding == [float(collection.embedding_id)]
+        return [
+            {
+                "id": f"{collection.table_name}-{i}",
+                "page_content": "",
+                "metadata": {},
+                "score": d,
+            }
+            for i, d in enumerate(distances[collection.id])
+        ]
+
+    monkeypatch.setattr(module, "DocumentService", FakeDocumentService)
+    monkeypatch.setattr(
+        FederatedSearchService, "_search_collection", fake_search_collection
+    )
+
+    service = FederatedSearchService(FakeDB([c, a, b]), _user())
+    results = await service.search([a.id, b.id, c.id, a.id], "q", limit=3)
+
+    assert sorted(embedded) == [7, 9]
+    assert [r["id"] for r in results] == [
+        "collection_3-0",
+        "collection_2-0",
+        "collection_1-0",
+    ]
+    assert results[1]["score"] == pytest.approx(0.95)
+    assert results[1]["raw_score"] == 0.1
+    assert results[0]["collection_id"] == str(c.id)
+
+
+@pytest.mark.asyncio
+async def test_federated_search_checks_every_collection():
+    service = FederatedSearchService(
+        FakeDB([_collection(1, spec=1), _collection(2, spec=1, owner=2)]), _user()
+    )
+    with pytest.raises(HTTPException) as forbidden:
+        await service.search([UUID(int=1), UUID(int=2)], "q")
+    with pytest.raises(HTTPException) as missing:
+        await service.search([UUID(int=1), UUID(int=3)], "q")
+    with pytest.raises(HTTPException) as operator:
+        await service.search([UUID(int=1)], "q", filter={"source": {"$in": ["a"]}})
+
+    assert forbidden.value.status_code == 403
+    assert missing.value.status_code == 404
+    assert operator.value.status_code == 400
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+
+from app.db import collection_stats
+from app.services import document as document_module
+from app.services.document import DocumentService
+
+
+def _collection():
+    return SimpleNamespace(
+        id=UUID(int=1), table_name="collection_t", chunk_count=42, document_count=3
+    )
+
+
+def _service(monkeypatch: pytest.MonkeyPatch, rows_for) -> tuple[DocumentService, list]:
+    calls: list = []
+    service = DocumentService(None, UUID(int=1), SimpleNamespace(id=1))
+
+    async def get_collection():
+        return _collection()
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        sql = " ".join(query.split())
+        calls.append((sql, params))
+        return rows_for(sql, params, one)
+
+    monkeypatch.setattr(service, "_get_collection", get_collection)
+    monkeypatch.setattr(document_module, "raw_sql", fake_raw_sql)
+    return service, calls
+
+
+def _file(n: int):
+    return {
+        "file_id": f"f{n}",
+        "source": f"{n}.txt",
+        "chunk_count": n,
+        "content_bytes": 10 * n,
+        "file_size": 8 * n,
+        "content_hash": None,
+        "created_at": datetime(2026, 1, 1, 0, 0, n, tzinfo=timezone.utc),
+    }
+
+
+def test_delete_sql_trims_or_removes_registry_rows():
+    sql = " ".join(
+        collection_stats.delete_chunks_sql("collection_1", "file_id = :id").split()
+    )
+
+    assert (
+        "UPDATE collection_files AS f SET chunk_count = GREATEST(f.chunk_count - p.n, 0)"
+        in sql
+    )
+    assert "AND p.n < r.n" in sql
+    assert "DELETE FROM collection_files AS f USING per_file AS p" in sql
+    assert "f.collection_id = :collection_id" in sql
+
+
+def test_staged_delta_sql_counts_new_chunks_per_file_without_locking_counters():
+    sql = " ".join(collection_stats.staged_insert_delta_sql('"t"', '"s"').split())
+
+    assert "COUNT(*) FILTER (WHERE t.langchain_id IS NULL) AS chunks" in sql
+    assert "GROUP BY s.file_id" in sql
+    assert "collections" not in sql and "collection_files" not in sql
+    upsert = " ".join(collection_stats.direct_insert_stats_sql().split())
+    assert "ON CONFLICT (collection_id, file_id) DO UPDATE" in upsert
+
+
+@pytest.mark.asyncio
+async def test_document_list_pages_registry_by_keyset(monkeypatch: pytest.MonkeyPatch):
+    service, calls = _service(
+        monkeypatch,
+        lambda sql, params, one: [_file(n) for n in range(1, params["limit"] + 1)],
+    )
+
+    first = await service.get_list(limit=2)
+
+    assert [i["file_id"] for i in first["items"]] == ["f1", "f2"]
+    assert first["items"][0]["chunks"] == []
+    assert first["items"][0]["file_size"] == 8
+    assert (first["chunk_total"], first["file_total"]) == (42, 3)
+    assert first["next_cursor"]
+    sql, params = calls[0]
+    assert "FROM collection_files" in sql and "collection_t" not in sql
+    assert "OFFSET :offset" in sql and params["limit"] == 3
+
+    await service.get_list(limit=2, cursor=first["next_cursor"])
+
+    sql, params = calls[1]
+    assert "(created_at, file_id) > (:after_created_at, :after_file_id)" in sql
+    assert "OFFSET" not in sql
+    assert params["after_file_id"] == "f2"
+    assert params["after_created_at"] == _file(2)["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_document_list_rejects_bad_cursor(monkeypatch: pytest.MonkeyPatch):
+    service, _ = _service(monkeypatch, lambda sql, params, one: [])
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_list(cursor="not-a-cursor")
+
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_file_chunks_load_lazily_by_chunk_index(monkeypatch: pytest.MonkeyPatch):
+    def rows_for(sql, params, one):
+        if one:
+            return _file(3)
+        return [
+            {
+                "langchain_id": UUID(int=i + 10),
+                "content": f"c{i}",
+                "file_id": "f3",
+                "chunk_index": i,
+                "source": "3.txt",
+                "langchain_metadata": '{"page": 1}',
+            }
+            for i in range(params["after"] + 1, params["after"] + 1 + params["limit"])
+        ]
+
+    service, calls = _service(monkeypatch, rows_for)
+
+    page = await service.get_file_chunks("f3", limit=2)
+
+    assert [c["metadata"]["chunk_index"] for c in page["items"]] == [0, 1]
+    assert page["items"][0]["metadata"]["page"] == 1
+    assert page["chunk_count"] == 3
+
+    await service.get_file_chunks("f3", limit=2, cursor=page["next_cursor"])
+
+    sql, params = calls[-1]
+    assert "WHERE file_id = :file_id AND chunk_index > :after" in sql
+    assert params["after"] == 1
+
+
+@pytest.mark.asyncio
+async def test_file_chunks_missing_file_is_404(monkeypatch: pytest.MonkeyPatch):
+    service, _ = _service(monkeypatch, lambda sql, params, one: None)
+
+    with pytest.raises(HTTPException) as exc:
+        await service.get_file_chunks("missing")
+
+    assert exc.value.status_code == 404
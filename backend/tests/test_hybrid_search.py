@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import hybrid, search_sql
+
+
+def _collection():
+    return SimpleNamespace(
+        table_name="collection_t",
+        embedding=SimpleNamespace(dimension=3, distance="cosine"),
+        vector_index="hnsw",
+        vector_index_params=None,
+        vector_type="vector",
+    )
+
+
+def test_hybrid_sql_fuses_both_signals_in_one_statement():
+    sql = hybrid.hybrid_search_sql(_collection(), "TRUE", "content_tsv_en")
+
+    assert sql.count("LIMIT :fetch") == 2
+    assert "ORDER BY embedding <=> CAST(:q AS vector)" in sql
+    assert "content_tsv_en @@ qs" in sql
+    assert "FULL OUTER JOIN keyword USING (langchain_id)" in sql
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fetches_limit_plus_margin(monkeypatch: pytest.MonkeyPatch):
+    calls: list = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append((query, params))
+        if "set_config" in query:
+            return [{"set_config": params["value"]}]
+        return [
+            {
+                "langchain_id": "a",
+                "content": "text",
+                "file_id": "f1",
+                "chunk_index": 2,
+                "source": None,
+                "langchain_metadata": {},
+                "rrf_score": 2 / 61,
+                "semantic_score": 0.12,
+                "keyword_score": None,
+            }
+        ]
+
+    monkeypatch.setattr(hybrid, "raw_sql", fake_raw_sql)
+    monkeypatch.setattr(search_sql, "raw_sql", fake_raw_sql)
+    monkeypatch.setattr(hybrid.settings, "hybrid_fetch_margin", 5)
+
+    results = await hybrid.hybrid_search(
+        None,
+        _collection(),
+        [0.1, 0.2, 0.3],
+        "검색어",
+        k=10,
+        fts_config="simple",
+        tsv_column="content_tsv_simple",
+        keyword_weight=0.5,
+    )
+
+    assert calls[0][1] == {"name": "hnsw.ef_search", "value": "40"}
+    params = calls[1][1]
+    assert params["fetch"] == 15 and params["k"] == 10
+    assert params["w_keyword"] == 0.5 and params["cfg"] == "simple"
+    assert results[0]["score"] == pytest.approx(2 / 61)
+    assert results[0]["semantic_score"] == 0.12
+    assert results[0]["keyword_score"] is None
+    assert results[0]["metadata"] == {"file_id": "f1", "chunk_index": 2}
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_skips_operator_filters():
+    result = await hybrid.hybrid_search(
+        None,
+        _collection(),
+        [0.1],
+        "q",
+        k=5,
+        fts_config="simple",
+        tsv_column="content_tsv_simple",
+        filter={"source": {"$in": ["a"]}},
+    )
+
+    assert result is None
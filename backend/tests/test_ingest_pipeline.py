@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+
+import pytest
+from langchain_core.documents import Document
+
+from app.utils import document_process
+from app.utils.ingest_pipeline import IngestionPipeline, PipelineSource
+
+
+@pytest.fixture(autouse=True)
+def _inline_parse_pool(monkeypatch):
+    async def stream_inline(fn, *args, maxsize, **kwargs):
+        batches = []
+        fn(*args, emit=batches.append, **kwargs)
+        for batch in batches:
+            yield batch
+
+    monkeypatch.setattr(
+        "app.utils.ingest_pipeline.stream_from_parse_pool", stream_inline
+    )
+
+
+def _sources(tmp_path, n: int) -> list[PipelineSource]:
+    sources = []
+    for i in range(n):
+        path = tmp_path / f"{i:04d}"
+        path.write_text("hello world\n" * 50)
+        sources.append(
+            PipelineSource(
+                path=str(path),
+                mime_type="text/plain",
+                file_id=f"f{i}",
+                filename=f"{i}.txt",
+            )
+        )
+    return sources
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_and_every_chunk_is_stored(tmp_path):
+    in_flight = 0
+    peak = 0
+    stored: list[str] = []
+
+    async def embed(chunks):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.0]] * len(chunks)
+
+    async def store(chunks, vectors):
+        stored.extend(c.metadata["file_id"] for c in chunks)
+
+    events: list[tuple[str, str]] = []
+
+    async def on_event(source, event, info):
+        events.append((source.file_id, event))
+
+    pipeline = IngestionPipeline(
+        embed=embed,
+        store=store,
+        chunk_size=40,
+        chunk_overlap=0,
+        on_event=on_event,
+        embed_concurrency=3,
+        queue_size=2,
+        batch_size=4,
+    )
+    sources = await pipeline.run(_sources(tmp_path, 3))
+
+    assert peak > 1
+    for source in sources:
+        assert source.stored == source.chunk_count > 0
+        assert stored.count(source.file_id) == source.chunk_count
+        assert [e for f, e in events if f == source.file_id][-1] == "stored"
+
+
+@pytest.mark.asyncio
+async def test_embed_error_aborts_pipeline(tmp_path):
+    async def embed(chunks):
+        raise RuntimeError("provider down")
+
+    async def store(chunks, vectors):
+        raise AssertionError("store must not run")
+
+    pipeline = IngestionPipeline(
+        embed=embed, store=store, chunk_size=40, chunk_overlap=0, batch_size=4
+    )
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        await pipeline.run(_sources(tmp_path, 2))
+
+
+def _run_in_thread(monkeypatch):
+    async def stream_threaded(fn, *args, maxsize, **kwargs):
+        channel = queue.Queue(maxsize)
+        done = object()
+
+        def run():
+            try:
+                fn(*args, emit=channel.put, **kwargs)
+            finally:
+                channel.put(done)
+
+        task = asyncio.ensure_future(asyncio.to_thread(run))
+        while (batch := await asyncio.to_thread(channel.get)) is not done:
+            yield batch
+        await task
+
+    monkeypatch.setattr(
+        "app.utils.ingest_pipeline.stream_from_parse_pool", stream_threaded
+    )
+
+
+@pytest.mark.asyncio
+async def test_batches_are_embedded_while_file_is_still_parsing(tmp_path, monkeypatch):
+    _run_in_thread(monkeypatch)
+    first_embedded = threading.Event()
+
+    def slow_parse(path, mime_type, metadata=None):
+        for i in range(5):
+            if i == 1:
+                # 첫 배치가 임베딩되기 전에는 파싱을 이어가지 않음
+                assert first_embedded.wait(5)
+            yield Document(page_content="hello world\n" * 5, metadata={})
+
+    monkeypatch.setattr(document_process, "iter_parse_path", slow_parse)
+
+    async def embed(chunks):
+        first_embedded.set()
+        return [[0.0]] * len(chunks)
+
+    async def store(chunks, vectors):
+        pass
+
+    pipeline = IngestionPipeline(
+        embed=embed, store=store, chunk_size=40, chunk_overlap=0, batch_size=2
+    )
+    (source,) = await pipeline.run(_sources(tmp_path, 1))
+
+    assert source.error is None
+    assert source.stored == source.chunk_count > 2
+
+
+@pytest.mark.asyncio
+async def test_parse_error_after_first_batch_fails_file_once(tmp_path, monkeypatch):
+    _run_in_thread(monkeypatch)
+
+    def broken_parse(path, mime_type, metadata=None):
+        yield Document(page_content="hello world\n" * 5, metadata={})
+        raise ValueError("corrupt page")
+
+    monkeypatch.setattr(document_process, "iter_parse_path", broken_parse)
+    events: list[tuple[str, dict]] = []
+
+    async def embed(chunks):
+        return [[0.0]] * len(chunks)
+
+    async def store(chunks, vectors):
+        pass
+
+    async def on_event(source, event, info):
+        events.append((event, info))
+
+    pipeline = IngestionPipeline(
+        embed=embed,
+        store=store,
+        chunk_size=40,
+        chunk_overlap=0,
+        on_event=on_event,
+        batch_size=1,
+    )
+    (source,) = await pipeline.run(_sources(tmp_path, 1))
+
+    assert source.error == "corrupt page"
+    assert [e for e, _ in events if e in ("failed", "stored", "chunked")] == ["failed"]
+    assert events[-1][0] == "failed"
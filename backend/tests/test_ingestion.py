@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import IngestionFileStage, IngestionJobStatus
+from app.services import ingestion as ingestion_module
+from app.services.ingestion import _process_files
+
+
+@pytest.fixture(autouse=True)
+def _inline_parse_pool(monkeypatch):
+    async def stream_inline(fn, *args, maxsize, **kwargs):
+        batches = []
+        fn(*args, emit=batches.append, **kwargs)
+        for batch in batches:
+            yield batch
+
+    class _Session:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(
+        "app.utils.ingest_pipeline.stream_from_parse_pool", stream_inline
+    )
+    monkeypatch.setattr("app.services.ingestion.async_session", _Session)
+    monkeypatch.setattr("app.services.ingestion.record_file_uploads", AsyncMock())
+
+
+def _job() -> SimpleNamespace:
+    return SimpleNamespace(chunk_size=50, chunk_overlap=0, locked_at=None)
+
+
+def _item(path, stage: str = IngestionFileStage.QUEUED.value) -> SimpleNamespace:
+    return SimpleNamespace(
+        file_id=uuid4(),
+        filename="a.txt",
+        content_type="text/plain",
+        spool_path=str(path),
+        metadata_={"tag": "x"},
+        stage=stage,
+        chunk_count=0,
+        error=None,
+    )
+
+
+def _svc() -> MagicMock:
+    svc = MagicMock()
+    svc.embed_chunks = AsyncMock(
+        side_effect=lambda c, e, docs, **kw: [[0.0]] * len(docs)
+    )
+    svc.store_chunks = AsyncMock(return_value=["id"])
+    svc.delete_by = AsyncMock(return_value=0)
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_process_file_walks_all_stages(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.settings.ingest_batch_size", 2)
+    path = tmp_path / "0000"
+    path.write_text("hello world " * 20)
+    session = MagicMock(commit=AsyncMock())
+    item = _item(path)
+    svc = _svc()
+
+    await _process_files(session, _job(), [item], svc, object(), object())
+
+    assert item.stage == IngestionFileStage.STORED.value
+    assert item.chunk_count > 2
+    batches = [call.args[2] for call in svc.store_chunks.await_args_list]
+    assert all(len(b) <= 2 for b in batches)
+    chunks = [c for b in batches for c in b]
+    assert len(chunks) == item.chunk_count
+    assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    assert {c.metadata["file_id"] for c in chunks} == {str(item.file_id)}
+    assert chunks[0].metadata["tag"] == "x"
+    svc.delete_by.assert_not_awaited()
+    assert session.commit.await_count == len(batches) + 2
+    record = ingestion_module.record_file_uploads
+    record.assert_awaited_once()
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    size = path.stat().st_size
+    assert record.await_args.args[2] == {str(item.file_id): (digest, size)}
+
+
+@pytest.mark.asyncio
+async def test_resumed_file_clears_partial_rows(tmp_path):
+    path = tmp_path / "0000"
+    path.write_text("hello")
+    item = _item(path, stage=IngestionFileStage.EMBEDDED.value)
+    svc = _svc()
+
+    await _process_files(MagicMock(commit=AsyncMock()), _job(), [item], svc, None, None)
+
+    svc.delete_by.assert_awaited_once_with(item.file_id, "file_id")
+    assert item.stage == IngestionFileStage.STORED.value
+
+
+@pytest.mark.asyncio
+async def test_unparseable_file_is_marked_failed(tmp_path):
+    empty = tmp_path / "empty"
+    empty.write_text("")
+    item = _item(empty)
+    svc = _svc()
+
+    await _process_files(MagicMock(commit=AsyncMock()), _job(), [item], svc, None, None)
+
+    assert item.stage == IngestionFileStage.FAILED.value
+    assert item.error
+    svc.embed_chunks.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_file_does_not_block_others(tmp_path):
+    ok = tmp_path / "0000"
+    ok.write_text("hello world " * 20)
+    empty = tmp_path / "empty"
+    empty.write_text("")
+    bad = _item(empty)
+    good = _item(ok)
+    svc = _svc()
+
+    await _process_files(
+        MagicMock(commit=AsyncMock()), _job(), [bad, good], svc, None, None
+    )
+
+    assert bad.stage == IngestionFileStage.FAILED.value
+    assert good.stage == IngestionFileStage.STORED.value
+
+
+@pytest.mark.asyncio
+async def test_lease_heartbeat_refreshes_lock_while_stage_runs(monkeypatch):
+    monkeypatch.setattr("app.services.ingestion.settings.ingest_lease_sec", 0.3)
+    calls: list = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append(params)
+        return {"id": params["id"]}
+
+    monkeypatch.setattr(ingestion_module, "raw_sql", fake_raw_sql)
+    job = SimpleNamespace(id=uuid4(), locked_by="w1")
+
+    # 이벤트 없이 임대 시간보다 오래 걸리는 단계
+    async with ingestion_module._lease_heartbeat(job):
+        await asyncio.sleep(0.45)
+    refreshed = len(calls)
+    await asyncio.sleep(0.2)
+
+    assert refreshed >= 3
+    assert calls[0] == {"id": job.id, "worker": "w1"}
+    # 블록을 벗어나면 갱신을 멈춤
+    assert len(calls) == refreshed
+
+
+@pytest.mark.asyncio
+async def test_missing_spool_file_is_retryable_not_a_file_failure(tmp_path):
+    item = _item(tmp_path / "gone")
+    svc = _svc()
+
+    with pytest.raises(RuntimeError, match="스풀 파일"):
+        await _process_files(
+            MagicMock(commit=AsyncMock()), _job(), [item], svc, None, None
+        )
+
+    assert item.stage == IngestionFileStage.QUEUED.value
+    svc.delete_by.assert_not_awaited()
+
+
+def _run_job_env(monkeypatch, error: Exception) -> SimpleNamespace:
+    job = SimpleNamespace(
+        id=uuid4(),
+        user_id=uuid4(),
+        collection_id=uuid4(),
+        model_api_key_id=None,
+        status=IngestionJobStatus.RUNNING.value,
+        error=None,
+        attempts=1,
+        max_attempts=3,
+        locked_by="w1",
+        locked_at=None,
+        run_after=None,
+        finished_at=None,
+        files=[],
+    )
+    session = MagicMock(commit=AsyncMock(), rollback=AsyncMock(), refresh=AsyncMock())
+    session.scalar = AsyncMock(side_effect=[job, SimpleNamespace(id=job.user_id)])
+
+    class _Session:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    svc = MagicMock()
+    svc.resolve_upload_target = AsyncMock(side_effect=error)
+    monkeypatch.setattr("app.services.ingestion.async_session", _Session)
+    monkeypatch.setattr(
+        "app.services.ingestion.DocumentService", MagicMock(return_value=svc)
+    )
+    monkeypatch.setattr("app.services.ingestion.settings.ingest_retry_backoff_sec", 30)
+    return job
+
+
+@pytest.mark.asyncio
+async def test_run_job_requeues_transient_failure_with_backoff(monkeypatch):
+    job = _run_job_env(monkeypatch, RuntimeError("db down"))
+
+    await ingestion_module.run_job(job.id)
+
+    assert job.status == IngestionJobStatus.QUEUED.value
+    assert job.locked_by is None
+    assert job.finished_at is None
+    assert "db down" in job.error
+    assert job.run_after > datetime.now(timezone.utc) + timedelta(seconds=20)
+
+
+@pytest.mark.asyncio
+async def test_run_job_fails_permanently_on_client_error(monkeypatch):
+    job = _run_job_env(
+        monkeypatch, HTTPException(status_code=403, detail="권한이 없습니다.")
+    )
+
+    await ingestion_module.run_job(job.id)
+
+    assert job.status == IngestionJobStatus.FAILED.value
+    assert job.error == "권한이 없습니다."
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_run_job_fails_after_last_attempt(monkeypatch):
+    job = _run_job_env(monkeypatch, RuntimeError("db down"))
+    job.attempts = job.max_attempts
+
+    await ingestion_module.run_job(job.id)
+
+    assert job.status == IngestionJobStatus.FAILED.value
+    assert job.finished_at is not None
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.utils import mcp_pool as mcp_pool_module
+from app.utils.mcp_pool import MCPConnectionManager
+
+
+class FakeSession:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.closed = False
+
+    async def initialize(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_mcp(monkeypatch: pytest.MonkeyPatch):
+    state = {"sessions": [], "discoveries": 0}
+
+    @asynccontextmanager
+    async def fake_create_session(connection):
+        state["connects"] = state.get("connects", 0) + 1
+        if "slow" in connection["url"]:
+            await asyncio.sleep(10)
+        if "dead" in connection["url"]:
+            raise ConnectionError("refused")
+        session = FakeSession(connection["url"])
+        state["sessions"].append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+    async def fake_load_mcp_tools(session, *, connection=None):
+        state["discoveries"] += 1
+        return [f"tool@{session.url}"]
+
+    monkeypatch.setattr(mcp_pool_module, "create_session", fake_create_session)
+    monkeypatch.setattr(mcp_pool_module, "load_mcp_tools", fake_load_mcp_tools)
+    return state
+
+
+def _server(url: str = "http://mcp/a", server_id: int = 7) -> dict:
+    return {
+        "id": server_id,
+        "name": f"s{server_id}",
+        "config": {"transport": "streamable_http", "url": url},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_tools_reuses_session_and_tool_cache(fake_mcp):
+    pool = MCPConnectionManager(ttl=60, maxsize=8)
+
+    first = await pool.get_tools(_server())
+    second = await pool.get_tools(_server())
+
+    assert first == second == ["tool@http://mcp/a"]
+    assert len(fake_mcp["sessions"]) == 1
+    assert fake_mcp["discoveries"] == 1
+    await pool.aclose()
+    assert fake_mcp["sessions"][0].closed
+
+
+@pytest.mark.asyncio
+async def test_expired_tools_are_rediscovered_on_same_session(fake_mcp):
+    pool = MCPConnectionManager(ttl=0, maxsize=8)
+
+    await pool.get_tools(_server())
+    await pool.get_tools(_server())
+
+    assert fake_mcp["discoveries"] == 2
+    assert len(fake_mcp["sessions"]) == 1
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_closes_session(fake_mcp):
+    pool = MCPConnectionManager(ttl=60, maxsize=8)
+    await pool.get_tools(_server())
+
+    assert await pool.invalidate(7) == 1
+    assert fake_mcp["sessions"][0].closed
+
+    await pool.get_tools(_server())
+    assert len(fake_mcp["sessions"]) == 2
+    assert fake_mcp["discoveries"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_config_change_replaces_session(fake_mcp):
+    pool = MCPConnectionManager(ttl=60, maxsize=8)
+    await pool.get_tools(_server("http://mcp/a"))
+
+    tools = await pool.get_tools(_server("http://mcp/b"))
+
+    assert tools == ["tool@http://mcp/b"]
+    assert fake_mcp["sessions"][0].closed
+    assert not fake_mcp["sessions"][1].closed
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_isolated_load_skips_slow_server(fake_mcp):
+    pool = MCPConnectionManager(ttl=60, maxsize=8)
+
+    result = await pool.load_tools_isolated(
+        [_server("http://mcp/a", 1), _server("http://mcp/slow", 2)],
+        timeout_sec=0.05,
+    )
+
+    assert result.tools == ["tool@http://mcp/a"]
+    assert [s["id"] for s in result.servers] == [1]
+    assert result.warnings == [
+        {
+            "server": "s2",
+            "reason": "timeout",
+            "detail": "0.05초 안에 응답하지 않았습니다.",
+        }
+    ]
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_repeated_failures(fake_mcp):
+    pool = MCPConnectionManager(
+        ttl=60, maxsize=8, breaker_threshold=2, breaker_cooldown_sec=60
+    )
+    dead = _server("http://mcp/dead", 3)
+
+    for _ in range(2):
+        result = await pool.load_tools_isolated([dead], timeout_sec=1)
+        assert result.warnings[0]["reason"] == "error"
+    connects = fake_mcp["connects"]
+
+    result = await pool.load_tools_isolated([dead], timeout_sec=1)
+
+    assert result.warnings[0]["reason"] == "circuit_open"
+    assert fake_mcp["connects"] == connects
+    await pool.invalidate(3)
+    result = await pool.load_tools_isolated([dead], timeout_sec=1)
+    assert result.warnings[0]["reason"] == "error"
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_closed_on_next_lookup(fake_mcp, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mcp_pool_module.time, "monotonic", lambda: now[0])
+    pool = MCPConnectionManager(ttl=600, maxsize=8, idle_sec=60)
+
+    await pool.get_tools(_server("http://mcp/a", 1))
+    now[0] += 30
+    await pool.get_tools(_server("http://mcp/b", 2))
+    now[0] += 40
+    await pool.get_tools(_server("http://mcp/b", 2))
+
+    a, b = fake_mcp["sessions"]
+    assert a.closed and not b.closed
+    assert [k[0] for k in pool._sessions] == ["2"]
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_session_is_evicted_over_limit(fake_mcp):
+    pool = MCPConnectionManager(ttl=600, maxsize=8, max_sessions=2)
+
+    await pool.get_tools(_server("http://mcp/a", 1))
+    await pool.get_tools(_server("http://mcp/b", 2))
+    await pool.get_tools(_server("http://mcp/a", 1))
+    await pool.get_tools(_server("http://mcp/c", 3))
+
+    a, b, c = fake_mcp["sessions"]
+    assert b.closed
+    assert not a.closed and not c.closed
+    assert sorted(k[0] for k in pool._sessions) == ["1", "3"]
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_leased_session_is_not_evicted_during_agent_run(fake_mcp, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(mcp_pool_module.time, "monotonic", lambda: now[0])
+    pool = MCPConnectionManager(ttl=600, maxsize=8, idle_sec=60, max_sessions=1)
+    server_a = _server("http://mcp/a", 1)
+
+    await pool.get_tools(server_a)
+    with pool.lease([server_a]):
+        # 긴 에이전트 실행 도중 다른 요청이 유휴/LRU 정리를 일으켜도 유지
+        now[0] += 120
+        await pool.get_tools(_server("http://mcp/b", 2))
+        a = fake_mcp["sessions"][0]
+        assert not a.closed
+    assert not pool._leases
+
+    now[0] += 30
+    await pool.get_tools(_server("http://mcp/b", 2))
+    # lease 해제 후에는 다시 정리 대상(최대 세션 수 초과)
+    assert a.closed
+    await pool.aclose()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.utils import parse_pool
+from app.utils.document_process import emit_chunk_batches
+
+
+@pytest.fixture(autouse=True)
+def _small_pool(monkeypatch):
+    monkeypatch.setattr(parse_pool.settings, "parse_workers", 1)
+    yield
+    parse_pool.shutdown_parse_pool()
+
+
+@pytest.mark.asyncio
+async def test_chunk_batches_stream_from_child_process(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("hello world " * 20)
+    batches = [
+        batch
+        async for batch in parse_pool.stream_from_parse_pool(
+            emit_chunk_batches,
+            str(path),
+            "text/plain",
+            {"tag": "x"},
+            maxsize=1,
+            file_id="f1",
+            filename="a.txt",
+            chunk_size=50,
+            chunk_overlap=0,
+            batch_size=2,
+        )
+    ]
+
+    records = [record for batch in batches for record in batch]
+    assert len(batches) > 1
+    assert all(len(batch) <= 2 for batch in batches)
+    text, meta = records[0]
+    assert text
+    assert meta["file_id"] == "f1"
+    assert meta["tag"] == "x"
+
+
+def _emit_then_sleep(delay: float, *, emit) -> None:
+    emit(1)
+    time.sleep(delay)
+    emit(2)
+
+
+@pytest.mark.asyncio
+async def test_stream_times_out_between_items_not_overall():
+    first = parse_pool.get_parse_pool()
+    # 자식 기동 시간을 제외하고 실행 중인 작업의 시간 초과만 확인
+    assert await parse_pool.run_in_parse_pool(sum, [1]) == 1
+    # 값 사이 간격이 제한 시간보다 짧으면 전체 시간이 더 길어도 성공
+    items = [
+        item
+        async for item in parse_pool.stream_from_parse_pool(
+            _emit_then_sleep, 0.6, maxsize=1, idle_timeout_sec=1
+        )
+    ]
+    assert items == [1, 2]
+
+    received = []
+    with pytest.raises(ValueError):
+        async for item in parse_pool.stream_from_parse_pool(
+            _emit_then_sleep, 30, maxsize=1, idle_timeout_sec=1
+        ):
+            received.append(item)
+
+    assert received == [1]
+    assert parse_pool.get_parse_pool() is not first
+
+
+def _emit_with_progress(progress: str, count: int, *, emit) -> None:
+    for i in range(count):
+        emit(i)
+        with open(progress, "w") as f:
+            f.write(str(i + 1))
+
+
+@pytest.mark.asyncio
+async def test_stream_blocks_child_while_consumer_is_slow(tmp_path):
+    progress = tmp_path / "progress"
+    stream = parse_pool.stream_from_parse_pool(
+        _emit_with_progress, str(progress), 50, maxsize=2
+    )
+
+    assert await anext(stream) == 0
+    await asyncio.sleep(1)
+    # 소비하지 않는 동안 자식은 채널 크기만큼만 앞서 나감
+    assert int(progress.read_text()) <= 4
+
+    rest = [item async for item in stream]
+    assert rest == list(range(1, 50))
+
+
+@pytest.mark.asyncio
+async def test_timeout_resets_pool():
+    first = parse_pool.get_parse_pool()
+    # 자식 기동 시간을 제외하고 실행 중인 작업의 시간 초과만 확인
+    assert await parse_pool.run_in_parse_pool(sum, [1]) == 1
+
+    with pytest.raises(ValueError):
+        await parse_pool.run_in_parse_pool(time.sleep, 5, timeout_sec=0.5)
+
+    assert parse_pool.get_parse_pool() is not first
+    assert await parse_pool.run_in_parse_pool(sum, [1, 2, 3]) == 6
+
+
+def _slow_sum(values: list[int], delay: float) -> int:
+    time.sleep(delay)
+    return sum(values)
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_only_its_worker_and_retries_collateral(monkeypatch):
+    monkeypatch.setattr(parse_pool.settings, "parse_workers", 2)
+    first = parse_pool.get_parse_pool()
+    # 두 자식을 미리 띄워 두 작업이 서로 다른 자식에서 동시에 실행되게 함
+    await asyncio.gather(
+        parse_pool.run_in_parse_pool(_slow_sum, [1], 0.3),
+        parse_pool.run_in_parse_pool(_slow_sum, [1], 0.3),
+    )
+
+    stuck, other = await asyncio.gather(
+        parse_pool.run_in_parse_pool(time.sleep, 30, timeout_sec=1),
+        parse_pool.run_in_parse_pool(_slow_sum, [1, 2, 3], 2, timeout_sec=10),
+        return_exceptions=True,
+    )
+
+    assert isinstance(stuck, ValueError)
+    # 시간 초과로 깨진 풀의 다른 작업은 실패하지 않고 새 풀에서 재시도
+    assert other == 6
+    assert parse_pool.get_parse_pool() is not first
+
+
+@pytest.mark.asyncio
+async def test_stale_pool_reset_does_not_replace_current_pool():
+    stale = parse_pool.get_parse_pool()
+    parse_pool._reset_pool(stale)
+    current = parse_pool.get_parse_pool()
+
+    parse_pool._reset_pool(stale)
+
+    assert parse_pool.get_parse_pool() is current
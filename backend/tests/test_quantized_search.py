@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import quantized
+from app.db.vector import secondary_index_specs
+from app.services import search_eval
+
+
+def _collection(vector_type: str = "vector", params: dict | None = None):
+    return SimpleNamespace(
+        id="c1",
+        table_name="collection_t",
+        embedding=SimpleNamespace(dimension=3, distance="cosine"),
+        vector_index="hnsw",
+        vector_index_params={"binary_quantize": True, **(params or {})},
+        vector_type=vector_type,
+    )
+
+
+def _row(id_: str, distance: float = 0.1):
+    return {
+        "langchain_id": id_,
+        "content": "text",
+        "file_id": "f1",
+        "chunk_index": 0,
+        "source": None,
+        "langchain_metadata": '{"page": 1}',
+        "distance": distance,
+    }
+
+
+def test_bit_index_matches_search_expression():
+    specs = dict(secondary_index_specs(_collection()))
+    sql = quantized.quantized_search_sql(_collection(), "TRUE")
+
+    index = specs["idx_collection_t_vec_bq"]
+    assert "(binary_quantize(embedding)::bit(3)) bit_hamming_ops" in index
+    assert "(binary_quantize(embedding)::bit(3)) <~>" in sql
+    assert "ORDER BY embedding <=> CAST(:q AS vector)" in sql
+
+
+def test_filter_clause_splits_columns_and_json():
+    where, params = quantized.filter_clause({"file_id": "f1", "lang": "ko"})
+
+    assert where == '"file_id" = :f0 AND langchain_metadata @> CAST(:f_json AS jsonb)'
+    assert params == {"f0": "f1", "f_json": '{"lang": "ko"}'}
+    assert quantized.filter_clause({"file_id": {"$in": ["a"]}}) is None
+
+
+@pytest.mark.asyncio
+async def test_quantized_search_sets_ef_search_and_maps_rows(monkeypatch):
+    calls: list = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append((query, params))
+        return [_row("a")] if "LIMIT :k" in query else [{"set_config": "1"}]
+
+    monkeypatch.setattr(quantized, "raw_sql", fake_raw_sql)
+    results = await quantized.quantized_search(
+        None, _collection(params={"rerank_factor": 50}), [0.1, 0.2, 0.3], k=10
+    )
+
+    assert calls[0][1] == {"ef": "500"}
+    assert calls[1][1]["shortlist"] == 500
+    assert calls[1][1]["q"] == "[0.1,0.2,0.3]"
+    assert results == [
+        {
+            "id": "a",
+            "page_content": "text",
+            "metadata": {"page": 1, "file_id": "f1", "chunk_index": 0},
+            "score": 0.1,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_quantized_recall(monkeypatch):
+    class FakeSession:
+        async def rollback(self):
+            pass
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        return [{"embedding": "[1,0,0]"}, {"embedding": "[0,1,0]"}]
+
+    async def fake_quantized(session, collection, vector, *, k):
+        return [{"id": "a"}, {"id": "x"}]
+
+    async def fake_exact(session, collection, vector, *, k):
+        return [{"id": "a"}, {"id": "b"}]
+
+    monkeypatch.setattr(search_eval, "raw_sql", fake_raw_sql)
+    monkeypatch.setattr(search_eval, "quantized_search", fake_quantized)
+    monkeypatch.setattr(search_eval, "exact_search", fake_exact)
+
+    report = await search_eval.evaluate_quantized_recall(
+        FakeSession(), _collection(), samples=2, k=2
+    )
+
+    assert report["samples"] == 2
+    assert report["recall"] == 0.5
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from app.utils.query_embedding import (
+    CachedQueryEmbeddings,
+    query_embedding_cache,
+    query_embedding_stats,
+)
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0, 0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.queries.append(text)
+        return [1.0, 2.0]
+
+
+class MemoryStore:
+    def __init__(self) -> None:
+        self.data: dict[tuple[int, str], list[float]] = {}
+
+    async def get_query(self, spec_id: int, query: str) -> list[float] | None:
+        return self.data.get((spec_id, query))
+
+    async def put_query(self, spec_id: int, query: str, vector: list[float]) -> None:
+        self.data[(spec_id, query)] = vector
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    query_embedding_cache.clear()
+    yield
+    query_embedding_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_hits_cache():
+    base = CountingEmbeddings()
+    embed = CachedQueryEmbeddings(base, spec_id=1, collection_id="c-hit")
+
+    first = await embed.aembed_query("hello  world")
+    second = await embed.aembed_query(" hello world ")
+
+    assert first == second == [1.0, 2.0]
+    assert base.queries == ["hello  world"]
+    stats = {s["collection_id"]: s for s in query_embedding_stats()}
+    assert (stats["c-hit"]["hits"], stats["c-hit"]["misses"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_returns_the_exact_provider_vector():
+    class PreciseEmbeddings(CountingEmbeddings):
+        def embed_query(self, text: str) -> list[float]:
+            self.queries.append(text)
+            return [0.1, 1 / 3]
+
+    embed = CachedQueryEmbeddings(PreciseEmbeddings(), spec_id=1, collection_id="p")
+
+    miss = await embed.aembed_query("q")
+    hit = await embed.aembed_query("q")
+
+    assert hit == miss == [0.1, 1 / 3]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_by_embedding_spec():
+    base = CountingEmbeddings()
+
+    await CachedQueryEmbeddings(base, spec_id=1, collection_id="a").aembed_query("q")
+    await CachedQueryEmbeddings(base, spec_id=2, collection_id="b").aembed_query("q")
+
+    assert len(base.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_store_is_consulted_after_local_miss():
+    store = MemoryStore()
+    base = CountingEmbeddings()
+    await CachedQueryEmbeddings(
+        base, spec_id=1, collection_id="s", shared=store
+    ).aembed_query("q")
+    query_embedding_cache.clear()
+
+    vec = await CachedQueryEmbeddings(
+        base, spec_id=1, collection_id="s", shared=store
+    ).aembed_query("q")
+
+    assert vec == [1.0, 2.0]
+    assert base.queries == ["q"]
+    assert query_embedding_cache.bytes > 0
+
+
+class LengthEmbeddings(CountingEmbeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        raise AssertionError("queries must not use the document embedding API")
+
+    def embed_query(self, text: str) -> list[float]:
+        self.queries.append(text)
+        return [float(len(text)), 0.0]
+
+
+@pytest.mark.asyncio
+async def test_batch_queries_embed_each_miss_once_as_query():
+    base = LengthEmbeddings()
+    embed = CachedQueryEmbeddings(base, spec_id=1, collection_id="batch")
+    await embed.aembed_query("cached")
+
+    vectors = await embed.aembed_queries(["ab", "cached", " ab ", "abcd"])
+
+    assert vectors == [[2.0, 0.0], [6.0, 0.0], [2.0, 0.0], [4.0, 0.0]]
+    assert sorted(base.queries) == ["ab", "abcd", "cached"]
+    # 배치 경로로 캐시된 벡터도 단건 질의 임베딩과 같음
+    assert await embed.aembed_query("abcd") == [4.0, 0.0]
+    assert len(base.queries) == 3
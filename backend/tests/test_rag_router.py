@@ -111,19 +111,25 @@ async def test_list_collections(monkeypatch: pytest.MonkeyPatch):
 async def test_upload_document(monkeypatch: pytest.MonkeyPatch):
     _set_current_user(FakeUser(1))
 
+    job_id = "00000000-0000-0000-0000-0000000000aa"
+
     class FakeService:
-        def __init__(self, db, collection_id, user):
+        def __init__(self, db):
             self.db = db
 
-        async def create(self, files, metadatas, chunk_size, chunk_overlap, model_api_key_id):
+        async def enqueue(self, **kwargs):
+            assert kwargs["chunk_size"] == 1000
+            assert [f.filename for f in kwargs["files"]] == ["test.txt"]
             return SimpleNamespace(
                 success=True,
-                message="업로드 완료",
-                added_chunk_ids=["c1"],
+                message="작업 등록",
+                added_chunk_ids=[],
                 warnings=None,
+                job_id=job_id,
+                status="queued",
             )
 
-    monkeypatch.setattr(router_module, "DocumentService", FakeService)
+    monkeypatch.setattr(router_module, "IngestionService", FakeService)
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
@@ -137,5 +143,263 @@ async def test_upload_document(monkeypatch: pytest.MonkeyPatch):
             },
         )
 
-    assert resp.status_code == 201
+    assert resp.status_code == 202
     assert resp.json()["success"] is True
+    assert resp.json()["job_id"] == job_id
+    assert resp.json()["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_get_ingestion_job(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    job_id = "00000000-0000-0000-0000-0000000000aa"
+    collection_id = "00000000-0000-0000-0000-000000000001"
+
+    class FakeService:
+        def __init__(self, db):
+            self.db = db
+
+        async def get_job(self, cid, jid, user):
+            return {
+                "id": str(jid),
+                "collection_id": str(cid),
+                "status": "running",
+                "attempts": 1,
+                "max_attempts": 3,
+                "created_at": "2026-01-01T00:00:00Z",
+                "files": [
+                    {
+                        "file_id": "00000000-0000-0000-0000-0000000000bb",
+                        "filename": "a.pdf",
+                        "stage": "embedded",
+                        "chunk_count": 12,
+                    }
+                ],
+            }
+
+    monkeypatch.setattr(router_module, "IngestionService", FakeService)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get(f"/api/v1/collections/{collection_id}/jobs/{job_id}")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "running"
+    assert body["files"][0]["stage"] == "embedded"
+
+
+@pytest.mark.asyncio
+async def test_build_collection_indexes(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    collection_id = "00000000-0000-0000-0000-000000000001"
+    scheduled: list = []
+
+    class FakeService:
+        def __init__(self, db):
+            self.db = db
+
+        async def start_index_build(self, cid, user):
+            return {"collection_id": str(cid), "status": "building"}
+
+    async def fake_run_index_build(cid):
+        scheduled.append(cid)
+
+    monkeypatch.setattr(router_module, "CollectionService", FakeService)
+    monkeypatch.setattr(router_module, "run_index_build", fake_run_index_build)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.post(f"/api/v1/collections/{collection_id}/indexes/build")
+
+    assert resp.status_code == 202
+    assert resp.json()["status"] == "building"
+    assert scheduled == [UUID(collection_id)]
+
+
+@pytest.mark.asyncio
+async def test_get_collection_indexes(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    collection_id = "00000000-0000-0000-0000-000000000001"
+
+    class FakeService:
+        def __init__(self, db):
+            self.db = db
+
+        async def get_index_status(self, cid, user):
+            return {
+                "collection_id": str(cid),
+                "status": "building",
+                "indexes": [
+                    {
+                        "name": "idx_vec_hnsw",
+                        "exists": True,
+                        "valid": False,
+                        "phase": "building index",
+                    }
+                ],
+            }
+
+    monkeypatch.setattr(router_module, "CollectionService", FakeService)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get(f"/api/v1/collections/{collection_id}/indexes")
+
+    assert resp.status_code == 200
+    index = resp.json()["indexes"][0]
+    assert index["valid"] is False
+    assert index["phase"] == "building index"
+
+
+@pytest.mark.asyncio
+async def test_reindex_collection(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    collection_id = "00000000-0000-0000-0000-000000000001"
+    scheduled: list = []
+
+    class FakeService:
+        def __init__(self, db):
+            self.db = db
+
+        async def reindex(self, cid, data, user):
+            return {
+                "collection_id": str(cid),
+                "status": "building",
+                "vector_index": data.vector_index,
+            }
+
+    async def fake_run_index_build(cid, *, rebuild_vector=False):
+        scheduled.append((cid, rebuild_vector))
+
+    monkeypatch.setattr(router_module, "CollectionService", FakeService)
+    monkeypatch.setattr(router_module, "run_index_build", fake_run_index_build)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.post(
+            f"/api/v1/collections/{collection_id}/indexes/reindex",
+            json={"vector_index": "ivfflat", "vector_index_params": {"probes": 8}},
+        )
+        invalid = await ac.post(
+            f"/api/v1/collections/{collection_id}/indexes/reindex",
+            json={"vector_index": "hnsw", "vector_index_params": {"m": 32, "ef_construction": 40}},
+        )
+
+    assert resp.status_code == 202
+    assert resp.json()["vector_index"] == "ivfflat"
+    assert scheduled == [(UUID(collection_id), True)]
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_documents_batch(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    collection_id = "00000000-0000-0000-0000-000000000001"
+
+    class FakeService:
+        def __init__(self, db, cid, user):
+            self.cid = cid
+
+        async def search_batch(self, queries, *, limit, filter, model_api_key_id):
+            return [
+                [{"id": f"{q}-{i}", "page_content": q, "metadata": {}, "score": 0.1 * i}
+                 for i in range(limit)]
+                for q in queries
+            ]
+
+    monkeypatch.setattr(router_module, "DocumentService", FakeService)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.post(
+            f"/api/v1/collections/{collection_id}/documents/search:batch",
+            json={"queries": ["가", "나"], "limit": 2},
+        )
+        empty = await ac.post(
+            f"/api/v1/collections/{collection_id}/documents/search:batch",
+            json={"queries": []},
+        )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["query"] for item in body] == ["가", "나"]
+    assert [r["id"] for r in body[1]["results"]] == ["나-0", "나-1"]
+    assert empty.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_file_chunks(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    collection_id = "00000000-0000-0000-0000-000000000001"
+
+    class FakeService:
+        def __init__(self, db, cid, user):
+            self.cid = cid
+
+        async def get_file_chunks(self, file_id, *, limit, cursor):
+            assert (limit, cursor) == (2, "abc")
+            return {
+                "file_id": file_id,
+                "source": "a.txt",
+                "chunk_count": 5,
+                "content_bytes": 50,
+                "file_size": 40,
+                "items": [
+                    {"id": "c1", "content": "x", "metadata": {"chunk_index": 2}},
+                ],
+                "next_cursor": "def",
+            }
+
+    monkeypatch.setattr(router_module, "DocumentService", FakeService)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get(
+            f"/api/v1/collections/{collection_id}/documents/f1/chunks",
+            params={"limit": 2, "cursor": "abc"},
+        )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["file_id"] == "f1"
+    assert body["items"][0]["id"] == "c1"
+    assert (body["content_bytes"], body["file_size"]) == (50, 40)
+    assert body["next_cursor"] == "def"
+
+
+@pytest.mark.asyncio
+async def test_search_collections(monkeypatch: pytest.MonkeyPatch):
+    _set_current_user(FakeUser(1))
+    calls: list = []
+
+    class FakeService:
+        def __init__(self, db, user):
+            pass
+
+        async def search(self, collection_ids, query, **kwargs):
+            calls.append((collection_ids, query, kwargs["search_type"]))
+            return [
+                {
+                    "id": "a",
+                    "page_content": "본문",
+                    "metadata": {},
+                    "score": 0.9,
+                    "raw_score": 0.2,
+                    "collection_id": str(collection_ids[0]),
+                }
+            ]
+
+    monkeypatch.setattr(router_module, "FederatedSearchService", FakeService)
+
+    collection_id = "00000000-0000-0000-0000-000000000001"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.post(
+            "/api/v1/collections/search",
+            json={"collection_ids": [collection_id], "query": "질의", "search_type": "hybrid"},
+        )
+
+    assert resp.status_code == 200
+    assert resp.json()[0]["collection_id"] == collection_id
+    assert calls == [([UUID(collection_id)], "질의", "hybrid")]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.utils.search_cache import (
+    invalidate_search_results,
+    search_cache_key,
+    search_result_cache,
+)
+from app.services import document as document_module
+from app.services.document import DocumentService
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    search_result_cache.clear()
+    yield
+    search_result_cache.clear()
+
+
+def _collection(version: int = 0):
+    return SimpleNamespace(
+        id=UUID(int=1), write_version=version, table_name="collection_t"
+    )
+
+
+def test_key_normalizes_query_and_filter_and_tracks_version():
+    a = search_cache_key(
+        _collection(),
+        " hello  world",
+        search_type="semantic",
+        filter={"b": 1, "a": 2},
+        limit=5,
+    )
+    b = search_cache_key(
+        _collection(),
+        "hello world",
+        search_type="semantic",
+        filter={"a": 2, "b": 1},
+        limit=5,
+    )
+    bumped = search_cache_key(
+        _collection(1),
+        "hello world",
+        search_type="semantic",
+        filter={"a": 2, "b": 1},
+        limit=5,
+    )
+
+    assert a == b
+    assert a != bumped
+
+
+def _service(monkeypatch: pytest.MonkeyPatch, collection, calls: list):
+    service = DocumentService(None, collection.id, SimpleNamespace(id=1))
+
+    async def get_collection():
+        return collection
+
+    async def search_embedding(col, model_api_key_id):
+        return object()
+
+    async def run_search(col, embed, query, **kwargs):
+        calls.append(query)
+        return [{"id": "a", "page_content": "x", "metadata": {}, "score": 0.1}]
+
+    monkeypatch.setattr(service, "_get_collection", get_collection)
+    monkeypatch.setattr(service, "_search_embedding", search_embedding)
+    monkeypatch.setattr(service, "_search", run_search)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_search_reuses_results_until_write_version_changes(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    collection = _collection()
+    calls: list = []
+    service = _service(monkeypatch, collection, calls)
+
+    first = await service.search("q", limit=3)
+    second = await service.search(" q ", limit=3)
+    collection.write_version += 1
+    await service.search("q", limit=3)
+
+    assert first == second
+    assert calls == ["q", "q"]
+    assert search_result_cache.stats()["hits"] >= 1
+    assert search_result_cache.bytes > 0
+    assert invalidate_search_results(collection.id) == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_bumps_write_version_in_one_statement(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    collection = _collection()
+    statements: list = []
+    commits: list = []
+
+    async def fake_raw_sql(db, query, params=None, one=False):
+        statements.append((" ".join(query.split()), params))
+        return {"deleted": 3}
+
+    class FakeDB:
+        async def commit(self):
+            commits.append(True)
+
+    monkeypatch.setattr(document_module, "raw_sql", fake_raw_sql)
+    service = DocumentService(FakeDB(), collection.id, SimpleNamespace(id=1))
+
+    async def get_collection():
+        return collection
+
+    monkeypatch.setattr(service, "_get_collection", get_collection)
+
+    deleted = await service.delete_by(UUID(int=9), "file_id")
+
+    [(sql, params)] = statements
+    assert deleted == 3 and commits == [True]
+    assert "DELETE FROM collection_t WHERE file_id = :id RETURNING file_id" in sql
+    assert "write_version = c.write_version + 1" in sql
+    assert params == {"id": str(UUID(int=9)), "collection_id": collection.id}
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import search_plan
+
+
+def _collection(vector_index: str = "hnsw", params: dict | None = None):
+    return SimpleNamespace(
+        table_name="collection_t",
+        embedding=SimpleNamespace(dimension=3, distance="cosine"),
+        vector_index=vector_index,
+        vector_index_params=params,
+        vector_type="vector",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch: pytest.MonkeyPatch):
+    search_plan.selectivity_cache.clear()
+    search_plan.ivf_lists_cache.clear()
+    search_plan._ADAPT.clear()
+    monkeypatch.setattr(search_plan, "_iterative_supported", None)
+    yield
+    search_plan._ADAPT.clear()
+
+
+def _fake_db(
+    monkeypatch, *, version: str = "0.8.0", rows: float = 10_000, matched: float = 100
+):
+    calls: list[str] = []
+
+    async def fake_raw_sql(session, query, params=None, one=False):
+        calls.append(query)
+        if "pg_extension" in query:
+            return {"extversion": version}
+        if "reltuples" in query:
+            return {"reltuples": rows}
+        if "reloptions" in query:
+            return {"reloptions": ["lists=8"]} if params["index"] else None
+        return {"QUERY PLAN": [{"Plan": {"Plan Rows": matched}}]}
+
+    monkeypatch.setattr(search_plan, "raw_sql", fake_raw_sql)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_small_limit_without_filter_uses_base_ef_search(monkeypatch):
+    calls = _fake_db(monkeypatch)
+
+    plan = await search_plan.plan_vector_search(None, _collection(), limit=3)
+
+    assert plan.k == 3
+    assert plan.parameters == ("hnsw.ef_search = 40",)
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_uses_iterative_scan(monkeypatch):
+    _fake_db(monkeypatch)
+
+    plan = await search_plan.plan_vector_search(
+        None, _collection(), limit=10, filter={"file_id": "f1"}
+    )
+
+    assert plan.iterative is True
+    assert plan.selectivity == pytest.approx(0.01)
+    assert "hnsw.iterative_scan = relaxed_order" in plan.parameters
+    assert plan.query_options().to_parameter() == list(plan.parameters)
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_scales_ef_without_iterative_scan(monkeypatch):
+    _fake_db(monkeypatch, version="0.7.4", matched=1000)
+
+    plan = await search_plan.plan_vector_search(
+        None, _collection(), limit=10, filter={"lang": "ko"}
+    )
+
+    assert plan.parameters == ("hnsw.ef_search = 400",)
+
+
+@pytest.mark.asyncio
+async def test_underfilled_results_widen_next_plan(monkeypatch):
+    _fake_db(monkeypatch, version="0.7.4", matched=1000)
+    collection = _collection(vector_index="ivfflat", params={"probes": 2, "lists": 100})
+
+    first = await search_plan.plan_vector_search(
+        None, collection, limit=10, filter={"a": 1}
+    )
+    search_plan.record_search_outcome(first, returned=3)
+    second = await search_plan.plan_vector_search(
+        None, collection, limit=10, filter={"a": 1}
+    )
+
+    assert first.parameters == ("ivfflat.probes = 20",)
+    assert second.parameters == ("ivfflat.probes = 40",)
+
+
+@pytest.mark.asyncio
+async def test_exact_scan_collections_have_no_options(monkeypatch):
+    _fake_db(monkeypatch)
+
+    plan = await search_plan.plan_vector_search(
+        None, _collection(vector_index="none"), limit=5, filter={"a": 1}
+    )
+
+    assert plan.query_options() is None
+
+
+@pytest.mark.asyncio
+async def test_ivfflat_probes_are_capped_by_built_lists(monkeypatch):
+    _fake_db(monkeypatch, version="0.7.4", matched=10)
+    collection = _collection(vector_index="ivfflat", params={"probes": 4})
+
+    plan = await search_plan.plan_vector_search(
+        None, collection, limit=10, filter={"a": 1}
+    )
+
+    # 선택도 0.001로 probes가 4000까지 커져도 실제 인덱스 lists(8)를 넘지 않음
+    assert plan.parameters == ("ivfflat.probes = 8",)
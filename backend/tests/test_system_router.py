@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.dependencies import get_db, get_current_user
+
+
+class FakeRole:
+    def __init__(self, code: str) -> None:
+        self.code = code
+
+
+class FakeUser:
+    def __init__(self, user_id: int, role_code: str = "user") -> None:
+        self.id = user_id
+        self.role = FakeRole(role_code)
+
+
+def _set_current_user(user: FakeUser) -> None:
+    def override_user():
+        return user
+
+    app.dependency_overrides[get_current_user] = override_user
+
+
+@pytest.fixture(autouse=True)
+def _override_db() -> None:
+    async def override_db():
+        yield None
+
+    app.dependency_overrides[get_db] = override_db
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_requires_admin():
+    _set_current_user(FakeUser(1, "user"))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get("/api/v1/system/caches")
+
+    assert resp.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_lists_agent_cache():
+    _set_current_user(FakeUser(1, "admin"))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get("/api/v1/system/caches")
+
+    assert resp.status_code == 200
+    names = {c["name"] for c in resp.json()}
+    assert "agents" in names
+
+
+@pytest.mark.asyncio
+async def test_embedding_throughput_requires_admin():
+    _set_current_user(FakeUser(1, "user"))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        resp = await ac.get("/api/v1/system/embedding-throughput")
+
+    assert resp.status_code == 403
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from asyncpg.exceptions import DuplicateTableError
+from langchain_postgres.v2.indexes import HNSWQueryOptions, IVFFlatQueryOptions
+
+from app.db import vector as vector_module
+from app.db.vector import (
+    _ivf_lists,
+    secondary_index_specs,
+    storage_type_for,
+    vector_query_options,
+)
+
+
+def _collection(
+    dimension: int = 1536,
+    distance: str = "cosine",
+    vector_index: str = "hnsw",
+    params: dict | None = None,
+    vector_type: str = "vector",
+):
+    return SimpleNamespace(
+        table_name="collection_t",
+        embedding=SimpleNamespace(dimension=dimension, distance=distance),
+        vector_index=vector_index,
+        vector_index_params=params,
+        vector_type=vector_type,
+    )
+
+
+def test_ivf_lists_follow_row_count():
+    assert _ivf_lists(None) is None
+    assert _ivf_lists(0) is None
+    assert _ivf_lists(5_000) == 10
+    assert _ivf_lists(500_000) == 500
+    assert _ivf_lists(4_000_000) == 2000
+
+
+def test_hnsw_policy_builds_only_hnsw_index():
+    specs = dict(
+        secondary_index_specs(
+            _collection(distance="l2", params={"m": 24}), rows=200_000
+        )
+    )
+
+    assert (
+        specs["collection_t_tsv_simple_idx"]
+        == "collection_t USING GIN (content_tsv_simple)"
+    )
+    assert "vector_l2_ops" in specs["idx_collection_t_vec_hnsw"]
+    assert "m = 24, ef_construction = 64" in specs["idx_collection_t_vec_hnsw"]
+    assert "idx_collection_t_vec_ivf" not in specs
+
+
+def test_ivfflat_policy_sizes_lists_from_rows():
+    specs = dict(
+        secondary_index_specs(_collection(vector_index="ivfflat"), rows=200_000)
+    )
+
+    assert "lists = 200" in specs["idx_collection_t_vec_ivf"]
+    assert "idx_collection_t_vec_hnsw" not in specs
+
+
+def test_ivfflat_without_lists_is_deferred_on_empty_table():
+    collection = _collection(vector_index="ivfflat")
+
+    assert "idx_collection_t_vec_ivf" not in dict(secondary_index_specs(collection))
+    assert "idx_collection_t_vec_ivf" not in dict(
+        secondary_index_specs(collection, rows=0)
+    )
+    # 빌드가 보류돼도 검색 옵션은 정책을 따름
+    assert isinstance(vector_query_options(collection, 10), IVFFlatQueryOptions)
+    explicit = _collection(vector_index="ivfflat", params={"lists": 50})
+    assert (
+        "lists = 50"
+        in dict(secondary_index_specs(explicit))["idx_collection_t_vec_ivf"]
+    )
+
+
+def test_none_policy_has_no_vector_index():
+    names = [
+        name for name, _ in secondary_index_specs(_collection(vector_index="none"))
+    ]
+
+    assert not any("_vec_" in name for name in names)
+    assert vector_query_options(_collection(vector_index="none"), 10) is None
+
+
+def test_query_options_follow_policy():
+    hnsw = vector_query_options(_collection(params={"ef_search": 40}), 100)
+    ivf = vector_query_options(
+        _collection(vector_index="ivfflat", params={"lists": 4, "probes": 10}), 100
+    )
+
+    assert isinstance(hnsw, HNSWQueryOptions) and hnsw.ef_search == 100
+    assert isinstance(ivf, IVFFlatQueryOptions) and ivf.probes == 4
+
+
+def test_secondary_index_specs_skip_vector_indexes_over_2000_dims():
+    names = [name for name, _ in secondary_index_specs(_collection(dimension=3072))]
+
+    assert "idx_collection_t_vec_hnsw" not in names
+    assert "idx_collection_t_content_trgm" in names
+
+
+def test_halfvec_collections_get_ann_index_up_to_4000_dims():
+    specs = dict(
+        secondary_index_specs(_collection(dimension=3072, vector_type="halfvec"))
+    )
+
+    assert "halfvec_cosine_ops" in specs["idx_collection_t_vec_hnsw"]
+
+
+def test_storage_type_follows_spec_dtype():
+    assert (
+        storage_type_for(SimpleNamespace(dtype="halfvec", dimension=3072)) == "halfvec"
+    )
+    # vector로는 인덱스를 만들 수 없는 차원은 dtype이 없거나 float32여도 halfvec
+    assert (
+        storage_type_for(SimpleNamespace(dtype="float32", dimension=3072)) == "halfvec"
+    )
+    assert storage_type_for(SimpleNamespace(dtype=None, dimension=3072)) == "halfvec"
+    assert (
+        storage_type_for(SimpleNamespace(dtype="float32", dimension=1536)) == "vector"
+    )
+    assert (
+        storage_type_for(SimpleNamespace(dtype="halfvec", dimension=8000)) == "vector"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("exists", "column_type", "altered"),
+    [(False, None, True), (True, "halfvec(8)", False), (True, "vector(8)", True)],
+)
+async def test_halfvec_column_is_only_converted_when_needed(
+    monkeypatch: pytest.MonkeyPatch, exists, column_type, altered
+):
+    stmts: list[str] = []
+    init = AsyncMock(side_effect=DuplicateTableError() if exists else None)
+
+    async def exec_many(batch):
+        stmts.extend(batch)
+
+    monkeypatch.setattr(
+        vector_module, "pg_engine", SimpleNamespace(ainit_vectorstore_table=init)
+    )
+    monkeypatch.setattr(
+        vector_module, "_embedding_column_type", AsyncMock(return_value=column_type)
+    )
+    monkeypatch.setattr(vector_module, "_exec_many_ddl", exec_many)
+
+    await vector_module.create_vectorstore_table(
+        _collection(dimension=8, vector_type="halfvec"), defer_indexes=True
+    )
+
+    assert any("TYPE halfvec(8)" in s for s in stmts) is altered
+    assert any("content_tsv_en" in s for s in stmts)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_postgres.v2.indexes import HNSWQueryOptions
+
+from app.db import vector
+
+
+class FakeInner:
+    def __init__(self, embedding_service, hybrid_search_config):
+        self.embedding_service = embedding_service
+        self.index_query_options = None
+        self.hybrid_search_config = hybrid_search_config
+
+
+class FakeStore:
+    def __init__(self, inner):
+        self._PGVectorStore__vs = inner
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    vector.vectorstore_cache.clear()
+    yield
+    vector.vectorstore_cache.clear()
+
+
+@pytest.fixture
+def creates(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+
+    async def fake_create(**kwargs):
+        calls.append(kwargs["table_name"])
+        return FakeStore(
+            FakeInner(kwargs["embedding_service"], kwargs["hybrid_search_config"])
+        )
+
+    monkeypatch.setattr(vector.PGVectorStore, "create", fake_create)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_store_is_introspected_once_and_rebound(creates: list):
+    collection = SimpleNamespace(table_name="collection_t")
+    options = HNSWQueryOptions(ef_search=200)
+
+    first = await vector.get_vectorstore(collection, embedding="e1")
+    second = await vector.get_vectorstore(
+        collection, embedding="e2", index_query_options=options
+    )
+
+    assert creates == ["collection_t"]
+    assert first._PGVectorStore__vs.embedding_service == "e1"
+    assert second._PGVectorStore__vs.embedding_service == "e2"
+    assert second._PGVectorStore__vs.index_query_options is options
+    # 하이브리드 설정은 요청마다 독립 복사본
+    assert (
+        first._PGVectorStore__vs.hybrid_search_config
+        is not second._PGVectorStore__vs.hybrid_search_config
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_new_introspection(creates: list):
+    collection = SimpleNamespace(table_name="collection_t")
+
+    await vector.get_vectorstore(collection, use_hybrid_search=False)
+    await vector.get_vectorstore(collection, use_hybrid_search=True)
+    assert vector.invalidate_vectorstore("collection_t") == 2
+    await vector.get_vectorstore(collection, use_hybrid_search=False)
+
+    assert creates == ["collection_t"] * 3
+
+
+@pytest.mark.asyncio
+async def test_bind_matches_installed_pgvectorstore_layout():
+    inner = FakeInner("e0", None)
+
+    class FakeEngine:
+        async def _run_as_async(self, coro):
+            coro.close()
+            return inner
+
+    store = await vector.PGVectorStore.create(
+        engine=FakeEngine(), embedding_service="e0", table_name="collection_t"
+    )
+
+    bound = vector._bind(store, "e1", None)
+
+    assert getattr(store, vector._INNER_STORE_ATTR) is inner
+    assert getattr(bound, vector._INNER_STORE_ATTR).embedding_service == "e1"
+    assert inner.embedding_service == "e0"
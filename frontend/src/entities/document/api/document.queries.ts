@@ -1,4 +1,5 @@
 import { queryOptions } from "@tanstack/react-query";
+import { getDocumentChunks } from "./get-document-chunks";
 import { getDocuments } from "./get-documents";
 import type { DocumentsListParams } from "../model";
 
@@ -13,8 +14,16 @@ export const documentQueries = {
         params?.view ?? "document",
         params?.limit ?? 10,
         params?.offset ?? 0,
+        params?.cursor ?? null,
       ] as const,
       queryFn: () => getDocuments(collectionId, params),
       staleTime: 5 * 60 * 1000,
     }),
+
+  fileChunks: (collectionId: string, fileId: string) =>
+    queryOptions({
+      queryKey: [...documentQueries.all(collectionId), "file", fileId, "chunks"] as const,
+      queryFn: () => getDocumentChunks(collectionId, fileId),
+      staleTime: 5 * 60 * 1000,
+    }),
 };
@@ -0,0 +1,24 @@
+import { kyClient } from "@/shared/api/ky-client";
+import { type DocumentFileChunks, documentFileChunksSchema } from "../model";
+
+/**
+ * Why: 문서 목록에는 청크가 없으므로 선택한 파일의 청크를 지연 조회합니다.
+ *
+ * Contract:
+ * - cursor가 있으면 해당 위치 다음 청크부터 조회합니다.
+ *
+ * @returns 파일 정보와 청크 목록 응답.
+ */
+export const getDocumentChunks = async (
+  collectionId: string,
+  fileId: string,
+  params?: { limit?: number; cursor?: string }
+): Promise<DocumentFileChunks> => {
+  const res = await kyClient
+    .get(`collections/${collectionId}/documents/${fileId}/chunks`, {
+      searchParams: params as Record<string, string | number>,
+    })
+    .json();
+
+  return documentFileChunksSchema.parse(res);
+};
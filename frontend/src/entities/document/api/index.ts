@@ -3,3 +3,4 @@ export { useCreateDocument } from "./use-create-document";
 export { useDeleteDocuments } from "./use-delete-documents";
 export { useDeleteDocument } from "./use-delete-document-by-id";
 export { useSearchDocument } from "./use-search-document";
+export { useDocumentChunks } from "./use-document-chunks";
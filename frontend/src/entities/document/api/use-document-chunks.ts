@@ -0,0 +1,18 @@
+import { useQuery } from "@tanstack/react-query";
+
+import { documentQueries } from "./document.queries";
+
+/**
+ * Why: 파일별 청크 목록을 React Query로 지연 조회합니다.
+ *
+ * Contract:
+ * - collectionId/fileId가 없으면 조회를 비활성화합니다.
+ *
+ * @returns React Query 결과 객체.
+ */
+export const useDocumentChunks = (collectionId: string, fileId: string) => {
+  return useQuery({
+    ...documentQueries.fileChunks(collectionId, fileId),
+    enabled: !!collectionId && !!fileId,
+  });
+};
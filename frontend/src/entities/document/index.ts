@@ -4,12 +4,14 @@ export {
   useDeleteDocuments,
   useDeleteDocument,
   useSearchDocument,
+  useDocumentChunks,
 } from "./api";
 
 export {
   chunkItemSchema,
   documentChunkSchema,
   documentFileSchema,
+  documentFileChunksSchema,
   paginatedChunkResponseSchema,
   documentUploadRequestSchema,
   documentUploadResponseSchema,
@@ -22,6 +24,7 @@ export {
   documentsSearchResponseSchema,
   type DocumentChunk,
   type DocumentFile,
+  type DocumentFileChunks,
   type DocumentViewType,
   type ChunkItem,
   type DocumentUploadRequest,
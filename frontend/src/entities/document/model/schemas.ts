@@ -16,9 +16,18 @@ export const documentChunkSchema = z.object({
 
 export const documentFileSchema = z.object({
   file_id: z.string(),
-  source: z.string(),
+  source: z.string().nullish(),
   chunk_count: z.number().int(),
-  chunks: z.array(chunkItemSchema),
+  content_bytes: z.number().int().optional(),
+  file_size: z.number().int().nullish(),
+  content_hash: z.string().nullish(),
+  created_at: z.string().nullish(),
+  chunks: z.array(chunkItemSchema).default([]),
+});
+
+export const documentFileChunksSchema = documentFileSchema.omit({ chunks: true }).extend({
+  items: z.array(chunkItemSchema),
+  next_cursor: z.string().nullish(),
 });
 
 export const paginatedChunkResponseSchema = z.object({
@@ -31,6 +40,7 @@ export const paginatedDocumentResponseSchema = z.object({
   items: z.array(documentFileSchema),
   chunk_total: z.number().int(),
   file_total: z.number().int(),
+  next_cursor: z.string().nullish(),
 });
 
 export const documentReadSchema = z.object({
@@ -51,7 +61,9 @@ export const documentUploadResponseSchema = z.object({
   success: z.boolean(),
   message: z.string(),
   added_chunk_ids: z.array(z.string()),
-  warnings: z.array(z.string()).optional(),
+  warnings: z.array(z.string()).nullish(),
+  job_id: z.string().uuid().nullish(),
+  status: z.string().nullish(),
 });
 
 export const documentDeleteRequestSchema = z.object({
@@ -65,6 +77,7 @@ export const documentsListParamsSchema = z.object({
   limit: z.number().int().min(1).max(100).optional(),
   offset: z.number().int().min(0).optional(),
   view: documentViewTypeSchema.optional(),
+  cursor: z.string().optional(),
 });
 
 export const documentSearchTypeSchema = z.enum(["semantic", "keyword", "hybrid"]);
@@ -3,6 +3,7 @@ import {
   chunkItemSchema,
   documentChunkSchema,
   documentFileSchema,
+  documentFileChunksSchema,
   paginatedChunkResponseSchema,
   paginatedDocumentResponseSchema,
   documentReadSchema,
@@ -21,6 +22,7 @@ import {
 export type ChunkItem = z.infer<typeof chunkItemSchema>;
 export type DocumentChunk = z.infer<typeof documentChunkSchema>;
 export type DocumentFile = z.infer<typeof documentFileSchema>;
+export type DocumentFileChunks = z.infer<typeof documentFileChunksSchema>;
 
 // 페이지네이션 응답
 export type PaginatedChunkResponse = z.infer<typeof paginatedChunkResponseSchema>;
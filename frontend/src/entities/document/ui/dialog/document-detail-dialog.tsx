@@ -3,20 +3,26 @@ import { Badge } from "@/shared/ui/badge";
 import { Separator } from "@/shared/ui/separator";
 import { ScrollArea } from "@/shared/ui/scroll-area";
 
+import { useDocumentChunks } from "../../api";
 import type { DocumentFile } from "../../model";
 
 type DocumentDetailDialogProps = {
+  collectionId: string;
   isOpen: boolean;
   onOpenChange: (open: boolean) => void;
   document: DocumentFile;
 };
 
 export const DocumentDetailDialog = ({
+  collectionId,
   isOpen,
   onOpenChange,
   document,
 }: DocumentDetailDialogProps) => {
-  const totalChars = document.chunks.reduce((sum, chunk) => sum + chunk.content.length, 0);
+  // 목록 응답에는 청크가 없으므로 다이얼로그를 열 때 파일별로 조회합니다.
+  const { data } = useDocumentChunks(collectionId, isOpen ? document.file_id : "");
+  const chunks = data?.items ?? document.chunks;
+  const totalChars = chunks.reduce((sum, chunk) => sum + chunk.content.length, 0);
   const avgCharsPerChunk =
     document.chunk_count > 0 ? Math.round(totalChars / document.chunk_count) : 0;
 
@@ -32,7 +38,7 @@ export const DocumentDetailDialog = ({
           <div className="grid grid-cols-2 gap-4">
             <div>
               <label className="text-muted-foreground text-sm font-medium">파일명</label>
-              <p className="text-sm">{document.source}</p>
+              <p className="text-sm">{document.source ?? document.file_id}</p>
             </div>
             <div>
               <label className="text-muted-foreground text-sm font-medium">파일 ID</label>
@@ -64,7 +70,7 @@ export const DocumentDetailDialog = ({
             <h3 className="mb-2 text-sm font-medium">청크 목록</h3>
             <ScrollArea className="h-[300px] rounded-md border">
               <div className="space-y-4 p-4">
-                {document.chunks.map((chunk, index) => (
+                {chunks.map((chunk, index) => (
                   <div key={chunk.id} className="space-y-2 rounded border p-3">
                     <div className="flex items-center justify-between">
                       <span className="text-muted-foreground font-mono text-sm">
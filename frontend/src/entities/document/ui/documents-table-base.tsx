@@ -24,7 +24,7 @@ export const DocumentsTableBase = ({
         <TableRow>
           <TableHead>파일명</TableHead>
           <TableHead>청크 수</TableHead>
-          <TableHead>문자 수</TableHead>
+          <TableHead>크기(바이트)</TableHead>
           <TableHead>파일 ID</TableHead>
           <TableHead>작업</TableHead>
         </TableRow>
@@ -41,9 +41,6 @@ export const DocumentsTableBase = ({
           </TableRow>
         ) : (
           documents.map((doc) => {
-            const charCount =
-              doc.chunks?.reduce((total, chunk) => total + (chunk.content?.length || 0), 0) ?? 0;
-
             return (
               <TableRow
                 key={doc.file_id}
@@ -52,7 +49,7 @@ export const DocumentsTableBase = ({
               >
                 <TableCell>{doc.source || doc.file_id}</TableCell>
                 <TableCell>{doc.chunk_count || 0}</TableCell>
-                <TableCell>{charCount}</TableCell>
+                <TableCell>{doc.file_size != null ? doc.file_size.toLocaleString() : "-"}</TableCell>
                 <TableCell className="font-mono text-xs">{doc.file_id}</TableCell>
                 <TableCell onClick={(e) => e.stopPropagation()}>
                   <Button
@@ -74,6 +74,7 @@ export const DocumentListView = ({ collectionId }: DocumentListViewProps) => {
       {/* 상세 다이얼로그들 */}
       {selectedDocument && (
         <DocumentDetailDialog
+          collectionId={collectionId}
           document={selectedDocument}
           isOpen={!!selectedDocument}
           onOpenChange={(open) => !open && setSelectedDocument(null)}